@@ -0,0 +1,49 @@
+"""Add content-addressed blob store tables
+
+Revision ID: add_content_blob_store
+Revises: add_langgraph_checkpoints
+Create Date: 2025-09-20 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_content_blob_store'
+down_revision: Union[str, None] = 'add_langgraph_checkpoints'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create content blob and blob link tables"""
+    
+    op.create_table(
+        'content_blobs',
+        sa.Column('sha256', sa.String(64), primary_key=True, comment='SHA-256 of the content'),
+        sa.Column('size', sa.BigInteger, nullable=False),
+        sa.Column('ref_count', sa.Integer, nullable=False, server_default='0', comment='Referencing File/ImageHistory rows'),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.func.now())
+    )
+    
+    op.create_table(
+        'content_blob_links',
+        sa.Column('path', sa.String(500), primary_key=True, comment='Materialized legacy path'),
+        sa.Column('sha256', sa.String(64), nullable=False),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now())
+    )
+    
+    op.create_index('ix_content_blob_links_sha256', 'content_blob_links', ['sha256'])
+    op.create_index('ix_content_blob_links_created_at', 'content_blob_links', ['created_at'])
+
+
+def downgrade() -> None:
+    """Drop content blob tables"""
+    
+    op.drop_index('ix_content_blob_links_created_at', table_name='content_blob_links')
+    op.drop_index('ix_content_blob_links_sha256', table_name='content_blob_links')
+    op.drop_table('content_blob_links')
+    op.drop_table('content_blobs')
@@ -0,0 +1,43 @@
+"""Add conversation summary versions table
+
+Revision ID: add_conversation_summary_versions
+Revises: add_content_blob_store
+Create Date: 2025-09-24 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_conversation_summary_versions'
+down_revision: Union[str, None] = 'add_content_blob_store'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create versioned long-term memory summaries table"""
+    
+    op.create_table(
+        'conversation_summary_versions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('conversation_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('conversations.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('version', sa.Integer, nullable=False),
+        sa.Column('base_version', sa.Integer, nullable=True, comment='Version the incremental summary was built from'),
+        sa.Column('summary_text', sa.Text, nullable=False),
+        sa.Column('pairs_covered', sa.Integer, nullable=False, server_default='0', comment='Cumulative Q&A pairs folded into the summary'),
+        sa.Column('covered_until', sa.String(64), nullable=True, comment='Question timestamp of the last summarized pair'),
+        sa.Column('model', sa.String(100), nullable=True),
+        sa.Column('latency_ms', sa.Integer, nullable=True),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        sa.UniqueConstraint('conversation_id', 'version', name='unique_conversation_summary_version')
+    )
+
+
+def downgrade() -> None:
+    """Drop conversation summary versions table"""
+    
+    op.drop_table('conversation_summary_versions')
@@ -0,0 +1,81 @@
+"""Rework LangGraph checkpoints table and add checkpoint writes table
+
+Revision ID: add_langgraph_checkpoint_writes
+Revises: add_conversation_summary_versions
+Create Date: 2025-09-26 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_langgraph_checkpoint_writes'
+down_revision: Union[str, None] = 'add_conversation_summary_versions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Store serialized checkpoints per namespace and buffered node writes"""
+
+    # The JSONB checkpoints table was never written to; replace it with the serde-typed layout
+    op.drop_index('idx_langgraph_checkpoints_parent', table_name='langgraph_checkpoints')
+    op.drop_index('idx_langgraph_checkpoints_created_at', table_name='langgraph_checkpoints')
+    op.drop_index('idx_langgraph_checkpoints_checkpoint_ns', table_name='langgraph_checkpoints')
+    op.drop_index('idx_langgraph_checkpoints_thread_id', table_name='langgraph_checkpoints')
+    op.drop_table('langgraph_checkpoints')
+
+    op.create_table(
+        'langgraph_checkpoints',
+        sa.Column('thread_id', sa.String(255), primary_key=True),
+        sa.Column('checkpoint_ns', sa.String(255), primary_key=True, server_default=''),
+        sa.Column('checkpoint_id', sa.String(255), primary_key=True),
+        sa.Column('parent_checkpoint_id', sa.String(255), nullable=True),
+        sa.Column('checkpoint_type', sa.String(50), nullable=False, comment='Serializer type tag'),
+        sa.Column('checkpoint', sa.LargeBinary, nullable=False, comment='Serialized checkpoint including channel values'),
+        sa.Column('metadata_type', sa.String(50), nullable=False),
+        sa.Column('metadata', sa.LargeBinary, nullable=False),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now())
+    )
+    op.create_index('idx_langgraph_checkpoints_thread_created', 'langgraph_checkpoints', ['thread_id', 'created_at'])
+
+    op.create_table(
+        'langgraph_checkpoint_writes',
+        sa.Column('thread_id', sa.String(255), primary_key=True),
+        sa.Column('checkpoint_ns', sa.String(255), primary_key=True, server_default=''),
+        sa.Column('checkpoint_id', sa.String(255), primary_key=True),
+        sa.Column('task_id', sa.String(255), primary_key=True),
+        sa.Column('idx', sa.Integer, primary_key=True, comment='Negative for special channels (error, interrupt)'),
+        sa.Column('channel', sa.String(255), nullable=False),
+        sa.Column('value_type', sa.String(50), nullable=False),
+        sa.Column('value', sa.LargeBinary, nullable=True),
+        sa.Column('task_path', sa.String(500), nullable=False, server_default=''),
+        sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now())
+    )
+
+
+def downgrade() -> None:
+    """Restore the original JSONB checkpoints table"""
+
+    op.drop_table('langgraph_checkpoint_writes')
+    op.drop_index('idx_langgraph_checkpoints_thread_created', table_name='langgraph_checkpoints')
+    op.drop_table('langgraph_checkpoints')
+
+    op.create_table(
+        'langgraph_checkpoints',
+        sa.Column('thread_id', sa.String(255), nullable=False, primary_key=True),
+        sa.Column('checkpoint_id', sa.String(255), nullable=False, primary_key=True),
+        sa.Column('parent_checkpoint_id', sa.String(255), nullable=True),
+        sa.Column('checkpoint_ns', sa.String(255), nullable=False, default=''),
+        sa.Column('checkpoint', postgresql.JSONB, nullable=False),
+        sa.Column('metadata', postgresql.JSONB, nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), server_default=sa.func.now(), nullable=False)
+    )
+    op.create_index('idx_langgraph_checkpoints_thread_id', 'langgraph_checkpoints', ['thread_id'])
+    op.create_index('idx_langgraph_checkpoints_checkpoint_ns', 'langgraph_checkpoints', ['checkpoint_ns'])
+    op.create_index('idx_langgraph_checkpoints_created_at', 'langgraph_checkpoints', ['created_at'])
+    op.create_index('idx_langgraph_checkpoints_parent', 'langgraph_checkpoints', ['parent_checkpoint_id'])
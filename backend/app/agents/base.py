@@ -3,7 +3,7 @@ AI 에이전트 베이스 클래스
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, Callable, List
+from typing import Dict, Any, Optional, Callable, List, AsyncGenerator, Literal
 from pydantic import BaseModel
 from datetime import datetime
 import logging
@@ -64,6 +64,22 @@ class AgentOutput(BaseModel):
     error: Optional[str] = None  # 에러 메시지
 
 
+class AgentStreamEvent(BaseModel):
+    """에이전트 스트리밍 이벤트 - execute_stream이 생성하는 표준 이벤트 형식
+
+    - token: LLM이 생성한 텍스트 조각 (text)
+    - citations: 최종 답변 생성 전에 확정된 인용/출처 정보 (citations, sources)
+      검색 도중의 중간 인용은 partial=True로 먼저 전달되고 이후 이벤트가 이전 것을 대체
+    - result: 스트림 종료 시점의 최종 AgentOutput (output)
+    """
+    type: Literal["token", "citations", "result"]
+    text: Optional[str] = None
+    citations: Optional[List[Dict[str, Any]]] = None
+    sources: Optional[List[Dict[str, Any]]] = None
+    partial: bool = False
+    output: Optional[AgentOutput] = None
+
+
 class BaseAgent(ABC):
     """AI 에이전트 베이스 클래스"""
     
@@ -93,6 +109,38 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def execute_stream(
+        self,
+        input_data: AgentInput,
+        model: str = "gemini",
+        progress_callback: Optional[Callable[[str, int], None]] = None
+    ) -> AsyncGenerator[AgentStreamEvent, None]:
+        """
+        에이전트 스트리밍 실행 메서드
+        
+        기본 구현은 execute 결과 전체를 하나의 token 이벤트로 전달합니다.
+        LLM 응답을 토큰 단위로 전달할 수 있는 에이전트는 이 메서드를 재정의합니다.
+        
+        Args:
+            input_data: 입력 데이터
+            model: 사용할 LLM 모델
+            progress_callback: 진행 상태 콜백 함수
+            
+        Yields:
+            token/citations 이벤트, 마지막으로 result 이벤트
+        """
+        output = await self.execute(input_data, model, progress_callback)
+        
+        if output.citations or output.sources:
+            yield AgentStreamEvent(
+                type="citations",
+                citations=output.citations or [],
+                sources=output.sources or []
+            )
+        if output.result:
+            yield AgentStreamEvent(type="token", text=output.result)
+        yield AgentStreamEvent(type="result", output=output)
+    
     @abstractmethod
     def get_capabilities(self) -> list[str]:
         """
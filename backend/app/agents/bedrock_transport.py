@@ -0,0 +1,261 @@
+"""
+AWS Bedrock 비동기 전송 계층
+- boto3(동기) 대신 SigV4로 서명한 httpx.AsyncClient로 bedrock-runtime을 직접 호출
+- 이벤트 루프를 막거나 스레드 풀을 차지하지 않으므로 동시 채팅 처리량이 스레드 수가 아닌 I/O에 비례
+- invoke-with-response-stream 응답(AWS event stream)을 직접 해석해 실제 토큰 단위로 스트리밍
+- ChatBedrockAsync는 LangChain 채팅 모델 인터페이스(ainvoke/astream)를 그대로 제공
+"""
+
+import base64
+import json
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+import httpx
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.credentials import Credentials
+from botocore.eventstream import EventStreamBuffer
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, SystemMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict, Field
+
+from app.core.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ANTHROPIC_BEDROCK_VERSION = "bedrock-2023-05-31"
+
+
+class BedrockError(Exception):
+    """Bedrock 호출 실패 (HTTP 오류 또는 스트림 예외 이벤트)"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, error_type: Optional[str] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_type = error_type
+
+
+class BedrockAsyncTransport:
+    """SigV4 서명 httpx 클라이언트 기반 bedrock-runtime 호출 (연결 풀 공유)"""
+
+    def __init__(
+        self,
+        endpoint_url: Optional[str] = None,
+        region: Optional[str] = None,
+        credentials: Optional[Credentials] = None,
+        max_connections: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.region = region or settings.AWS_REGION
+        self.endpoint_url = (
+            endpoint_url or settings.BEDROCK_ENDPOINT_URL or f"https://bedrock-runtime.{self.region}.amazonaws.com"
+        ).rstrip("/")
+        self.credentials = credentials or Credentials(
+            settings.AWS_ACCESS_KEY_ID or "", settings.AWS_SECRET_ACCESS_KEY or ""
+        )
+        self.max_connections = max_connections or settings.LLM_PROVIDER_MAX_CONCURRENCY
+        timeout = timeout_seconds or settings.BEDROCK_REQUEST_TIMEOUT_SECONDS
+
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            ),
+            transport=transport
+        )
+        self._sync_client: Optional[httpx.Client] = None
+        self.stats = {"invocations": 0, "streams": 0, "errors": 0, "stream_events": 0}
+
+    async def invoke(self, model_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """InvokeModel - 전체 응답 본문(JSON) 반환"""
+        self.stats["invocations"] += 1
+        url, headers, payload = self._signed("invoke", model_id, body, accept="application/json")
+        response = await self.client.post(url, headers=headers, content=payload)
+        if response.status_code >= 400:
+            self._raise_http_error(response.status_code, response.content)
+        return response.json()
+
+    async def stream(self, model_id: str, body: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """InvokeModelWithResponseStream - 모델이 보낸 청크(JSON)를 도착하는 대로 반환"""
+        self.stats["streams"] += 1
+        url, headers, payload = self._signed(
+            "invoke-with-response-stream", model_id, body, accept="application/vnd.amazon.eventstream"
+        )
+        async with self.client.stream("POST", url, headers=headers, content=payload) as response:
+            if response.status_code >= 400:
+                self._raise_http_error(response.status_code, await response.aread())
+            buffer = EventStreamBuffer()
+            async for data in response.aiter_bytes():
+                buffer.add_data(data)
+                for chunk in self._decode_events(buffer):
+                    yield chunk
+
+    def invoke_sync(self, model_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """동기 InvokeModel (LangChain invoke 경로용)"""
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(timeout=self.client.timeout)
+        self.stats["invocations"] += 1
+        url, headers, payload = self._signed("invoke", model_id, body, accept="application/json")
+        response = self._sync_client.post(url, headers=headers, content=payload)
+        if response.status_code >= 400:
+            self._raise_http_error(response.status_code, response.content)
+        return response.json()
+
+    async def close(self) -> None:
+        await self.client.aclose()
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "endpoint": self.endpoint_url, "max_connections": self.max_connections}
+
+    def _signed(self, action: str, model_id: str, body: Dict[str, Any], accept: str) -> Tuple[str, Dict[str, str], bytes]:
+        url = f"{self.endpoint_url}/model/{quote(model_id, safe='')}/{action}"
+        payload = json.dumps(body).encode("utf-8")
+        request = AWSRequest(
+            method="POST",
+            url=url,
+            data=payload,
+            headers={"Content-Type": "application/json", "Accept": accept}
+        )
+        SigV4Auth(self.credentials, "bedrock", self.region).add_auth(request)
+        return url, dict(request.headers.items()), payload
+
+    def _decode_events(self, buffer: EventStreamBuffer) -> Iterator[Dict[str, Any]]:
+        for event in buffer:
+            message_type = event.headers.get(":message-type")
+            if message_type == "exception" or message_type == "error":
+                self.stats["errors"] += 1
+                error_type = event.headers.get(":exception-type") or event.headers.get(":error-code")
+                raise BedrockError(event.payload.decode("utf-8", "replace"), error_type=error_type)
+            if event.headers.get(":event-type") != "chunk":
+                continue
+            self.stats["stream_events"] += 1
+            encoded = json.loads(event.payload).get("bytes")
+            if encoded:
+                yield json.loads(base64.b64decode(encoded))
+
+    def _raise_http_error(self, status_code: int, content: bytes) -> None:
+        self.stats["errors"] += 1
+        try:
+            message = json.loads(content).get("message") or content.decode("utf-8", "replace")
+        except (ValueError, AttributeError):
+            message = content.decode("utf-8", "replace")
+        raise BedrockError(f"Bedrock 호출 실패 ({status_code}): {message}", status_code=status_code)
+
+
+class ChatBedrockAsync(BaseChatModel):
+    """BedrockAsyncTransport를 사용하는 Anthropic Claude(Bedrock) 채팅 모델"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    model_id: str
+    model_kwargs: Dict[str, Any] = Field(default_factory=dict)
+    transport: Any = Field(default=None, exclude=True)
+
+    @property
+    def _llm_type(self) -> str:
+        return "amazon_bedrock_chat_async"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_id": self.model_id, **self.model_kwargs}
+
+    def _request_body(self, messages: List[BaseMessage], stop: Optional[List[str]]) -> Dict[str, Any]:
+        """LangChain 메시지를 Anthropic Messages API 요청 본문으로 변환 (연속된 같은 역할은 합침)"""
+        system_parts: List[str] = []
+        turns: List[Dict[str, str]] = []
+        for message in messages:
+            content = message.content if isinstance(message.content, str) else json.dumps(message.content, ensure_ascii=False)
+            if isinstance(message, SystemMessage):
+                system_parts.append(content)
+                continue
+            role = "assistant" if isinstance(message, AIMessage) else "user"
+            if turns and turns[-1]["role"] == role:
+                turns[-1]["content"] += f"\n\n{content}"
+            else:
+                turns.append({"role": role, "content": content})
+
+        body: Dict[str, Any] = {
+            "anthropic_version": ANTHROPIC_BEDROCK_VERSION,
+            "max_tokens": 4096,
+            **self.model_kwargs,
+            "messages": turns,
+        }
+        if system_parts:
+            body["system"] = "\n\n".join(system_parts)
+        if stop:
+            body["stop_sequences"] = stop
+        return body
+
+    @staticmethod
+    def _to_result(response: Dict[str, Any], latency_ms: float) -> ChatResult:
+        text = "".join(block.get("text", "") for block in response.get("content", []) if block.get("type") == "text")
+        usage = response.get("usage", {})
+        message = AIMessage(
+            content=text,
+            response_metadata={
+                "stop_reason": response.get("stop_reason"),
+                "usage": usage,
+                "latency_ms": round(latency_ms, 1),
+            },
+            usage_metadata={
+                "input_tokens": usage.get("input_tokens", 0),
+                "output_tokens": usage.get("output_tokens", 0),
+                "total_tokens": usage.get("input_tokens", 0) + usage.get("output_tokens", 0),
+            }
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        started = time.perf_counter()
+        response = self.transport.invoke_sync(self.model_id, self._request_body(messages, stop))
+        return self._to_result(response, (time.perf_counter() - started) * 1000)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        started = time.perf_counter()
+        response = await self.transport.invoke(self.model_id, self._request_body(messages, stop))
+        return self._to_result(response, (time.perf_counter() - started) * 1000)
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        async for event in self.transport.stream(self.model_id, self._request_body(messages, stop)):
+            event_type = event.get("type")
+            if event_type == "content_block_delta":
+                text = event.get("delta", {}).get("text", "")
+                if not text:
+                    continue
+                chunk = ChatGenerationChunk(message=AIMessageChunk(content=text))
+                if run_manager:
+                    await run_manager.on_llm_new_token(text, chunk=chunk)
+                yield chunk
+            elif event_type == "message_delta":
+                yield ChatGenerationChunk(message=AIMessageChunk(
+                    content="",
+                    response_metadata={"stop_reason": event.get("delta", {}).get("stop_reason")}
+                ))
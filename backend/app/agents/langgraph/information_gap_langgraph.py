@@ -14,16 +14,14 @@ import logging
 
 # LangGraph 핵심 imports (최신 버전)
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.postgres import PostgresSaver
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 # 기존 시스템 imports
 from app.agents.base import BaseAgent, AgentInput, AgentOutput
 from app.agents.workers.information_gap_analyzer import information_gap_analyzer
-from app.core.config import settings
+from app.agents.workflow_cache import workflow_cache
+from app.agents.llm_client_registry import llm_client_registry
 from app.core.feature_flags import is_langgraph_enabled, LangGraphFeatureFlags
 from app.services.langgraph_monitor import langgraph_monitor
 
@@ -148,17 +146,9 @@ class LangGraphInformationGapAnalyzer(BaseAgent):
         # Legacy 에이전트 (fallback용)
         self.legacy_agent = information_gap_analyzer
         
-        # LangGraph 워크플로우 구성
-        self.workflow = self._build_workflow()
-        
-        # PostgreSQL 체크포인터 설정
-        if settings.DATABASE_URL:
-            self.checkpointer = PostgresSaver.from_conn_string(
-                settings.DATABASE_URL,
-                
-            )
-        else:
-            self.checkpointer = None
+        # LangGraph 워크플로우는 첫 실행 때 한 번만 컴파일해 프로세스 전체에서 재사용 (체크포인터도 공유)
+        self.checkpointer = workflow_cache.get_checkpointer()
+        if self.checkpointer is None:
             logger.warning("DATABASE_URL이 설정되지 않음 - 체크포인터 비활성화")
 
     def _build_workflow(self) -> StateGraph:
@@ -621,25 +611,8 @@ JSON 형식으로 도메인 분석 결과를 제공하세요."""),
         }
 
     def _get_llm_model(self, model_name: str):
-        """LLM 모델 인스턴스 반환"""
-        if "claude" in model_name.lower():
-            return ChatAnthropic(
-                model_name=model_name,
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.3
-            )
-        elif "gemini" in model_name.lower():
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                google_api_key=settings.GOOGLE_API_KEY,
-                temperature=0.3
-            )
-        else:
-            return ChatAnthropic(
-                model_name="claude-3-sonnet-20240229",
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.3
-            )
+        """LLM 모델 인스턴스 반환 (레지스트리의 공유 클라이언트)"""
+        return llm_client_registry.for_model_name(model_name, temperature=0.3)
 
     async def execute(self, input_data: AgentInput, model: str = "claude-sonnet", progress_callback=None) -> AgentOutput:
         """
@@ -692,13 +665,9 @@ JSON 형식으로 도메인 분석 결과를 제공하세요."""),
             
             # LangGraph 워크플로우 실행 (에러 안전 처리)
             try:
-                if self.checkpointer:
-                    app = self.workflow.compile(checkpointer=self.checkpointer)
-                    config = {"configurable": {"thread_id": f"info_gap_{input_data.user_id}_{input_data.session_id}"}}
-                    final_state = await app.ainvoke(initial_state, config=config)
-                else:
-                    app = self.workflow.compile()
-                    final_state = await app.ainvoke(initial_state)
+                app = workflow_cache.get(self.agent_id, self._build_workflow)
+                run_options = workflow_cache.run_options(f"info_gap_{input_data.user_id}_{input_data.session_id}")
+                final_state = await app.ainvoke(initial_state, **run_options)
             except Exception as workflow_error:
                 logger.error(f"❌ LangGraph Information Gap 워크플로우 실행 실패: {workflow_error}")
                 raise workflow_error  # 상위로 전파하여 fallback 처리
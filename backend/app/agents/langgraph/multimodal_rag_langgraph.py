@@ -21,38 +21,30 @@ from pathlib import Path
 
 # LangGraph 핵심 imports
 from langgraph.graph import StateGraph, END, START
-from langgraph.checkpoint.postgres import PostgresSaver
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-
-# Document processing imports
-try:
-    import pypdf
-    import docx
-    from PIL import Image
-    import pytesseract
-    DOCUMENT_PROCESSING_AVAILABLE = True
-except ImportError:
-    DOCUMENT_PROCESSING_AVAILABLE = False
-    logger.warning("Document processing libraries not available. Installing: pip install pypdf python-docx Pillow pytesseract")
 
 # Embedding and vector store imports
 try:
     from langchain_community.embeddings import HuggingFaceEmbeddings
-    from langchain_community.vectorstores import FAISS
     from langchain.text_splitter import RecursiveCharacterTextSplitter
     VECTOR_PROCESSING_AVAILABLE = True
 except ImportError:
     VECTOR_PROCESSING_AVAILABLE = False
-    logger.warning("Vector processing libraries not available. Installing: pip install langchain-community faiss-cpu")
+    logger.warning("Vector processing libraries not available. Installing: pip install langchain-community sentence-transformers")
 
 # 기존 시스템 imports
 from app.agents.base import BaseAgent, AgentInput, AgentOutput
-from app.core.config import settings
+from app.agents.workflow_cache import workflow_cache
+from app.agents.llm_client_registry import llm_client_registry
 from app.core.feature_flags import is_langgraph_enabled, LangGraphFeatureFlags
 from app.services.langgraph_monitor import langgraph_monitor
+from app.services.vector_index_service import vector_index_service
+from app.services.embedding_service import embedding_service
+from app.services.document_extraction_service import (
+    document_extraction_service,
+    DOCUMENT_PROCESSING_AVAILABLE
+)
 
 logger = logging.getLogger(__name__)
 
@@ -151,23 +143,16 @@ class LangGraphMultimodalRAGAgent(BaseAgent):
             description="LangGraph StateGraph로 구현된 고급 멀티모달 RAG 시스템"
         )
         
-        # LangGraph 워크플로우 구성
-        self.workflow = self._build_workflow()
-        
-        # PostgreSQL 체크포인터 설정
-        if settings.DATABASE_URL:
-            self.checkpointer = PostgresSaver.from_conn_string(
-                settings.DATABASE_URL,
-                
-            )
-        else:
-            self.checkpointer = None
+        # LangGraph 워크플로우는 첫 실행 때 한 번만 컴파일해 프로세스 전체에서 재사용 (체크포인터도 공유)
+        self.checkpointer = workflow_cache.get_checkpointer()
+        if self.checkpointer is None:
             logger.warning("DATABASE_URL이 설정되지 않음 - 체크포인터 비활성화")
         
-        # 문서 처리 설정
+        # 문서 처리 설정 (벡터 인덱스는 요청별 상태로만 참조 - vector_index_service)
         self.text_splitter = None
         self.embeddings_model = None
-        self.vector_store = None
+        self.embedding_model_name = embedding_service.model_name
+        self._warm_up_tasks: set = set()
         
         # 초기화
         self._initialize_components()
@@ -184,10 +169,8 @@ class LangGraphMultimodalRAGAgent(BaseAgent):
                     separators=["\n\n", "\n", " ", ""]
                 )
                 
-                # 임베딩 모델 초기화 (lightweight model)
-                self.embeddings_model = HuggingFaceEmbeddings(
-                    model_name="sentence-transformers/all-MiniLM-L6-v2"
-                )
+                # 임베딩은 워커 풀에서 배치 처리 (모델은 워커에서 최초 사용 시 로드)
+                self.embeddings_model = embedding_service
                 
                 logger.info("✅ 멀티모달 RAG 컴포넌트 초기화 완료")
             else:
@@ -395,30 +378,28 @@ class LangGraphMultimodalRAGAgent(BaseAgent):
                 if not content_item.get("success", False):
                     continue
                 
-                text = content_item.get("content", "")
-                if not text or len(text.strip()) < 10:
-                    continue
-                
-                # 텍스트 청킹
-                if self.text_splitter and VECTOR_PROCESSING_AVAILABLE:
-                    chunks = self.text_splitter.split_text(text)
+                # PDF/DOCX는 추출 단계에서 페이지별로 이미 청킹됨
+                if "chunks" in content_item:
+                    chunks = content_item["chunks"]
                 else:
-                    # 간단한 청킹 (fallback)
-                    chunk_size = 1000
-                    chunks = [text[i:i+chunk_size] for i in range(0, len(text), chunk_size)]
+                    text = content_item.get("content", "")
+                    if not text or len(text.strip()) < 10:
+                        continue
+                    chunks = [{"content": chunk} for chunk in self._split_text(text)]
                 
                 # 청크별 메타데이터 생성
                 for i, chunk in enumerate(chunks):
                     chunk_id = f"{content_item.get('doc_id', 'unknown')}_{i}"
                     processed_chunks.append({
                         "chunk_id": chunk_id,
-                        "content": chunk,
+                        "content": chunk["content"],
                         "metadata": {
                             "source_doc": content_item.get("doc_id"),
                             "chunk_index": i,
-                            "chunk_length": len(chunk),
+                            "chunk_length": len(chunk["content"]),
                             "source_type": content_item.get("type"),
-                            **content_item.get("metadata", {})
+                            **content_item.get("metadata", {}),
+                            **({"page_number": chunk["page_number"]} if chunk.get("page_number") else {})
                         },
                         "type": "text_chunk"
                     })
@@ -505,72 +486,83 @@ class LangGraphMultimodalRAGAgent(BaseAgent):
             if not processed_chunks and not text_analysis_results:
                 return {"embeddings_generated": {"status": "no_content"}}
             
-            # 모든 텍스트 콘텐츠 수집
-            texts_to_embed = []
-            metadata_list = []
+            # 문서별 청크 그룹 구성 (문서 단위로 인덱스를 만들어 다른 요청에서도 재사용)
+            document_chunks: Dict[str, List[Dict[str, Any]]] = {}
             
             # 처리된 청크에서 텍스트 수집
             for chunk in processed_chunks:
                 if chunk.get("content"):
-                    texts_to_embed.append(chunk["content"])
-                    metadata_list.append(chunk.get("metadata", {}))
+                    metadata = chunk.get("metadata", {})
+                    source_doc = str(metadata.get("source_doc") or "unknown")
+                    document_chunks.setdefault(source_doc, []).append({
+                        "content": chunk["content"],
+                        "metadata": metadata
+                    })
             
             # 이미지에서 추출된 텍스트 추가
             image_results = state.get("image_analysis_results", [])
             for img_result in image_results:
                 extracted_text = img_result.get("extracted_text", "")
                 if extracted_text and len(extracted_text.strip()) > 5:
-                    texts_to_embed.append(extracted_text)
-                    metadata_list.append({
-                        "source_type": "image_ocr",
-                        "image_id": img_result.get("image_id", "unknown")
+                    image_id = img_result.get("image_id", "unknown")
+                    document_chunks.setdefault(f"image:{image_id}", []).append({
+                        "content": extracted_text,
+                        "metadata": {
+                            "source_type": "image_ocr",
+                            "image_id": image_id
+                        }
                     })
             
-            if not texts_to_embed:
+            texts_count = sum(len(chunks) for chunks in document_chunks.values())
+            if not texts_count:
                 return {"embeddings_generated": {"status": "no_texts"}}
             
-            # 임베딩 생성 및 벡터 스토어 구축
+            document_indexes: List[str] = []
+            
+            # 임베딩 생성 및 문서 인덱스 확보 (이미 인덱싱된 문서는 임베딩 생략)
             if self.embeddings_model and VECTOR_PROCESSING_AVAILABLE:
                 try:
-                    # FAISS 벡터 스토어 생성
-                    vector_store = FAISS.from_texts(
-                        texts_to_embed,
-                        self.embeddings_model,
-                        metadatas=metadata_list
-                    )
+                    document_indexes = list(await asyncio.gather(*[
+                        vector_index_service.ensure_index(
+                            self.embedding_model_name,
+                            chunks,
+                            self.embeddings_model.embed
+                        )
+                        for chunks in document_chunks.values()
+                    ]))
                     
                     embeddings_generated = {
                         "status": "success",
-                        "embeddings_count": len(texts_to_embed),
+                        "embeddings_count": texts_count,
                         "vector_store_created": True,
-                        "embedding_model": "sentence-transformers/all-MiniLM-L6-v2"
+                        "embedding_model": self.embedding_model_name
                     }
                     
-                    # 벡터 스토어를 상태로 저장 (실제로는 메모리에 보관)
-                    self.vector_store = vector_store
-                    
                 except Exception as e:
-                    logger.error(f"벡터 스토어 생성 실패: {e}")
+                    logger.error(f"벡터 인덱스 생성 실패: {e}")
                     embeddings_generated = {
                         "status": "failed",
                         "error": str(e),
-                        "texts_count": len(texts_to_embed)
+                        "texts_count": texts_count
                     }
             else:
                 # 임베딩 모델이 없는 경우
                 embeddings_generated = {
                     "status": "no_embedding_model",
-                    "texts_count": len(texts_to_embed),
+                    "texts_count": texts_count,
                     "fallback_mode": True
                 }
             
             return {
                 "embeddings_generated": embeddings_generated,
-                "vector_store_built": {"vector_store_available": self.vector_store is not None},
+                "vector_store_built": {
+                    "vector_store_available": bool(document_indexes),
+                    "document_indexes": document_indexes
+                },
                 "execution_metadata": {
                     **state.get("execution_metadata", {}),
                     "embeddings_generation_completed_at": time.time(),
-                    "texts_embedded": len(texts_to_embed)
+                    "texts_embedded": texts_count
                 }
             }
             
@@ -587,29 +579,25 @@ class LangGraphMultimodalRAGAgent(BaseAgent):
             logger.info("🔍 LangGraph MultimodalRAG: 검색 수행 중...")
             
             query = state["original_query"]
-            embeddings_generated = state.get("embeddings_generated", {})
+            embeddings_generated = state.get("embeddings_generated") or {}
+            document_indexes = (state.get("vector_store_built") or {}).get("document_indexes", [])
             
-            if embeddings_generated.get("status") != "success" or not self.vector_store:
+            if embeddings_generated.get("status") != "success" or not document_indexes:
                 # 벡터 검색이 불가능한 경우 키워드 기반 검색
                 return await self._perform_keyword_search(state)
             
-            # 의미적 검색 수행
+            # 의미적 검색 수행 (이번 요청의 문서 인덱스만 대상)
             try:
-                # 유사도 검색 (top_k=5)
-                search_results = self.vector_store.similarity_search_with_score(
-                    query=query,
+                query_vector = await self.embeddings_model.embed_query(query)
+                
+                # 유사도 검색 (top_k=5, 코사인 유사도)
+                similarity_search_results = await vector_index_service.search(
+                    self.embedding_model_name,
+                    query_vector,
+                    document_indexes,
                     k=min(5, embeddings_generated.get("embeddings_count", 1))
                 )
                 
-                similarity_search_results = []
-                for doc, score in search_results:
-                    similarity_search_results.append({
-                        "content": doc.page_content,
-                        "metadata": doc.metadata,
-                        "similarity_score": float(score),
-                        "relevance_score": max(0, 1 - score)  # 거리를 관련성으로 변환
-                    })
-                
                 # 관련 컨텍스트 구성
                 relevant_context = {
                     "search_method": "semantic_similarity",
@@ -896,25 +884,8 @@ JSON 형식으로 분석 결과를 제공하세요."""),
             return "text_only"
 
     def _get_llm_model(self, model_name: str):
-        """LLM 모델 인스턴스 반환"""
-        if "claude" in model_name.lower():
-            return ChatAnthropic(
-                model_name=model_name,
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.1
-            )
-        elif "gemini" in model_name.lower():
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                google_api_key=settings.GOOGLE_API_KEY,
-                temperature=0.1
-            )
-        else:
-            return ChatAnthropic(
-                model_name="claude-3-sonnet-20240229",
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.1
-            )
+        """LLM 모델 인스턴스 반환 (레지스트리의 공유 클라이언트)"""
+        return llm_client_registry.for_model_name(model_name, temperature=0.1)
 
     def _detect_document_type(self, document: Dict[str, Any]) -> DocumentType:
         """문서 유형 감지"""
@@ -973,29 +944,33 @@ JSON 형식으로 분석 결과를 제공하세요."""),
                     "success": True,
                     "content": "",  # 이미지 자체는 여기서 텍스트로 변환하지 않음
                     "type": "image",
-                    "metadata": {"requires_ocr": True},
+                    "metadata": {"requires_ocr": True, "checksum": document.get("checksum")},
                     "image_data": document.get("content")
                 }
             
-            elif doc_type == DocumentType.PDF:
+            elif doc_type in (DocumentType.PDF, DocumentType.DOCX):
+                source = self._binary_source(document)
+                if source is None:
+                    # 이미 텍스트로 변환된 내용이 전달된 경우
+                    content = str(document.get("content", ""))
+                    return {
+                        "doc_id": doc_id,
+                        "success": True,
+                        "content": content,
+                        "type": doc_type.value,
+                        "metadata": {"extraction_method": "text_only"}
+                    }
+                
                 if not DOCUMENT_PROCESSING_AVAILABLE:
                     return {
                         "doc_id": doc_id,
                         "success": False,
-                        "error": "PDF processing not available",
+                        "error": f"{doc_type.value.upper()} processing not available",
                         "content": "",
-                        "type": "pdf"
+                        "type": doc_type.value
                     }
                 
-                # PDF 텍스트 추출 (간단한 구현)
-                content = document.get("content", "")
-                return {
-                    "doc_id": doc_id,
-                    "success": True,
-                    "content": content,  # 실제로는 pypdf 사용
-                    "type": "pdf",
-                    "metadata": {"extraction_method": "text_only"}
-                }
+                return await self._extract_and_chunk_document(doc_id, doc_type, source, document.get("checksum"))
             
             else:
                 # 기타 문서 유형은 텍스트로 처리
@@ -1017,15 +992,93 @@ JSON 형식으로 분석 결과를 제공하세요."""),
                 "type": doc_type.value
             }
 
+    def _split_text(self, text: str) -> List[str]:
+        """텍스트 청킹"""
+        if self.text_splitter and VECTOR_PROCESSING_AVAILABLE:
+            return self.text_splitter.split_text(text)
+        # 간단한 청킹 (fallback)
+        chunk_size = 1000
+        return [text[i:i+chunk_size] for i in range(0, len(text), chunk_size)]
+
+    @staticmethod
+    def _binary_source(document: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """추출 대상 파일 (경로, 바이트 또는 base64 문자열) - 일반 텍스트면 None"""
+        file_path = document.get("file_path") or document.get("upload_path")
+        if file_path:
+            return {"file_path": file_path}
+        
+        content = document.get("content")
+        if isinstance(content, bytes):
+            return {"content": content}
+        if isinstance(content, str) and content:
+            try:
+                base64.b64decode(content, validate=True)
+                return {"content": content}
+            except (ValueError, TypeError):
+                return None
+        return None
+
+    async def _extract_and_chunk_document(
+        self,
+        doc_id: str,
+        doc_type: DocumentType,
+        source: Dict[str, Any],
+        checksum: Optional[str]
+    ) -> Dict[str, Any]:
+        """PDF/DOCX를 페이지 단위로 스트리밍 추출하면서 바로 청킹하고 임베딩을 미리 시작"""
+        chunks: List[Dict[str, Any]] = []
+        sections = 0
+        total_chars = 0
+        
+        async for section in document_extraction_service.iter_sections(
+            doc_type.value, checksum=checksum, **source
+        ):
+            sections += 1
+            total_chars += len(section.text)
+            section_chunks = self._split_text(section.text)
+            chunks.extend({"content": chunk, "page_number": section.page_number} for chunk in section_chunks)
+            
+            # 나머지 페이지를 추출하는 동안 임베딩 캐시를 미리 채움 (임베딩 노드에서 재사용)
+            if self.embeddings_model and section_chunks:
+                self._warm_up_embeddings(section_chunks)
+        
+        return {
+            "doc_id": doc_id,
+            "success": True,
+            "content": "",  # 전체 텍스트 대신 청크만 상태에 보관
+            "chunks": chunks,
+            "type": doc_type.value,
+            "metadata": {
+                "extraction_method": "streaming_pages" if doc_type == DocumentType.PDF else "docx_sections",
+                "sections": sections,
+                "original_length": total_chars
+            }
+        }
+
+    def _warm_up_embeddings(self, texts: List[str]) -> None:
+        task = asyncio.create_task(self.embeddings_model.embed(texts))
+        self._warm_up_tasks.add(task)
+        
+        def _done(finished: asyncio.Task) -> None:
+            self._warm_up_tasks.discard(finished)
+            if not finished.cancelled() and finished.exception():
+                logger.warning(f"임베딩 사전 계산 실패: {finished.exception()}")
+        
+        task.add_done_callback(_done)
+
     async def _process_single_image(self, image_content: Dict[str, Any]) -> Dict[str, Any]:
         """단일 이미지 처리 (OCR 등)"""
         image_id = image_content.get("doc_id", "unknown")
         
         try:
             # OCR이 가능한 경우에만 텍스트 추출 시도
-            if DOCUMENT_PROCESSING_AVAILABLE:
-                # 실제 구현에서는 pytesseract 사용
-                extracted_text = "이미지에서 추출된 텍스트 (OCR 미구현)"
+            image_data = image_content.get("image_data")
+            if DOCUMENT_PROCESSING_AVAILABLE and image_data:
+                extracted_text = await document_extraction_service.extract_text(
+                    "image",
+                    content=image_data,
+                    checksum=image_content.get("metadata", {}).get("checksum")
+                )
             else:
                 extracted_text = ""
             
@@ -1151,13 +1204,9 @@ JSON 형식으로 분석 결과를 제공하세요."""),
             
             # LangGraph 워크플로우 실행 (에러 안전 처리)
             try:
-                if self.checkpointer:
-                    app = self.workflow.compile(checkpointer=self.checkpointer)
-                    config = {"configurable": {"thread_id": f"multimodal_rag_{input_data.user_id}_{input_data.session_id}"}}
-                    final_state = await app.ainvoke(initial_state, config=config)
-                else:
-                    app = self.workflow.compile()
-                    final_state = await app.ainvoke(initial_state)
+                app = workflow_cache.get(self.agent_id, self._build_workflow)
+                run_options = workflow_cache.run_options(f"multimodal_rag_{input_data.user_id}_{input_data.session_id}")
+                final_state = await app.ainvoke(initial_state, **run_options)
             except Exception as workflow_error:
                 logger.error(f"❌ LangGraph Multimodal RAG 워크플로우 실행 실패: {workflow_error}")
                 raise workflow_error  # 상위로 전파하여 fallback 처리
@@ -1262,7 +1311,7 @@ JSON 형식으로 분석 결과를 제공하세요."""),
         return [
             "다중 문서 형식 처리 (PDF, DOCX, 이미지, 텍스트)",
             "OCR 기반 이미지 텍스트 추출",
-            "의미적 유사도 검색 (FAISS 벡터 스토어)",
+            "의미적 유사도 검색 (영속 문서 벡터 인덱스)",
             "멀티모달 상관관계 분석",
             "RAG 기반 답변 생성",
             "실시간 품질 평가",
@@ -20,16 +20,14 @@ import functools
 
 # LangGraph 핵심 imports
 from langgraph.graph import StateGraph, END, START
-from langgraph.checkpoint.postgres import PostgresSaver
 from langgraph.types import Send
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 # 기존 시스템 imports
 from app.agents.base import BaseAgent, AgentInput, AgentOutput
-from app.core.config import settings
+from app.agents.workflow_cache import workflow_cache
+from app.agents.llm_client_registry import llm_client_registry
 from app.core.feature_flags import is_langgraph_enabled, LangGraphFeatureFlags
 from app.services.langgraph_monitor import langgraph_monitor
 from app.services.search_service import search_service
@@ -124,17 +122,9 @@ class LangGraphParallelProcessor(BaseAgent):
             description="LangGraph StateGraph로 구현된 고성능 병렬 처리 에이전트"
         )
         
-        # LangGraph 워크플로우 구성
-        self.workflow = self._build_workflow()
-        
-        # PostgreSQL 체크포인터 설정
-        if settings.DATABASE_URL:
-            self.checkpointer = PostgresSaver.from_conn_string(
-                settings.DATABASE_URL,
-                
-            )
-        else:
-            self.checkpointer = None
+        # LangGraph 워크플로우는 첫 실행 때 한 번만 컴파일해 프로세스 전체에서 재사용 (체크포인터도 공유)
+        self.checkpointer = workflow_cache.get_checkpointer()
+        if self.checkpointer is None:
             logger.warning("DATABASE_URL이 설정되지 않음 - 체크포인터 비활성화")
         
         # 병렬 처리 설정
@@ -607,25 +597,8 @@ JSON 형식으로 상세한 병렬 처리 계획을 제공하세요."""),
         return "continue"
 
     def _get_llm_model(self, model_name: str):
-        """LLM 모델 인스턴스 반환"""
-        if "claude" in model_name.lower():
-            return ChatAnthropic(
-                model_name=model_name,
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.3
-            )
-        elif "gemini" in model_name.lower():
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                google_api_key=settings.GOOGLE_API_KEY,
-                temperature=0.3
-            )
-        else:
-            return ChatAnthropic(
-                model_name="claude-3-sonnet-20240229",
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.3
-            )
+        """LLM 모델 인스턴스 반환 (레지스트리의 공유 클라이언트)"""
+        return llm_client_registry.for_model_name(model_name, temperature=0.3)
 
     async def _execute_single_search_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """단일 검색 작업 실행"""
@@ -966,13 +939,9 @@ JSON 형식으로 상세한 병렬 처리 계획을 제공하세요."""),
             
             # LangGraph 워크플로우 실행 (에러 안전 처리)
             try:
-                if self.checkpointer:
-                    app = self.workflow.compile(checkpointer=self.checkpointer)
-                    config = {"configurable": {"thread_id": f"parallel_{input_data.user_id}_{input_data.session_id}"}}
-                    final_state = await app.ainvoke(initial_state, config=config)
-                else:
-                    app = self.workflow.compile()
-                    final_state = await app.ainvoke(initial_state)
+                app = workflow_cache.get(self.agent_id, self._build_workflow)
+                run_options = workflow_cache.run_options(f"parallel_{input_data.user_id}_{input_data.session_id}")
+                final_state = await app.ainvoke(initial_state, **run_options)
             except Exception as workflow_error:
                 logger.error(f"❌ LangGraph 병렬 처리 워크플로우 실행 실패: {workflow_error}")
                 raise workflow_error  # 상위로 전파하여 fallback 처리
@@ -1065,6 +1034,15 @@ JSON 형식으로 상세한 병렬 처리 계획을 제공하세요."""),
                 error=f"LangGraph 병렬 처리 error: {str(e)}"
             )
 
+    async def execute(
+        self,
+        input_data: AgentInput,
+        model: str = "claude-sonnet",
+        progress_callback=None
+    ) -> AgentOutput:
+        """BaseAgent 실행 인터페이스 (병렬 처리 시스템 실행)"""
+        return await self.execute_parallel_processing(input_data, model, progress_callback)
+
     def get_capabilities(self) -> List[str]:
         """에이전트 기능 목록"""
         return [
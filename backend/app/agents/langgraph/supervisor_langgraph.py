@@ -18,21 +18,20 @@ import operator
 
 # LangGraph 핵심 imports
 from langgraph.graph import StateGraph, END, START
-from langgraph.checkpoint.postgres import PostgresSaver
 from langgraph.types import Send
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 # 기존 시스템 imports
 from app.agents.base import BaseAgent, AgentInput, AgentOutput, ConversationContext
-from app.agents.supervisor import supervisor_agent, IntentType
 from app.agents.routing.intent_classifier import dynamic_intent_classifier
 from app.agents.langgraph.web_search_langgraph import langgraph_web_search_agent
 from app.agents.langgraph.canvas_langgraph import langgraph_canvas_agent
 from app.agents.langgraph.information_gap_langgraph import langgraph_information_gap_analyzer
 from app.agents.langgraph.parallel_processor import langgraph_parallel_processor
+from app.agents.workflow_cache import workflow_cache
+from app.agents.speculative_executor import speculative_executor
+from app.agents.llm_client_registry import llm_client_registry
 from app.core.config import settings
 from app.core.feature_flags import is_langgraph_enabled, LangGraphFeatureFlags
 from app.services.langgraph_monitor import langgraph_monitor
@@ -40,6 +39,11 @@ from app.services.langgraph_monitor import langgraph_monitor
 logger = logging.getLogger(__name__)
 
 
+def merge_metadata(left: Optional[Dict[str, Any]], right: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """병렬 노드가 같은 단계에서 함께 기록하는 실행 메타데이터 병합"""
+    return {**(left or {}), **(right or {})}
+
+
 class SupervisorState(TypedDict):
     """LangGraph Supervisor 상태 정의"""
     # 입력 데이터
@@ -68,7 +72,7 @@ class SupervisorState(TypedDict):
     final_output: Optional[str]
     
     # 성능 및 품질 메트릭
-    execution_metadata: Dict[str, Any]
+    execution_metadata: Annotated[Dict[str, Any], merge_metadata]
     quality_metrics: Dict[str, Any]
     routing_confidence: float
     
@@ -76,6 +80,9 @@ class SupervisorState(TypedDict):
     errors: Annotated[List[str], operator.add]
     fallback_attempts: Annotated[List[Dict[str, Any]], operator.add]
     should_fallback: bool
+    
+    # 추측 실행 ID (없으면 추측 실행 안 함)
+    speculation_id: Optional[str]
 
 
 class AgentType(Enum):
@@ -118,9 +125,6 @@ class LangGraphSupervisorAgent(BaseAgent):
             description="LangGraph StateGraph로 구현된 고급 워크플로우 관리 시스템"
         )
         
-        # 레거시 Supervisor (fallback용)
-        self.legacy_supervisor = supervisor_agent
-        
         # Worker 에이전트 등록
         self.worker_agents = {
             AgentType.WEB_SEARCH: langgraph_web_search_agent,
@@ -130,21 +134,25 @@ class LangGraphSupervisorAgent(BaseAgent):
             # AgentType.MULTIMODAL_RAG: langgraph_multimodal_rag,  # 추후 구현
         }
         
-        # LangGraph 워크플로우 구성
-        self.workflow = self._build_workflow()
-        
-        # PostgreSQL 체크포인터 설정
-        if settings.DATABASE_URL:
-            self.checkpointer = PostgresSaver.from_conn_string(
-                settings.DATABASE_URL,
-                
-            )
-        else:
-            self.checkpointer = None
+        # LangGraph 워크플로우는 첫 실행 때 한 번만 컴파일해 프로세스 전체에서 재사용 (체크포인터도 공유)
+        self.checkpointer = workflow_cache.get_checkpointer()
+        if self.checkpointer is None:
             logger.warning("DATABASE_URL이 설정되지 않음 - 체크포인터 비활성화")
 
-    def _build_workflow(self) -> StateGraph:
-        """LangGraph Supervisor 워크플로우 구성"""
+    @property
+    def legacy_supervisor(self):
+        """레거시 Supervisor (fallback용, 처음 fallback할 때 로드)"""
+        from app.agents.supervisor import supervisor_agent
+        
+        return supervisor_agent
+
+    def _build_workflow(self, speculative: bool = True) -> StateGraph:
+        """
+        LangGraph Supervisor 워크플로우 구성
+
+        speculative=True면 서로 독립적인 의도 분석과 컨텍스트 평가를 병렬로 실행하고
+        복잡도 평가에서 합류합니다. (유력 에이전트 추측 실행은 의도 분석 노드에서 시작)
+        """
         
         # StateGraph 생성
         workflow = StateGraph(SupervisorState)
@@ -159,11 +167,35 @@ class LangGraphSupervisorAgent(BaseAgent):
         workflow.add_node("integrate_results", self._integrate_results_node)
         workflow.add_node("finalize_response", self._finalize_response_node)
         
-        # 엣지 정의 - 선형 파이프라인
-        workflow.set_entry_point("analyze_intent")
-        workflow.add_edge("analyze_intent", "evaluate_context")
-        workflow.add_edge("evaluate_context", "assess_complexity")
-        workflow.add_edge("assess_complexity", "plan_routing_strategy")
+        if speculative:
+            # 엣지 정의 - 분석 단계 병렬 실행 후 합류
+            workflow.add_edge(START, "analyze_intent")
+            workflow.add_edge(START, "evaluate_context")
+            workflow.add_edge(["analyze_intent", "evaluate_context"], "assess_complexity")
+            workflow.add_conditional_edges(
+                "assess_complexity",
+                self._should_continue,
+                {
+                    "continue": "plan_routing_strategy",
+                    "fallback": END
+                }
+            )
+        else:
+            # 엣지 정의 - 선형 파이프라인
+            workflow.set_entry_point("analyze_intent")
+            workflow.add_edge("analyze_intent", "evaluate_context")
+            workflow.add_edge("evaluate_context", "assess_complexity")
+            workflow.add_edge("assess_complexity", "plan_routing_strategy")
+            
+            workflow.add_conditional_edges(
+                "analyze_intent",
+                self._should_continue,
+                {
+                    "continue": "evaluate_context",
+                    "fallback": END
+                }
+            )
+        
         workflow.add_edge("plan_routing_strategy", "select_agents")
         workflow.add_edge("select_agents", "execute_agents")
         workflow.add_edge("execute_agents", "integrate_results")
@@ -171,15 +203,6 @@ class LangGraphSupervisorAgent(BaseAgent):
         workflow.add_edge("finalize_response", END)
         
         # 조건부 엣지 (복잡한 라우팅 로직)
-        workflow.add_conditional_edges(
-            "analyze_intent",
-            self._should_continue,
-            {
-                "continue": "evaluate_context",
-                "fallback": END
-            }
-        )
-        
         workflow.add_conditional_edges(
             "plan_routing_strategy",
             self._determine_execution_mode,
@@ -250,6 +273,8 @@ class LangGraphSupervisorAgent(BaseAgent):
                     "confidence": 0.7
                 }
             
+            self._start_speculative_agent(state, intent_analysis)
+            
             return {
                 "intent_analysis": intent_analysis,
                 "routing_confidence": intent_analysis.get("confidence", 0.7),
@@ -273,7 +298,8 @@ class LangGraphSupervisorAgent(BaseAgent):
             
             model = self._get_llm_model(state["model"])
             context = state.get("conversation_context", {})
-            intent_analysis = state.get("intent_analysis", {})
+            # 병렬 실행 시에는 의도 분석 결과 없이 대화 맥락만으로 평가
+            intent_analysis = state.get("intent_analysis") or {}
             
             context_prompt = ChatPromptTemplate.from_messages([
                 ("system", """대화 맥락 평가 전문가로서 다음을 종합 분석하세요:
@@ -296,7 +322,7 @@ JSON 형식으로 종합 평가 결과를 제공하세요."""),
             
             response = await model.ainvoke(context_prompt.format_messages(
                 query=state["original_query"],
-                intent_analysis=json.dumps(intent_analysis, ensure_ascii=False, indent=2),
+                intent_analysis=json.dumps(intent_analysis, ensure_ascii=False, indent=2) if intent_analysis else "없음",
                 context=json.dumps(context, ensure_ascii=False, indent=2) if context else "없음"
             ))
             
@@ -329,6 +355,10 @@ JSON 형식으로 종합 평가 결과를 제공하세요."""),
 
     async def _assess_complexity_node(self, state: SupervisorState) -> Dict[str, Any]:
         """복잡도 평가 노드 - 작업 복잡도 및 리소스 요구사항 분석"""
+        if state.get("should_fallback", False):
+            # 병렬 분석에서 의도 분석이 실패하면 LLM 호출 없이 바로 fallback 경로로
+            return {}
+        
         try:
             logger.info("🧠 LangGraph Supervisor: 복잡도 평가 중...")
             
@@ -537,17 +567,27 @@ JSON 형식으로 상세한 라우팅 전략을 제공하세요."""),
             agent_results = []
             execution_mode = execution_plan.get("mode", "single_agent")
             
+            # 미리 실행한 에이전트가 확정된 주 에이전트와 같으면 그 결과를 사용 (다르면 취소됨)
+            speculative_task = speculative_executor.claim(
+                state.get("speculation_id"), selected_agents[0].get("agent_type", "general_chat")
+            )
+            
+            def run_agent(index: int, agent_config: Dict[str, Any]):
+                if index == 0 and speculative_task is not None:
+                    return speculative_task
+                return self._execute_single_agent(agent_config, state)
+            
             # 실행 모드별 처리
             if execution_mode == "single_agent":
                 # 단일 에이전트 실행
                 primary_agent = selected_agents[0]
-                result = await self._execute_single_agent(primary_agent, state)
+                result = await run_agent(0, primary_agent)
                 agent_results.append(result)
                 
             elif execution_mode == "sequential":
                 # 순차 실행
-                for agent_config in selected_agents:
-                    result = await self._execute_single_agent(agent_config, state)
+                for i, agent_config in enumerate(selected_agents):
+                    result = await run_agent(i, agent_config)
                     agent_results.append(result)
                     
                     # 실패 시 다음 에이전트로 fallback 가능
@@ -557,8 +597,8 @@ JSON 형식으로 상세한 라우팅 전략을 제공하세요."""),
             elif execution_mode == "parallel":
                 # 병렬 실행
                 tasks = []
-                for agent_config in selected_agents:
-                    task = self._execute_single_agent(agent_config, state)
+                for i, agent_config in enumerate(selected_agents):
+                    task = run_agent(i, agent_config)
                     tasks.append(task)
                 
                 results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -579,7 +619,8 @@ JSON 형식으로 상세한 라우팅 전략을 제공하세요."""),
                 "execution_metadata": {
                     **state.get("execution_metadata", {}),
                     "agents_execution_completed_at": time.time(),
-                    "executed_agents_count": len(agent_results)
+                    "executed_agents_count": len(agent_results),
+                    "speculative_hit": speculative_task is not None
                 }
             }
             
@@ -745,25 +786,8 @@ JSON 형식으로 상세한 라우팅 전략을 제공하세요."""),
         return "continue"
 
     def _get_llm_model(self, model_name: str):
-        """LLM 모델 인스턴스 반환"""
-        if "claude" in model_name.lower():
-            return ChatAnthropic(
-                model_name=model_name,
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.2
-            )
-        elif "gemini" in model_name.lower():
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                google_api_key=settings.GOOGLE_API_KEY,
-                temperature=0.2
-            )
-        else:
-            return ChatAnthropic(
-                model_name="claude-3-sonnet-20240229",
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.2
-            )
+        """LLM 모델 인스턴스 반환 (레지스트리의 공유 클라이언트)"""
+        return llm_client_registry.for_model_name(model_name, temperature=0.2)
 
     def _map_intent_to_agent(self, intent: str) -> str:
         """의도를 에이전트 타입으로 매핑"""
@@ -777,6 +801,31 @@ JSON 형식으로 상세한 라우팅 전략을 제공하세요."""),
         }
         return intent_mapping.get(intent, "general_chat")
 
+    def _start_speculative_agent(self, state: SupervisorState, intent_analysis: Dict[str, Any]) -> None:
+        """의도 분석 결과로 가장 유력한 Worker 에이전트를 라우팅 확정 전에 미리 실행"""
+        speculation_id = state.get("speculation_id")
+        if not speculation_id:
+            return
+        
+        confidence = intent_analysis.get("confidence", 0.7)
+        if not isinstance(confidence, (int, float)) or confidence < settings.SUPERVISOR_SPECULATION_MIN_CONFIDENCE:
+            return
+        
+        agent_type = self._map_intent_to_agent(intent_analysis.get("primary_intent", "general_chat"))
+        try:
+            if AgentType(agent_type) not in self.worker_agents:
+                return
+        except ValueError:
+            return
+        
+        # Worker 입력은 요청 원본 값뿐이므로 이후 분석 단계 결과와 무관하게 같은 결과
+        speculative_executor.start(
+            speculation_id,
+            agent_type,
+            lambda: self._execute_single_agent({"agent_type": agent_type}, state)
+        )
+        logger.info(f"⚡ LangGraph Supervisor: {agent_type} 에이전트 추측 실행 시작")
+
     async def _execute_single_agent(self, agent_config: Dict[str, Any], state: SupervisorState) -> Dict[str, Any]:
         """단일 에이전트 실행"""
         start_time = time.time()
@@ -833,6 +882,56 @@ JSON 형식으로 상세한 라우팅 전략을 제공하세요."""),
                 "execution_time": execution_time
             }
 
+    def _get_compiled_workflow(self, speculative: bool):
+        if speculative:
+            return workflow_cache.get(self.agent_id, self._build_workflow, variant="speculative")
+        return workflow_cache.get(self.agent_id, lambda: self._build_workflow(speculative=False), variant="sequential")
+
+    def _build_initial_state(
+        self,
+        input_data: AgentInput,
+        model: str,
+        start_time: float,
+        speculative: bool
+    ) -> SupervisorState:
+        """요청 입력으로 워크플로우 초기 상태 구성"""
+        # 대화 컨텍스트 준비
+        conversation_context = {}
+        if input_data.conversation_context:
+            conversation_context = {
+                "current_focus_topic": input_data.conversation_context.current_focus_topic,
+                "interaction_count": input_data.conversation_context.interaction_count,
+                "user_preferences": input_data.conversation_context.user_preferences or {},
+                "previous_messages": input_data.conversation_context.previous_messages or []
+            }
+        elif input_data.context:
+            conversation_context = input_data.context.get('conversation_context', {})
+        
+        return SupervisorState(
+            original_query=input_data.query,
+            user_id=input_data.user_id,
+            session_id=input_data.session_id,
+            conversation_context=conversation_context,
+            model=model,
+            intent_analysis=None,
+            context_evaluation=None,
+            complexity_assessment=None,
+            routing_strategy=None,
+            selected_agents=None,
+            execution_plan=None,
+            agent_results=[],
+            parallel_results=None,
+            integrated_response=None,
+            final_output=None,
+            execution_metadata={"start_time": start_time},
+            quality_metrics={},
+            routing_confidence=0.0,
+            errors=[],
+            fallback_attempts=[],
+            should_fallback=False,
+            speculation_id=str(uuid.uuid4()) if speculative else None
+        )
+
     async def execute(self, input_data: AgentInput, model: str = "claude-sonnet", progress_callback=None) -> AgentOutput:
         """
         LangGraph Supervisor Agent 실행
@@ -857,55 +956,20 @@ JSON 형식으로 상세한 라우팅 전략을 제공하세요."""),
             except Exception as monitoring_error:
                 logger.warning(f"⚠️ 모니터링 시작 실패 (무시됨): {monitoring_error}")
             
-            # 대화 컨텍스트 준비
-            conversation_context = {}
-            if input_data.conversation_context:
-                conversation_context = {
-                    "current_focus_topic": input_data.conversation_context.current_focus_topic,
-                    "interaction_count": input_data.conversation_context.interaction_count,
-                    "user_preferences": input_data.conversation_context.user_preferences or {},
-                    "previous_messages": input_data.conversation_context.previous_messages or []
-                }
-            elif input_data.context:
-                conversation_context = input_data.context.get('conversation_context', {})
-            
-            # 초기 상태 설정
-            initial_state = SupervisorState(
-                original_query=input_data.query,
-                user_id=input_data.user_id,
-                session_id=input_data.session_id,
-                conversation_context=conversation_context,
-                model=model,
-                intent_analysis=None,
-                context_evaluation=None,
-                complexity_assessment=None,
-                routing_strategy=None,
-                selected_agents=None,
-                execution_plan=None,
-                agent_results=[],
-                parallel_results=None,
-                integrated_response=None,
-                final_output=None,
-                execution_metadata={"start_time": start_time},
-                quality_metrics={},
-                routing_confidence=0.0,
-                errors=[],
-                fallback_attempts=[],
-                should_fallback=False
-            )
+            speculative = settings.SUPERVISOR_SPECULATIVE_EXECUTION
+            initial_state = self._build_initial_state(input_data, model, start_time, speculative)
             
             # LangGraph 워크플로우 실행 (에러 안전 처리)
             try:
-                if self.checkpointer:
-                    app = self.workflow.compile(checkpointer=self.checkpointer)
-                    config = {"configurable": {"thread_id": f"supervisor_{input_data.user_id}_{input_data.session_id}"}}
-                    final_state = await app.ainvoke(initial_state, config=config)
-                else:
-                    app = self.workflow.compile()
-                    final_state = await app.ainvoke(initial_state)
+                app = self._get_compiled_workflow(speculative)
+                run_options = workflow_cache.run_options(f"supervisor_{input_data.user_id}_{input_data.session_id}")
+                final_state = await app.ainvoke(initial_state, **run_options)
             except Exception as workflow_error:
                 logger.error(f"❌ LangGraph Supervisor 워크플로우 실행 실패: {workflow_error}")
                 raise workflow_error  # 상위로 전파하여 fallback 처리
+            finally:
+                # 실행 단계까지 가지 못하고 끝난 경우 남은 추측 작업 취소
+                speculative_executor.cancel(initial_state["speculation_id"])
             
             # 결과 처리
             execution_time_ms = int((time.time() - start_time) * 1000)
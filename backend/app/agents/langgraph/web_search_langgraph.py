@@ -14,18 +14,16 @@ import logging
 
 # LangGraph 핵심 imports
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.postgres import PostgresSaver
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 # 기존 시스템 imports
-from app.agents.base import BaseAgent, AgentInput, AgentOutput
+from app.agents.base import BaseAgent, AgentInput, AgentOutput, AgentStreamEvent
 from app.agents.workers.web_search import WebSearchAgent, SearchQuery, EnhancedSearchResult
 from app.services.search_service import search_service
 from app.services.web_crawler import web_crawler
-from app.core.config import settings
+from app.agents.workflow_cache import workflow_cache
+from app.agents.llm_client_registry import llm_client_registry
 from app.core.feature_flags import is_langgraph_enabled, LangGraphFeatureFlags
 from app.services.langgraph_monitor import langgraph_monitor
 
@@ -76,17 +74,9 @@ class LangGraphWebSearchAgent(BaseAgent):
         # 레거시 에이전트 (fallback용)
         self.legacy_agent = WebSearchAgent()
         
-        # LangGraph 워크플로우 구성
-        self.workflow = self._build_workflow()
-        
-        # PostgreSQL 체크포인터 설정 (상태 영속성)
-        if settings.DATABASE_URL:
-            self.checkpointer = PostgresSaver.from_conn_string(
-                settings.DATABASE_URL,
-                
-            )
-        else:
-            self.checkpointer = None
+        # LangGraph 워크플로우는 첫 실행 때 한 번만 컴파일해 프로세스 전체에서 재사용 (체크포인터도 공유)
+        self.checkpointer = workflow_cache.get_checkpointer()
+        if self.checkpointer is None:
             logger.warning("DATABASE_URL이 설정되지 않음 - 체크포인터 비활성화")
 
     def _build_workflow(self) -> StateGraph:
@@ -312,8 +302,6 @@ JSON 형식으로 분석 결과를 제공하세요.""")
             
             # 핵심 정보 추출
             key_info = []
-            citations = []
-            sources = []
             
             for i, result in enumerate(state["raw_content"][:8]):  # 상위 8개 결과
                 key_info.append({
@@ -322,20 +310,8 @@ JSON 형식으로 분석 결과를 제공하세요.""")
                     "url": result.get("url", ""),
                     "index": i + 1
                 })
-                
-                citations.append({
-                    "id": i + 1,
-                    "title": result.get("title", ""),
-                    "url": result.get("url", ""),
-                    "snippet": result.get("snippet", "")[:150]
-                })
-                
-                sources.append({
-                    "title": result.get("title", ""),
-                    "url": result.get("url", ""),
-                    "domain": result.get("domain", ""),
-                    "published_date": result.get("published_date")
-                })
+            
+            citations, sources = self._build_citations(state["raw_content"])
             
             synthesis_prompt = ChatPromptTemplate.from_messages([
                 ("system", """검색 결과를 종합하여 사용자 질문에 대한 정확하고 포괄적인 답변을 작성하세요.
@@ -405,6 +381,28 @@ JSON 형식으로 분석 결과를 제공하세요.""")
                 "final_response": "응답 생성 중 오류가 발생했습니다."
             }
 
+    def _build_citations(self, raw_content: List[Dict[str, Any]]) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """상위 검색 결과로 citations와 sources 구성"""
+        citations = []
+        sources = []
+        
+        for i, result in enumerate(raw_content[:8]):  # 상위 8개 결과
+            citations.append({
+                "id": i + 1,
+                "title": result.get("title", ""),
+                "url": result.get("url", ""),
+                "snippet": result.get("snippet", "")[:150]
+            })
+            
+            sources.append({
+                "title": result.get("title", ""),
+                "url": result.get("url", ""),
+                "domain": result.get("domain", ""),
+                "published_date": result.get("published_date")
+            })
+        
+        return citations, sources
+
     def _should_continue(self, state: WebSearchState) -> str:
         """조건부 라우팅 함수"""
         if state.get("should_fallback", False) or len(state.get("errors", [])) > 2:
@@ -412,26 +410,42 @@ JSON 형식으로 분석 결과를 제공하세요.""")
         return "continue"
 
     def _get_llm_model(self, model_name: str):
-        """LLM 모델 인스턴스 반환"""
-        if "claude" in model_name.lower():
-            return ChatAnthropic(
-                model_name=model_name,
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.3
-            )
-        elif "gemini" in model_name.lower():
-            return ChatGoogleGenerativeAI(
-                model=model_name,
-                google_api_key=settings.GOOGLE_API_KEY,
-                temperature=0.3
-            )
-        else:
-            # 기본값: Claude
-            return ChatAnthropic(
-                model_name="claude-3-sonnet-20240229",
-                anthropic_api_key=settings.ANTHROPIC_API_KEY,
-                temperature=0.3
+        """LLM 모델 인스턴스 반환 (레지스트리의 공유 클라이언트)"""
+        return llm_client_registry.for_model_name(model_name, temperature=0.3)
+
+    def _build_initial_state(self, input_data: AgentInput, model: str, start_time: float) -> WebSearchState:
+        """워크플로우 초기 상태 생성"""
+        return WebSearchState(
+            original_query=input_data.query,
+            user_id=input_data.user_id,
+            session_id=input_data.session_id,
+            model=model,
+            search_plan=None,
+            search_queries=[],
+            search_results=[],
+            raw_content=[],
+            relevance_analysis=None,
+            synthesized_answer=None,
+            final_response=None,
+            execution_metadata={"start_time": start_time},
+            citations=[],
+            sources=[],
+            errors=[],
+            should_fallback=False
+        )
+
+    @staticmethod
+    def _message_chunk_text(message_chunk: Any) -> str:
+        """LLM 메시지 청크에서 텍스트만 추출 (content가 블록 리스트인 모델 포함)"""
+        content = getattr(message_chunk, "content", "")
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list):
+            return "".join(
+                block.get("text", "") if isinstance(block, dict) else str(block)
+                for block in content
             )
+        return ""
 
     async def execute(self, input_data: AgentInput, model: str = "claude-sonnet", progress_callback=None) -> AgentOutput:
         """
@@ -455,38 +469,14 @@ JSON 형식으로 분석 결과를 제공하세요.""")
             await langgraph_monitor.start_execution("langgraph_web_search")
             
             # 초기 상태 설정
-            initial_state = WebSearchState(
-                original_query=input_data.query,
-                user_id=input_data.user_id,
-                session_id=input_data.session_id,
-                model=model,
-                search_plan=None,
-                search_queries=[],
-                search_results=[],
-                raw_content=[],
-                relevance_analysis=None,
-                synthesized_answer=None,
-                final_response=None,
-                execution_metadata={"start_time": start_time},
-                citations=[],
-                sources=[],
-                errors=[],
-                should_fallback=False
-            )
+            initial_state = self._build_initial_state(input_data, model, start_time)
             
             # LangGraph 워크플로우 실행
             try:
-                if self.checkpointer:
-                    # 체크포인터 사용 (상태 영속성)
-                    logger.info("🔧 LangGraph 워크플로우 컴파일 중 (with checkpointer)...")
-                    app = self.workflow.compile(checkpointer=self.checkpointer)
-                    config = {"configurable": {"thread_id": f"{input_data.user_id}_{input_data.session_id}"}}
-                    final_state = await app.ainvoke(initial_state, config=config)
-                else:
-                    # 체크포인터 없이 실행
-                    logger.info("🔧 LangGraph 워크플로우 컴파일 중 (without checkpointer)...")
-                    app = self.workflow.compile()
-                    final_state = await app.ainvoke(initial_state)
+                # 체크포인터가 있으면 thread_id로 상태 영속성 유지
+                app = workflow_cache.get(self.agent_id, self._build_workflow)
+                run_options = workflow_cache.run_options(f"{input_data.user_id}_{input_data.session_id}")
+                final_state = await app.ainvoke(initial_state, **run_options)
                 
                 logger.info("✅ LangGraph 워크플로우 실행 성공")
                 
@@ -589,6 +579,121 @@ JSON 형식으로 분석 결과를 제공하세요.""")
             logger.info("🔄 예외 발생 - Legacy WebSearchAgent로 fallback")
             return await self.legacy_agent.execute(input_data, model, progress_callback)
 
+    async def execute_stream(self, input_data: AgentInput, model: str = "claude-sonnet", progress_callback=None):
+        """
+        LangGraph 웹 검색 에이전트 스트리밍 실행
+        답변 종합 노드의 LLM 토큰을 생성되는 즉시 전달하며, 실패 시 Legacy 스트리밍으로 fallback
+        """
+        start_time = time.time()
+        
+        # Feature Flag 확인
+        if not is_langgraph_enabled(
+            LangGraphFeatureFlags.LANGGRAPH_WEB_SEARCH, 
+            input_data.user_id
+        ):
+            logger.info("🔄 Feature Flag: Legacy WebSearchAgent 스트리밍 사용")
+            async for event in self.legacy_agent.execute_stream(input_data, model, progress_callback):
+                yield event
+            return
+        
+        logger.info(f"🚀 LangGraph WebSearchAgent 스트리밍 실행 시작 (사용자: {input_data.user_id})")
+        
+        final_state: Optional[Dict[str, Any]] = None
+        streamed_chunks: List[str] = []
+        citations_sent = False
+        
+        try:
+            await langgraph_monitor.start_execution("langgraph_web_search")
+            
+            initial_state = self._build_initial_state(input_data, model, start_time)
+            app = workflow_cache.get(self.agent_id, self._build_workflow)
+            run_options = workflow_cache.run_options(f"{input_data.user_id}_{input_data.session_id}")
+            
+            # values: 단계별 전체 상태, messages: 노드 내부 LLM 토큰
+            async for mode, payload in app.astream(
+                initial_state,
+                stream_mode=["values", "messages"],
+                **run_options
+            ):
+                if mode == "values":
+                    final_state = payload
+                    # 관련성 분석까지 끝나면 인용 정보가 확정되므로 답변 토큰보다 먼저 전달
+                    if not citations_sent and payload.get("relevance_analysis") is not None:
+                        citations, sources = self._build_citations(payload.get("raw_content", []))
+                        if citations:
+                            yield AgentStreamEvent(type="citations", citations=citations, sources=sources)
+                        citations_sent = True
+                    continue
+                
+                message_chunk, chunk_metadata = payload
+                if chunk_metadata.get("langgraph_node") != "synthesize_answer":
+                    continue
+                text = self._message_chunk_text(message_chunk)
+                if text:
+                    streamed_chunks.append(text)
+                    yield AgentStreamEvent(type="token", text=text)
+                    
+        except Exception as e:
+            logger.error(f"❌ LangGraph WebSearchAgent 스트리밍 실패: {e}")
+            final_state = None
+        
+        failed = (
+            final_state is None
+            or final_state.get("should_fallback", False)
+            or len(final_state.get("errors", [])) > 0
+        )
+        
+        # 아직 토큰을 보내지 않았다면 Legacy 스트리밍으로 안전하게 전환
+        if failed and not streamed_chunks:
+            langgraph_monitor.record_fallback("langgraph_web_search", "streaming workflow failed")
+            logger.info("🔄 LangGraph 스트리밍 실패 - Legacy WebSearchAgent 스트리밍으로 fallback")
+            async for event in self.legacy_agent.execute_stream(input_data, model, progress_callback):
+                yield event
+            return
+        
+        final_state = final_state or {}
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        final_response = "".join(streamed_chunks) or final_state.get("final_response") or "검색 결과를 생성할 수 없습니다."
+        
+        if not streamed_chunks:
+            # 모델이 토큰 스트리밍을 지원하지 않는 경우 완성된 답변을 한 번에 전달
+            yield AgentStreamEvent(type="token", text=final_response)
+        
+        try:
+            from app.services.langgraph_monitor import AgentType, ExecutionStatus
+            await langgraph_monitor.track_execution(
+                agent_type=AgentType.LANGGRAPH,
+                agent_name="langgraph_web_search",
+                execution_time=execution_time_ms / 1000,
+                status=ExecutionStatus.SUCCESS,
+                query=input_data.query,
+                response_length=len(final_response),
+                user_id=input_data.user_id
+            )
+        except Exception as monitor_error:
+            logger.warning(f"모니터링 기록 실패: {monitor_error}")
+        
+        output = AgentOutput(
+            result=final_response,
+            metadata={
+                "agent_version": "langgraph",
+                "search_queries_count": len(final_state.get("search_queries", [])),
+                "results_count": len(final_state.get("raw_content", [])),
+                "langgraph_execution": True,
+                "streamed": True,
+                **final_state.get("execution_metadata", {})
+            },
+            execution_time_ms=execution_time_ms,
+            agent_id=self.agent_id,
+            model_used=model,
+            timestamp=datetime.utcnow().isoformat(),
+            citations=final_state.get("citations", []),
+            sources=final_state.get("sources", [])
+        )
+        
+        logger.info(f"✅ LangGraph WebSearchAgent 스트리밍 완료 ({execution_time_ms}ms)")
+        yield AgentStreamEvent(type="result", output=output)
+
     def get_capabilities(self) -> List[str]:
         """에이전트 기능 목록"""
         return [
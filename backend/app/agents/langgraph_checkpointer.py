@@ -0,0 +1,442 @@
+"""
+LangGraph 비동기 체크포인터 (앱 asyncpg 연결 풀 공유)
+- 동기 PostgresSaver(요청마다 별도 연결, 단계마다 블로킹 쓰기) 대신 앱의 비동기 엔진으로 저장
+- 노드 단계마다 생기는 체크포인트/중간 쓰기를 메모리에 모았다가 한 트랜잭션으로 일괄 기록
+- 읽기 전에는 그 스레드의 쌓인 쓰기를 먼저 기록하므로 같은 스레드의 다음 실행은 항상 최신 상태를 봄
+- 이 프로세스에서 기록한 적 없는 스레드는 조회하지 않음 (실행마다 새 스레드면 읽기 왕복 없음)
+- TTL이 지난 스레드는 백그라운드에서 정리
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_metadata,
+)
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.db.models.langgraph_checkpoint import LangGraphCheckpoint, LangGraphCheckpointWrite
+from app.db.session import AsyncSessionLocal
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CheckpointKey = Tuple[str, str, str]
+WriteKey = Tuple[str, str, str, str, int]
+
+
+class SQLCheckpointStore:
+    """체크포인트 테이블 접근 (모든 호출이 앱 공용 AsyncSession 풀에서 연결을 빌림)"""
+
+    async def write_batch(self, checkpoints: List[Dict[str, Any]], writes: List[Dict[str, Any]]) -> None:
+        """체크포인트와 중간 쓰기를 한 트랜잭션으로 기록"""
+        async with AsyncSessionLocal() as session:
+            if checkpoints:
+                stmt = pg_insert(LangGraphCheckpoint.__table__).values(checkpoints)
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["thread_id", "checkpoint_ns", "checkpoint_id"],
+                        set_={
+                            "checkpoint_type": stmt.excluded.checkpoint_type,
+                            "checkpoint": stmt.excluded.checkpoint,
+                            "metadata_type": stmt.excluded.metadata_type,
+                            "metadata": stmt.excluded["metadata"],
+                        }
+                    )
+                )
+
+            # 일반 쓰기는 처음 기록만 유지, 특수 채널(idx < 0)은 덮어쓰기
+            regular = [w for w in writes if w["idx"] >= 0]
+            special = [w for w in writes if w["idx"] < 0]
+            keys = ["thread_id", "checkpoint_ns", "checkpoint_id", "task_id", "idx"]
+            if regular:
+                await session.execute(
+                    pg_insert(LangGraphCheckpointWrite.__table__).values(regular).on_conflict_do_nothing(index_elements=keys)
+                )
+            if special:
+                stmt = pg_insert(LangGraphCheckpointWrite.__table__).values(special)
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=keys,
+                        set_={
+                            "channel": stmt.excluded.channel,
+                            "value_type": stmt.excluded.value_type,
+                            "value": stmt.excluded.value,
+                        }
+                    )
+                )
+            await session.commit()
+
+    async def fetch_checkpoints(
+        self,
+        thread_id: str,
+        checkpoint_ns: Optional[str] = None,
+        checkpoint_id: Optional[str] = None,
+        before_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """체크포인트 조회 (최신순, checkpoint_id는 시간순 정렬되는 uuid6)"""
+        conditions = [LangGraphCheckpoint.thread_id == thread_id]
+        if checkpoint_ns is not None:
+            conditions.append(LangGraphCheckpoint.checkpoint_ns == checkpoint_ns)
+        if checkpoint_id:
+            conditions.append(LangGraphCheckpoint.checkpoint_id == checkpoint_id)
+        if before_id:
+            conditions.append(LangGraphCheckpoint.checkpoint_id < before_id)
+
+        query = select(LangGraphCheckpoint.__table__).where(and_(*conditions)).order_by(
+            LangGraphCheckpoint.checkpoint_id.desc()
+        )
+        if limit:
+            query = query.limit(limit)
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(query)
+            return [dict(row) for row in result.mappings()]
+
+    async def fetch_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> List[Dict[str, Any]]:
+        query = select(LangGraphCheckpointWrite.__table__).where(
+            LangGraphCheckpointWrite.thread_id == thread_id,
+            LangGraphCheckpointWrite.checkpoint_ns == checkpoint_ns,
+            LangGraphCheckpointWrite.checkpoint_id == checkpoint_id,
+        ).order_by(LangGraphCheckpointWrite.task_id, LangGraphCheckpointWrite.idx)
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(query)
+            return [dict(row) for row in result.mappings()]
+
+    async def delete_thread(self, thread_id: str) -> None:
+        async with AsyncSessionLocal() as session:
+            await session.execute(delete(LangGraphCheckpointWrite).where(LangGraphCheckpointWrite.thread_id == thread_id))
+            await session.execute(delete(LangGraphCheckpoint).where(LangGraphCheckpoint.thread_id == thread_id))
+            await session.commit()
+
+    async def prune(self, cutoff: datetime) -> int:
+        """마지막 체크포인트가 cutoff 이전인 스레드 삭제, 삭제한 스레드 수 반환"""
+        stale = (
+            select(LangGraphCheckpoint.thread_id)
+            .group_by(LangGraphCheckpoint.thread_id)
+            .having(func.max(LangGraphCheckpoint.created_at) < cutoff)
+        )
+        async with AsyncSessionLocal() as session:
+            thread_ids = [row[0] for row in (await session.execute(stale)).all()]
+            if thread_ids:
+                await session.execute(
+                    delete(LangGraphCheckpointWrite).where(LangGraphCheckpointWrite.thread_id.in_(thread_ids))
+                )
+                await session.execute(
+                    delete(LangGraphCheckpoint).where(LangGraphCheckpoint.thread_id.in_(thread_ids))
+                )
+                await session.commit()
+            return len(thread_ids)
+
+
+class AsyncPooledCheckpointer(BaseCheckpointSaver):
+    """
+    쓰기 일괄 처리 비동기 체크포인터
+
+    aput/aput_writes는 메모리 버퍼에만 넣고 바로 반환하며, 버퍼는 flush_interval_ms 후 또는
+    batch_size에 도달하면 한 번에 기록됩니다. 프로세스가 비정상 종료되면 마지막 flush 이후의
+    중간 상태는 잃을 수 있습니다 (실행 재개보다 지연 시간을 우선하는 요청/응답형 그래프 용도).
+    동기 API(get_tuple/put 등)는 지원하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        store: Optional[Any] = None,
+        *,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+        ttl_hours: Optional[float] = None,
+        prune_interval_seconds: Optional[int] = None,
+        serde: Optional[Any] = None
+    ):
+        super().__init__(serde=serde)
+        self.store = store or SQLCheckpointStore()
+        self.batch_size = batch_size or settings.LANGGRAPH_CHECKPOINT_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval_ms if flush_interval_ms is not None else settings.LANGGRAPH_CHECKPOINT_FLUSH_MS
+        ) / 1000
+        self.ttl_hours = ttl_hours if ttl_hours is not None else settings.LANGGRAPH_CHECKPOINT_TTL_HOURS
+        self.prune_interval = prune_interval_seconds or settings.LANGGRAPH_CHECKPOINT_PRUNE_INTERVAL_SECONDS
+
+        self._pending_checkpoints: Dict[CheckpointKey, Dict[str, Any]] = {}
+        self._pending_writes: Dict[WriteKey, Dict[str, Any]] = {}
+        # 이 프로세스에서 체크포인트를 기록한 스레드와 마지막 기록 시각
+        self._written_threads: Dict[str, datetime] = {}
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._prune_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "checkpoints": 0,
+            "writes": 0,
+            "flushes": 0,
+            "flushed_rows": 0,
+            "read_flushes": 0,
+            "reads": 0,
+            "skipped_reads": 0,
+            "flush_errors": 0,
+            "flush_ms": 0.0,
+            "pruned_threads": 0,
+        }
+
+    # ===== 쓰기 =====
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_type, checkpoint_bytes = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_bytes = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+
+        now = datetime.utcnow()
+        self._written_threads[thread_id] = now
+        self._pending_checkpoints[(thread_id, checkpoint_ns, checkpoint["id"])] = {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint["id"],
+            "parent_checkpoint_id": configurable.get("checkpoint_id"),
+            "checkpoint_type": checkpoint_type,
+            "checkpoint": checkpoint_bytes,
+            "metadata_type": metadata_type,
+            "metadata": metadata_bytes,
+            "created_at": now,
+        }
+        self.stats["checkpoints"] += 1
+        await self._schedule_flush()
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = ""
+    ) -> None:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable["checkpoint_id"]
+
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            key = (thread_id, checkpoint_ns, checkpoint_id, task_id, write_idx)
+            if write_idx >= 0 and key in self._pending_writes:
+                continue
+            value_type, value_bytes = self.serde.dumps_typed(value)
+            self._pending_writes[key] = {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+                "task_id": task_id,
+                "idx": write_idx,
+                "channel": channel,
+                "value_type": value_type,
+                "value": value_bytes,
+                "task_path": task_path,
+                "created_at": datetime.utcnow(),
+            }
+            self.stats["writes"] += 1
+        await self._schedule_flush()
+
+    async def _schedule_flush(self) -> None:
+        self._ensure_prune_task()
+        if len(self._pending_checkpoints) + len(self._pending_writes) >= self.batch_size:
+            # 버퍼가 가득 차면 호출자가 기록을 기다림 (메모리 상한 겸 배압)
+            await self.aflush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self.aflush()
+        except Exception as e:
+            logger.error(f"❌ LangGraph 체크포인트 일괄 기록 실패: {e}")
+
+    async def aflush(self) -> None:
+        """버퍼에 쌓인 체크포인트/중간 쓰기를 한 트랜잭션으로 기록"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if not self._pending_checkpoints and not self._pending_writes:
+                return
+            checkpoints, self._pending_checkpoints = self._pending_checkpoints, {}
+            writes, self._pending_writes = self._pending_writes, {}
+
+            started = time.perf_counter()
+            try:
+                await self.store.write_batch(list(checkpoints.values()), list(writes.values()))
+            except Exception:
+                # 실패한 행은 버퍼로 되돌려 다음 flush에서 재시도 (그 사이 들어온 행이 우선)
+                self._pending_checkpoints = {**checkpoints, **self._pending_checkpoints}
+                self._pending_writes = {**writes, **self._pending_writes}
+                self.stats["flush_errors"] += 1
+                raise
+            self.stats["flushes"] += 1
+            self.stats["flushed_rows"] += len(checkpoints) + len(writes)
+            self.stats["flush_ms"] += (time.perf_counter() - started) * 1000
+
+    # ===== 읽기 =====
+
+    async def _prepare_read(self, thread_id: str) -> bool:
+        """조회 전 준비 - 기록한 적 없는 스레드면 False (조회 생략), 버퍼에 그 스레드 행이 있으면 먼저 기록"""
+        if thread_id not in self._written_threads:
+            self.stats["skipped_reads"] += 1
+            return False
+        if any(key[0] == thread_id for key in self._pending_checkpoints) or any(
+            key[0] == thread_id for key in self._pending_writes
+        ):
+            self.stats["read_flushes"] += 1
+            await self.aflush()
+        self.stats["reads"] += 1
+        return True
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        configurable = config["configurable"]
+        if not await self._prepare_read(configurable["thread_id"]):
+            return None
+        rows = await self.store.fetch_checkpoints(
+            configurable["thread_id"],
+            configurable.get("checkpoint_ns", ""),
+            checkpoint_id=configurable.get("checkpoint_id"),
+            limit=1
+        )
+        if not rows:
+            return None
+        return await self._to_tuple(rows[0])
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        if config is None:
+            # 전체 스레드 조회는 대상이 아님 (스레드 단위 요청/응답 그래프 전용)
+            return
+        configurable = config["configurable"]
+        if not await self._prepare_read(configurable["thread_id"]):
+            return
+        rows = await self.store.fetch_checkpoints(
+            configurable["thread_id"],
+            configurable.get("checkpoint_ns"),
+            checkpoint_id=configurable.get("checkpoint_id"),
+            before_id=before["configurable"].get("checkpoint_id") if before else None,
+            limit=None if filter else limit
+        )
+        returned = 0
+        for row in rows:
+            checkpoint_tuple = await self._to_tuple(row)
+            if filter and not all(checkpoint_tuple.metadata.get(k) == v for k, v in filter.items()):
+                continue
+            yield checkpoint_tuple
+            returned += 1
+            if limit is not None and returned >= limit:
+                break
+
+    async def _to_tuple(self, row: Dict[str, Any]) -> CheckpointTuple:
+        writes = await self.store.fetch_writes(row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"])
+        parent_config = None
+        if row["parent_checkpoint_id"]:
+            parent_config = {
+                "configurable": {
+                    "thread_id": row["thread_id"],
+                    "checkpoint_ns": row["checkpoint_ns"],
+                    "checkpoint_id": row["parent_checkpoint_id"],
+                }
+            }
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": row["thread_id"],
+                    "checkpoint_ns": row["checkpoint_ns"],
+                    "checkpoint_id": row["checkpoint_id"],
+                }
+            },
+            checkpoint=self.serde.loads_typed((row["checkpoint_type"], row["checkpoint"])),
+            metadata=self.serde.loads_typed((row["metadata_type"], row["metadata"])),
+            parent_config=parent_config,
+            pending_writes=[
+                (write["task_id"], write["channel"], self.serde.loads_typed((write["value_type"], write["value"])))
+                for write in writes
+            ],
+        )
+
+    # ===== 정리 =====
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        self._pending_checkpoints = {k: v for k, v in self._pending_checkpoints.items() if k[0] != thread_id}
+        self._pending_writes = {k: v for k, v in self._pending_writes.items() if k[0] != thread_id}
+        self._written_threads.pop(thread_id, None)
+        await self.store.delete_thread(thread_id)
+
+    async def aprune(self) -> int:
+        """TTL이 지난 스레드 삭제"""
+        await self.aflush()
+        cutoff = datetime.utcnow() - timedelta(hours=self.ttl_hours)
+        pruned = await self.store.prune(cutoff)
+        self._written_threads = {
+            thread_id: written_at for thread_id, written_at in self._written_threads.items() if written_at >= cutoff
+        }
+        self.stats["pruned_threads"] += pruned
+        if pruned:
+            logger.info(f"🧹 LangGraph 체크포인트 정리: 스레드 {pruned}개 ({self.ttl_hours}시간 경과)")
+        return pruned
+
+    def _ensure_prune_task(self) -> None:
+        if self.ttl_hours <= 0:
+            return
+        if self._prune_task is None or self._prune_task.done():
+            self._prune_task = asyncio.create_task(self._prune_loop())
+
+    async def _prune_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.prune_interval)
+            try:
+                await self.aprune()
+            except Exception as e:
+                logger.warning(f"LangGraph 체크포인트 정리 실패: {e}")
+
+    async def aclose(self) -> None:
+        """정리 작업 중단 후 남은 버퍼 기록"""
+        for task in (self._prune_task, self._flush_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._prune_task = self._flush_task = None
+        await self.aflush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "flush_ms": round(self.stats["flush_ms"], 1),
+            "pending_checkpoints": len(self._pending_checkpoints),
+            "pending_writes": len(self._pending_writes),
+            "written_threads": len(self._written_threads),
+            "batch_size": self.batch_size,
+            "flush_interval_ms": int(self.flush_interval * 1000),
+            "ttl_hours": self.ttl_hours,
+        }
@@ -0,0 +1,259 @@
+"""
+LLM 클라이언트 레지스트리
+- (제공자, 모델, 생성 파라미터)별로 클라이언트를 한 번만 만들어 프로세스 전체에서 공유
+- 공유 클라이언트는 내부 HTTP 연결 풀을 계속 재사용하므로 병렬 작업마다 클라이언트/연결을 새로 만들지 않음
+- 제공자별 동시 호출 수 제한과 호출 성공/실패 기반 상태(health) 추적
+"""
+
+import asyncio
+import json
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ANTHROPIC = "anthropic"
+GOOGLE = "google"
+BEDROCK = "bedrock"
+
+DEFAULT_ANTHROPIC_MODEL = "claude-3-sonnet-20240229"
+
+
+def provider_for_model(model_name: str) -> Tuple[str, str]:
+    """LangGraph 에이전트의 모델 이름을 (제공자, 모델 ID)로 변환 (알 수 없는 이름은 기본 Claude)"""
+    lowered = model_name.lower()
+    if "claude" in lowered:
+        return ANTHROPIC, model_name
+    if "gemini" in lowered:
+        return GOOGLE, model_name
+    return ANTHROPIC, DEFAULT_ANTHROPIC_MODEL
+
+
+@dataclass
+class ClientHealth:
+    """클라이언트 호출 상태 (연속 실패가 기준을 넘으면 일정 시간 비정상으로 표시)"""
+    calls: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_error: Optional[str] = None
+    last_latency_ms: float = 0.0
+    unhealthy_until: float = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return time.time() >= self.unhealthy_until
+
+    def record_success(self, latency_ms: float) -> None:
+        self.calls += 1
+        self.consecutive_failures = 0
+        self.last_latency_ms = latency_ms
+        self.unhealthy_until = 0.0
+
+    def record_failure(self, error: Exception, latency_ms: float) -> None:
+        self.calls += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = str(error)[:200]
+        self.last_latency_ms = latency_ms
+        if self.consecutive_failures >= settings.LLM_CLIENT_UNHEALTHY_AFTER_FAILURES:
+            self.unhealthy_until = time.time() + settings.LLM_CLIENT_UNHEALTHY_COOLDOWN_SECONDS
+
+
+class PooledLLMClient:
+    """
+    공유 LangChain 채팅 모델 래퍼
+
+    ainvoke/astream은 제공자별 세마포어로 동시 호출 수를 제한하고 상태를 기록합니다.
+    그 밖의 속성/메서드는 원래 모델로 그대로 위임합니다.
+    """
+
+    def __init__(self, provider: str, model: str, client: Any, registry: "LLMClientRegistry"):
+        self.provider = provider
+        self.model = model
+        self.client = client
+        self.health = ClientHealth()
+        self._registry = registry
+
+    @property
+    def healthy(self) -> bool:
+        return self.health.healthy
+
+    async def ainvoke(self, *args, **kwargs) -> Any:
+        async with self._registry.limiter(self.provider):
+            started = time.perf_counter()
+            try:
+                result = await self.client.ainvoke(*args, **kwargs)
+            except Exception as e:
+                self.health.record_failure(e, (time.perf_counter() - started) * 1000)
+                raise
+            self.health.record_success((time.perf_counter() - started) * 1000)
+            return result
+
+    async def astream(self, *args, **kwargs) -> AsyncIterator[Any]:
+        async with self._registry.limiter(self.provider):
+            started = time.perf_counter()
+            try:
+                async for chunk in self.client.astream(*args, **kwargs):
+                    yield chunk
+            except Exception as e:
+                self.health.record_failure(e, (time.perf_counter() - started) * 1000)
+                raise
+            self.health.record_success((time.perf_counter() - started) * 1000)
+
+    def invoke(self, *args, **kwargs) -> Any:
+        started = time.perf_counter()
+        try:
+            result = self.client.invoke(*args, **kwargs)
+        except Exception as e:
+            self.health.record_failure(e, (time.perf_counter() - started) * 1000)
+            raise
+        self.health.record_success((time.perf_counter() - started) * 1000)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.client, name)
+
+
+ClientFactory = Callable[[str, Dict[str, Any]], Any]
+
+
+class LLMClientRegistry:
+    """프로세스 전역 LLM 클라이언트 레지스트리"""
+
+    def __init__(self, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency or settings.LLM_PROVIDER_MAX_CONCURRENCY
+        self._clients: Dict[Tuple[str, str, str], PooledLLMClient] = {}
+        self._factories: Dict[str, ClientFactory] = {
+            ANTHROPIC: self._create_anthropic,
+            GOOGLE: self._create_google,
+            BEDROCK: self._create_bedrock,
+        }
+        self._lock = threading.Lock()
+        # 세마포어는 이벤트 루프에 묶이므로 루프별로 따로 보관
+        self._limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._bedrock_runtime = None
+        self._bedrock_transport = None
+        self.stats = {"created": 0, "reused": 0}
+
+    def get(self, provider: str, model: str, **params) -> PooledLLMClient:
+        """(제공자, 모델, 파라미터)에 해당하는 공유 클라이언트 반환 (없으면 생성)"""
+        key = (provider, model, json.dumps(params, sort_keys=True, default=str))
+        client = self._clients.get(key)
+        if client is not None:
+            self.stats["reused"] += 1
+            return client
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                factory = self._factories.get(provider)
+                if factory is None:
+                    raise ValueError(f"지원하지 않는 LLM 제공자: {provider}")
+                client = PooledLLMClient(provider, model, factory(model, params), self)
+                self._clients[key] = client
+                self.stats["created"] += 1
+                logger.debug(f"LLM 클라이언트 생성: {provider}/{model} {params}")
+            else:
+                self.stats["reused"] += 1
+        return client
+
+    def for_model_name(self, model_name: str, **params) -> PooledLLMClient:
+        """LangGraph 에이전트용 모델 이름으로 공유 클라이언트 조회"""
+        provider, model = provider_for_model(model_name)
+        return self.get(provider, model, **params)
+
+    def register_factory(self, provider: str, factory: ClientFactory) -> None:
+        self._factories[provider] = factory
+
+    def limiter(self, provider: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        limiters = self._limiters.get(loop)
+        if limiters is None:
+            limiters = self._limiters[loop] = {}
+        semaphore = limiters.get(provider)
+        if semaphore is None:
+            semaphore = limiters[provider] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients.clear()
+            self._bedrock_runtime = None
+
+    async def close(self) -> None:
+        """공유 연결 풀 종료"""
+        if self._bedrock_transport is not None:
+            await self._bedrock_transport.close()
+            self._bedrock_transport = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "max_concurrency_per_provider": self.max_concurrency,
+            "bedrock_transport": self._bedrock_transport.get_stats() if self._bedrock_transport else None,
+            "clients": [
+                {
+                    "provider": client.provider,
+                    "model": client.model,
+                    "params": json.loads(key[2]),
+                    "healthy": client.healthy,
+                    "calls": client.health.calls,
+                    "failures": client.health.failures,
+                    "consecutive_failures": client.health.consecutive_failures,
+                    "last_latency_ms": round(client.health.last_latency_ms, 1),
+                    "last_error": client.health.last_error,
+                }
+                for key, client in list(self._clients.items())
+            ],
+        }
+
+    # ===== 제공자별 생성 =====
+
+    @staticmethod
+    def _create_anthropic(model: str, params: Dict[str, Any]) -> Any:
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(model_name=model, anthropic_api_key=settings.ANTHROPIC_API_KEY, **params)
+
+    @staticmethod
+    def _create_google(model: str, params: Dict[str, Any]) -> Any:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(model=model, google_api_key=settings.GOOGLE_API_KEY, **params)
+
+    def _create_bedrock(self, model: str, params: Dict[str, Any]) -> Any:
+        if settings.BEDROCK_ASYNC_TRANSPORT_ENABLED:
+            from app.agents.bedrock_transport import BedrockAsyncTransport, ChatBedrockAsync
+
+            # 모든 Bedrock 모델이 서명 httpx 연결 풀 하나를 공유
+            if self._bedrock_transport is None:
+                self._bedrock_transport = BedrockAsyncTransport(max_connections=self.max_concurrency)
+            return ChatBedrockAsync(model_id=model, model_kwargs=dict(params), transport=self._bedrock_transport)
+
+        from langchain_aws import ChatBedrock
+
+        if self._bedrock_runtime is None:
+            import boto3
+            from botocore.config import Config
+
+            # 모든 Bedrock 모델이 연결 풀을 가진 boto3 클라이언트 하나를 공유
+            self._bedrock_runtime = boto3.client(
+                service_name="bedrock-runtime",
+                region_name=settings.AWS_REGION,
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                config=Config(max_pool_connections=self.max_concurrency),
+            )
+        return ChatBedrock(client=self._bedrock_runtime, model_id=model, model_kwargs=dict(params))
+
+
+# 전역 LLM 클라이언트 레지스트리 인스턴스
+llm_client_registry = LLMClientRegistry()
@@ -2,98 +2,155 @@
 LLM 모델 라우터
 """
 
-from typing import Optional, Dict, Any, AsyncGenerator, List
-from langchain_aws import ChatBedrock
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.language_models import BaseLanguageModel
-import boto3
+from typing import Optional, Dict, Any, AsyncGenerator, List, Tuple
+from collections import OrderedDict
 from datetime import datetime
+import hashlib
+import json
+import re
+import time
 
 from app.core.config import settings
 from app.agents.mock_llm import mock_llm
+from app.agents.llm_client_registry import BEDROCK, GOOGLE, PooledLLMClient, llm_client_registry
 from app.services.logging_service import logging_service, log_llm_usage
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def _estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (한국어 1글자 ≈ 1.5토큰, 영문 4글자 ≈ 1토큰)"""
+    non_ascii = sum(1 for c in text if ord(c) > 127)
+    return int(non_ascii * 1.5 + (len(text) - non_ascii) * 0.25)
+
+
+def is_degraded_model(model_used: str) -> bool:
+    """Mock 또는 fallback 응답 여부 (캐시/저장하면 실제 모델 응답 대신 재사용됨)"""
+    return model_used.startswith("mock") or "fallback" in model_used
+
+
+class LLMResponseCache:
+    """
+    결정적 유틸리티 프롬프트용 응답 캐시
+    - 키: (모델, 정규화된 프롬프트, 생성 파라미터, 날짜 컨텍스트 사용 시 날짜)
+    - TTL 만료 + 최대 항목 수 초과 시 LRU 제거
+    - 호출 지점(call site)별 히트율 및 절약 토큰 집계
+    """
+    
+    _WHITESPACE = re.compile(r"\s+")
+    
+    def __init__(self, max_entries: int = 5000, default_ttl_seconds: int = 3600):
+        self.max_entries = max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[str, str, float]]" = OrderedDict()  # key -> (응답, 모델, 만료 시각)
+        self._stats: Dict[str, Dict[str, int]] = {}
+    
+    def make_key(
+        self,
+        model_name: str,
+        prompt: str,
+        include_datetime: bool,
+        params: Dict[str, Any]
+    ) -> str:
+        # 날짜/시간 컨텍스트는 분 단위로 바뀌므로 원본 프롬프트로 키를 만들고 날짜만 반영
+        date_bucket = None
+        if include_datetime:
+            from app.utils.timezone import now_kst
+            date_bucket = now_kst().strftime('%Y-%m-%d')
+        
+        normalized_prompt = self._WHITESPACE.sub(" ", prompt).strip()
+        raw_key = json.dumps(
+            [model_name, normalized_prompt, date_bucket, sorted(params.items())],
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+    
+    def _site_stats(self, call_site: str) -> Dict[str, int]:
+        return self._stats.setdefault(call_site, {"hits": 0, "misses": 0, "tokens_saved": 0})
+    
+    def get(self, key: str, call_site: str) -> Optional[Tuple[str, str]]:
+        entry = self._entries.get(key)
+        stats = self._site_stats(call_site)
+        
+        if entry is None or entry[2] <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            stats["misses"] += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        stats["hits"] += 1
+        return entry[0], entry[1]
+    
+    def set(self, key: str, response: str, model_used: str, ttl_seconds: Optional[int] = None) -> None:
+        ttl = ttl_seconds or self.default_ttl_seconds
+        self._entries[key] = (response, model_used, time.time() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def record_saving(self, call_site: str, prompt: str, response: str) -> None:
+        self._site_stats(call_site)["tokens_saved"] += _estimate_tokens(prompt) + _estimate_tokens(response)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        call_sites = {}
+        for call_site, stats in self._stats.items():
+            lookups = stats["hits"] + stats["misses"]
+            call_sites[call_site] = {**stats, "hit_rate": stats["hits"] / lookups if lookups else 0.0}
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "call_sites": call_sites,
+            "total_tokens_saved": sum(stats["tokens_saved"] for stats in self._stats.values())
+        }
+
+
 class LLMRouter:
     """LLM 모델 라우터 클래스"""
     
     def __init__(self):
-        self._models: Dict[str, BaseLanguageModel] = {}
+        self._models: Dict[str, PooledLLMClient] = {}
+        self.response_cache = LLMResponseCache(
+            max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+            default_ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL_SECONDS
+        )
         self._initialize_models()
     
     def _initialize_models(self):
-        """사용 가능한 모델들을 초기화"""
+        """사용 가능한 모델들을 초기화 (클라이언트는 LLM 클라이언트 레지스트리에서 공유)"""
         try:
             # AWS Bedrock Claude 모델 초기화
             if settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
                 try:
-                    # Bedrock 클라이언트 생성
-                    bedrock_client = boto3.client(
-                        service_name="bedrock-runtime",
-                        region_name=settings.AWS_REGION,
-                        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                    )
+                    sonnet_kwargs = {"temperature": 0.7, "max_tokens": 4096, "top_p": 0.9}
                     
                     # Claude Sonnet 4.0 (최신 모델) - inference profile 사용
-                    self._models["claude-4"] = ChatBedrock(
-                        client=bedrock_client,
-                        model_id="us.anthropic.claude-sonnet-4-20250514-v1:0",
-                        model_kwargs={
-                            "temperature": 0.7,
-                            "max_tokens": 4096,
-                            "top_p": 0.9,
-                        }
+                    self._models["claude-4"] = llm_client_registry.get(
+                        BEDROCK, "us.anthropic.claude-sonnet-4-20250514-v1:0", **sonnet_kwargs
                     )
-                    logger.debug("AWS Bedrock Claude 4.0 Sonnet 모델 초기화 완료")
+                    logger.debug("AWS Bedrock Claude Sonnet 4.0 모델 초기화 완료")
                     
                     # Claude 3.7 Sonnet - inference profile 사용
-                    self._models["claude-3.7"] = ChatBedrock(
-                        client=bedrock_client,
-                        model_id="us.anthropic.claude-3-7-sonnet-20250219-v1:0",
-                        model_kwargs={
-                            "temperature": 0.7,
-                            "max_tokens": 4096,
-                            "top_p": 0.9,
-                        }
+                    self._models["claude-3.7"] = llm_client_registry.get(
+                        BEDROCK, "us.anthropic.claude-3-7-sonnet-20250219-v1:0", **sonnet_kwargs
                     )
                     logger.debug("AWS Bedrock Claude 3.7 Sonnet 모델 초기화 완료")
                     
-                    # Claude 3.5 Sonnet (기본 모델)
-                    self._models["claude"] = ChatBedrock(
-                        client=bedrock_client,
-                        model_id="anthropic.claude-3-5-sonnet-20240620-v1:0",
-                        model_kwargs={
-                            "temperature": 0.7,
-                            "max_tokens": 4096,
-                            "top_p": 0.9,
-                        }
+                    # Claude 3.5 Sonnet (기본 모델, claude-3.5 별칭도 같은 클라이언트 사용)
+                    self._models["claude"] = llm_client_registry.get(
+                        BEDROCK, "anthropic.claude-3-5-sonnet-20240620-v1:0", **sonnet_kwargs
                     )
+                    self._models["claude-3.5"] = self._models["claude"]
                     logger.debug("AWS Bedrock Claude 3.5 Sonnet 모델 초기화 완료")
                     
-                    # Claude 3.5 Sonnet (별칭 - 명시적 버전)
-                    self._models["claude-3.5"] = ChatBedrock(
-                        client=bedrock_client,
-                        model_id="anthropic.claude-3-5-sonnet-20240620-v1:0",
-                        model_kwargs={
-                            "temperature": 0.7,
-                            "max_tokens": 4096,
-                            "top_p": 0.9,
-                        }
-                    )
-                    logger.debug("AWS Bedrock Claude 3.5 Sonnet (별칭) 모델 초기화 완료")
-                    
                     # Claude 3.5 Haiku (빠른 응답용)
-                    self._models["claude-haiku"] = ChatBedrock(
-                        client=bedrock_client,
-                        model_id="anthropic.claude-3-haiku-20240307-v1:0",
-                        model_kwargs={
-                            "temperature": 0.7,
-                            "max_tokens": 4096,
-                        }
+                    self._models["claude-haiku"] = llm_client_registry.get(
+                        BEDROCK, "anthropic.claude-3-haiku-20240307-v1:0", temperature=0.7, max_tokens=4096
                     )
                     logger.debug("AWS Bedrock Claude 3.5 Haiku 모델 초기화 완료")
                     
@@ -106,30 +163,20 @@ class LLMRouter:
             if settings.GOOGLE_API_KEY:
                 try:
                     # Gemini Pro 1.5
-                    self._models["gemini-pro"] = ChatGoogleGenerativeAI(
-                        model="gemini-1.5-pro",
-                        google_api_key=settings.GOOGLE_API_KEY,
-                        temperature=0.7,
-                        max_output_tokens=8192,
-                        top_p=0.9,
+                    self._models["gemini-pro"] = llm_client_registry.get(
+                        GOOGLE, "gemini-1.5-pro", temperature=0.7, max_output_tokens=8192, top_p=0.9
                     )
                     logger.debug("Google Gemini 1.5 Pro 모델 초기화 완료")
                     
                     # Gemini Flash (더 빠른 응답용)
-                    self._models["gemini-flash"] = ChatGoogleGenerativeAI(
-                        model="gemini-1.5-flash",
-                        google_api_key=settings.GOOGLE_API_KEY,
-                        temperature=0.7,
-                        max_output_tokens=8192,
+                    self._models["gemini-flash"] = llm_client_registry.get(
+                        GOOGLE, "gemini-1.5-flash", temperature=0.7, max_output_tokens=8192
                     )
                     logger.debug("Google Gemini 1.5 Flash 모델 초기화 완료")
                     
                     # Gemini 1.0 Pro (기본 모델)
-                    self._models["gemini-1.0"] = ChatGoogleGenerativeAI(
-                        model="gemini-1.0-pro",
-                        google_api_key=settings.GOOGLE_API_KEY,
-                        temperature=0.7,
-                        max_output_tokens=8192,
+                    self._models["gemini-1.0"] = llm_client_registry.get(
+                        GOOGLE, "gemini-1.0-pro", temperature=0.7, max_output_tokens=8192
                     )
                     logger.debug("Google Gemini 1.0 Pro 모델 초기화 완료")
                     
@@ -145,7 +192,7 @@ class LLMRouter:
         except Exception as e:
             logger.error(f"모델 초기화 중 오류 발생: {e}")
     
-    def get_model(self, model_name: str) -> Optional[BaseLanguageModel]:
+    def get_model(self, model_name: str) -> Optional[PooledLLMClient]:
         """
         지정된 모델 반환
         
@@ -160,9 +207,12 @@ class LLMRouter:
             logger.warning(f"모델 '{model_name}'을 찾을 수 없음")
             # 사용 가능한 다른 모델로 fallback
             return self.get_fallback_model()
+        if not model.healthy:
+            logger.warning(f"모델 '{model_name}'이 연속 실패로 일시 비정상 상태 - fallback 사용")
+            return self.get_fallback_model() or model
         return model
     
-    def get_fallback_model(self) -> Optional[BaseLanguageModel]:
+    def get_fallback_model(self) -> Optional[PooledLLMClient]:
         """
         사용 가능한 fallback 모델 반환
         
@@ -171,7 +221,7 @@ class LLMRouter:
         """
         # 우선순위: gemini-pro > gemini-flash > gemini-1.0 > claude-4 > claude-3.7 > claude-3.5 > claude > claude-haiku (Gemini 우선 - 안정성)
         for model_name in ["gemini-pro", "gemini-flash", "gemini-1.0", "claude-4", "claude-3.7", "claude-3.5", "claude", "claude-haiku"]:
-            if model_name in self._models:
+            if model_name in self._models and self._models[model_name].healthy:
                 logger.debug(f"Fallback 모델로 {model_name} 사용")
                 return self._models[model_name]
         
@@ -273,6 +323,8 @@ class LLMRouter:
         user_id: Optional[str] = None,
         conversation_id: Optional[str] = None,
         include_datetime: bool = True,
+        cache: Optional[str] = None,
+        cache_ttl_seconds: Optional[int] = None,
         **kwargs
     ) -> tuple[str, str]:
         """
@@ -284,11 +336,30 @@ class LLMRouter:
             user_id: 사용자 ID (로깅용)
             conversation_id: 대화 ID (로깅용)
             include_datetime: 날짜/시간 컨텍스트 포함 여부 (기본값: True)
+            cache: 응답 캐시를 사용할 호출 지점 이름 (예: "intent_classification").
+                   결정적인 유틸리티 프롬프트에서만 지정하세요. None이면 캐시하지 않음
+            cache_ttl_seconds: 캐시 TTL (기본값: LLM_RESPONSE_CACHE_TTL_SECONDS)
             **kwargs: 추가 파라미터
             
         Returns:
             (응답 텍스트, 실제 사용된 모델 이름)
         """
+        if cache and settings.LLM_RESPONSE_CACHE_ENABLED:
+            cache_key = self.response_cache.make_key(model_name, prompt, include_datetime, kwargs)
+            cached = self.response_cache.get(cache_key, cache)
+            if cached is not None:
+                self.response_cache.record_saving(cache, prompt, cached[0])
+                return cached
+            
+            response, model_used = await self._generate_uncached(model_name, prompt, include_datetime)
+            # Mock 모드/fallback 응답은 캐시하지 않음 (실제 API 키 설정 후에도 TTL 동안 Mock 응답이 나가지 않도록)
+            if not is_degraded_model(model_used):
+                self.response_cache.set(cache_key, response, model_used, cache_ttl_seconds)
+            return response, model_used
+        
+        return await self._generate_uncached(model_name, prompt, include_datetime)
+    
+    async def _generate_uncached(self, model_name: str, prompt: str, include_datetime: bool) -> tuple[str, str]:
         # 날짜/시간 컨텍스트 추가 (제목 생성 등 특별한 경우 제외)
         final_prompt = self._add_datetime_context(prompt) if include_datetime else prompt
         
@@ -500,47 +571,9 @@ class LLMRouter:
                     else:
                         yield str(chunk)
             else:
-                # 스트리밍을 지원하지 않는 경우 일반 응답을 청크로 나누어 전송
+                # 스트리밍을 지원하지 않는 경우 완성된 응답을 지연 없이 한 번에 전달
                 response = await model.ainvoke(final_prompt)
-                content = response.content
-                
-                # 문장별로 스트리밍 시뮬레이션 (줄바꿈 포함)
-                import asyncio
-                import re
-                
-                logger.debug_streaming("실제 LLM 응답 청크 분할", {"length": len(content)})
-                
-                # 문장과 줄바꿈을 기준으로 청크 분할
-                chunks = []
-                lines = content.split('\n')
-                
-                for line in lines:
-                    if line.strip():
-                        # 긴 줄은 문장으로 분할
-                        sentences = re.split(r'([.!?]\s+)', line)
-                        current_chunk = ""
-                        
-                        for sentence in sentences:
-                            current_chunk += sentence
-                            if len(current_chunk) > 50 or sentence.endswith(('.', '!', '?')):
-                                if current_chunk.strip():
-                                    chunks.append(current_chunk)
-                                    current_chunk = ""
-                        
-                        if current_chunk.strip():
-                            chunks.append(current_chunk)
-                    else:
-                        # 빈 줄은 줄바꿈으로 추가
-                        chunks.append('\n')
-                
-                # 청크별로 스트리밍
-                for i, chunk in enumerate(chunks):
-                    if i < len(chunks) - 1 and not chunk.endswith('\n'):
-                        chunk += '\n'  # 줄바꿈 추가
-                    
-                    logger.debug(f"📤 청크 전송: {repr(chunk[:30])}")
-                    yield chunk
-                    await asyncio.sleep(0.05)  # 스트리밍 딜레이
+                yield response.content
                     
         except Exception as e:
             logger.error(f"스트리밍 응답 생성 중 오류: {e}")
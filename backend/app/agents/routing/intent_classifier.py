@@ -5,7 +5,9 @@ Dynamic Intent Classification Engine
 
 import time
 import json
+import asyncio
 import logging
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -14,6 +16,8 @@ import hashlib
 
 from app.agents.base import BaseAgent, AgentInput, AgentOutput, ConversationContext
 from app.agents.llm_router import llm_router
+from app.agents.routing.local_intent_model import HashedNgramIntentModel, normalize_query
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +73,11 @@ class DynamicIntentClassifier(BaseAgent):
             "high_confidence_count": 0,
             "correction_count": 0,
             "accuracy_by_intent": {},
-            "avg_confidence": 0.0
+            "avg_confidence": 0.0,
+            # 분류 단계별 처리 수 (query_cache → local_model → llm)
+            "query_cache_hits": 0,
+            "local_model_hits": 0,
+            "llm_calls": 0
         }
         
         # 동적 학습 설정
@@ -86,6 +94,18 @@ class DynamicIntentClassifier(BaseAgent):
         
         # 현재 사용 중인 프롬프트 전략
         self.current_strategy = "context_aware"
+        
+        # 로컬 단계 분류 (LLM 호출 전)
+        self.query_cache: "OrderedDict[str, ClassificationResult]" = OrderedDict()
+        self.query_cache_size = settings.INTENT_QUERY_CACHE_SIZE
+        self.local_confidence_threshold = settings.INTENT_LOCAL_CONFIDENCE_THRESHOLD
+        self.local_min_samples = settings.INTENT_LOCAL_MIN_SAMPLES
+        self.local_model_path = settings.INTENT_LOCAL_MODEL_PATH
+        self._intent_labels = [intent.value for intent in IntentType]
+        self.local_model = (
+            HashedNgramIntentModel.load(self.local_model_path, self._intent_labels) if self.local_model_path else None
+        ) or HashedNgramIntentModel(self._intent_labels)
+        self._updates_since_save = 0
     
     async def execute(self, input_data: AgentInput, model: str = "claude-sonnet", progress_callback=None) -> AgentOutput:
         """의도 분류 실행"""
@@ -169,7 +189,13 @@ class DynamicIntentClassifier(BaseAgent):
         user_pattern: Optional[UserBehaviorPattern],
         model: str
     ) -> ClassificationResult:
-        """동적 의도 분류 실행"""
+        """동적 의도 분류 실행 (질의 캐시 → 로컬 모델 → LLM 순서)"""
+        
+        local_result = self._classify_locally(query, conversation_context)
+        if local_result is not None:
+            return local_result
+        
+        self.performance_metrics["llm_calls"] += 1
         
         # 프롬프트 전략 선택
         prompt_func = self.prompt_templates.get(self.current_strategy, self.prompt_templates["base"])
@@ -180,7 +206,8 @@ class DynamicIntentClassifier(BaseAgent):
                 model_name=model,
                 prompt=prompt,
                 temperature=0.1,  # 일관성 있는 분류를 위해 낮은 온도
-                include_datetime=False
+                include_datetime=False,
+                cache="intent_classification"
             )
             
             # JSON 응답 파싱
@@ -194,7 +221,7 @@ class DynamicIntentClassifier(BaseAgent):
                 if intent in [e.value for e in IntentType]
             ]
             
-            return ClassificationResult(
+            classification = ClassificationResult(
                 primary_intent=primary_intent,
                 secondary_intents=secondary_intents,
                 confidence_score=classification_data.get("confidence", 0.5),
@@ -205,10 +232,110 @@ class DynamicIntentClassifier(BaseAgent):
                 complexity_score=classification_data.get("complexity_score", 0.5)
             )
             
+            # 확신 있는 LLM 결과로 로컬 단계 학습
+            if classification.confidence_score >= self.confidence_threshold and not self._depends_on_context(query, conversation_context):
+                self._cache_classification(query, classification)
+                self._train_local_model(query, primary_intent.value)
+            
+            return classification
+            
         except Exception as e:
             logger.error(f"LLM 분류 실패, fallback 사용: {e}")
             return self._fallback_classification(query, conversation_context)
     
+    # ===== 로컬 단계 분류 =====
+    
+    # 이전 대화를 가리키는 표현 - 질의만으로는 의도를 알 수 없으므로 로컬 단계를 건너뜀
+    _CONTEXT_REFERENCES = ("그것", "그거", "이거", "저거", "관련된", "위에서", "아까", "방금", "그럼", "그러면")
+    
+    def _depends_on_context(self, query: str, conversation_context: Optional[ConversationContext]) -> bool:
+        if not conversation_context or not conversation_context.recent_messages:
+            return False
+        return any(reference in query for reference in self._CONTEXT_REFERENCES)
+    
+    def _classify_locally(
+        self,
+        query: str,
+        conversation_context: Optional[ConversationContext]
+    ) -> Optional[ClassificationResult]:
+        """질의 캐시 또는 로컬 모델로 분류 (확신이 부족하면 None → LLM 호출)"""
+        if self._depends_on_context(query, conversation_context):
+            return None
+        
+        key = normalize_query(query)
+        cached = self.query_cache.get(key)
+        if cached is not None:
+            self.query_cache.move_to_end(key)
+            self.performance_metrics["query_cache_hits"] += 1
+            return cached
+        
+        if self.local_model.samples_seen < self.local_min_samples:
+            return None
+        
+        probabilities = self.local_model.predict_proba(query)
+        ranked = sorted(probabilities.items(), key=lambda item: item[1], reverse=True)
+        intent, confidence = ranked[0]
+        if confidence < self.local_confidence_threshold:
+            return None
+        
+        self.performance_metrics["local_model_hits"] += 1
+        return ClassificationResult(
+            primary_intent=IntentType(intent),
+            secondary_intents=[IntentType(label) for label, p in ranked[1:3] if p >= 0.2],
+            confidence_score=confidence,
+            reasoning=f"로컬 분류 모델 예측 (확률 {confidence:.2f})",
+            context_factors=["local_model"]
+        )
+    
+    def _cache_classification(self, query: str, classification: ClassificationResult) -> None:
+        key = normalize_query(query)
+        self.query_cache[key] = ClassificationResult(
+            primary_intent=classification.primary_intent,
+            secondary_intents=classification.secondary_intents,
+            confidence_score=classification.confidence_score,
+            reasoning=classification.reasoning,
+            context_factors=["query_cache"],
+            requires_clarification=classification.requires_clarification,
+            suggested_follow_ups=classification.suggested_follow_ups,
+            complexity_score=classification.complexity_score
+        )
+        self.query_cache.move_to_end(key)
+        while len(self.query_cache) > self.query_cache_size:
+            self.query_cache.popitem(last=False)
+    
+    def _train_local_model(self, query: str, intent: str, weight: float = 1.0) -> None:
+        """로컬 모델 온라인 학습 (일정 횟수마다 백그라운드로 저장)"""
+        self.local_model.partial_fit(query, intent, weight)
+        self._updates_since_save += 1
+        
+        if self.local_model_path and self._updates_since_save >= 50:
+            self._updates_since_save = 0
+            try:
+                loop = asyncio.get_running_loop()
+                loop.run_in_executor(None, self.local_model.save, self.local_model_path)
+            except RuntimeError:
+                self.local_model.save(self.local_model_path)
+    
+    def train_from_history(self, records: List[Dict[str, Any]]) -> int:
+        """
+        classification_history 형식의 기록으로 로컬 모델 학습 (오프라인 초기 학습용)
+        
+        수정 기록(correct_intent 포함)은 가중치를 높여 반영합니다.
+        """
+        trained = 0
+        for record in records:
+            query = record.get("query")
+            if not query:
+                continue
+            if record.get("correct_intent"):
+                self._train_local_model(query, record["correct_intent"], weight=3.0)
+            elif record.get("confidence", 0) >= self.confidence_threshold and record.get("tier", "llm") == "llm":
+                self._train_local_model(query, record["primary_intent"])
+            else:
+                continue
+            trained += 1
+        return trained
+    
     def _get_context_aware_prompt(
         self,
         query: str,
@@ -412,7 +539,11 @@ class DynamicIntentClassifier(BaseAgent):
             "primary_intent": classification.primary_intent.value,
             "confidence": classification.confidence_score,
             "reasoning": classification.reasoning,
-            "strategy": self.current_strategy
+            "strategy": self.current_strategy,
+            "tier": next(
+                (factor for factor in classification.context_factors if factor in ("query_cache", "local_model")),
+                "llm"
+            )
         }
         
         self.classification_history.append(classification_record)
@@ -454,6 +585,15 @@ class DynamicIntentClassifier(BaseAgent):
         
         pattern.last_updated = datetime.utcnow()
         
+        # 수정된 의도로 캐시를 고치고 로컬 모델에 더 큰 가중치로 학습
+        if correct_intent in self._intent_labels:
+            key = normalize_query(query)
+            if key in self.query_cache:
+                cached = self.query_cache[key]
+                cached.primary_intent = IntentType(correct_intent)
+                cached.reasoning = "사용자 수정 반영"
+            self._train_local_model(query, correct_intent, weight=3.0)
+        
         # 성능 메트릭 업데이트
         self.performance_metrics["correction_count"] += 1
         
@@ -468,10 +608,19 @@ class DynamicIntentClassifier(BaseAgent):
         accuracy = (total - self.performance_metrics["correction_count"]) / total if total > 0 else 0
         confidence_rate = self.performance_metrics["high_confidence_count"] / total if total > 0 else 0
         
+        llm_avoided = self.performance_metrics["query_cache_hits"] + self.performance_metrics["local_model_hits"]
+        
         return {
             "total_classifications": total,
             "accuracy": accuracy,
             "high_confidence_rate": confidence_rate,
+            "llm_avoided_rate": llm_avoided / total,
+            "tier_counts": {
+                "query_cache": self.performance_metrics["query_cache_hits"],
+                "local_model": self.performance_metrics["local_model_hits"],
+                "llm": self.performance_metrics["llm_calls"]
+            },
+            "local_model_samples": self.local_model.samples_seen,
             "correction_count": self.performance_metrics["correction_count"],
             "current_strategy": self.current_strategy,
             "users_tracked": len(self.user_patterns),
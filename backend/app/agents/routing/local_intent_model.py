@@ -0,0 +1,159 @@
+"""
+로컬 의도 분류 모델
+LLM 분류 결과와 사용자 수정 이력으로 온라인 학습하는 해시 n-gram 선형 모델
+"""
+
+import logging
+import os
+import re
+import tempfile
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"[^\w\s]", re.UNICODE)
+
+
+def normalize_query(query: str) -> str:
+    """캐시/학습용 질의 정규화 (소문자, 구두점 제거, 공백 정리)"""
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", query.lower())).strip()
+
+
+class HashedNgramIntentModel:
+    """
+    해시 n-gram 특징 + 다항 로지스틱 회귀 (SGD 온라인 학습)
+
+    한국어는 어절 변형이 많아 문자 1~3-gram과 단어 1~2-gram을 함께 사용하고,
+    특징은 고정 크기 버킷으로 해싱하므로 어휘 사전이 필요 없습니다.
+    """
+
+    def __init__(
+        self,
+        labels: List[str],
+        n_features: int = 2 ** 18,
+        learning_rate: float = 0.5,
+        l2: float = 1e-6
+    ):
+        self.labels = list(labels)
+        self.n_features = n_features
+        self.learning_rate = learning_rate
+        self.l2 = l2
+
+        self.weights = np.zeros((len(self.labels), n_features), dtype=np.float32)
+        self.bias = np.zeros(len(self.labels), dtype=np.float32)
+        self.samples_seen = 0
+        self._lock = threading.Lock()
+
+    # ===== 특징 추출 =====
+
+    def _features(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """해시 버킷 인덱스와 값 (L2 정규화된 빈도)"""
+        normalized = normalize_query(text)
+        tokens = normalized.split()
+        grams: List[str] = []
+
+        grams.extend(f"w:{token}" for token in tokens)
+        grams.extend(f"b:{a}_{b}" for a, b in zip(tokens, tokens[1:]))
+        compact = f" {normalized} "
+        for n in (1, 2, 3):
+            grams.extend(f"c{n}:{compact[i:i + n]}" for i in range(len(compact) - n + 1))
+
+        if not grams:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        buckets: Dict[int, float] = {}
+        for gram in grams:
+            bucket = zlib.crc32(gram.encode("utf-8")) % self.n_features
+            buckets[bucket] = buckets.get(bucket, 0.0) + 1.0
+
+        indices = np.fromiter(buckets.keys(), dtype=np.int64, count=len(buckets))
+        values = np.fromiter(buckets.values(), dtype=np.float32, count=len(buckets))
+        values /= np.linalg.norm(values)
+        return indices, values
+
+    def _scores(self, indices: np.ndarray, values: np.ndarray) -> np.ndarray:
+        logits = self.weights[:, indices] @ values + self.bias
+        logits -= logits.max()
+        exp = np.exp(logits)
+        return exp / exp.sum()
+
+    # ===== 예측 / 학습 =====
+
+    def predict_proba(self, text: str) -> Dict[str, float]:
+        indices, values = self._features(text)
+        with self._lock:
+            probabilities = self._scores(indices, values)
+        return {label: float(p) for label, p in zip(self.labels, probabilities)}
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """(의도, 확률)"""
+        probabilities = self.predict_proba(text)
+        label = max(probabilities, key=probabilities.get)
+        return label, probabilities[label]
+
+    def partial_fit(self, text: str, label: str, weight: float = 1.0) -> None:
+        """한 샘플로 가중치 갱신 (교차 엔트로피 SGD)"""
+        if label not in self.labels:
+            return
+        indices, values = self._features(text)
+        if indices.size == 0:
+            return
+
+        with self._lock:
+            probabilities = self._scores(indices, values)
+            gradient = probabilities
+            gradient[self.labels.index(label)] -= 1.0
+            step = self.learning_rate * weight
+
+            self.weights[:, indices] -= step * (np.outer(gradient, values) + self.l2 * self.weights[:, indices])
+            self.bias -= step * gradient
+            self.samples_seen += 1
+
+    # ===== 저장 / 로드 =====
+
+    def save(self, path: str) -> None:
+        """임시 파일에 쓴 뒤 교체"""
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            weights, bias, samples_seen = self.weights.copy(), self.bias.copy(), self.samples_seen
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npz")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    weights=weights,
+                    bias=bias,
+                    labels=np.array(self.labels),
+                    samples_seen=np.array(samples_seen)
+                )
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str, labels: List[str]) -> Optional["HashedNgramIntentModel"]:
+        """저장된 모델 로드 (라벨 구성이 다르면 None)"""
+        if not os.path.exists(path):
+            return None
+        try:
+            data = np.load(path)
+            if list(data["labels"]) != list(labels):
+                logger.warning("저장된 의도 모델의 라벨 구성이 달라 새로 학습합니다")
+                return None
+            model = cls(labels, n_features=data["weights"].shape[1])
+            model.weights = data["weights"].astype(np.float32)
+            model.bias = data["bias"].astype(np.float32)
+            model.samples_seen = int(data["samples_seen"])
+            return model
+        except Exception as e:
+            logger.warning(f"의도 모델 로드 실패 - 새로 학습합니다: {e}")
+            return None
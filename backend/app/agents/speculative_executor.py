@@ -0,0 +1,73 @@
+"""
+추측 실행 작업 관리
+- 선택이 확정되기 전에 가장 가능성 높은 작업을 미리 시작하고, 확정 시점에 결과를 넘겨받음
+- 확정된 선택과 다르면 미리 시작한 작업을 취소
+- 작업은 요청 실행 ID(run_id)별로 보관하므로 컴파일된 그래프 상태에는 직렬화 가능한 ID만 저장
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SpeculativeExecutor:
+    """요청별 추측 실행 작업 보관소"""
+
+    def __init__(self):
+        self._tasks: Dict[str, Tuple[str, asyncio.Task]] = {}
+        self.stats = {"started": 0, "hits": 0, "misses": 0, "cancelled": 0}
+
+    def start(self, run_id: str, key: str, factory: Callable[[], Awaitable[Any]]) -> bool:
+        """
+        run_id에 대한 추측 작업 시작 (이미 있으면 무시)
+
+        Args:
+            run_id: 요청 실행 ID
+            key: 추측한 선택 (예: 에이전트 타입)
+            factory: 작업 코루틴을 만드는 함수
+        """
+        if run_id in self._tasks:
+            return False
+        self._tasks[run_id] = (key, asyncio.create_task(factory()))
+        self.stats["started"] += 1
+        logger.debug(f"추측 실행 시작: {run_id} → {key}")
+        return True
+
+    def claim(self, run_id: Optional[str], key: str) -> Optional[asyncio.Task]:
+        """확정된 선택이 추측과 같으면 작업을 넘겨주고, 다르면 취소 후 None 반환"""
+        if not run_id or run_id not in self._tasks:
+            return None
+        speculated_key, task = self._tasks.pop(run_id)
+        if speculated_key == key:
+            self.stats["hits"] += 1
+            return task
+        self.stats["misses"] += 1
+        self._cancel_task(task)
+        logger.debug(f"추측 실행 취소: {run_id} ({speculated_key} ≠ {key})")
+        return None
+
+    def cancel(self, run_id: Optional[str]) -> None:
+        """넘겨받지 않은 추측 작업 정리 (실행이 중간에 끝난 경우)"""
+        if run_id and run_id in self._tasks:
+            _, task = self._tasks.pop(run_id)
+            self._cancel_task(task)
+
+    def _cancel_task(self, task: asyncio.Task) -> None:
+        if not task.done():
+            task.cancel()
+            self.stats["cancelled"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        decided = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "in_flight": len(self._tasks),
+            "hit_rate": round(self.stats["hits"] / decided, 3) if decided else 0.0,
+        }
+
+
+# 전역 추측 실행 관리자 인스턴스
+speculative_executor = SpeculativeExecutor()
@@ -5,11 +5,11 @@ Supervisor 에이전트 - 지능형 라우팅 시스템을 통해 사용자 요
 import time
 import json
 import asyncio
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncGenerator
 from enum import Enum
 import logging
 
-from app.agents.base import BaseAgent, AgentInput, AgentOutput
+from app.agents.base import BaseAgent, AgentInput, AgentOutput, AgentStreamEvent
 from app.agents.llm_router import llm_router
 from app.agents.workers.web_search import web_search_agent
 from app.agents.workers.information_gap_analyzer import information_gap_analyzer
@@ -88,47 +88,7 @@ class SupervisorAgent(BaseAgent):
             raise ValueError("유효하지 않은 입력 데이터")
         
         try:
-            # 🧠 Stage 1: 대화 맥락 최적화 (비동기 병렬 처리)
-            context_task = None
-            if hasattr(input_data, 'conversation_history') and input_data.conversation_history:
-                self.logger.info(f"🔧 맥락 최적화 시작: {len(input_data.conversation_history)}개 턴")
-                context_task = asyncio.create_task(
-                    context_optimizer.optimize_context(
-                        input_data.conversation_history,
-                        input_data.query,
-                        max_tokens=300  # 성능 최적화를 위한 제한
-                    )
-                )
-            
-            # 🧠 Stage 2: 3단계 하이브리드 의도 분류 (최대 2초)
-            self.logger.info(f"🧠 차세대 의도 분류 시작: '{input_data.query[:50]}...'")
-            
-            # 맥락 최적화 결과 대기 (있는 경우)
-            optimized_context = ""
-            if context_task:
-                try:
-                    context_result: ContextOptimizationResult = await asyncio.wait_for(context_task, timeout=1.5)
-                    optimized_context = context_result.optimized_context
-                    self.logger.info(
-                        f"✅ 맥락 최적화 완료: {context_result.original_token_count} → "
-                        f"{context_result.optimized_token_count} 토큰 ({context_result.compression_ratio:.2f}x)"
-                    )
-                except asyncio.TimeoutError:
-                    self.logger.warning("⚠️ 맥락 최적화 타임아웃 - 원본 사용")
-                    if context_task:
-                        context_task.cancel()
-            
-            # 🚀 의도 분류 수행
-            classification_result: IntentClassificationResult = await intent_classifier.classify_intent(
-                input_data.query, 
-                optimized_context if optimized_context else None
-            )
-            
-            self.logger.info(
-                f"🎯 의도 분류 완료: {classification_result.intent_type.value} "
-                f"(신뢰도: {classification_result.confidence:.2f}, "
-                f"Stage {classification_result.classification_stage}, {classification_result.processing_time_ms}ms)"
-            )
+            classification_result = await self._classify_for_routing(input_data)
             
             # 🏃‍♂️ Fast Path 실행 (간단한 팩트 질문)
             if classification_result.intent_type == NewIntentType.SIMPLE_FACT:
@@ -174,6 +134,201 @@ class SupervisorAgent(BaseAgent):
                 model_used=model
             )
     
+    async def execute_stream(self, input_data: AgentInput, model: str = "claude-sonnet", progress_callback=None) -> AsyncGenerator[AgentStreamEvent, None]:
+        """🚀 Supervisor 스트리밍 실행 - 라우팅 후 선택된 경로의 LLM 토큰을 생성 즉시 전달"""
+        start_time = time.time()
+        
+        if not self.validate_input(input_data):
+            raise ValueError("유효하지 않은 입력 데이터")
+        
+        emitted = False
+        try:
+            classification_result = await self._classify_for_routing(input_data)
+            
+            # 🏃‍♂️ Fast Path 실행 (간단한 팩트 질문)
+            if classification_result.intent_type == NewIntentType.SIMPLE_FACT:
+                self.logger.info(f"🏃‍♂️ Fast Path 스트리밍 활성화 - 간단한 질문 감지")
+                
+                if progress_callback:
+                    await progress_callback({
+                        "step": "fast_processing",
+                        "message": "빠른 응답 생성 중...",
+                        "progress": 50
+                    })
+                
+                async for event in self._stream_llm_response(
+                    self._build_fast_path_prompt(input_data.query),
+                    model,
+                    start_time,
+                    {
+                        "handled_by": "supervisor_fast_path",
+                        "optimization": "intent_classification_bypassed",
+                        "routing_version": "fast_path_v2_pure_llm"
+                    }
+                ):
+                    emitted = True
+                    yield event
+                return
+            
+            # 🔄 복잡 처리 경로
+            self.logger.info(f"🔄 복잡 처리 모드 (스트리밍): {classification_result.intent_type.value}")
+            
+            if progress_callback:
+                await progress_callback({
+                    "step": "complex_analysis",
+                    "message": "복잡한 분석 수행 중...",
+                    "progress": 20
+                })
+            
+            legacy_intent, worker_agent = self._resolve_complex_route(input_data, classification_result)
+            
+            if worker_agent:
+                self.logger.info(f"🚀 작업 위임 (스트리밍): {legacy_intent.value} → {worker_agent.agent_id}")
+                
+                if progress_callback:
+                    await progress_callback({
+                        "step": "delegating_to_worker",
+                        "message": f"{worker_agent.name}에게 작업 위임 중...",
+                        "progress": 40
+                    })
+                
+                delegation_metadata = self._build_delegation_metadata(
+                    legacy_intent, worker_agent, classification_result
+                )
+                async for event in worker_agent.execute_stream(input_data, model, progress_callback):
+                    if event.type == "result" and event.output:
+                        event.output.metadata.update(delegation_metadata)
+                    emitted = True
+                    yield event
+            else:
+                # Worker가 없는 경우 직접 처리
+                self.logger.info(f"🤖 직접 처리 (스트리밍): {legacy_intent.value} (해당 Worker 없음)")
+                async for event in self._stream_llm_response(
+                    self._build_direct_prompt(input_data.query, legacy_intent.value),
+                    model,
+                    start_time,
+                    {
+                        "handled_by": "supervisor_direct",
+                        "intent_type": legacy_intent.value,
+                        "reason": "no_suitable_worker_available"
+                    }
+                ):
+                    emitted = True
+                    yield event
+                
+        except Exception as e:
+            self.logger.error(f"❌ Supervisor 스트리밍 실행 중 오류: {e}")
+            
+            # 이미 토큰을 전달한 뒤라면 재시도할 수 없으므로 오류 결과만 전달
+            if emitted:
+                yield AgentStreamEvent(
+                    type="result",
+                    output=self.create_output(
+                        result="",
+                        metadata={"error": str(e), "supervisor_decision": "stream_interrupted"},
+                        execution_time_ms=int((time.time() - start_time) * 1000),
+                        model_used=model
+                    )
+                )
+                return
+            
+            # 오류 발생 시 fallback 분류 시도
+            fallback_intent = self._emergency_fallback_classification(input_data.query)
+            worker_agent = self._select_worker(fallback_intent, input_data.user_id)
+            
+            if worker_agent:
+                self.logger.info(f"🆘 긴급 fallback 스트리밍 실행: {fallback_intent.value}")
+                async for event in worker_agent.execute_stream(input_data, model, progress_callback):
+                    if event.type == "result" and event.output:
+                        event.output.metadata["supervisor_decision"] = "emergency_fallback"
+                        event.output.metadata["original_error"] = str(e)
+                    yield event
+                return
+            
+            output = self.create_output(
+                result="죄송합니다. 요청 처리 중 오류가 발생했습니다. 다시 시도해 주세요.",
+                metadata={
+                    "error": str(e),
+                    "supervisor_decision": "error_fallback"
+                },
+                execution_time_ms=int((time.time() - start_time) * 1000),
+                model_used=model
+            )
+            yield AgentStreamEvent(type="token", text=output.result)
+            yield AgentStreamEvent(type="result", output=output)
+    
+    async def _stream_llm_response(
+        self,
+        prompt: str,
+        model: str,
+        start_time: float,
+        metadata: Dict[str, Any]
+    ) -> AsyncGenerator[AgentStreamEvent, None]:
+        """llm_router 스트리밍 결과를 token 이벤트로 전달하고 마지막에 result 이벤트 생성"""
+        chunks: List[str] = []
+        async for chunk in llm_router.stream_response(model, prompt):
+            if not chunk:
+                continue
+            chunks.append(chunk)
+            yield AgentStreamEvent(type="token", text=chunk)
+        
+        execution_time = int((time.time() - start_time) * 1000)
+        yield AgentStreamEvent(
+            type="result",
+            output=self.create_output(
+                result="".join(chunks),
+                metadata={**metadata, "streamed": True},
+                execution_time_ms=execution_time,
+                model_used=model
+            )
+        )
+    
+    async def _classify_for_routing(self, input_data: AgentInput) -> IntentClassificationResult:
+        """맥락 최적화 + 하이브리드 의도 분류 (execute/execute_stream 공통 라우팅 단계)"""
+        # 🧠 Stage 1: 대화 맥락 최적화 (비동기 병렬 처리)
+        context_task = None
+        if hasattr(input_data, 'conversation_history') and input_data.conversation_history:
+            self.logger.info(f"🔧 맥락 최적화 시작: {len(input_data.conversation_history)}개 턴")
+            context_task = asyncio.create_task(
+                context_optimizer.optimize_context(
+                    input_data.conversation_history,
+                    input_data.query,
+                    max_tokens=300  # 성능 최적화를 위한 제한
+                )
+            )
+        
+        # 🧠 Stage 2: 3단계 하이브리드 의도 분류 (최대 2초)
+        self.logger.info(f"🧠 차세대 의도 분류 시작: '{input_data.query[:50]}...'")
+        
+        # 맥락 최적화 결과 대기 (있는 경우)
+        optimized_context = ""
+        if context_task:
+            try:
+                context_result: ContextOptimizationResult = await asyncio.wait_for(context_task, timeout=1.5)
+                optimized_context = context_result.optimized_context
+                self.logger.info(
+                    f"✅ 맥락 최적화 완료: {context_result.original_token_count} → "
+                    f"{context_result.optimized_token_count} 토큰 ({context_result.compression_ratio:.2f}x)"
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning("⚠️ 맥락 최적화 타임아웃 - 원본 사용")
+                if context_task:
+                    context_task.cancel()
+        
+        # 🚀 의도 분류 수행
+        classification_result: IntentClassificationResult = await intent_classifier.classify_intent(
+            input_data.query, 
+            optimized_context if optimized_context else None
+        )
+        
+        self.logger.info(
+            f"🎯 의도 분류 완료: {classification_result.intent_type.value} "
+            f"(신뢰도: {classification_result.confidence:.2f}, "
+            f"Stage {classification_result.classification_stage}, {classification_result.processing_time_ms}ms)"
+        )
+        
+        return classification_result
+    
     # 레거시 메서드 - 새로운 시스템에서는 사용하지 않음
     async def _analyze_task_type_direct(self, query: str, model: str) -> TaskType:
         """레거시 메서드 - dynamic_intent_classifier로 대체됨"""
@@ -245,31 +400,7 @@ class SupervisorAgent(BaseAgent):
     async def _handle_directly(self, input_data: AgentInput, model: str, start_time: float, intent_type: str = "general_chat") -> AgentOutput:
         """Supervisor가 직접 처리"""
         try:
-            # 의도 유형에 따른 맞춤형 프롬프트
-            if intent_type == "clarification":
-                prompt = f"""
-사용자의 질문이 다소 모호합니다: "{input_data.query}"
-
-질문의 의도를 파악하기 어려워 더 구체적인 정보가 필요합니다.
-사용자에게 친근하게 다음과 같은 도움을 제공해주세요:
-
-1. 질문을 더 명확히 하는 방법 제안
-2. 구체적인 예시나 상황 요청  
-3. 관련된 몇 가지 가능한 해석 제시
-
-답변은 한국어로 자연스럽고 도움이 되는 톤으로 작성해주세요.
-"""
-            else:
-                prompt = f"""
-사용자 질문: "{input_data.query}"
-
-위 질문에 대해 도움이 되는 답변을 제공해주세요.
-현재 특별한 도구나 검색 기능을 사용할 수 없지만, 
-가능한 한 유용하고 정확한 정보를 제공해주세요.
-
-답변은 한국어로 자연스럽게 작성해주세요.
-"""
-            
+            prompt = self._build_direct_prompt(input_data.query, intent_type)
             response, _ = await llm_router.generate_response(model, prompt)
             execution_time = int((time.time() - start_time) * 1000)
             
@@ -295,6 +426,34 @@ class SupervisorAgent(BaseAgent):
                 model_used=model
             )
     
+    def _build_direct_prompt(self, query: str, intent_type: str = "general_chat") -> str:
+        """Supervisor 직접 처리용 프롬프트 구성"""
+        # 의도 유형에 따른 맞춤형 프롬프트
+        if intent_type == "clarification":
+            prompt = f"""
+사용자의 질문이 다소 모호합니다: "{query}"
+
+질문의 의도를 파악하기 어려워 더 구체적인 정보가 필요합니다.
+사용자에게 친근하게 다음과 같은 도움을 제공해주세요:
+
+1. 질문을 더 명확히 하는 방법 제안
+2. 구체적인 예시나 상황 요청  
+3. 관련된 몇 가지 가능한 해석 제시
+
+답변은 한국어로 자연스럽고 도움이 되는 톤으로 작성해주세요.
+"""
+        else:
+            prompt = f"""
+사용자 질문: "{query}"
+
+위 질문에 대해 도움이 되는 답변을 제공해주세요.
+현재 특별한 도구나 검색 기능을 사용할 수 없지만, 
+가능한 한 유용하고 정확한 정보를 제공해주세요.
+
+답변은 한국어로 자연스럽게 작성해주세요.
+"""
+        return prompt
+    
     def _extract_original_query(self, query: str) -> str:
         """
         대화 맥락이 추가된 쿼리에서 원본 질문만 추출
@@ -353,16 +512,20 @@ class SupervisorAgent(BaseAgent):
             self.logger.warning(f"⚠️ LLM 검증 실패: {e} - 복잡한 질문으로 처리")
             return False  # 실패 시 안전하게 복잡한 질문으로 처리
     
+    def _build_fast_path_prompt(self, query: str) -> str:
+        """Fast Path용 간단 프롬프트 구성"""
+        return f"""질문: "{query}"
+
+위 질문에 대해 간단명료한 답변을 제공해주세요.
+기본적인 지식을 바탕으로 정확하고 도움이 되는 정보를 한국어로 답변해주세요."""
+    
     async def _handle_simple_question_fast(self, input_data: AgentInput, model: str, start_time: float) -> AgentOutput:
         """간단한 질문을 위한 고속 처리 경로 (의도 분류 우회)"""
         try:
             self.logger.info(f"🏃‍♂️ Fast Path 실행: {input_data.query}")
             
             # 간단하고 최적화된 프롬프트
-            prompt = f"""질문: "{input_data.query}"
-
-위 질문에 대해 간단명료한 답변을 제공해주세요.
-기본적인 지식을 바탕으로 정확하고 도움이 되는 정보를 한국어로 답변해주세요."""
+            prompt = self._build_fast_path_prompt(input_data.query)
 
             # LLM 응답 생성 (복잡한 분석 단계 완전 우회)
             response, _ = await llm_router.generate_response(model, prompt)
@@ -391,25 +554,12 @@ class SupervisorAgent(BaseAgent):
             self.logger.info("🔄 Fast Path 실패 - 일반 처리 경로로 폴백")
             return await self._handle_directly(input_data, model, start_time, "general_chat")
     
-    async def _handle_complex_question(
-        self, 
-        input_data: AgentInput, 
-        model: str, 
-        classification_result: IntentClassificationResult, 
-        start_time: float, 
-        progress_callback=None
-    ) -> AgentOutput:
-        """복잡한 질문 처리 - 기존 LangGraph 시스템 활용"""
-        
-        self.logger.info(f"🔄 복잡 처리 모드: {classification_result.intent_type.value}")
-        
-        if progress_callback:
-            await progress_callback({
-                "step": "complex_analysis",
-                "message": "복잡한 분석 수행 중...",
-                "progress": 20
-            })
-        
+    def _resolve_complex_route(
+        self,
+        input_data: AgentInput,
+        classification_result: IntentClassificationResult
+    ) -> tuple[IntentType, Optional[BaseAgent]]:
+        """복잡 처리 경로의 레거시 의도 유형과 Worker 에이전트 결정"""
         # NewIntentType을 기존 IntentType으로 매핑
         intent_mapping = {
             NewIntentType.WEB_SEARCH: IntentType.WEB_SEARCH,
@@ -432,6 +582,48 @@ class SupervisorAgent(BaseAgent):
         # Worker 에이전트 선택 및 실행
         worker_agent = self._select_worker(legacy_intent, input_data.user_id)
         
+        return legacy_intent, worker_agent
+    
+    def _build_delegation_metadata(
+        self,
+        legacy_intent: IntentType,
+        worker_agent: BaseAgent,
+        classification_result: IntentClassificationResult
+    ) -> Dict[str, Any]:
+        """Worker 위임 결과에 추가할 Supervisor 메타데이터"""
+        return {
+            "supervisor_decision": legacy_intent.value,
+            "delegated_to": worker_agent.agent_id,
+            "classification_confidence": classification_result.confidence,
+            "classification_stage": classification_result.classification_stage,
+            "intent_classification_time_ms": classification_result.processing_time_ms,
+            "routing_version": "v3_hybrid_fast_path",
+            "needs_web_search": classification_result.needs_web_search,
+            "needs_reasoning": classification_result.needs_reasoning,
+            "needs_canvas": classification_result.needs_canvas
+        }
+    
+    async def _handle_complex_question(
+        self, 
+        input_data: AgentInput, 
+        model: str, 
+        classification_result: IntentClassificationResult, 
+        start_time: float, 
+        progress_callback=None
+    ) -> AgentOutput:
+        """복잡한 질문 처리 - 기존 LangGraph 시스템 활용"""
+        
+        self.logger.info(f"🔄 복잡 처리 모드: {classification_result.intent_type.value}")
+        
+        if progress_callback:
+            await progress_callback({
+                "step": "complex_analysis",
+                "message": "복잡한 분석 수행 중...",
+                "progress": 20
+            })
+        
+        legacy_intent, worker_agent = self._resolve_complex_route(input_data, classification_result)
+        
         if worker_agent:
             self.logger.info(f"🚀 작업 위임: {legacy_intent.value} → {worker_agent.agent_id}")
             
@@ -446,17 +638,9 @@ class SupervisorAgent(BaseAgent):
             result = await worker_agent.execute(input_data, model, progress_callback)
             
             # 메타데이터 강화
-            result.metadata.update({
-                "supervisor_decision": legacy_intent.value,
-                "delegated_to": worker_agent.agent_id,
-                "classification_confidence": classification_result.confidence,
-                "classification_stage": classification_result.classification_stage,
-                "intent_classification_time_ms": classification_result.processing_time_ms,
-                "routing_version": "v3_hybrid_fast_path",
-                "needs_web_search": classification_result.needs_web_search,
-                "needs_reasoning": classification_result.needs_reasoning,
-                "needs_canvas": classification_result.needs_canvas
-            })
+            result.metadata.update(
+                self._build_delegation_metadata(legacy_intent, worker_agent, classification_result)
+            )
             
             return result
         else:
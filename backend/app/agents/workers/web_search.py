@@ -14,10 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-from app.agents.base import BaseAgent, AgentInput, AgentOutput
+from app.agents.base import BaseAgent, AgentInput, AgentOutput, AgentStreamEvent
 from app.agents.llm_router import llm_router
+from app.core.config import settings
 from app.services.search_service import search_service
-from app.services.web_crawler import web_crawler
+from app.services.search_dedup import ResultDeduplicator
+from app.services.web_crawler import WebCrawlResult, web_crawler
 from app.db.session import AsyncSessionLocal
 from app.utils.logger import get_logger
 
@@ -161,127 +163,266 @@ class WebSearchAgent(BaseAgent):
         """다중 검색어 기반 지능형 웹 검색 실행"""
         start_time = time.time()
         
-        # 원본 쿼리 및 대화 맥락 정보 저장
-        original_query = input_data.query
-        conversation_context = input_data.conversation_context
+        if not self.validate_input(input_data):
+            raise ValueError("유효하지 않은 입력 데이터")
+        
+        try:
+            pipeline = await self._run_search_pipeline(input_data, model, progress_callback)
+            
+            enhanced_summary = await self._generate_enhanced_response(
+                original_query=input_data.query,
+                search_queries=pipeline["search_queries"],
+                search_results=pipeline["ranked_results"],
+                model=model
+            )
+            
+            return self._build_search_output(input_data, model, pipeline, enhanced_summary, start_time)
+            
+        except Exception as e:
+            self.logger.error(f"다중 검색어 웹 검색 실행 중 오류: {e}")
+            return self._build_error_output(model, e, start_time)
+    
+    async def execute_stream(self, input_data: AgentInput, model: str = "gemini", progress_callback=None):
+        """다중 검색어 기반 웹 검색 스트리밍 실행 - 인용 정보를 먼저 전달하고 답변을 토큰 단위로 전달"""
+        start_time = time.time()
         
         if not self.validate_input(input_data):
             raise ValueError("유효하지 않은 입력 데이터")
         
-        async with AsyncSessionLocal() as session:
+        # 검색 결과가 도착할 때마다 중간 랭킹 상위 결과를 받아 인용 정보로 먼저 전달
+        partial_results: asyncio.Queue = asyncio.Queue()
+        
+        async def on_partial(ranked: List[Dict[str, Any]]):
+            partial_results.put_nowait(ranked[:8])
+        
+        pipeline_task = asyncio.create_task(
+            self._run_search_pipeline(input_data, model, progress_callback, on_partial)
+        )
+        getter = None
+        try:
+            emitted_urls = None
+            while True:
+                getter = asyncio.ensure_future(partial_results.get())
+                done, _ = await asyncio.wait({pipeline_task, getter}, return_when=asyncio.FIRST_COMPLETED)
+                if getter not in done:
+                    getter.cancel()
+                    break
+                top_results = getter.result()
+                urls = [r.get("url") for r in top_results]
+                if urls == emitted_urls:
+                    continue
+                emitted_urls = urls
+                citations, sources = self._convert_to_citations_and_sources(top_results)
+                if citations:
+                    yield AgentStreamEvent(type="citations", citations=citations, sources=sources, partial=True)
+            pipeline = pipeline_task.result()
+        except Exception as e:
+            self.logger.error(f"다중 검색어 웹 검색 실행 중 오류: {e}")
+            output = self._build_error_output(model, e, start_time)
+            yield AgentStreamEvent(type="token", text=output.result)
+            yield AgentStreamEvent(type="result", output=output)
+            return
+        finally:
+            # 소비자가 중간에 스트림을 닫거나 취소해도 대기 중인 작업이 남지 않도록 정리
+            if getter is not None and not getter.done():
+                getter.cancel()
+            if not pipeline_task.done():
+                pipeline_task.cancel()
+        
+        ranked_results = pipeline["ranked_results"]
+        
+        # 랭킹이 끝난 시점에 인용 정보가 확정되므로 답변 생성 전에 전달
+        citations, sources = self._convert_to_citations_and_sources(ranked_results[:8])
+        if citations:
+            yield AgentStreamEvent(type="citations", citations=citations, sources=sources)
+        
+        if not ranked_results:
+            enhanced_summary = "죄송합니다. 관련된 검색 결과를 찾을 수 없습니다."
+            yield AgentStreamEvent(type="token", text=enhanced_summary)
+        else:
+            prompt = self._build_enhanced_response_prompt(
+                input_data.query, pipeline["search_queries"], ranked_results
+            )
+            streamed_chunks: List[str] = []
             try:
-                # 0단계: URL 정보 분석 (5%)
-                if progress_callback:
-                    await progress_callback({
-                        "step": "query_analysis",
-                        "message": "사용자 요청 분석 중...",
-                        "progress": 5
-                    })
-                url_info = self._extract_url_info(input_data.query)
-                
-                # 1단계: 다중 검색어 생성 (15%)
-                if progress_callback:
-                    search_type_msg = {
-                        "general": "일반 검색어 분석 및 생성 중...",
-                        "site_specific": "사이트별 검색어 분석 및 생성 중...",
-                        "url_crawl": "URL 크롤링 검색어 분석 및 생성 중..."
-                    }
-                    await progress_callback({
-                        "step": "query_generation",
-                        "message": search_type_msg.get(url_info["search_type"], "검색어 분석 및 생성 중..."),
-                        "progress": 15
-                    })
-                search_queries = await self._generate_multiple_search_queries(input_data.query, model, url_info, input_data.conversation_context)
-                
-                # 2단계: 병렬 웹 검색 실행 (60%)
-                if progress_callback:
-                    await progress_callback({
-                        "step": "parallel_search",
-                        "message": f"다중 검색 실행 중... ({len(search_queries)}개 검색어)",
-                        "progress": 60
-                    })
-                all_search_results = await self._execute_parallel_searches(search_queries, session, progress_callback, conversation_context, original_query)
-                
-                # 3단계: 결과 통합 및 중복 제거 (75%)
-                if progress_callback:
-                    await progress_callback({
-                        "step": "result_filtering",
-                        "message": "검색 결과 통합 및 필터링 중...",
-                        "progress": 75
-                    })
-                integrated_results = await self._integrate_and_deduplicate_results(all_search_results, input_data.query)
-                
-                # 4단계: 지능형 랭킹 적용 (85%)
-                if progress_callback:
-                    await progress_callback({
-                        "step": "result_ranking",
-                        "message": "검색 결과 품질 평가 및 랭킹 중...",
-                        "progress": 85
-                    })
-                ranked_results = await self._apply_intelligent_ranking(integrated_results, input_data.query, model)
-                
-                # 5단계: LLM 기반 통합 답변 생성 (95%)
-                if progress_callback:
-                    await progress_callback({
-                        "step": "response_generation",
-                        "message": "AI 분석 및 통합 답변 생성 중...",
-                        "progress": 95
-                    })
-                enhanced_summary = await self._generate_enhanced_response(
-                    original_query=input_data.query,
-                    search_queries=search_queries,
-                    search_results=ranked_results,
-                    model=model
-                )
-                
-                execution_time = int((time.time() - start_time) * 1000)
-                
-                # 최종 결과를 citations와 sources로 변환
-                citations, sources = self._convert_to_citations_and_sources(ranked_results[:8])
-                
-                metadata = {
-                    "search_queries": [q.query for q in search_queries],
-                    "search_queries_count": len(search_queries),
-                    "total_results_found": sum(len(r.results) for r in all_search_results if r.success),
-                    "final_results_count": len(ranked_results),
-                    "search_method": "multi_query_intelligent_search",
-                    "query_types": list(set(q.intent_type for q in search_queries)),
-                    "languages_used": list(set(q.language for q in search_queries)),
-                    "search_types": list(set(q.search_type for q in search_queries)),
-                    "target_sites": list(set(filter(None, [q.target_url for q in search_queries]))),
-                    "used_operators": list(set(filter(None, [op for q in search_queries if q.search_operators for op in q.search_operators]))),
-                    "url_analysis": url_info,
-                    "top_sources": [r.get('title', '')[:50] for r in ranked_results[:3]],
-                    # 맥락 통합 검색어 정보 추가
-                    "original_query": original_query,
-                    "context_integrated_queries": conversation_context.optimal_search_queries if conversation_context else [],
-                    "has_conversation_context": bool(conversation_context and conversation_context.optimal_search_queries)
-                }
-                
-                return AgentOutput(
-                    result=enhanced_summary,
-                    metadata=metadata,
-                    execution_time_ms=execution_time,
-                    agent_id=self.agent_id,
-                    model_used=model,
-                    timestamp=datetime.now().isoformat(),
-                    citations=citations,
-                    sources=sources
-                )
-                
+                async for chunk in llm_router.stream_response(model, prompt):
+                    if not chunk:
+                        continue
+                    streamed_chunks.append(chunk)
+                    yield AgentStreamEvent(type="token", text=chunk)
             except Exception as e:
-                self.logger.error(f"다중 검색어 웹 검색 실행 중 오류: {e}")
-                execution_time = int((time.time() - start_time) * 1000)
-                
-                return AgentOutput(
-                    result=f"죄송합니다. 웹 검색 중 오류가 발생했습니다: {str(e)}",
-                    metadata={"error": True, "error_message": str(e)},
-                    execution_time_ms=execution_time,
-                    agent_id=self.agent_id,
-                    model_used=model,
-                    timestamp=datetime.now().isoformat(),
-                    error=str(e)
-                )
+                self.logger.error(f"통합 답변 스트리밍 실패: {e}")
+                if not streamed_chunks:
+                    fallback = self._build_fallback_summary(input_data.query, ranked_results)
+                    streamed_chunks.append(fallback)
+                    yield AgentStreamEvent(type="token", text=fallback)
+            enhanced_summary = "".join(streamed_chunks)
+        
+        output = self._build_search_output(input_data, model, pipeline, enhanced_summary, start_time)
+        yield AgentStreamEvent(type="result", output=output)
+    
+    async def _run_search_pipeline(
+        self,
+        input_data: AgentInput,
+        model: str,
+        progress_callback=None,
+        partial_callback=None
+    ) -> Dict[str, Any]:
+        """
+        검색어 생성부터 랭킹까지의 검색 파이프라인 실행 (답변 생성 직전 단계까지)
+        
+        검색 결과는 도착하는 대로 중복 제거/랭킹하고, 품질 기준을 넘으면 남은 검색을 기다리지 않음.
+        partial_callback이 있으면 결과가 도착할 때마다 중간 랭킹 결과 목록으로 호출
+        """
+        # 원본 쿼리 및 대화 맥락 정보 저장
+        original_query = input_data.query
+        conversation_context = input_data.conversation_context
+        
+        async with AsyncSessionLocal() as session:
+            # 0단계: URL 정보 분석 (5%)
+            if progress_callback:
+                await progress_callback({
+                    "step": "query_analysis",
+                    "message": "사용자 요청 분석 중...",
+                    "progress": 5
+                })
+            url_info = self._extract_url_info(input_data.query)
+            
+            # 1단계: 다중 검색어 생성 (15%)
+            if progress_callback:
+                search_type_msg = {
+                    "general": "일반 검색어 분석 및 생성 중...",
+                    "site_specific": "사이트별 검색어 분석 및 생성 중...",
+                    "url_crawl": "URL 크롤링 검색어 분석 및 생성 중..."
+                }
+                await progress_callback({
+                    "step": "query_generation",
+                    "message": search_type_msg.get(url_info["search_type"], "검색어 분석 및 생성 중..."),
+                    "progress": 15
+                })
+            search_queries = await self._generate_multiple_search_queries(input_data.query, model, url_info, input_data.conversation_context)
+            
+            # 2단계: 병렬 웹 검색 실행 (60%)
+            if progress_callback:
+                await progress_callback({
+                    "step": "parallel_search",
+                    "message": f"다중 검색 실행 중... ({len(search_queries)}개 검색어)",
+                    "progress": 60
+                })
+            deduplicator = ResultDeduplicator()
+            # 핵심 검색어와 사용자가 지정한 URL 크롤링은 품질 기준을 넘어도 끝까지 기다림
+            required_remaining = sum(1 for q in search_queries if self._is_required_query(q))
+            
+            async def on_result(enhanced_result: EnhancedSearchResult) -> bool:
+                nonlocal required_remaining
+                if self._is_required_query(enhanced_result.search_query):
+                    required_remaining -= 1
+                self._add_search_result(deduplicator, enhanced_result)
+                ranked = self._rank_results(self._diversify_results(deduplicator))
+                if partial_callback:
+                    await partial_callback(ranked)
+                return required_remaining <= 0 and self._quality_bar_met(ranked)
+            
+            all_search_results = await self._execute_parallel_searches(
+                search_queries, session, progress_callback, conversation_context, original_query, on_result
+            )
+            
+            # 3단계: 결과 통합 및 중복 제거 (75%)
+            if progress_callback:
+                await progress_callback({
+                    "step": "result_filtering",
+                    "message": "검색 결과 통합 및 필터링 중...",
+                    "progress": 75
+                })
+            integrated_results = self._diversify_results(deduplicator, log=True)
+            
+            # 4단계: 지능형 랭킹 적용 (85%)
+            if progress_callback:
+                await progress_callback({
+                    "step": "result_ranking",
+                    "message": "검색 결과 품질 평가 및 랭킹 중...",
+                    "progress": 85
+                })
+            ranked_results = await self._apply_intelligent_ranking(integrated_results, input_data.query, model)
+            
+            # 5단계: LLM 기반 통합 답변 생성 (95%)
+            if progress_callback:
+                await progress_callback({
+                    "step": "response_generation",
+                    "message": "AI 분석 및 통합 답변 생성 중...",
+                    "progress": 95
+                })
+        
+        return {
+            "url_info": url_info,
+            "search_queries": search_queries,
+            "all_search_results": all_search_results,
+            "ranked_results": ranked_results
+        }
+    
+    def _build_search_output(
+        self,
+        input_data: AgentInput,
+        model: str,
+        pipeline: Dict[str, Any],
+        enhanced_summary: str,
+        start_time: float
+    ) -> AgentOutput:
+        """검색 파이프라인 결과와 생성된 답변으로 AgentOutput 구성"""
+        original_query = input_data.query
+        conversation_context = input_data.conversation_context
+        search_queries = pipeline["search_queries"]
+        all_search_results = pipeline["all_search_results"]
+        ranked_results = pipeline["ranked_results"]
+        
+        execution_time = int((time.time() - start_time) * 1000)
+        
+        # 최종 결과를 citations와 sources로 변환
+        citations, sources = self._convert_to_citations_and_sources(ranked_results[:8])
+        
+        metadata = {
+            "search_queries": [q.query for q in search_queries],
+            "search_queries_count": len(search_queries),
+            "total_results_found": sum(len(r.results) for r in all_search_results if r.success),
+            "final_results_count": len(ranked_results),
+            "search_method": "multi_query_intelligent_search",
+            "query_types": list(set(q.intent_type for q in search_queries)),
+            "languages_used": list(set(q.language for q in search_queries)),
+            "search_types": list(set(q.search_type for q in search_queries)),
+            "target_sites": list(set(filter(None, [q.target_url for q in search_queries]))),
+            "used_operators": list(set(filter(None, [op for q in search_queries if q.search_operators for op in q.search_operators]))),
+            "url_analysis": pipeline["url_info"],
+            "top_sources": [r.get('title', '')[:50] for r in ranked_results[:3]],
+            # 맥락 통합 검색어 정보 추가
+            "original_query": original_query,
+            "context_integrated_queries": conversation_context.optimal_search_queries if conversation_context else [],
+            "has_conversation_context": bool(conversation_context and conversation_context.optimal_search_queries)
+        }
+        
+        return AgentOutput(
+            result=enhanced_summary,
+            metadata=metadata,
+            execution_time_ms=execution_time,
+            agent_id=self.agent_id,
+            model_used=model,
+            timestamp=datetime.now().isoformat(),
+            citations=citations,
+            sources=sources
+        )
+    
+    def _build_error_output(self, model: str, error: Exception, start_time: float) -> AgentOutput:
+        """검색 실패 시 AgentOutput 구성"""
+        execution_time = int((time.time() - start_time) * 1000)
+        
+        return AgentOutput(
+            result=f"죄송합니다. 웹 검색 중 오류가 발생했습니다: {str(error)}",
+            metadata={"error": True, "error_message": str(error)},
+            execution_time_ms=execution_time,
+            agent_id=self.agent_id,
+            model_used=model,
+            timestamp=datetime.now().isoformat(),
+            error=str(error)
+        )
     
     async def _generate_multiple_search_queries(self, user_query: str, model: str, url_info: Dict[str, Any], conversation_context=None) -> List[SearchQuery]:
         """사용자 질문을 분석하여 다중 검색어 생성 (URL 정보 포함)"""
@@ -526,26 +667,63 @@ JSON 형태로만 응답해주세요.
         session: AsyncSession,
         progress_callback=None,
         conversation_context=None,
-        original_query: str = None
+        original_query: str = None,
+        on_result=None
     ) -> List[EnhancedSearchResult]:
-        """병렬로 다중 검색어 실행"""
-        search_tasks = []
+        """
+        다중 검색어를 동시 실행 수 제한 안에서 병렬 실행
+        
+        핵심 검색어(우선순위 1)부터 시작하고 끝나는 순서대로 결과를 모음.
+        on_result(결과)가 True를 반환하면 남은 검색은 취소하고 지금까지의 결과를 반환
+        URL 크롤링 대상은 검색 동시 실행 제한과 별개로 크롤러의 crawl_many로 한 번에 가져옴
+        (호스트별 동시 요청 제한, 공유 연결 풀)
+        """
+        semaphore = asyncio.Semaphore(max(1, settings.WEB_SEARCH_MAX_CONCURRENT_QUERIES))
         
-        # 각 검색어에 대해 비동기 태스크 생성
-        for i, query in enumerate(search_queries):
-            task = self._execute_single_search(query, session, i, len(search_queries), progress_callback, conversation_context, original_query)
-            search_tasks.append(task)
+        crawl_urls = list(dict.fromkeys(
+            q.target_url for q in search_queries if q.search_type == "url_crawl" and q.target_url
+        ))
+        crawled: Optional[asyncio.Task] = None
+        if crawl_urls:
+            async def crawl_targets() -> Dict[str, WebCrawlResult]:
+                return dict(zip(crawl_urls, await web_crawler.crawl_many(crawl_urls)))
+            
+            crawled = asyncio.create_task(crawl_targets())
         
-        # 모든 검색을 병렬로 실행
-        results = await asyncio.gather(*search_tasks, return_exceptions=True)
+        async def bounded_search(i: int, query: SearchQuery) -> EnhancedSearchResult:
+            async with semaphore:
+                return await self._execute_single_search(
+                    query, session, i, len(search_queries), progress_callback, conversation_context, original_query,
+                    crawled
+                )
+        
+        # 세마포어는 대기 순서대로 풀리므로 우선순위 순으로 태스크 생성
+        order = sorted(range(len(search_queries)), key=lambda i: search_queries[i].priority)
+        pending = {asyncio.create_task(bounded_search(i, search_queries[i])) for i in order}
         
-        # 성공한 결과만 필터링
         enhanced_results = []
-        for result in results:
-            if isinstance(result, EnhancedSearchResult):
-                enhanced_results.append(result)
-            elif isinstance(result, Exception):
-                self.logger.warning(f"검색 태스크 실패: {result}")
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                enough = False
+                for task in done:
+                    if task.exception() is not None:
+                        self.logger.warning(f"검색 태스크 실패: {task.exception()}")
+                        continue
+                    enhanced_results.append(task.result())
+                    if on_result and await on_result(task.result()):
+                        enough = True
+                if enough and pending:
+                    self.logger.info(f"⏱️ 검색 품질 기준 충족 - 남은 검색 {len(pending)}개 취소")
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if crawled is not None and not crawled.done():
+                crawled.cancel()
+                pending.add(crawled)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         
         self.logger.info(f"병렬 검색 완료: {len(enhanced_results)}/{len(search_queries)} 성공")
         return enhanced_results
@@ -558,9 +736,10 @@ JSON 형태로만 응답해주세요.
         total_tasks: int,
         progress_callback=None,
         conversation_context=None,
-        original_query: str = None
+        original_query: str = None,
+        crawled: Optional[asyncio.Task] = None
     ) -> EnhancedSearchResult:
-        """단일 검색어 실행 (일반 검색 + URL 크롤링 지원)"""
+        """단일 검색어 실행 (일반 검색 + URL 크롤링 지원, crawled: URL별 크롤링 결과를 돌려주는 공유 태스크)"""
         # 각 검색 태스크마다 독립적인 세션 사용 (동시성 문제 해결)
         async with AsyncSessionLocal() as independent_session:
             try:
@@ -608,7 +787,11 @@ JSON 형태로만 응답해주세요.
                 
                 # URL 크롤링 실행 (url_crawl 타입인 경우)
                 if search_query.search_type == "url_crawl" and search_query.target_url:
-                    crawl_result = await web_crawler.crawl_url(search_query.target_url)
+                    if crawled is not None:
+                        # 공유 태스크는 다른 검색도 기다리므로 이 검색이 취소돼도 취소되지 않게 함
+                        crawl_result = (await asyncio.shield(crawled))[search_query.target_url]
+                    else:
+                        crawl_result = (await web_crawler.crawl_many([search_query.target_url]))[0]
                     
                     if not crawl_result.error:
                         # 크롤링된 콘텐츠에서 검색
@@ -742,55 +925,61 @@ JSON 형태로만 응답해주세요.
         final_score = (base_score + result_count_bonus + avg_score) * priority_weight
         return min(final_score, 1.0)
     
-    async def _integrate_and_deduplicate_results(
-        self,
-        all_results: List[EnhancedSearchResult],
-        original_query: str
-    ) -> List[Dict[str, Any]]:
-        """검색 결과 통합 및 중복 제거"""
-        all_unique_results = {}
+    def _add_search_result(self, deduplicator: ResultDeduplicator, enhanced_result: EnhancedSearchResult) -> None:
+        """검색어 하나의 결과를 중복 제거기에 추가 (검색어 정보 포함)"""
+        if not enhanced_result.success:
+            return
         
-        for enhanced_result in all_results:
-            if not enhanced_result.success:
+        for result in enhanced_result.results:
+            if not result.get("url"):
                 continue
-                
-            for result in enhanced_result.results:
-                url = result.get("url", "")
-                title = result.get("title", "")
-                
-                # URL 기준 중복 제거
-                if url and url not in all_unique_results:
-                    # 검색어 정보 추가
-                    result_with_context = result.copy()
-                    result_with_context["search_query"] = enhanced_result.search_query.query
-                    result_with_context["query_priority"] = enhanced_result.search_query.priority
-                    result_with_context["query_type"] = enhanced_result.search_query.intent_type
-                    result_with_context["relevance_score"] = enhanced_result.relevance_score
-                    
-                    all_unique_results[url] = result_with_context
-                elif url in all_unique_results:
-                    # 이미 있는 결과의 점수 향상 (다중 검색어에서 발견된 경우)
-                    existing = all_unique_results[url]
-                    existing["score"] = max(existing["score"], result.get("score", 0.5))
-                    existing["relevance_score"] = max(existing["relevance_score"], enhanced_result.relevance_score)
+            
+            # 검색어 정보 추가
+            result_with_context = result.copy()
+            result_with_context["search_query"] = enhanced_result.search_query.query
+            result_with_context["query_priority"] = enhanced_result.search_query.priority
+            result_with_context["query_type"] = enhanced_result.search_query.intent_type
+            result_with_context["relevance_score"] = enhanced_result.relevance_score
+            
+            # 추적 파라미터/AMP/모바일 변형이나 전재 기사는 한 클러스터로 묶고 가장 좋은 결과만 유지
+            # (여러 검색어에서 발견된 경우 점수는 최댓값 유지)
+            deduplicator.add(result_with_context)
+    
+    def _diversify_results(self, deduplicator: ResultDeduplicator, log: bool = False) -> List[Dict[str, Any]]:
+        """중복 제거된 결과에 도메인별 결과 수 제한 적용"""
+        unique_results = deduplicator.results()
         
-        # 도메인별 결과 수 제한 (다양성 보장)
+        # 도메인별 결과 수 제한 (다양성 보장, 모바일/www 호스트는 같은 도메인으로 계산)
         domain_counts = {}
         filtered_results = []
         
-        for result in all_unique_results.values():
-            url = result.get("url", "")
-            if url:
-                from urllib.parse import urlparse
-                domain = urlparse(url).netloc
-                
-                if domain_counts.get(domain, 0) < 3:  # 도메인당 최대 3개
-                    filtered_results.append(result)
-                    domain_counts[domain] = domain_counts.get(domain, 0) + 1
+        for result in unique_results:
+            domain = urlparse(result["canonical_url"]).netloc
+            if domain_counts.get(domain, 0) < 3:  # 도메인당 최대 3개
+                filtered_results.append(result)
+                domain_counts[domain] = domain_counts.get(domain, 0) + 1
         
-        self.logger.info(f"결과 통합 완료: {len(all_unique_results)} → {len(filtered_results)} (중복 제거 및 다양성 필터 적용)")
+        if log:
+            stats = deduplicator.stats
+            self.logger.info(
+                f"결과 통합 완료: {stats['added']} → {len(unique_results)} → {len(filtered_results)} "
+                f"(URL 중복 {stats['url_duplicates']}개, 근사 중복 {stats['near_duplicates']}개, 다양성 필터 적용)"
+            )
         return filtered_results
     
+    @staticmethod
+    def _is_required_query(search_query: SearchQuery) -> bool:
+        """품질 기준과 관계없이 결과를 기다려야 하는 검색어 (핵심 검색어, URL 크롤링)"""
+        return search_query.priority == 1 or search_query.search_type == "url_crawl"
+    
+    def _quality_bar_met(self, ranked_results: List[Dict[str, Any]]) -> bool:
+        """기준 점수 이상 결과가 충분히 모였는지"""
+        good = sum(
+            1 for r in ranked_results
+            if r.get("final_ranking_score", 0) >= settings.WEB_SEARCH_QUALITY_MIN_SCORE
+        )
+        return good >= settings.WEB_SEARCH_QUALITY_MIN_RESULTS
+    
     async def _apply_intelligent_ranking(
         self,
         results: List[Dict[str, Any]],
@@ -801,6 +990,14 @@ JSON 형태로만 응답해주세요.
         if not results:
             return results
         
+        ranked_results = self._rank_results(results)
+        
+        top_scores = [round(r.get('final_ranking_score', 0), 3) for r in ranked_results[:3]]
+        self.logger.info(f"지능형 랭킹 적용 완료: 상위 3개 점수 {top_scores}")
+        return ranked_results
+    
+    def _rank_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """결과별 점수 계산 후 정렬 (결과마다 독립적으로 계산되어 결과가 도착할 때마다 다시 적용 가능)"""
         # 다차원 스코어링
         for result in results:
             score_components = {
@@ -824,11 +1021,7 @@ JSON 형태로만 응답해주세요.
             result["final_ranking_score"] = final_score
         
         # 최종 점수로 정렬
-        ranked_results = sorted(results, key=lambda x: x.get("final_ranking_score", 0), reverse=True)
-        
-        top_scores = [round(r.get('final_ranking_score', 0), 3) for r in ranked_results[:3]]
-        self.logger.info(f"지능형 랭킹 적용 완료: 상위 3개 점수 {top_scores}")
-        return ranked_results
+        return sorted(results, key=lambda x: x.get("final_ranking_score", 0), reverse=True)
     
     def _calculate_authority_score(self, url: str) -> float:
         """도메인 권위도 점수 계산"""
@@ -942,21 +1135,36 @@ JSON 형태로만 응답해주세요.
             return "죄송합니다. 관련된 검색 결과를 찾을 수 없습니다."
         
         try:
-            # 검색 결과를 텍스트로 구성
-            results_text = ""
-            for i, result in enumerate(search_results[:8], 1):
-                results_text += f"""
+            prompt = self._build_enhanced_response_prompt(original_query, search_queries, search_results)
+            response, _ = await llm_router.generate_response(model, prompt)
+            return response
+            
+        except Exception as e:
+            self.logger.error(f"통합 답변 생성 실패: {e}")
+            return self._build_fallback_summary(original_query, search_results)
+    
+    def _build_enhanced_response_prompt(
+        self,
+        original_query: str,
+        search_queries: List[SearchQuery],
+        search_results: List[Dict[str, Any]]
+    ) -> str:
+        """통합 답변 생성용 프롬프트 구성"""
+        # 검색 결과를 텍스트로 구성
+        results_text = ""
+        for i, result in enumerate(search_results[:8], 1):
+            results_text += f"""
 {i}. {result.get('title', '제목 없음')}
    URL: {result.get('url', '')}
    내용: {result.get('snippet', '설명 없음')[:300]}
    검색어: "{result.get('search_query', '')}"
    품질점수: {result.get('final_ranking_score', 0):.2f}
 """
-            
-            # 사용된 검색어들
-            search_queries_text = ", ".join([f'"{q.query}"' for q in search_queries])
-            
-            prompt = f"""
+        
+        # 사용된 검색어들
+        search_queries_text = ", ".join([f'"{q.query}"' for q in search_queries])
+        
+        return f"""
 사용자 질문: "{original_query}"
 
 다중 검색어를 사용한 포괄적인 웹 검색을 수행했습니다.
@@ -978,18 +1186,14 @@ JSON 형태로만 응답해주세요.
 
 답변:
 """
-            
-            response, _ = await llm_router.generate_response(model, prompt)
-            return response
-            
-        except Exception as e:
-            self.logger.error(f"통합 답변 생성 실패: {e}")
-            # Fallback: 간단한 결과 요약
-            summary = f"'{original_query}'에 대한 다중 검색 결과입니다:\n\n"
-            for i, result in enumerate(search_results[:5], 1):
-                summary += f"{i}. {result.get('title', '제목 없음')}\n"
-                summary += f"   {result.get('snippet', '설명 없음')[:150]}...\n\n"
-            return summary
+    
+    def _build_fallback_summary(self, original_query: str, search_results: List[Dict[str, Any]]) -> str:
+        """LLM 답변 생성 실패 시 간단한 결과 요약"""
+        summary = f"'{original_query}'에 대한 다중 검색 결과입니다:\n\n"
+        for i, result in enumerate(search_results[:5], 1):
+            summary += f"{i}. {result.get('title', '제목 없음')}\n"
+            summary += f"   {result.get('snippet', '설명 없음')[:150]}...\n\n"
+        return summary
     
     async def _enhance_summary(
         self,
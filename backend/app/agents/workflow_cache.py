@@ -0,0 +1,143 @@
+"""
+LangGraph 컴파일 워크플로우 캐시
+- StateGraph 구성/compile()과 체크포인터 생성을 요청마다 하지 않고 프로세스당 한 번만 수행
+- 캐시 키: (에이전트 ID, 워크플로우 변형, 체크포인터 백엔드)
+- 컴파일된 그래프는 상태를 갖지 않으므로 요청별 값은 입력 상태와 config(thread_id)로만 전달
+- 실행 옵션(run_options)으로 체크포인트 저장 시점(durability)을 함께 지정
+"""
+
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+NO_CHECKPOINTER = "none"
+POSTGRES_CHECKPOINTER = "postgres"
+ASYNC_POSTGRES_CHECKPOINTER = "postgres_async"
+
+
+class CompiledWorkflowCache:
+    """에이전트별 컴파일된 LangGraph 워크플로우와 공유 체크포인터 보관"""
+
+    def __init__(self):
+        self._compiled: Dict[Tuple[str, str, str], Any] = {}
+        self._checkpointers: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "compiles": 0, "compile_ms": 0.0}
+
+    def default_backend(self) -> str:
+        return settings.LANGGRAPH_CHECKPOINTER_BACKEND if settings.DATABASE_URL else NO_CHECKPOINTER
+
+    def get_checkpointer(self, backend: Optional[str] = None) -> Any:
+        """백엔드별 프로세스 공유 체크포인터 (없으면 None)"""
+        backend = backend or self.default_backend()
+        if backend == NO_CHECKPOINTER:
+            return None
+        if backend in self._checkpointers:
+            return self._checkpointers[backend]
+        with self._lock:
+            if backend not in self._checkpointers:
+                self._checkpointers[backend] = self._create_checkpointer(backend)
+        return self._checkpointers[backend]
+
+    def get(
+        self,
+        agent_id: str,
+        build: Callable[[], Any],
+        variant: str = "default",
+        backend: Optional[str] = None
+    ) -> Any:
+        """
+        컴파일된 워크플로우 반환 (처음 한 번만 build()로 StateGraph를 만들어 컴파일)
+
+        Args:
+            agent_id: 에이전트 ID
+            build: 컴파일 전 StateGraph를 돌려주는 함수
+            variant: 그래프 구성이 달라지는 기능 플래그 조합 이름
+            backend: 체크포인터 백엔드 (기본: DATABASE_URL 설정 여부로 결정)
+        """
+        backend = backend or self.default_backend()
+        key = (agent_id, variant, backend)
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            self.stats["hits"] += 1
+            return compiled
+
+        checkpointer = self.get_checkpointer(backend)
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is None:
+                started = time.perf_counter()
+                workflow = build()
+                compiled = workflow.compile(checkpointer=checkpointer) if checkpointer else workflow.compile()
+                elapsed_ms = (time.perf_counter() - started) * 1000
+                self._compiled[key] = compiled
+                self.stats["compiles"] += 1
+                self.stats["compile_ms"] += elapsed_ms
+                logger.info(f"🔧 LangGraph 워크플로우 컴파일: {agent_id} [{variant}/{backend}] {elapsed_ms:.1f}ms")
+            else:
+                self.stats["hits"] += 1
+        return compiled
+
+    def run_options(self, thread_id: str, backend: Optional[str] = None) -> Dict[str, Any]:
+        """
+        ainvoke/astream에 넘길 실행 옵션 (체크포인터가 없으면 빈 dict)
+
+        thread_id에는 실행마다 새 ID를 붙여, 같은 대화의 다음 턴이 이전 턴의 저장 상태를
+        이어받지 않게 합니다. (operator.add 리듀서 필드인 errors/agent_results 등이 턴마다
+        누적되는 것 방지) 요청/응답형 그래프는 저장 상태를 다시 읽지 않으므로 기본 백엔드는
+        "none"이며, 체크포인터를 켜면 기본 durability="exit"로 실행이 끝날 때 최종 상태만
+        저장합니다. (새 스레드는 시작 시 DB 조회 없음)
+        """
+        if self.get_checkpointer(backend) is None:
+            return {}
+        return {
+            "config": {"configurable": {"thread_id": f"{thread_id}:{uuid.uuid4().hex}"}},
+            "durability": settings.LANGGRAPH_CHECKPOINT_DURABILITY,
+        }
+
+    def invalidate(self, agent_id: Optional[str] = None) -> None:
+        """컴파일 결과 제거 (agent_id가 없으면 전체)"""
+        with self._lock:
+            for key in [k for k in self._compiled if agent_id is None or k[0] == agent_id]:
+                del self._compiled[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "compile_ms": round(self.stats["compile_ms"], 1),
+            "workflows": [f"{agent_id}[{variant}/{backend}]" for agent_id, variant, backend in self._compiled],
+            "checkpointers": {
+                backend: checkpointer.get_stats() if hasattr(checkpointer, "get_stats") else {}
+                for backend, checkpointer in list(self._checkpointers.items())
+            },
+        }
+
+    async def close(self) -> None:
+        """비동기 체크포인터의 남은 쓰기 기록 및 정리 작업 종료"""
+        for checkpointer in list(self._checkpointers.values()):
+            if hasattr(checkpointer, "aclose"):
+                await checkpointer.aclose()
+
+    @staticmethod
+    def _create_checkpointer(backend: str) -> Any:
+        if backend == ASYNC_POSTGRES_CHECKPOINTER:
+            from app.agents.langgraph_checkpointer import AsyncPooledCheckpointer
+
+            logger.info("비동기 PostgreSQL 체크포인터 생성 (앱 연결 풀 공유)")
+            return AsyncPooledCheckpointer()
+        if backend == POSTGRES_CHECKPOINTER:
+            from langgraph.checkpoint.postgres import PostgresSaver
+
+            logger.info("PostgreSQL 체크포인터 생성 (프로세스 공유)")
+            return PostgresSaver.from_conn_string(settings.DATABASE_URL)
+        raise ValueError(f"지원하지 않는 체크포인터 백엔드: {backend}")
+
+
+# 전역 워크플로우 캐시 인스턴스
+workflow_cache = CompiledWorkflowCache()
@@ -178,58 +178,50 @@ async def send_message_stream(
     user_id = current_user.get("id", "default_user")
     
     async def generate():
-        try:
-            # 🎨 진행 상태를 스트림에 추가하기 위한 큐
-            progress_queue = asyncio.Queue()
-            
-            # 🎨 진행 상태 콜백 함수 (Canvas 에이전트용)
-            async def progress_callback(progress_data):
-                """Canvas 에이전트의 진행 상태를 큐에 추가"""
-                progress_event = {
-                    "type": "progress",
-                    "data": {
-                        "step": progress_data.get("step", "processing"),
-                        "message": progress_data.get("message", "처리 중..."),
-                        "progress": progress_data.get("progress", 0),
-                        "timestamp": now_kst().isoformat()
-                    }
+        # 🎨 진행 상태 이벤트와 에이전트 스트리밍 이벤트를 하나의 큐로 합쳐 도착 즉시 전송
+        event_queue: asyncio.Queue = asyncio.Queue()
+        
+        # 🎨 진행 상태 콜백 함수 (Canvas 에이전트용)
+        async def progress_callback(progress_data):
+            """에이전트의 진행 상태를 큐에 추가"""
+            progress_event = {
+                "type": "progress",
+                "data": {
+                    "step": progress_data.get("step", "processing"),
+                    "message": progress_data.get("message", "처리 중..."),
+                    "progress": progress_data.get("progress", 0),
+                    "timestamp": now_kst().isoformat()
                 }
-                logger.info(f"🎨 Canvas 진행상태 큐 추가: {progress_event}")
-                await progress_queue.put(progress_event)
-            
-            # 프로그레스 이벤트를 먼저 전송하는 태스크
-            async def send_progress_events():
-                while True:
-                    try:
-                        # 0.1초 대기로 진행 상태 이벤트 확인
-                        progress_event = await asyncio.wait_for(progress_queue.get(), timeout=0.1)
-                        yield f"data: {json.dumps(progress_event)}\n\n"
-                    except asyncio.TimeoutError:
-                        break
-            
-            # 🎨 진행 상태 이벤트 먼저 전송
-            async for progress_data in send_progress_events():
-                yield progress_data
-            
-            # 새로운 execute_chat_stream 메서드로 대화 컨텍스트 지원 스트리밍
-            async for event in agent_service.execute_chat_stream(
-                message=chat_message.message,
-                model=chat_message.model,
-                agent_type=chat_message.agent_type,
-                user_id=user_id,
-                session_id=chat_message.session_id,
-                progress_callback=progress_callback  # 🎨 Canvas 진행 상태 콜백 추가
-            ):
-                # 스트리밍 중간에도 진행 상태 이벤트 확인
-                try:
-                    while True:
-                        progress_event = progress_queue.get_nowait()
-                        yield f"data: {json.dumps(progress_event)}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-                
+            }
+            logger.debug(f"🎨 진행상태 큐 추가: {progress_event}")
+            await event_queue.put(progress_event)
+        
+        async def pump_agent_events():
+            """execute_chat_stream 이벤트를 큐로 전달 (종료 시 None 전송)"""
+            try:
+                async for event in agent_service.execute_chat_stream(
+                    message=chat_message.message,
+                    model=chat_message.model,
+                    agent_type=chat_message.agent_type,
+                    user_id=user_id,
+                    session_id=chat_message.session_id,
+                    progress_callback=progress_callback  # 🎨 Canvas 진행 상태 콜백 추가
+                ):
+                    await event_queue.put(event)
+            finally:
+                await event_queue.put(None)
+        
+        pump_task = asyncio.create_task(pump_agent_events())
+        try:
+            while True:
+                event = await event_queue.get()
+                if event is None:
+                    break
                 # 이벤트를 JSON으로 직렬화하여 SSE 형태로 전송
                 yield f"data: {json.dumps(event)}\n\n"
+            
+            # 에이전트 스트림에서 발생한 예외 전파
+            await pump_task
                 
         except Exception as e:
             # 오류 이벤트
@@ -241,6 +233,10 @@ async def send_message_stream(
                 }
             }
             yield f"data: {json.dumps(error_result)}\n\n"
+        finally:
+            # 클라이언트 연결 종료 시 진행 중인 에이전트 실행 취소
+            if not pump_task.done():
+                pump_task.cancel()
     
     # SSE 응답 헤더 설정
     return StreamingResponse(
@@ -249,6 +245,7 @@ async def send_message_stream(
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # 프록시(nginx) 버퍼링 비활성화 - 토큰 즉시 전달
             "Access-Control-Allow-Origin": "*",
             "Access-Control-Allow-Headers": "Cache-Control",
         }
@@ -484,7 +481,8 @@ async def generate_conversation_title(
             model_name=request.model,
             prompt=title_prompt,
             user_id=current_user["id"],
-            conversation_id=None
+            conversation_id=None,
+            cache="conversation_title"
         )
         
         # 생성된 제목 정리
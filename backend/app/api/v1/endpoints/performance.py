@@ -10,6 +10,8 @@ from app.api.deps import get_db, get_current_user
 from app.services.performance_monitor import performance_monitor
 from app.services.conversation_cache_manager import conversation_cache_manager
 from app.services.intelligent_cache_manager import intelligent_cache_manager
+from app.services.embedding_service import embedding_service
+from app.services.vector_index_service import vector_index_service
 from app.db.models.user import User
 
 router = APIRouter()
@@ -72,6 +74,108 @@ async def get_cache_performance(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/embeddings")
+async def get_embedding_performance(
+    current_user: User = Depends(get_current_user)
+):
+    """임베딩 서비스 처리량 및 벡터 인덱스 통계 조회"""
+    try:
+        return {
+            'embedding_service': embedding_service.get_metrics(),
+            'vector_index': vector_index_service.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/llm-cache")
+async def get_llm_cache_performance(
+    current_user: User = Depends(get_current_user)
+):
+    """LLM 응답 캐시 호출 지점별 히트율 및 절약 토큰 조회"""
+    try:
+        from app.agents.llm_router import llm_router
+        return llm_router.response_cache.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/search-fanout")
+async def get_search_fanout_performance(
+    current_user: User = Depends(get_current_user)
+):
+    """검색 제공자별 지연 시간 분포(p50/p95/p99), hedge 및 취소 횟수 조회"""
+    try:
+        from app.services.search_service import search_service
+        return search_service.fanout.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/site-recommendations")
+async def get_site_recommendation_performance(
+    current_user: User = Depends(get_current_user)
+):
+    """메타 검색 사이트 추천 저장소 적중률 및 LLM 호출 수 조회"""
+    try:
+        from app.services.site_recommendation_store import site_recommendation_store
+        return site_recommendation_store.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/conversation-context")
+async def get_conversation_context_performance(
+    current_user: User = Depends(get_current_user)
+):
+    """대화 컨텍스트 증분 캐시 적중률 및 백그라운드 요약 대기열 조회"""
+    try:
+        from app.services.conversation_context_cache import conversation_context_store
+        from app.services.conversation_memory_service import conversation_summary_worker
+        return {
+            "context_cache": conversation_context_store.get_stats(),
+            "summary_worker": conversation_summary_worker.get_stats()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/llm-clients")
+async def get_llm_client_performance(
+    current_user: User = Depends(get_current_user)
+):
+    """공유 LLM 클라이언트별 재사용 횟수, 호출 상태 및 지연 시간 조회"""
+    try:
+        from app.agents.llm_client_registry import llm_client_registry
+        return llm_client_registry.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/langgraph-workflows")
+async def get_langgraph_workflow_performance(
+    current_user: User = Depends(get_current_user)
+):
+    """컴파일된 LangGraph 워크플로우 캐시 적중 횟수 및 컴파일 시간 조회"""
+    try:
+        from app.agents.workflow_cache import workflow_cache
+        return workflow_cache.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/supervisor-speculation")
+async def get_supervisor_speculation_performance(
+    current_user: User = Depends(get_current_user)
+):
+    """Supervisor 추측 실행 적중/취소 통계 조회"""
+    try:
+        from app.agents.speculative_executor import speculative_executor
+        return speculative_executor.get_stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/api")
 async def get_api_performance(
     minutes: int = Query(30, ge=1, le=1440),
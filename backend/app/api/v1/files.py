@@ -8,7 +8,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import uuid
 import os
-import shutil
+import asyncio
 from pathlib import Path
 import mimetypes
 import hashlib
@@ -21,6 +21,7 @@ from app.api.deps import get_current_active_user
 from app.core.config import settings
 from app.db.models import File as FileModel
 from app.db.session import AsyncSessionLocal
+from app.services.blob_store import blob_store
 from sqlalchemy.future import select
 from sqlalchemy import func
 from fastapi.responses import FileResponse, StreamingResponse
@@ -54,6 +55,7 @@ SUPPORTED_MIME_TYPES = {
 
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB
 MAX_FILES_PER_REQUEST = 10
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 스트리밍 저장 단위 (1MB)
 
 
 class FileUploadResponse(BaseModel):
@@ -93,13 +95,59 @@ class FileListResponse(BaseModel):
     limit: int
 
 
-def get_file_checksum(file_path: str) -> str:
-    """파일의 MD5 체크섬 계산"""
+class FileTooLargeError(Exception):
+    """스트리밍 중 최대 파일 크기 초과"""
+    pass
+
+
+def _write_and_hash(buffer, hashes, chunk: bytes) -> None:
+    """청크 저장과 체크섬 갱신을 한 번에 (executor 스레드에서 실행)"""
+    buffer.write(chunk)
+    for digest in hashes:
+        digest.update(chunk)
+
+
+async def stream_upload_to_disk(file: UploadFile, file_path: Path) -> tuple[int, str, str]:
+    """
+    업로드 파일을 청크 단위로 디스크에 저장하면서 체크섬 계산
+    
+    디스크 I/O와 해시 계산은 executor에서 수행해 이벤트 루프를 막지 않고,
+    파일을 다시 읽지 않습니다. MAX_FILE_SIZE를 넘으면 즉시 중단하고 부분 파일을 삭제합니다.
+    
+    Returns:
+        (파일 크기, MD5 체크섬, SHA-256 - 블롭 저장소 키)
+    """
+    loop = asyncio.get_running_loop()
     hash_md5 = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+    hash_sha256 = hashlib.sha256()
+    file_size = 0
+    
+    buffer = await loop.run_in_executor(None, open, file_path, "wb")
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            
+            file_size += len(chunk)
+            if file_size > MAX_FILE_SIZE:
+                raise FileTooLargeError(file.filename)
+            
+            await loop.run_in_executor(None, _write_and_hash, buffer, (hash_md5, hash_sha256), chunk)
+    except BaseException:
+        await loop.run_in_executor(None, buffer.close)
+        await loop.run_in_executor(None, _remove_file, file_path)
+        raise
+    
+    await loop.run_in_executor(None, buffer.close)
+    return file_size, hash_md5.hexdigest(), hash_sha256.hexdigest()
+
+
+def _remove_file(file_path: Path) -> None:
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        pass
 
 
 def get_upload_directory() -> Path:
@@ -156,83 +204,108 @@ async def upload_files(
     
     upload_dir = get_upload_directory()
     user_id = current_user["id"]
-    uploaded_files = []
     
     # 사용자별 하위 디렉토리 생성
     user_upload_dir = upload_dir / user_id
     user_upload_dir.mkdir(exist_ok=True)
     
+    # 저장 전에 모든 파일을 먼저 검증
     for file in files:
-        try:
-            # 파일 유효성 검증
-            is_valid, message = validate_file(file)
-            if not is_valid:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"파일 '{file.filename}': {message}"
-                )
-            
-            # 고유한 파일 ID 생성
-            file_id = str(uuid.uuid4())
-            file_extension = SUPPORTED_MIME_TYPES[file.content_type]
-            
-            # 파일 저장 경로 생성
-            safe_filename = f"{file_id}{file_extension}"
-            file_path = user_upload_dir / safe_filename
-            
-            # 파일 저장
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            
-            # 체크섬 계산
-            checksum = get_file_checksum(str(file_path))
-            
-            # 파일 정보 생성
-            file_info = FileUploadResponse(
-                file_id=file_id,
-                original_name=file.filename,
-                file_size=file_path.stat().st_size,
-                mime_type=file.content_type,
-                file_extension=file_extension,
-                upload_path=str(file_path),
-                status='uploaded',
-                checksum=checksum,
-                created_at=datetime.utcnow().isoformat()
+        is_valid, message = validate_file(file)
+        if not is_valid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"파일 '{file.filename}': {message}"
             )
-            
-            uploaded_files.append(file_info)
-            
-            # 메타데이터를 PostgreSQL에 저장
-            async with AsyncSessionLocal() as session:
-                file_record = FileModel(
-                    file_id=file_id,
+    
+    blob_refs = {}
+    
+    async def save_file(file: UploadFile) -> FileUploadResponse:
+        # 고유한 파일 ID 생성
+        file_id = str(uuid.uuid4())
+        file_extension = SUPPORTED_MIME_TYPES[file.content_type]
+        
+        # 파일 저장 경로 생성
+        safe_filename = f"{file_id}{file_extension}"
+        file_path = user_upload_dir / safe_filename
+        
+        # 스트리밍 저장 + 체크섬 계산 (한 번만 읽음)
+        tmp_path = await asyncio.get_running_loop().run_in_executor(None, blob_store.temp_path)
+        file_size, checksum, sha256 = await stream_upload_to_disk(file, tmp_path)
+        
+        # 같은 내용이 이미 있으면 기존 블롭을 링크하고 임시 파일은 버림
+        blob_refs[file_id] = await blob_store.adopt_file(tmp_path, sha256, file_path)
+        
+        return FileUploadResponse(
+            file_id=file_id,
+            original_name=file.filename,
+            file_size=file_size,
+            mime_type=file.content_type,
+            file_extension=file_extension,
+            upload_path=str(file_path),
+            status='uploaded',
+            checksum=checksum,
+            created_at=datetime.utcnow().isoformat()
+        )
+    
+    # 파일들을 동시에 저장
+    results = await asyncio.gather(*[save_file(file) for file in files], return_exceptions=True)
+    uploaded_files = [result for result in results if isinstance(result, FileUploadResponse)]
+    
+    for file, result in zip(files, results):
+        if isinstance(result, FileUploadResponse):
+            continue
+        
+        # 하나라도 실패하면 이번 요청에서 저장한 파일을 모두 정리
+        for ref in blob_refs.values():
+            await blob_store.discard(ref)
+        
+        if isinstance(result, FileTooLargeError):
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"파일 '{file.filename}': 파일 크기가 너무 큽니다. 최대 {MAX_FILE_SIZE // (1024*1024)}MB까지 허용됩니다."
+            )
+        logger.error(f"파일 업로드 실패 - {file.filename}: {result}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"파일 '{file.filename}' 업로드 중 오류가 발생했습니다."
+        )
+    
+    # 요청 전체의 메타데이터를 한 트랜잭션으로 저장
+    try:
+        async with AsyncSessionLocal() as session:
+            session.add_all([
+                FileModel(
+                    file_id=file_info.file_id,
                     user_id=user_id,
-                    original_name=file.filename,
-                    file_size=file_path.stat().st_size,
-                    mime_type=file.content_type or 'application/octet-stream',
-                    file_extension=file_extension,
-                    upload_path=str(file_path),
-                    checksum=checksum,
+                    original_name=file_info.original_name,
+                    file_size=file_info.file_size,
+                    mime_type=file_info.mime_type or 'application/octet-stream',
+                    file_extension=file_info.file_extension,
+                    upload_path=file_info.upload_path,
+                    checksum=file_info.checksum,
                     status='uploaded',
                     description=description,
                     tags=tags.split(',') if tags else [],
-                    metadata_={'original_filename': file.filename, 'upload_time': datetime.utcnow().isoformat()}
+                    metadata_={'original_filename': file_info.original_name, 'upload_time': file_info.created_at}
                 )
-                session.add(file_record)
-                await session.commit()
-                logger.info(f"파일 메타데이터 저장 완료: {file_id}")
-            
-            logger.info(f"파일 업로드 성공: {file.filename} -> {file_id}")
-            
-        except HTTPException:
-            # 이미 HTTPException인 경우 재발생
-            raise
-        except Exception as e:
-            logger.error(f"파일 업로드 실패 - {file.filename}: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"파일 '{file.filename}' 업로드 중 오류가 발생했습니다."
-            )
+                for file_info in uploaded_files
+            ])
+            await blob_store.record_links(blob_refs.values(), session)
+            await session.commit()
+            logger.info(f"파일 메타데이터 저장 완료: {len(uploaded_files)}개")
+    except Exception as e:
+        for ref in blob_refs.values():
+            await blob_store.discard(ref)
+        logger.error(f"파일 메타데이터 저장 실패: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="파일 업로드 중 오류가 발생했습니다."
+        )
+    
+    for file_info in uploaded_files:
+        deduplicated = " (중복 내용 - 기존 블롭 재사용)" if blob_refs[file_info.file_id].deduplicated else ""
+        logger.info(f"파일 업로드 성공: {file_info.original_name} -> {file_info.file_id}{deduplicated}")
     
     return uploaded_files
 
@@ -1,17 +1,19 @@
 from app.db.models.user import User
-from app.db.models.conversation import Conversation, Message, ConversationSummary
+from app.db.models.conversation import Conversation, Message, ConversationSummary, ConversationSummaryVersion
 from app.db.models.workspace import Workspace, Artifact
 from app.db.models.cache import CacheEntry
 from app.db.models.feedback import MessageFeedback, FeedbackAnalytics, UserFeedbackProfile
-from app.db.models.file import File, FileProcessingJob, FileShare, FileVersion
+from app.db.models.file import File, FileProcessingJob, FileShare, FileVersion, ContentBlob, ContentBlobLink
 from app.db.models.image_generation import GeneratedImage
 from app.db.models.image_session import ImageGenerationSession, ImageGenerationVersion
+from app.db.models.langgraph_checkpoint import LangGraphCheckpoint, LangGraphCheckpointWrite
 
 __all__ = [
     "User",
     "Conversation",
     "Message", 
     "ConversationSummary",
+    "ConversationSummaryVersion",
     "Workspace",
     "Artifact",
     "CacheEntry",
@@ -22,7 +24,11 @@ __all__ = [
     "FileProcessingJob",
     "FileShare", 
     "FileVersion",
+    "ContentBlob",
+    "ContentBlobLink",
     "GeneratedImage",
     "ImageGenerationSession",
-    "ImageGenerationVersion"
+    "ImageGenerationVersion",
+    "LangGraphCheckpoint",
+    "LangGraphCheckpointWrite"
 ]
\ No newline at end of file
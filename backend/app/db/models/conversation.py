@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON, Integer, Enum as SQLEnum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Text, JSON, Integer, Enum as SQLEnum, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -86,5 +86,27 @@ class ConversationSummary(Base):
     conversation = relationship("Conversation", back_populates="summaries")
 
 
+class ConversationSummaryVersion(Base):
+    """장기메모리 요약 버전 (백그라운드 작업자가 이전 버전 + 새 Q&A 쌍으로 증분 생성)"""
+    __tablename__ = "conversation_summary_versions"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)
+    base_version = Column(Integer)  # 증분 생성의 기준 버전 (처음 생성이면 없음)
+    
+    summary_text = Column(Text, nullable=False)
+    pairs_covered = Column(Integer, nullable=False, default=0)  # 요약에 반영된 Q&A 쌍 수 (누적)
+    covered_until = Column(String(64))  # 요약에 반영된 마지막 질문 시각 (ISO 형식)
+    model = Column(String(100))
+    latency_ms = Column(Integer)
+    
+    created_at = Column(DateTime, default=now_kst)
+    
+    __table_args__ = (
+        UniqueConstraint('conversation_id', 'version', name='unique_conversation_summary_version'),
+    )
+
+
 # Conversation 모델에 summaries 관계 추가를 위해 기존 관계 확장이 필요하지만,
 # 순환 import를 피하기 위해 relationship을 나중에 추가하도록 설계
\ No newline at end of file
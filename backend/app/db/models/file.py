@@ -87,4 +87,29 @@ class FileVersion(Base):
 
     __table_args__ = (
         UniqueConstraint('file_id', 'version_number', name='unique_file_version'),
-    )
\ No newline at end of file
+    )
+
+class ContentBlob(Base):
+    """콘텐츠 주소 기반 저장소의 블롭 (SHA-256 기준 한 번만 저장)"""
+    __tablename__ = "content_blobs"
+
+    sha256 = Column(String(64), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)  # 블롭을 참조하는 File/ImageHistory 행 수 (GC 시 갱신)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ContentBlob(sha256={self.sha256}, refs={self.ref_count})>"
+
+
+class ContentBlobLink(Base):
+    """블롭을 기존 경로로 노출하는 링크 (하드 링크/심볼릭 링크/복사본)"""
+    __tablename__ = "content_blob_links"
+
+    path = Column(String(500), primary_key=True)  # 절대 경로
+    sha256 = Column(String(64), nullable=False, index=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<ContentBlobLink(path={self.path}, sha256={self.sha256})>"
@@ -0,0 +1,54 @@
+"""
+LangGraph 체크포인트 데이터베이스 모델
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Column, String, Integer, DateTime, LargeBinary, Index
+
+from app.db.base import Base
+
+
+class LangGraphCheckpoint(Base):
+    """LangGraph 스레드 체크포인트 (채널 값을 포함한 전체 상태를 직렬화해 저장)"""
+    __tablename__ = "langgraph_checkpoints"
+
+    thread_id = Column(String(255), primary_key=True)
+    checkpoint_ns = Column(String(255), primary_key=True, default="")
+    checkpoint_id = Column(String(255), primary_key=True)
+    parent_checkpoint_id = Column(String(255))
+
+    checkpoint_type = Column(String(50), nullable=False)  # 직렬화 형식 (serde.dumps_typed)
+    checkpoint = Column(LargeBinary, nullable=False)
+    metadata_type = Column(String(50), nullable=False)
+    checkpoint_metadata = Column("metadata", LargeBinary, nullable=False)
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("idx_langgraph_checkpoints_thread_created", "thread_id", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<LangGraphCheckpoint(thread_id={self.thread_id}, checkpoint_id={self.checkpoint_id})>"
+
+
+class LangGraphCheckpointWrite(Base):
+    """체크포인트에 딸린 노드 중간 쓰기 (pending writes)"""
+    __tablename__ = "langgraph_checkpoint_writes"
+
+    thread_id = Column(String(255), primary_key=True)
+    checkpoint_ns = Column(String(255), primary_key=True, default="")
+    checkpoint_id = Column(String(255), primary_key=True)
+    task_id = Column(String(255), primary_key=True)
+    idx = Column(Integer, primary_key=True)  # 음수는 특수 채널 (오류/인터럽트 등, 덮어쓰기)
+
+    channel = Column(String(255), nullable=False)
+    value_type = Column(String(50), nullable=False)
+    value = Column(LargeBinary)
+    task_path = Column(String(500), nullable=False, default="")
+
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<LangGraphCheckpointWrite(thread_id={self.thread_id}, task_id={self.task_id}, idx={self.idx})>"
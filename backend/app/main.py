@@ -60,10 +60,55 @@ async def lifespan(app: FastAPI):
         environment=settings.ENVIRONMENT
     )
     
+    # L2 캐시 히트 카운트 flush 및 만료 정리 작업 시작
+    from app.services.cache_manager import cache_manager
+    await cache_manager.start_cleanup_task()
+    
+    # 미참조 업로드/이미지 블롭 정리 작업 시작
+    from app.services.blob_store import blob_store
+    await blob_store.start_gc_task()
+    
     yield
     
     # 애플리케이션 종료 시
     logger.info("🛑 AI 포탈 백엔드 서버가 종료됩니다...")
+    await cache_manager.stop_cleanup_task()
+    
+    # 임베딩 워커 풀 종료
+    from app.services.embedding_service import embedding_service
+    await embedding_service.close()
+    
+    # OpenSearch bulk 대기열 처리 및 연결 풀 종료
+    from app.services.opensearch_service import opensearch_service
+    await opensearch_service.close()
+    
+    # 블롭 GC 중지
+    from app.services.blob_store import blob_store
+    await blob_store.stop_gc_task()
+    
+    # 문서 추출 워커 풀 종료
+    from app.services.document_extraction_service import document_extraction_service
+    await document_extraction_service.close()
+    
+    # 웹 크롤러 연결 풀/파싱 워커 종료
+    from app.services.web_crawler import web_crawler
+    await web_crawler.close()
+    
+    # 공유 LLM 클라이언트 연결 풀 종료
+    from app.agents.llm_client_registry import llm_client_registry
+    await llm_client_registry.close()
+    
+    # LangGraph 체크포인터 버퍼 기록 및 정리 작업 종료
+    from app.agents.workflow_cache import workflow_cache
+    await workflow_cache.close()
+    
+    # 대화 요약 백그라운드 작업자 종료
+    from app.services.conversation_memory_service import conversation_summary_worker
+    await conversation_summary_worker.close()
+    
+    # 사이트 추천 저장소 갱신 작업 정리
+    from app.services.site_recommendation_store import site_recommendation_store
+    await site_recommendation_store.close()
     
     # 서버 종료 이벤트 로깅
     uptime = time.time() - server_start_time
@@ -156,7 +201,7 @@ async def health_check():
     # OpenSearch 상태 체크
     try:
         from app.services.opensearch_service import opensearch_service
-        if opensearch_service.is_connected():
+        if await opensearch_service.is_connected():
             services_status["opensearch"] = "healthy"
         else:
             services_status["opensearch"] = "disconnected"
@@ -196,14 +241,14 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 # 정적 파일 마운트 - 생성된 이미지 서빙
 app.mount(
     "/api/v1/images/generated", 
-    StaticFiles(directory=str(generated_images_dir)), 
+    StaticFiles(directory=str(generated_images_dir), follow_symlink=True),  # 블롭 저장소 심볼릭 링크 허용
     name="generated_images"
 )
 
 # 정적 파일 마운트 - 편집된 이미지 서빙
 app.mount(
     "/api/v1/images/edited", 
-    StaticFiles(directory=str(edited_images_dir)), 
+    StaticFiles(directory=str(edited_images_dir), follow_symlink=True),  # 블롭 저장소 심볼릭 링크 허용
     name="edited_images"
 )
 
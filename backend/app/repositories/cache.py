@@ -1,7 +1,8 @@
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List
 from datetime import datetime, timedelta
 import json
-from sqlalchemy import select, and_, delete
+from sqlalchemy import select, and_, delete, update, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.base import BaseRepository
 from app.db.models.cache import CacheEntry
@@ -13,64 +14,117 @@ class CacheRepository(BaseRepository[CacheEntry]):
     def __init__(self, session: AsyncSession):
         super().__init__(CacheEntry, session)
     
+    @staticmethod
+    def _deserialize(raw: str) -> Any:
+        """저장된 텍스트를 원래 값으로 복원"""
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return raw
+    
+    @staticmethod
+    def _serialize(value: Any) -> str:
+        """값을 저장용 텍스트로 직렬화 (문자열도 JSON 인코딩해 조회 시 타입이 그대로 복원되도록 함, datetime/UUID 등은 문자열로)"""
+        return json.dumps(value, default=str)
+    
     async def get_value(self, key: str) -> Optional[Any]:
-        """캐시 값 조회"""
+        """캐시 값 조회 (읽기 전용 - 히트 카운트는 increment_hits로 일괄 반영)"""
+        values = await self.get_values([key])
+        return values.get(key)
+    
+    async def get_values(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 캐시 값을 한 번의 SELECT로 조회 (만료되지 않은 항목만 반환)"""
+        if not keys:
+            return {}
+        
         result = await self.session.execute(
-            select(CacheEntry).where(
+            select(CacheEntry.key, CacheEntry.value).where(
                 and_(
-                    CacheEntry.key == key,
+                    CacheEntry.key.in_(keys),
                     CacheEntry.expires_at > datetime.utcnow()
                 )
             )
         )
-        entry = result.scalar_one_or_none()
-        
-        if entry:
-            # 히트 카운트 증가
-            entry.increment_hit()
-            await self.session.commit()
-            
-            try:
-                return json.loads(entry.value)
-            except json.JSONDecodeError:
-                return entry.value
-        
-        return None
+        return {row.key: self._deserialize(row.value) for row in result}
     
     async def set_value(
         self,
         key: str,
         value: Any,
         ttl_seconds: int = 3600
-    ) -> CacheEntry:
-        """캐시 값 설정"""
-        # 기존 엔트리 확인
-        result = await self.session.execute(
-            select(CacheEntry).where(CacheEntry.key == key)
-        )
-        entry = result.scalar_one_or_none()
+    ) -> int:
+        """캐시 값 설정 (INSERT ... ON CONFLICT 단일 문장)"""
+        return await self.upsert_values({key: value}, ttl_seconds)
+    
+    async def upsert_values(
+        self,
+        items: Dict[str, Any],
+        ttl_seconds: int = 3600
+    ) -> int:
+        """여러 캐시 값을 한 번의 INSERT ... ON CONFLICT DO UPDATE로 저장"""
+        if not items:
+            return 0
         
-        # JSON으로 직렬화
-        if not isinstance(value, str):
-            value = json.dumps(value)
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        rows = [
+            {
+                "key": key,
+                "value": self._serialize(value),
+                "ttl_seconds": ttl_seconds,
+                "expires_at": expires_at,
+                "hit_count": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for key, value in items.items()
+        ]
         
-        if entry:
-            # 기존 엔트리 업데이트
-            entry.value = value
-            entry.ttl_seconds = ttl_seconds
-            entry.update_expiry(ttl_seconds)
-            await self.session.commit()
-            await self.session.refresh(entry)
-            return entry
-        else:
-            # 새 엔트리 생성
-            return await self.create(
-                key=key,
-                value=value,
-                ttl_seconds=ttl_seconds,
-                expires_at=datetime.utcnow() + timedelta(seconds=ttl_seconds),
-                hit_count=0
+        stmt = pg_insert(CacheEntry).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CacheEntry.key],
+            set_={
+                "value": stmt.excluded.value,
+                "ttl_seconds": stmt.excluded.ttl_seconds,
+                "expires_at": stmt.excluded.expires_at,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+        return len(rows)
+    
+    async def increment_hits(self, hit_counts: Dict[str, int]) -> None:
+        """버퍼링된 히트 카운트를 한 번의 executemany UPDATE로 반영"""
+        if not hit_counts:
+            return
+        
+        table = CacheEntry.__table__
+        stmt = (
+            update(table)
+            .where(table.c.key == bindparam("b_key"))
+            .values(
+                hit_count=table.c.hit_count + bindparam("b_count"),
+                last_accessed_at=bindparam("b_accessed_at")
             )
+        )
+        now = datetime.utcnow()
+        await self.session.execute(
+            stmt,
+            [
+                {"b_key": key, "b_count": count, "b_accessed_at": now}
+                for key, count in hit_counts.items()
+            ]
+        )
+        await self.session.commit()
+    
+    async def delete_matching(self, pattern: str) -> int:
+        """키에 패턴 문자열이 포함된 캐시 엔트리 삭제"""
+        result = await self.session.execute(
+            delete(CacheEntry).where(CacheEntry.key.contains(pattern, autoescape=True))
+        )
+        await self.session.commit()
+        return result.rowcount
     
     async def delete_value(self, key: str) -> bool:
         """캐시 값 삭제"""
@@ -8,7 +8,6 @@ import re
 from datetime import datetime
 from app.utils.timezone import now_kst
 from app.utils.logger import get_logger
-from app.utils.streaming import split_response_into_natural_chunks, StreamingConfig
 
 from app.agents.base import AgentInput
 from app.agents.supervisor import supervisor_agent
@@ -34,9 +33,6 @@ class AgentService:
             "web_search": web_search_agent,
             "canvas": self.simple_canvas_agent,
         }
-        
-        # 스트리밍 설정 (Gemini 스타일 "스르륵" 타이핑 효과)
-        self.streaming_config = StreamingConfig()
     
     async def _fallback_general_chat(self, message: str, model: str) -> AsyncGenerator[Dict[str, Any], None]:
         """
@@ -549,188 +545,69 @@ class AgentService:
                 conversation_context=conversation_context  # 새로운 맥락 정보 추가
             )
             
-            # 에이전트 선택 및 실행 - 스트리밍 응답 실시간 축적 방식
+            # 에이전트 선택 및 실행 - 에이전트가 생성하는 토큰을 그대로 전달
             streamed_response = ""  # 스트리밍으로 생성된 실제 응답을 축적
             chunk_count = 0
             citations = []
             sources = []
+            result = None
             
             if agent_type == "none" or agent_type == "auto" or agent_type == "supervisor":
-                # Supervisor가 완전한 응답 생성 후 청크로 분할하여 스트리밍 (이중 LLM 호출 완전 제거)
-                logger.info(f"🤖 Supervisor 에이전트 실행 시작 - 모델: {selected_model}")
-                result = await self.supervisor.execute(agent_input, selected_model, progress_callback)
-                
-                # 결과에서 citations/sources 추출
-                citations = getattr(result, 'citations', [])
-                sources = getattr(result, 'sources', [])
-                complete_response = result.result  # 에이전트가 생성한 완전한 응답
-                
-                logger.info(f"🔪 Supervisor 응답 청킹 시작 - 응답 길이: {len(complete_response)}")
-                
-                # 에이전트 응답을 자연스러운 청크로 분할
-                response_chunks = split_response_into_natural_chunks(
-                    complete_response, 
-                    self.streaming_config.get("chunk_size_range")
-                )
-                
-                # 청크 분할 검증 로깅 (안전성 확인)
-                chunk_total_length = sum(len(chunk) for chunk in response_chunks)
-                logger.info(f"🔍 Supervisor 청크 분할 검증 - 원본: {len(complete_response)}자, 청크 합계: {chunk_total_length}자, 청크 수: {len(response_chunks)}")
-                
-                # 각 청크 정보 로깅
-                for i, chunk in enumerate(response_chunks[:5]):  # 처음 5개만 로깅
-                    logger.info(f"📝 청크 #{i+1}: {len(chunk)}자 - {repr(chunk[:50])}{'...' if len(chunk) > 50 else ''}")
-                
-                # 청크별로 스트리밍 전송 (자연스러운 타이핑 효과)
-                for i, chunk in enumerate(response_chunks):
-                    chunk_count += 1
-                    streamed_response += chunk  # 동일한 내용 축적
-                    
-                    logger.info(f"📡 Supervisor 청크 #{i+1}/{len(response_chunks)} 전송: {len(chunk)}자")
-                    
-                    yield {"type": "chunk", "data": {
-                        "text": chunk,
-                        "index": i,
-                        "is_final": False
-                    }}
-                    
-                    # Gemini 스타일 "스르륵" 흐름 딜레이
-                    import random
-                    if chunk.strip():  # 빈 청크가 아닌 경우만
-                        # 적응형 속도 조절 (텍스트 길이에 따라)
-                        if self.streaming_config.get("adaptive_speed", False):
-                            # 청크가 작을수록 빠르게, 클수록 조금 느리게
-                            speed_factor = max(0.5, 1.0 - (len(chunk) / 20))
-                        else:
-                            speed_factor = 1.0
-                        
-                        # 기본 딜레이 + 글자수 기반 추가 딜레이
-                        base_delay = random.uniform(*self.streaming_config.get("base_delay_range")) * speed_factor
-                        character_delay = len(chunk) * self.streaming_config.get("character_delay")
-                        
-                        # 흐름 가속 효과 (연속된 청크일수록 빨라짐)
-                        if self.streaming_config.get("flow_acceleration", False) and i > 3:
-                            acceleration_factor = max(0.7, 1.0 - (i * 0.02))  # 점진적 가속
-                            base_delay *= acceleration_factor
-                        
-                        total_delay = base_delay + character_delay
-                        
-                        # 한글/영문에 따른 미세 조정
-                        korean_chars = sum(1 for c in chunk if ord(c) >= 0xAC00 and ord(c) <= 0xD7A3)
-                        if korean_chars > 0:
-                            # 한글은 조금 더 천천히 (가독성)
-                            total_delay *= 1.1
-                        
-                        # 공백이 있으면 단어 간 일시정지 추가
-                        if ' ' in chunk:
-                            word_count = chunk.count(' ')
-                            total_delay += word_count * self.streaming_config.get("word_pause")
-                        
-                        await asyncio.sleep(min(total_delay, 0.08))  # 최대 80ms (더 빠르게)
-                    
-                    # 문장 끝 일시정지 (더 자연스럽게)
-                    if chunk.rstrip().endswith(('.', '!', '?')):
-                        await asyncio.sleep(self.streaming_config.get("sentence_pause"))
-                    elif chunk.endswith('\n\n'):
-                        await asyncio.sleep(self.streaming_config.get("paragraph_pause"))
-                    
+                agent = self.supervisor
             else:
-                # 특정 에이전트 직접 실행
                 agent = self.agents.get(agent_type)
-                if agent:
-                    logger.info(f"🤖 {agent_type} 에이전트 실행 시작 - 모델: {selected_model}")
-                    result = await agent.execute(agent_input, selected_model, progress_callback)
-                    
-                    # 결과에서 citations/sources 추출
-                    citations = getattr(result, 'citations', [])
-                    sources = getattr(result, 'sources', [])
-                    complete_response = result.result  # 에이전트가 생성한 완전한 응답
-                    
-                    logger.info(f"🔪 {agent_type} 응답 청킹 시작 - 응답 길이: {len(complete_response)}")
-                    
-                    # 에이전트 응답을 자연스러운 청크로 분할
-                    response_chunks = split_response_into_natural_chunks(
-                        complete_response, 
-                        self.streaming_config.get("chunk_size_range")
-                    )
-                    
-                    # 청크 분할 검증 로깅 (안전성 확인)
-                    chunk_total_length = sum(len(chunk) for chunk in response_chunks)
-                    logger.info(f"🔍 {agent_type} 청크 분할 검증 - 원본: {len(complete_response)}자, 청크 합계: {chunk_total_length}자, 청크 수: {len(response_chunks)}")
-                    
-                    # 각 청크 정보 로깅
-                    for i, chunk in enumerate(response_chunks[:5]):  # 처음 5개만 로깅
-                        logger.info(f"📝 청크 #{i+1}: {len(chunk)}자 - {repr(chunk[:50])}{'...' if len(chunk) > 50 else ''}")
-                    
-                    # 청크별로 스트리밍 전송 (자연스러운 타이핑 효과)
-                    for i, chunk in enumerate(response_chunks):
-                        chunk_count += 1
-                        streamed_response += chunk  # 동일한 내용 축적
-                        
-                        logger.info(f"📡 {agent_type} 청크 #{i+1}/{len(response_chunks)} 전송: {len(chunk)}자")
-                        
+            
+            if agent:
+                logger.info(f"🤖 {agent.agent_id} 에이전트 스트리밍 실행 시작 - 모델: {selected_model}")
+                
+                async for event in agent.execute_stream(agent_input, selected_model, progress_callback):
+                    if event.type == "token" and event.text:
+                        streamed_response += event.text
                         yield {"type": "chunk", "data": {
-                            "text": chunk,
-                            "index": i,
+                            "text": event.text,
+                            "index": chunk_count,
                             "is_final": False
                         }}
-                        
-                        # Gemini 스타일 "스르륵" 흐름 딜레이
-                        import random
-                        if chunk.strip():  # 빈 청크가 아닌 경우만
-                            # 적응형 속도 조절 (텍스트 길이에 따라)
-                            if self.streaming_config.get("adaptive_speed", False):
-                                # 청크가 작을수록 빠르게, 클수록 조금 느리게
-                                speed_factor = max(0.5, 1.0 - (len(chunk) / 20))
-                            else:
-                                speed_factor = 1.0
-                            
-                            # 기본 딜레이 + 글자수 기반 추가 딜레이
-                            base_delay = random.uniform(*self.streaming_config.get("base_delay_range")) * speed_factor
-                            character_delay = len(chunk) * self.streaming_config.get("character_delay")
-                            
-                            # 흐름 가속 효과 (연속된 청크일수록 빨라짐)
-                            if self.streaming_config.get("flow_acceleration", False) and i > 3:
-                                acceleration_factor = max(0.7, 1.0 - (i * 0.02))  # 점진적 가속
-                                base_delay *= acceleration_factor
-                            
-                            total_delay = base_delay + character_delay
-                            
-                            # 한글/영문에 따른 미세 조정
-                            korean_chars = sum(1 for c in chunk if ord(c) >= 0xAC00 and ord(c) <= 0xD7A3)
-                            if korean_chars > 0:
-                                # 한글은 조금 더 천천히 (가독성)
-                                total_delay *= 1.1
-                            
-                            # 공백이 있으면 단어 간 일시정지 추가
-                            if ' ' in chunk:
-                                word_count = chunk.count(' ')
-                                total_delay += word_count * self.streaming_config.get("word_pause")
-                            
-                            await asyncio.sleep(min(total_delay, 0.08))  # 최대 80ms (더 빠르게)
-                        
-                        # 문장 끝 일시정지 (더 자연스럽게)
-                        if chunk.rstrip().endswith(('.', '!', '?')):
-                            await asyncio.sleep(self.streaming_config.get("sentence_pause"))
-                        elif chunk.endswith('\n\n'):
-                            await asyncio.sleep(self.streaming_config.get("paragraph_pause"))
-                else:
-                    # 에이전트를 찾을 수 없으면 일반 채팅으로 실제 LLM 스트리밍 (유지)
-                    logger.info(f"💬 일반 채팅 모드 - 직접 LLM 스트리밍: {selected_model}")
-                    logger.debug(f"🎯 일반 채팅 프롬프트: {enhanced_message[:100]}{'...' if len(enhanced_message) > 100 else ''}")
-                    
-                    # 일반 채팅은 실제 LLM 스트리밍 유지 (에이전트 대체 모드)
-                    async for chunk in llm_router.stream_response(selected_model, enhanced_message):
                         chunk_count += 1
-                        streamed_response += chunk  # 실시간 축적
-                        
-                        logger.debug(f"📝 일반 채팅 청크 및 축적: {repr(chunk[:50])}{'...' if len(chunk) > 50 else ''}")
-                        
+                    elif event.type == "citations":
+                        # 답변 생성 전에 확정된 인용 정보를 먼저 전달
+                        citations = event.citations or []
+                        sources = event.sources or []
+                        yield {"type": "citations", "data": {
+                            "citations": citations,
+                            "sources": sources,
+                            "partial": event.partial
+                        }}
+                    elif event.type == "result":
+                        result = event.output
+                
+                if result is not None:
+                    citations = result.citations or citations
+                    sources = result.sources or sources
+                    
+                    # 토큰 없이 결과만 반환된 경우 (오류 등) 결과 텍스트를 한 번에 전달
+                    if not streamed_response and result.result:
+                        streamed_response = result.result
                         yield {"type": "chunk", "data": {
-                            "text": chunk,
-                            "index": chunk_count - 1,
+                            "text": result.result,
+                            "index": chunk_count,
                             "is_final": False
                         }}
+                        chunk_count += 1
+            else:
+                # 에이전트를 찾을 수 없으면 일반 채팅으로 실제 LLM 스트리밍 (유지)
+                logger.info(f"💬 일반 채팅 모드 - 직접 LLM 스트리밍: {selected_model}")
+                logger.debug(f"🎯 일반 채팅 프롬프트: {enhanced_message[:100]}{'...' if len(enhanced_message) > 100 else ''}")
+                
+                async for chunk in llm_router.stream_response(selected_model, enhanced_message):
+                    chunk_count += 1
+                    streamed_response += chunk  # 실시간 축적
+                    
+                    yield {"type": "chunk", "data": {
+                        "text": chunk,
+                        "index": chunk_count - 1,
+                        "is_final": False
+                    }}
             
             # 마지막 청크 표시
             if chunk_count > 0:
@@ -740,8 +617,8 @@ class AgentService:
                     "is_final": True
                 }}
             
-            # 에이전트 응답과 스트리밍 응답의 완전 일치 확인 및 DB 저장
-            response_metadata = {"streaming": True, "chunk_count": chunk_count, "response_method": "agent_chunked"}
+            # 스트리밍된 응답을 그대로 DB에 저장
+            response_metadata = {"streaming": True, "chunk_count": chunk_count, "response_method": "agent_token_stream"}
             
             # 에이전트 결과에서 citations와 sources 정보 추가
             if citations:
@@ -750,31 +627,11 @@ class AgentService:
                 response_metadata['sources'] = sources
             
             # canvas_data 추출 (스트리밍에서도 캔버스 데이터 저장)
-            canvas_data = None
-            if 'result' in locals() and hasattr(result, 'canvas_data'):
-                canvas_data = getattr(result, 'canvas_data', None)
-                if canvas_data:
-                    logger.info(f"🎨 스트리밍 모드에서 Canvas 데이터 추출 성공 - 타입: {canvas_data.get('type', 'unknown')}")
-                else:
-                    logger.debug("🎨 스트리밍 모드에서 Canvas 데이터 없음")
-                
-            # 실제 에이전트 응답과 스트리밍 응답 비교 로깅
-            if 'complete_response' in locals():  # 에이전트 모드인 경우
-                original_length = len(complete_response)
-                streamed_length = len(streamed_response)
-                is_identical = complete_response == streamed_response
-                
-                logger.info(f"🔄 응답 일치 확인 - 원본: {original_length}자, 스트리밍: {streamed_length}자, 동일: {is_identical}")
-                
-                if not is_identical:
-                    logger.warning(f"⚠️ 응답 불일치 감지! 원본 사용")
-                    # 원본 에이전트 응답을 DB에 저장 (안전 대비)
-                    final_response = complete_response
-                else:
-                    final_response = streamed_response
-            else:
-                # 일반 채팅 모드인 경우
-                final_response = streamed_response
+            canvas_data = result.canvas_data if result is not None else None
+            if canvas_data:
+                logger.info(f"🎨 스트리밍 모드에서 Canvas 데이터 추출 성공 - 타입: {canvas_data.get('type', 'unknown')}")
+            
+            final_response = streamed_response
                 
             logger.info(f"💾 스트리밍 응답 DB 저장 - 길이: {len(final_response)}, 실제 전송 청크: {chunk_count}")
             logger.info(f"💾 저장할 응답 내용 (처음 100자): {final_response[:100]}{'...' if len(final_response) > 100 else ''}")
@@ -784,7 +641,7 @@ class AgentService:
                     conversation_id=session_id,
                     user_id=user_id,
                     role=MessageRole.ASSISTANT,
-                    content=final_response,  # 에이전트 원본 또는 스트리밍 응답 (동일함 보장)
+                    content=final_response,  # 사용자에게 전송된 스트리밍 응답
                     session=db,
                     model=selected_model,
                     metadata_=response_metadata,
@@ -829,7 +686,7 @@ class AgentService:
             
             if agent_type == "none" or agent_type == "auto" or agent_type == "supervisor":
                 # Supervisor가 실행되어 result 객체가 있는 경우
-                if 'result' in locals() and hasattr(result, 'metadata'):
+                if result is not None:
                     delegated_to = result.metadata.get('delegated_to')
                     supervisor_decision = result.metadata.get('supervisor_decision')
                     
@@ -863,11 +720,7 @@ class AgentService:
             }}
             
             # Canvas 데이터 추출 (에이전트 결과에서)
-            canvas_data_for_response = None
-            if 'result' in locals() and hasattr(result, 'canvas_data'):
-                canvas_data_for_response = result.canvas_data
-                if canvas_data_for_response:
-                    logger.info(f"🎨 스트리밍 응답에서 Canvas 데이터 전송 - 타입: {canvas_data_for_response.get('type', 'unknown')}")
+            canvas_data_for_response = canvas_data
             
             # 최종 완료 결과 전송
             yield {"type": "result", "data": {
@@ -1009,7 +862,8 @@ class AgentService:
                 prompt=title_prompt,
                 user_id=user_id,
                 conversation_id=None,
-                include_datetime=False  # 제목 생성시에는 날짜 정보 불필요
+                include_datetime=False,  # 제목 생성시에는 날짜 정보 불필요
+                cache="conversation_title"
             )
             
             # 생성된 제목 정리
@@ -0,0 +1,377 @@
+"""
+콘텐츠 주소 기반 블롭 저장소 (업로드 파일 / 생성 이미지 중복 제거)
+- 내용은 SHA-256 기준으로 한 번만 저장: {BLOB_STORE_DIR}/{sha[:2]}/{sha}
+- 기존 경로(uploads/{user}/..., generated_images/...)는 블롭의 하드 링크로 노출
+  (다른 파일시스템이면 심볼릭 링크, 둘 다 불가하면 복사)
+- 참조 수는 File / ImageHistory / GeneratedImage 행에서 계산하고,
+  참조가 없는 링크와 블롭은 유예 기간이 지나면 GC로 삭제
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import select, delete, update, bindparam
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.db.models.file import File as FileModel, ContentBlob, ContentBlobLink
+
+logger = logging.getLogger(__name__)
+
+# 이미지 URL 경로 → 업로드 디렉토리 하위 폴더 (main.py 정적 파일 마운트와 동일)
+IMAGE_URL_DIRECTORIES = {
+    "/api/v1/images/generated/": "generated_images",
+    "/api/v1/images/edited/": "edited_images",
+}
+
+
+@dataclass
+class BlobRef:
+    """저장된 블롭과 노출 경로"""
+    sha256: str
+    size: int
+    path: Path  # 기존 방식의 파일 경로 (블롭 링크)
+    deduplicated: bool  # 이미 같은 내용의 블롭이 있었는지
+
+
+class BlobStore:
+    """SHA-256 콘텐츠 저장소"""
+
+    def __init__(self, root: Optional[str] = None, upload_dir: Optional[str] = None):
+        self.root = Path(root or settings.BLOB_STORE_DIR)
+        self.upload_dir = Path(upload_dir or settings.UPLOAD_DIR)
+        self._gc_task: Optional[asyncio.Task] = None
+        self.stats = {"stored": 0, "deduplicated": 0, "bytes_saved": 0, "gc_links_removed": 0, "gc_blobs_removed": 0}
+
+    # ===== 저장 =====
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.root / sha256[:2] / sha256
+
+    def temp_path(self) -> Path:
+        """블롭과 같은 파일시스템의 임시 파일 (adopt_file에서 rename 가능)"""
+        tmp_dir = self.root / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(dir=tmp_dir, suffix=".part")
+        os.close(fd)
+        return Path(path)
+
+    async def store_bytes(self, data: bytes, dest: Path) -> BlobRef:
+        """바이트 내용을 저장하고 dest 경로로 노출"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._store_bytes_sync, data, Path(dest))
+
+    async def adopt_file(self, tmp_path: Path, sha256: str, dest: Path) -> BlobRef:
+        """
+        이미 해시를 계산한 임시 파일을 블롭으로 편입
+
+        같은 내용의 블롭이 있으면 임시 파일은 버리고 기존 블롭을 링크합니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._adopt_file_sync, Path(tmp_path), sha256, Path(dest))
+
+    def _store_bytes_sync(self, data: bytes, dest: Path) -> BlobRef:
+        sha256 = hashlib.sha256(data).hexdigest()
+        if self.blob_path(sha256).exists():
+            return self._link(sha256, len(data), dest, deduplicated=True)
+
+        tmp_path = self.temp_path()
+        tmp_path.write_bytes(data)
+        return self._adopt_file_sync(tmp_path, sha256, dest)
+
+    def _adopt_file_sync(self, tmp_path: Path, sha256: str, dest: Path) -> BlobRef:
+        blob = self.blob_path(sha256)
+        size = tmp_path.stat().st_size
+
+        if blob.exists():
+            tmp_path.unlink()
+            return self._link(sha256, size, dest, deduplicated=True)
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, blob)
+        # 블롭은 링크를 통해서만 바뀌지 않도록 읽기 전용
+        os.chmod(blob, 0o444)
+        return self._link(sha256, size, dest, deduplicated=False)
+
+    def _link(self, sha256: str, size: int, dest: Path, deduplicated: bool) -> BlobRef:
+        """블롭을 dest 경로로 노출 (하드 링크 → 심볼릭 링크 → 복사)"""
+        blob = self.blob_path(sha256)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists() or dest.is_symlink():
+            dest.unlink()
+
+        try:
+            os.link(blob, dest)
+        except OSError:
+            try:
+                os.symlink(blob.resolve(), dest)
+            except OSError:
+                shutil.copyfile(blob, dest)
+
+        if deduplicated:
+            self.stats["deduplicated"] += 1
+            self.stats["bytes_saved"] += size
+        else:
+            self.stats["stored"] += 1
+        return BlobRef(sha256=sha256, size=size, path=dest, deduplicated=deduplicated)
+
+    async def discard(self, ref: BlobRef) -> None:
+        """기록 전에 실패한 저장 되돌리기 (다른 링크가 없는 새 블롭이면 함께 삭제)"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._discard_sync, ref)
+
+    def _discard_sync(self, ref: BlobRef) -> None:
+        if ref.path.exists() or ref.path.is_symlink():
+            ref.path.unlink()
+        blob = self.blob_path(ref.sha256)
+        if not ref.deduplicated and blob.exists() and blob.stat().st_nlink == 1:
+            blob.unlink()
+
+    # ===== 참조 기록 =====
+
+    async def record_links(self, refs: Iterable[BlobRef], session: Optional[AsyncSession] = None) -> None:
+        """
+        블롭과 링크 경로를 DB에 기록
+
+        session을 주면 호출자의 트랜잭션에 포함되고(커밋은 호출자), 없으면 자체 세션으로 커밋합니다.
+        """
+        refs = list(refs)
+        if not refs:
+            return
+
+        if session is None:
+            async with AsyncSessionLocal() as own_session:
+                await self._insert_links(own_session, refs)
+                await own_session.commit()
+        else:
+            await self._insert_links(session, refs)
+
+    @staticmethod
+    async def _insert_links(session: AsyncSession, refs: List[BlobRef]) -> None:
+        blobs = {ref.sha256: ref.size for ref in refs}
+        await session.execute(
+            pg_insert(ContentBlob)
+            .values([{"sha256": sha256, "size": size, "ref_count": 0} for sha256, size in blobs.items()])
+            .on_conflict_do_nothing(index_elements=["sha256"])
+        )
+
+        links = {_normalize_path(ref.path): ref.sha256 for ref in refs}
+        insert_stmt = pg_insert(ContentBlobLink).values(
+            [{"path": path, "sha256": sha256, "created_at": datetime.utcnow()} for path, sha256 in links.items()]
+        )
+        await session.execute(
+            insert_stmt.on_conflict_do_update(
+                index_elements=["path"],
+                set_={"sha256": insert_stmt.excluded.sha256, "created_at": insert_stmt.excluded.created_at}
+            )
+        )
+
+    async def store_image_bytes(self, data: bytes, dest: Path) -> BlobRef:
+        """생성 이미지 저장 + 링크 기록 (기록 실패 시에도 파일은 유지)"""
+        ref = await self.store_bytes(data, dest)
+        try:
+            await self.record_links([ref])
+        except Exception as e:
+            # 링크 기록이 없으면 GC 대상이 아니므로 파일은 안전하게 남음
+            logger.warning(f"블롭 링크 기록 실패 (파일은 저장됨): {dest} - {e}")
+        return ref
+
+    # ===== 가비지 컬렉션 =====
+
+    def url_to_path(self, url: str) -> Optional[str]:
+        """이미지 URL을 로컬 파일 경로로 변환 (로컬 이미지가 아니면 None)"""
+        for prefix, directory in IMAGE_URL_DIRECTORIES.items():
+            if prefix in url:
+                filename = url.split(prefix, 1)[1].split("?", 1)[0]
+                return _normalize_path(self.upload_dir / directory / filename)
+        return None
+
+    async def _referenced_paths(self, session: AsyncSession) -> Dict[str, int]:
+        """File / ImageHistory / GeneratedImage 행이 참조하는 경로별 참조 수"""
+        from app.db.models.image_history import ImageHistory
+        from app.db.models.image_generation import GeneratedImage
+
+        references: Dict[str, int] = {}
+
+        def add(path: Optional[str]) -> None:
+            if path:
+                references[path] = references.get(path, 0) + 1
+
+        for (upload_path,) in await session.execute(select(FileModel.upload_path)):
+            add(_normalize_path(upload_path))
+
+        # 소프트 삭제된 이미지도 복원될 수 있으므로 참조로 취급
+        for image_urls, primary_url in await session.execute(
+            select(ImageHistory.image_urls, ImageHistory.primary_image_url)
+        ):
+            urls = set(image_urls or []) | {primary_url}
+            for url in urls:
+                if isinstance(url, str):
+                    add(self.url_to_path(url))
+
+        for (file_url,) in await session.execute(select(GeneratedImage.file_url)):
+            if file_url:
+                add(self.url_to_path(file_url))
+
+        return references
+
+    async def collect_garbage(self, grace_seconds: Optional[int] = None) -> Dict[str, int]:
+        """
+        참조 수 갱신 및 미참조 링크/블롭 삭제
+
+        유예 기간보다 오래됐고 어떤 행도 참조하지 않는 링크를 지우고,
+        남은 링크가 없는 블롭을 삭제합니다.
+        """
+        grace = settings.BLOB_GC_GRACE_SECONDS if grace_seconds is None else grace_seconds
+        cutoff = datetime.utcnow() - timedelta(seconds=grace)
+        loop = asyncio.get_running_loop()
+
+        async with AsyncSessionLocal() as session:
+            references = await self._referenced_paths(session)
+            links = [
+                (row.path, row.sha256, row.created_at)
+                for row in await session.execute(
+                    select(ContentBlobLink.path, ContentBlobLink.sha256, ContentBlobLink.created_at)
+                )
+            ]
+            blobs = [
+                (row.sha256, row.created_at)
+                for row in await session.execute(select(ContentBlob.sha256, ContentBlob.created_at))
+            ]
+
+            orphan_links, ref_counts, dead_blobs = plan_sweep(links, blobs, references, cutoff)
+
+            await loop.run_in_executor(None, self._remove_files, orphan_links, dead_blobs)
+
+            if orphan_links:
+                await session.execute(
+                    delete(ContentBlobLink).where(ContentBlobLink.path.in_([path for path, _ in orphan_links]))
+                )
+            if dead_blobs:
+                await session.execute(delete(ContentBlob).where(ContentBlob.sha256.in_(dead_blobs)))
+
+            live_counts = [
+                {"b_sha256": sha256, "b_ref_count": count}
+                for sha256, count in ref_counts.items()
+                if sha256 not in dead_blobs
+            ]
+            if live_counts:
+                await session.execute(
+                    update(ContentBlob)
+                    .where(ContentBlob.sha256 == bindparam("b_sha256"))
+                    .values(ref_count=bindparam("b_ref_count"), updated_at=datetime.utcnow())
+                    .execution_options(synchronize_session=None),
+                    live_counts
+                )
+            await session.commit()
+
+        self.stats["gc_links_removed"] += len(orphan_links)
+        self.stats["gc_blobs_removed"] += len(dead_blobs)
+        if orphan_links or dead_blobs:
+            logger.info(f"🧹 블롭 GC: 링크 {len(orphan_links)}개, 블롭 {len(dead_blobs)}개 삭제")
+        return {"links_removed": len(orphan_links), "blobs_removed": len(dead_blobs)}
+
+    def _remove_files(self, orphan_links: List[Tuple[str, str]], dead_blobs: Set[str]) -> None:
+        for path, sha256 in orphan_links:
+            # 다른 내용으로 덮어쓴 경로는 건드리지 않음
+            if self._is_link_to(Path(path), sha256):
+                Path(path).unlink()
+        for sha256 in dead_blobs:
+            blob = self.blob_path(sha256)
+            if blob.exists():
+                blob.unlink()
+
+    def _is_link_to(self, path: Path, sha256: str) -> bool:
+        blob = self.blob_path(sha256)
+        if not blob.exists() or not (path.exists() or path.is_symlink()):
+            return False
+        if path.is_symlink():
+            return path.resolve() == blob.resolve()
+        # 하드 링크 또는 복사본
+        return os.path.samefile(path, blob) or _sha256_of(path) == sha256
+
+    async def start_gc_task(self) -> None:
+        """주기적 GC 시작"""
+        if self._gc_task and not self._gc_task.done():
+            return
+
+        async def gc_loop():
+            while True:
+                try:
+                    await asyncio.sleep(settings.BLOB_GC_INTERVAL_SECONDS)
+                    await self.collect_garbage()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Blob GC error: {e}")
+
+        self._gc_task = asyncio.create_task(gc_loop())
+
+    async def stop_gc_task(self) -> None:
+        if self._gc_task:
+            self._gc_task.cancel()
+            try:
+                await self._gc_task
+            except asyncio.CancelledError:
+                pass
+            self._gc_task = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "root": str(self.root)}
+
+
+def plan_sweep(
+    links: List[Tuple[str, str, datetime]],
+    blobs: List[Tuple[str, datetime]],
+    references: Dict[str, int],
+    cutoff: datetime
+) -> Tuple[List[Tuple[str, str]], Dict[str, int], Set[str]]:
+    """
+    GC 대상 계산 (DB/파일시스템 접근 없음)
+
+    Returns:
+        (삭제할 링크 [(경로, sha256)], 블롭별 참조 수, 삭제할 블롭 sha256 집합)
+    """
+    orphan_links: List[Tuple[str, str]] = []
+    ref_counts: Dict[str, int] = {sha256: 0 for sha256, _ in blobs}
+    live_links: Dict[str, int] = {sha256: 0 for sha256, _ in blobs}
+
+    for path, sha256, created_at in links:
+        refs = references.get(path, 0)
+        if refs == 0 and created_at < cutoff:
+            orphan_links.append((path, sha256))
+            continue
+        ref_counts[sha256] = ref_counts.get(sha256, 0) + refs
+        live_links[sha256] = live_links.get(sha256, 0) + 1
+
+    dead_blobs = {
+        sha256 for sha256, created_at in blobs
+        if live_links.get(sha256, 0) == 0 and created_at < cutoff
+    }
+    return orphan_links, ref_counts, dead_blobs
+
+
+def _normalize_path(path) -> str:
+    return os.path.abspath(str(path))
+
+
+def _sha256_of(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# 전역 블롭 저장소
+blob_store = BlobStore()
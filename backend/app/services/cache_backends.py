@@ -0,0 +1,406 @@
+"""
+CacheManager용 L2 캐시 백엔드
+- CacheBackend: 백엔드 공통 인터페이스 (배치 조회/저장 + 히트 카운터 버퍼링)
+- PostgresCacheBackend: cache_entries 테이블 (INSERT ... ON CONFLICT 업서트)
+- RedisCacheBackend: Redis 프로토콜 백엔드 (redis.asyncio 호환 클라이언트)
+- LocalRedisClient: 테스트/단일 프로세스용 Redis 명령 대체 구현
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional, Any, Dict, List, Iterable, AsyncIterator, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import fnmatch
+import json
+import logging
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Redis SCAN MATCH 글롭 특수 문자 (백슬래시로 이스케이프)
+_GLOB_SPECIAL = set("*?[]\\")
+
+
+def _escape_glob(text: str) -> str:
+    """키 조각을 Redis 글롭 패턴에서 문자 그대로 매칭되도록 이스케이프"""
+    return "".join(f"\\{ch}" if ch in _GLOB_SPECIAL else ch for ch in text)
+
+
+class CacheBackend(ABC):
+    """L2 캐시 백엔드 베이스 클래스
+
+    히트 카운트는 조회 경로에서 즉시 기록하지 않고 메모리에 모았다가
+    flush_hits()에서 한 번에 반영합니다.
+    """
+
+    name: str = "base"
+
+    def __init__(self, max_pending_hits: int = 1000):
+        self._pending_hits: Dict[str, int] = {}
+        self._max_pending_hits = max_pending_hits
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.flushed_hits = 0
+
+    @abstractmethod
+    async def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 키를 한 번에 조회 (존재하고 만료되지 않은 키만 반환)"""
+        pass
+
+    @abstractmethod
+    async def _set_many(self, items: Dict[str, Any], ttl_seconds: int) -> None:
+        """여러 키를 한 번에 저장"""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """키 삭제"""
+        pass
+
+    @abstractmethod
+    async def delete_pattern(self, pattern: str) -> int:
+        """키에 pattern 문자열이 포함된 항목 삭제"""
+        pass
+
+    @abstractmethod
+    async def clear_expired(self) -> int:
+        """만료 항목 정리 (자체 만료를 지원하는 백엔드는 0 반환)"""
+        pass
+
+    @abstractmethod
+    async def _write_hits(self, hit_counts: Dict[str, int]) -> None:
+        """버퍼링된 히트 카운트를 저장소에 반영"""
+        pass
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """여러 키 조회 - 통계/히트 버퍼 기록 포함, 백엔드 오류는 미스로 처리"""
+        if not keys:
+            return {}
+
+        try:
+            values = await self._get_many(keys)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"L2 캐시 조회 실패 ({self.name}): {e}")
+            return {}
+
+        self.hits += len(values)
+        self.misses += len(keys) - len(values)
+        if values:
+            self.record_hits(values.keys())
+        return values
+
+    async def set_many(self, items: Dict[str, Any], ttl_seconds: int) -> None:
+        """여러 키 저장 - 백엔드 오류는 로깅 후 무시 (L1은 이미 갱신됨)"""
+        if not items:
+            return
+
+        try:
+            await self._set_many(items, ttl_seconds)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"L2 캐시 저장 실패 ({self.name}): {e}")
+
+    async def get(self, key: str) -> Optional[Any]:
+        """단일 키 조회"""
+        values = await self.get_many([key])
+        return values.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int) -> None:
+        """단일 키 저장"""
+        await self.set_many({key: value}, ttl_seconds)
+
+    def record_hits(self, keys: Iterable[str]) -> None:
+        """히트 카운트를 버퍼에 기록 (버퍼가 가득 차면 비동기 flush 예약)"""
+        for key in keys:
+            self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+
+        if len(self._pending_hits) >= self._max_pending_hits and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            try:
+                self._flush_task = asyncio.get_running_loop().create_task(self.flush_hits())
+            except RuntimeError:
+                # 실행 중인 이벤트 루프가 없으면 다음 주기적 flush에서 반영
+                pass
+
+    async def flush_hits(self) -> int:
+        """버퍼링된 히트 카운트를 저장소에 일괄 반영"""
+        async with self._flush_lock:
+            if not self._pending_hits:
+                return 0
+
+            pending, self._pending_hits = self._pending_hits, {}
+            try:
+                await self._write_hits(pending)
+            except Exception as e:
+                self.errors += 1
+                logger.warning(f"캐시 히트 카운트 반영 실패 ({self.name}): {e}")
+                # 실패한 카운트는 다음 flush에서 재시도
+                for key, count in pending.items():
+                    self._pending_hits[key] = self._pending_hits.get(key, 0) + count
+                return 0
+
+            flushed = sum(pending.values())
+            self.flushed_hits += flushed
+            return flushed
+
+    def stats(self) -> Dict[str, Any]:
+        """백엔드 통계"""
+        total_requests = self.hits + self.misses
+        hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            "backend": self.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": f"{hit_rate:.2f}%",
+            "pending_hit_keys": len(self._pending_hits),
+            "flushed_hits": self.flushed_hits,
+        }
+
+
+class PostgresCacheBackend(CacheBackend):
+    """PostgreSQL cache_entries 테이블 기반 L2 백엔드
+
+    요청 세션과 분리된 짧은 세션을 배치 단위로 사용하므로
+    호출자의 트랜잭션을 커밋하지 않습니다.
+    """
+
+    name = "postgres"
+
+    def __init__(self, session_factory=None, max_pending_hits: int = 1000):
+        super().__init__(max_pending_hits=max_pending_hits)
+        self._session_factory = session_factory
+
+    def _get_session_factory(self):
+        if self._session_factory is None:
+            from app.db.session import AsyncSessionLocal
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    async def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        from app.repositories.cache import CacheRepository
+
+        async with self._get_session_factory()() as session:
+            return await CacheRepository(session).get_values(keys)
+
+    async def _set_many(self, items: Dict[str, Any], ttl_seconds: int) -> None:
+        from app.repositories.cache import CacheRepository
+
+        async with self._get_session_factory()() as session:
+            await CacheRepository(session).upsert_values(items, ttl_seconds)
+
+    async def delete(self, key: str) -> bool:
+        from app.repositories.cache import CacheRepository
+
+        async with self._get_session_factory()() as session:
+            return await CacheRepository(session).delete_value(key)
+
+    async def delete_pattern(self, pattern: str) -> int:
+        from app.repositories.cache import CacheRepository
+
+        async with self._get_session_factory()() as session:
+            return await CacheRepository(session).delete_matching(pattern)
+
+    async def clear_expired(self) -> int:
+        from app.repositories.cache import CacheRepository
+
+        async with self._get_session_factory()() as session:
+            return await CacheRepository(session).clear_expired()
+
+    async def _write_hits(self, hit_counts: Dict[str, int]) -> None:
+        from app.repositories.cache import CacheRepository
+
+        async with self._get_session_factory()() as session:
+            await CacheRepository(session).increment_hits(hit_counts)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis 프로토콜 기반 L2 백엔드 (MGET + 파이프라인 SET EX)
+
+    값은 JSON으로 저장하고 만료는 Redis TTL에 맡깁니다.
+    히트 카운트는 {prefix}hits 해시에 HINCRBY로 반영합니다.
+    """
+
+    name = "redis"
+
+    def __init__(self, client, key_prefix: str = "aiportal:cache:", max_pending_hits: int = 1000):
+        super().__init__(max_pending_hits=max_pending_hits)
+        self.client = client
+        self.key_prefix = key_prefix
+        self.hits_key = f"{key_prefix}hits"
+
+    def _k(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    async def _get_many(self, keys: List[str]) -> Dict[str, Any]:
+        raw_values = await self.client.mget([self._k(key) for key in keys])
+        values: Dict[str, Any] = {}
+        for key, raw in zip(keys, raw_values):
+            if raw is None:
+                continue
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            values[key] = json.loads(raw)
+        return values
+
+    async def _set_many(self, items: Dict[str, Any], ttl_seconds: int) -> None:
+        pipe = self.client.pipeline()
+        for key, value in items.items():
+            pipe.set(self._k(key), json.dumps(value, default=str), ex=ttl_seconds)
+        await pipe.execute()
+
+    async def delete(self, key: str) -> bool:
+        return bool(await self.client.delete(self._k(key)))
+
+    async def delete_pattern(self, pattern: str) -> int:
+        # 키에 글롭 문자가 있어도 다른 항목이 함께 지워지지 않도록 접두사/패턴은 문자 그대로 매칭
+        match = f"{_escape_glob(self.key_prefix)}*{_escape_glob(pattern)}*"
+        keys = [key async for key in self.client.scan_iter(match=match)]
+        keys = [key for key in keys if key not in (self.hits_key, self.hits_key.encode())]
+        if not keys:
+            return 0
+        return await self.client.delete(*keys)
+
+    async def clear_expired(self) -> int:
+        # Redis는 TTL로 자체 만료
+        return 0
+
+    async def _write_hits(self, hit_counts: Dict[str, int]) -> None:
+        pipe = self.client.pipeline()
+        for key, count in hit_counts.items():
+            pipe.hincrby(self.hits_key, key, count)
+        await pipe.execute()
+
+
+class _LocalPipeline:
+    """LocalRedisClient용 파이프라인 (명령을 모았다가 execute에서 순서대로 실행)"""
+
+    def __init__(self, client: "LocalRedisClient"):
+        self._client = client
+        self._commands: List[Tuple[str, tuple, dict]] = []
+
+    def set(self, *args, **kwargs) -> "_LocalPipeline":
+        self._commands.append(("set", args, kwargs))
+        return self
+
+    def hincrby(self, *args, **kwargs) -> "_LocalPipeline":
+        self._commands.append(("hincrby", args, kwargs))
+        return self
+
+    def delete(self, *args, **kwargs) -> "_LocalPipeline":
+        self._commands.append(("delete", args, kwargs))
+        return self
+
+    async def execute(self) -> List[Any]:
+        results = []
+        for name, args, kwargs in self._commands:
+            results.append(await getattr(self._client, name)(*args, **kwargs))
+        self._commands = []
+        return results
+
+
+class LocalRedisClient:
+    """RedisCacheBackend가 사용하는 Redis 명령의 프로세스 내 대체 구현
+
+    테스트와 Redis가 없는 단일 워커 개발 환경용입니다.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[str, Optional[datetime]]] = {}
+        self._hashes: Dict[str, Dict[str, int]] = {}
+
+    def _alive(self, key: str) -> bool:
+        entry = self._data.get(key)
+        if entry is None:
+            return False
+        _, expires_at = entry
+        if expires_at is not None and expires_at <= datetime.utcnow():
+            del self._data[key]
+            return False
+        return True
+
+    async def ping(self) -> bool:
+        return True
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._data[key][0] if self._alive(key) else None
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None) -> bool:
+        expires_at = datetime.utcnow() + timedelta(seconds=ex) if ex else None
+        self._data[key] = (value, expires_at)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            if self._data.pop(key, None) is not None or self._hashes.pop(key, None) is not None:
+                deleted += 1
+        return deleted
+
+    async def hincrby(self, name: str, key: str, amount: int = 1) -> int:
+        bucket = self._hashes.setdefault(name, {})
+        bucket[key] = bucket.get(key, 0) + amount
+        return bucket[key]
+
+    async def hget(self, name: str, key: str) -> Optional[str]:
+        value = self._hashes.get(name, {}).get(key)
+        return None if value is None else str(value)
+
+    async def scan_iter(self, match: str = "*") -> AsyncIterator[str]:
+        pattern = self._to_fnmatch(match)
+        for key in list(self._data.keys()) + list(self._hashes.keys()):
+            if fnmatch.fnmatchcase(key, pattern) and (key in self._hashes or self._alive(key)):
+                yield key
+
+    @staticmethod
+    def _to_fnmatch(match: str) -> str:
+        """Redis 글롭의 백슬래시 이스케이프를 fnmatch 표기([*] 등)로 변환"""
+        converted = []
+        chars = iter(match)
+        for ch in chars:
+            if ch == "\\":
+                escaped = next(chars, "\\")
+                converted.append(f"[{escaped}]" if escaped in "*?[" else escaped)
+            else:
+                converted.append(ch)
+        return "".join(converted)
+
+    def pipeline(self) -> _LocalPipeline:
+        return _LocalPipeline(self)
+
+
+def create_cache_backend(backend_type: Optional[str] = None) -> Optional[CacheBackend]:
+    """설정(CACHE_L2_BACKEND)에 따른 L2 백엔드 생성
+
+    - postgres: cache_entries 테이블
+    - redis: REDIS_URL (redis 패키지가 없으면 postgres로 대체)
+    - memory: LocalRedisClient (프로세스 내)
+    - none: L2 비활성화
+    """
+    backend_type = (backend_type or settings.CACHE_L2_BACKEND or "none").lower()
+
+    if backend_type == "none":
+        return None
+
+    if backend_type == "memory":
+        return RedisCacheBackend(LocalRedisClient())
+
+    if backend_type == "redis":
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError:
+            logger.warning("redis 패키지가 설치되지 않음 - PostgreSQL L2 캐시로 대체 (pip install redis)")
+            return PostgresCacheBackend()
+        return RedisCacheBackend(redis_asyncio.from_url(settings.REDIS_URL))
+
+    return PostgresCacheBackend()
@@ -1,17 +1,27 @@
 """
 2-Tier 캐싱 시스템
 L1: 메모리 캐시 (LRU)
-L2: PostgreSQL 캐시 테이블
+L2: 교체 가능한 공유 백엔드 (PostgreSQL 캐시 테이블 / Redis) - cache_backends 참고
 """
 
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Callable, Awaitable
 from datetime import datetime, timedelta
 import json
 import hashlib
+import logging
+import math
+import random
+import time
 from collections import OrderedDict
 import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.repositories.cache import CacheRepository
+from app.core.config import settings
+from app.services.cache_backends import CacheBackend, create_cache_backend
+
+logger = logging.getLogger(__name__)
+
+# get_or_compute로 저장된 항목 표시 (값 + 만료 메타데이터)
+_COMPUTED_ENTRY_MARK = "__computed_entry__"
 
 
 class LRUCache:
@@ -85,19 +95,91 @@ class LRUCache:
         }
 
 
+class SingleFlight:
+    """키별 단일 실행 (request coalescing)
+    
+    같은 키에 대한 동시 요청은 하나의 작업만 실행하고 나머지는 그 결과를 함께 기다립니다.
+    기다리던 호출자가 취소되어도 공유 작업은 취소되지 않습니다 (asyncio.shield).
+    프로세스 내부에서만 합쳐지며, 워커 간 동시 갱신은 조기 만료로 분산됩니다.
+    """
+    
+    def __init__(self):
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """키에 대한 작업을 실행하거나 진행 중인 작업의 결과를 기다림"""
+        if key in self._tasks:
+            self.coalesced += 1
+        task = self.start(key, func)
+        return await asyncio.shield(task)
+    
+    def start(self, key: str, func: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """작업 시작 (이미 진행 중이면 기존 작업 반환)"""
+        task = self._tasks.get(key)
+        if task is not None:
+            return task
+        
+        task = asyncio.ensure_future(func())
+        self._tasks[key] = task
+        self.executions += 1
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return task
+    
+    def owns(self, key: str) -> bool:
+        """현재 실행 중인 작업이 해당 키의 유효한 작업인지 (무효화되지 않았는지)"""
+        return self._tasks.get(key) is asyncio.current_task()
+    
+    def forget(self, key: str) -> None:
+        """키 무효화 - 진행 중인 작업은 끝까지 실행되지만 결과를 캐시에 저장하지 않음"""
+        self._tasks.pop(key, None)
+    
+    def forget_matching(self, pattern: str) -> None:
+        """pattern을 포함하는 모든 키 무효화"""
+        for key in [key for key in self._tasks if pattern in key]:
+            self._tasks.pop(key, None)
+    
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 기다리는 호출자가 없는 작업의 예외도 회수 처리
+        if not task.cancelled():
+            task.exception()
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._tasks)
+        }
+
+
 class CacheManager:
-    """2-Tier 캐시 매니저"""
+    """2-Tier 캐시 매니저
+    
+    L2 백엔드는 요청 세션과 무관하게 동작합니다. get/set 등의 session 인자는
+    하위 호환을 위해 유지되며 L2 사용 여부에 영향을 주지 않습니다.
+    """
     
     def __init__(
         self,
         l1_max_size: int = 1000,
         l1_ttl_seconds: int = 300,  # 5분
         l2_ttl_seconds: int = 3600,  # 1시간
+        l2_backend: Optional[CacheBackend] = None,
+        hit_flush_interval_seconds: Optional[int] = None,
     ):
         self.l1_cache = LRUCache(max_size=l1_max_size)
         self.l1_ttl = l1_ttl_seconds
         self.l2_ttl = l2_ttl_seconds
+        self.l2_backend = l2_backend
+        self.hit_flush_interval = hit_flush_interval_seconds or settings.CACHE_HIT_FLUSH_INTERVAL_SECONDS
         self._cleanup_task: Optional[asyncio.Task] = None
+        
+        # get_or_compute 상태
+        self._single_flight = SingleFlight()
+        self._compute_stats = {"stale_served": 0, "early_refreshes": 0, "refresh_failures": 0}
     
     def _generate_key(self, prefix: str, *args, **kwargs) -> str:
         """캐시 키 생성"""
@@ -120,24 +202,35 @@ class CacheManager:
         session: Optional[AsyncSession] = None
     ) -> Optional[Any]:
         """캐시에서 값 조회 (L1 → L2)"""
+        values = await self.get_many([key], session)
+        return values.get(key)
+    
+    async def get_many(
+        self,
+        keys: List[str],
+        session: Optional[AsyncSession] = None
+    ) -> Dict[str, Any]:
+        """여러 키를 한 번에 조회 - L1 미스 키만 모아 L2에 한 번 요청"""
+        found: Dict[str, Any] = {}
+        l1_misses: List[str] = []
         
         # L1 캐시 확인
-        l1_result = self.l1_cache.get(key)
-        if l1_result:
-            value, _ = l1_result
-            return value
-        
-        # L2 캐시 확인 (PostgreSQL)
-        if session:
-            cache_repo = CacheRepository(session)
-            l2_value = await cache_repo.get_value(key)
-            
-            if l2_value is not None:
+        for key in keys:
+            l1_result = self.l1_cache.get(key)
+            if l1_result:
+                found[key], _ = l1_result
+            else:
+                l1_misses.append(key)
+        
+        # L2 캐시 확인 (배치 조회, 히트 카운트는 백엔드에서 버퍼링)
+        if l1_misses and self.l2_backend:
+            l2_values = await self.l2_backend.get_many(l1_misses)
+            for key, value in l2_values.items():
                 # L1 캐시에도 저장
-                self.l1_cache.set(key, l2_value, self.l1_ttl)
-                return l2_value
+                self.l1_cache.set(key, value, self.l1_ttl)
+                found[key] = value
         
-        return None
+        return found
     
     async def set(
         self,
@@ -147,16 +240,128 @@ class CacheManager:
         ttl_seconds: Optional[int] = None
     ):
         """캐시에 값 설정 (L1 + L2)"""
+        await self.set_many({key: value}, session, ttl_seconds)
+    
+    async def set_many(
+        self,
+        items: Dict[str, Any],
+        session: Optional[AsyncSession] = None,
+        ttl_seconds: Optional[int] = None
+    ):
+        """여러 값을 한 번에 설정 - L2에는 단일 배치 쓰기"""
         l1_ttl = ttl_seconds or self.l1_ttl
         l2_ttl = ttl_seconds or self.l2_ttl
         
         # L1 캐시에 저장
-        self.l1_cache.set(key, value, l1_ttl)
+        for key, value in items.items():
+            self.l1_cache.set(key, value, l1_ttl)
         
-        # L2 캐시에 저장 (PostgreSQL)
-        if session:
-            cache_repo = CacheRepository(session)
-            await cache_repo.set_value(key, value, l2_ttl)
+        # L2 캐시에 저장
+        if items and self.l2_backend:
+            await self.l2_backend.set_many(items, l2_ttl)
+    
+    async def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[int] = None,
+        stale_ttl_seconds: int = 0,
+        early_expiration_beta: float = 1.0,
+        cache_if: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        캐시 조회, 미스 시 loader 실행 (키별 단일 실행)
+        
+        - 동시 미스: loader는 한 번만 실행되고 나머지 호출자는 결과를 공유
+        - stale-while-revalidate: TTL이 지나도 stale_ttl_seconds 동안은 이전 값을 즉시
+          반환하고 백그라운드에서 갱신
+        - 확률적 조기 만료 (XFetch): 만료 직전에는 계산 시간에 비례한 확률로 미리 갱신해
+          인기 키가 한 순간에 만료되지 않도록 분산 (early_expiration_beta=0이면 비활성화)
+        - cache_if가 False를 반환한 결과는 캐시하지 않음 (빈 결과 등)
+        
+        이 메서드로 저장한 값은 만료 메타데이터와 함께 저장되므로 같은 키는
+        get_or_compute로만 조회해야 합니다.
+        """
+        ttl = ttl_seconds or self.l2_ttl
+        
+        entry = await self.get(key)
+        if isinstance(entry, dict) and entry.get(_COMPUTED_ENTRY_MARK):
+            now = time.time()
+            expires_at = entry["expires_at"]
+            
+            if now < expires_at:
+                if not self._should_refresh_early(entry, now, early_expiration_beta):
+                    return entry["value"]
+                self._compute_stats["early_refreshes"] += 1
+            elif now < expires_at + stale_ttl_seconds:
+                self._compute_stats["stale_served"] += 1
+            else:
+                entry = None
+            
+            if entry is not None:
+                # 현재 값을 반환하고 백그라운드에서 갱신
+                self._single_flight.start(
+                    key,
+                    lambda: self._refresh_in_background(key, loader, ttl, stale_ttl_seconds, cache_if)
+                )
+                return entry["value"]
+        
+        return await self._single_flight.do(
+            key,
+            lambda: self._compute_and_store(key, loader, ttl, stale_ttl_seconds, cache_if)
+        )
+    
+    @staticmethod
+    def _should_refresh_early(entry: Dict[str, Any], now: float, beta: float) -> bool:
+        """XFetch: now - delta * beta * ln(rand) >= expires_at 이면 조기 갱신"""
+        if beta <= 0:
+            return False
+        delta = entry.get("compute_seconds", 0.0)
+        return now - delta * beta * math.log(1.0 - random.random()) >= entry["expires_at"]
+    
+    async def _compute_and_store(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        cache_if: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """loader 실행 후 만료 메타데이터와 함께 저장 (실행 중 무효화되었으면 저장하지 않음)"""
+        started = time.monotonic()
+        value = await loader()
+        compute_seconds = time.monotonic() - started
+        
+        if (cache_if is None or cache_if(value)) and self._single_flight.owns(key):
+            entry = {
+                _COMPUTED_ENTRY_MARK: 1,
+                "value": value,
+                "expires_at": time.time() + ttl,
+                "compute_seconds": compute_seconds,
+            }
+            # L1/L2에는 stale 기간까지 보관하고 신선도는 expires_at으로 판단
+            await self.set(key, entry, ttl_seconds=ttl + stale_ttl)
+        
+        return value
+    
+    async def _refresh_in_background(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        cache_if: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """백그라운드 갱신 - 실패해도 기존 값은 만료 시까지 유지
+        
+        갱신 중 L1/L2 미스로 합류한 호출자에게는 결과(또는 예외)가 그대로 전달됩니다.
+        """
+        try:
+            return await self._compute_and_store(key, loader, ttl, stale_ttl, cache_if)
+        except Exception as e:
+            self._compute_stats["refresh_failures"] += 1
+            logger.warning(f"캐시 백그라운드 갱신 실패 ({key}): {e}")
+            raise
     
     async def delete(
         self,
@@ -164,12 +369,15 @@ class CacheManager:
         session: Optional[AsyncSession] = None
     ) -> bool:
         """캐시에서 값 삭제 (L1 + L2)"""
+        self._single_flight.forget(key)
         l1_deleted = self.l1_cache.delete(key)
         l2_deleted = False
         
-        if session:
-            cache_repo = CacheRepository(session)
-            l2_deleted = await cache_repo.delete_value(key)
+        if self.l2_backend:
+            try:
+                l2_deleted = await self.l2_backend.delete(key)
+            except Exception as e:
+                logger.warning(f"L2 캐시 삭제 실패: {e}")
         
         return l1_deleted or l2_deleted
     
@@ -179,6 +387,8 @@ class CacheManager:
         session: Optional[AsyncSession] = None
     ):
         """패턴에 맞는 캐시 무효화"""
+        self._single_flight.forget_matching(pattern)
+        
         # L1 캐시에서 패턴 매칭 키 삭제
         keys_to_delete = [
             key for key in self.l1_cache.cache.keys()
@@ -187,43 +397,71 @@ class CacheManager:
         for key in keys_to_delete:
             self.l1_cache.delete(key)
         
-        # L2는 필요시 구현
+        # L2 캐시에서 패턴 매칭 키 삭제
+        if self.l2_backend:
+            try:
+                await self.l2_backend.delete_pattern(pattern)
+            except Exception as e:
+                logger.warning(f"L2 캐시 패턴 무효화 실패: {e}")
+    
+    async def flush_hit_counters(self) -> int:
+        """버퍼링된 L2 히트 카운트 반영"""
+        if not self.l2_backend:
+            return 0
+        return await self.l2_backend.flush_hits()
     
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
         return {
             "l1": self.l1_cache.stats(),
-            "l2": "PostgreSQL cache (stats available via DB query)"
+            "l2": self.l2_backend.stats() if self.l2_backend else "disabled",
+            "single_flight": {**self._single_flight.stats(), **self._compute_stats}
         }
     
-    async def start_cleanup_task(self, session_factory):
-        """주기적 정리 작업 시작"""
+    async def start_cleanup_task(self, session_factory=None):
+        """주기적 정리 작업 시작 (히트 카운트 flush + 만료 항목 정리)
+        
+        session_factory는 하위 호환용 인자이며 L2 백엔드가 자체 세션을 관리합니다.
+        """
+        if self._cleanup_task and not self._cleanup_task.done():
+            return
+        
         async def cleanup():
+            expiry_interval = 300  # 5분마다 만료 항목 정리
+            elapsed = 0
             while True:
                 try:
-                    await asyncio.sleep(300)  # 5분마다
+                    await asyncio.sleep(self.hit_flush_interval)
+                    elapsed += self.hit_flush_interval
+                    
+                    await self.flush_hit_counters()
                     
                     # L2 캐시 만료 항목 정리
-                    async with session_factory() as session:
-                        cache_repo = CacheRepository(session)
-                        deleted_count = await cache_repo.clear_expired()
+                    if elapsed >= expiry_interval and self.l2_backend:
+                        elapsed = 0
+                        deleted_count = await self.l2_backend.clear_expired()
                         if deleted_count > 0:
-                            print(f"Cleaned up {deleted_count} expired cache entries")
+                            logger.info(f"Cleaned up {deleted_count} expired cache entries")
                             
+                except asyncio.CancelledError:
+                    raise
                 except Exception as e:
-                    print(f"Cache cleanup error: {e}")
+                    logger.error(f"Cache cleanup error: {e}")
         
         self._cleanup_task = asyncio.create_task(cleanup())
     
     async def stop_cleanup_task(self):
-        """정리 작업 중지"""
+        """정리 작업 중지 (남은 히트 카운트 반영)"""
         if self._cleanup_task:
             self._cleanup_task.cancel()
             try:
                 await self._cleanup_task
             except asyncio.CancelledError:
                 pass
+            self._cleanup_task = None
+        
+        await self.flush_hit_counters()
 
 
 # 전역 캐시 매니저 인스턴스
-cache_manager = CacheManager()
\ No newline at end of file
+cache_manager = CacheManager(l2_backend=create_cache_backend())
\ No newline at end of file
@@ -1,31 +1,171 @@
 # Canvas Cache Manager - 2-Tier 캐싱 시스템
 # AIPortal Canvas v5.0 - 통합 데이터 아키텍처
 
-import asyncio
-import json
-import pickle
-import hashlib
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, Callable, Awaitable
 from uuid import UUID
-from functools import lru_cache
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, text, func
 
 from app.models.canvas_models import (
     CanvasData, CanvasSyncState, CanvasEventData
 )
+from app.services.cache_backends import CacheBackend
+from app.services.cache_manager import SingleFlight, cache_manager
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 인스턴스 간 공유 - 같은 Canvas의 동시 L1 미스는 L2 조회/원본 로드를 한 번만 수행
+_canvas_single_flight = SingleFlight()
+
+
+class ByteBudgetCache:
+    """
+    바이트 예산 기반 L1 캐시 (LRU / LFU)
+    
+    - 항목 크기는 실제 저장되는 직렬화 바이트 기준
+    - 빈도별 OrderedDict 버킷으로 조회/저장/축출 모두 O(1)
+      (LRU는 단일 버킷, LFU는 같은 빈도 내에서 LRU 순서)
+    """
+    
+    def __init__(self, max_bytes: int, max_items: int, policy: str = "lru"):
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"지원하지 않는 축출 정책: {policy}")
+        
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self.policy = policy
+        
+        # key -> (value, size_bytes, expires_at(monotonic))
+        self._entries: Dict[str, Tuple[Any, int, float]] = {}
+        self._freqs: Dict[str, int] = {}
+        self._buckets: Dict[int, OrderedDict] = {}
+        self._min_freq = 0
+        
+        self.total_bytes = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+    
+    def keys(self) -> List[str]:
+        return list(self._entries.keys())
+    
+    def get(self, key: str) -> Optional[Any]:
+        """값 조회 (만료 항목은 제거 후 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        value, _, expires_at = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        
+        self._touch(key)
+        return value
+    
+    def size_of(self, key: str) -> int:
+        """저장된 항목의 바이트 크기"""
+        entry = self._entries.get(key)
+        return entry[1] if entry else 0
+    
+    def set(self, key: str, value: Any, size_bytes: int, ttl_seconds: int) -> bool:
+        """값 저장 - 예산을 넘으면 정책에 따라 축출, 단일 항목이 예산보다 크면 저장하지 않음"""
+        if size_bytes > self.max_bytes:
+            self.delete(key)
+            return False
+        
+        self.delete(key)
+        while self._entries and (
+            self.total_bytes + size_bytes > self.max_bytes or len(self._entries) >= self.max_items
+        ):
+            self._evict_one()
+        
+        self._entries[key] = (value, size_bytes, time.monotonic() + ttl_seconds)
+        self.total_bytes += size_bytes
+        
+        freq = 1 if self.policy == "lfu" else 0
+        self._freqs[key] = freq
+        self._buckets.setdefault(freq, OrderedDict())[key] = None
+        self._min_freq = freq
+        return True
+    
+    def delete(self, key: str) -> bool:
+        """항목 제거"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        
+        self.total_bytes -= entry[1]
+        freq = self._freqs.pop(key)
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if freq == self._min_freq:
+                self._min_freq = min(self._buckets) if self._buckets else 0
+        return True
+    
+    def delete_prefix(self, prefix: str) -> int:
+        """prefix로 시작하는 항목 제거"""
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            self.delete(key)
+        return len(keys)
+    
+    def clear_expired(self) -> int:
+        """만료 항목 일괄 제거"""
+        now = time.monotonic()
+        expired = [key for key, (_, _, expires_at) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            self.delete(key)
+        return len(expired)
+    
+    def _touch(self, key: str) -> None:
+        freq = self._freqs[key]
+        if self.policy == "lru":
+            self._buckets[freq].move_to_end(key)
+            return
+        
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if freq == self._min_freq:
+                self._min_freq = freq + 1
+        self._freqs[key] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+    
+    def _evict_one(self) -> None:
+        bucket = self._buckets[self._min_freq]
+        key = next(iter(bucket))
+        self.delete(key)
+        self.evictions += 1
+    
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "items": len(self._entries),
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
 class CanvasCacheManager:
     """
     Canvas 2-Tier 캐싱 시스템
     
     캐싱 계층:
-    1. L1 Cache (메모리): 빠른 접근, 제한된 용량
-    2. L2 Cache (PostgreSQL): 영속적, 대용량
+    1. L1 Cache (메모리): 바이트 예산 기반 LRU/LFU, 빠른 접근
+    2. L2 Cache (공유 백엔드): 워커 간 공유, 영속적 (CacheManager L2 백엔드 재사용)
+    
+    두 계층 모두 동일한 직렬화 JSON 문자열을 저장하며, 크기 계산도 이 바이트 기준입니다.
     
     주요 역할:
     1. 고성능 Canvas 데이터 캐싱
@@ -34,61 +174,83 @@ class CanvasCacheManager:
     4. 자동 만료 및 무효화
     """
     
-    def __init__(self, db_session: AsyncSession):
+    CANVAS_PREFIX = "canvas:"
+    SYNC_PREFIX = "canvas_sync:"
+    EVENTS_PREFIX = "canvas_events:"
+    
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        l2_backend: Optional[CacheBackend] = None,
+        max_l1_bytes: int = 64 * 1024 * 1024,
+        eviction_policy: str = "lru"
+    ):
         self.db = db_session
         
-        # L1 캐시 (메모리)
-        self._canvas_cache: Dict[str, Dict[str, Any]] = {}  # canvas_id -> canvas_data
-        self._sync_state_cache: Dict[str, Dict[str, Any]] = {}  # "canvas_id:client_id" -> sync_state
-        self._event_cache: Dict[str, List[Dict[str, Any]]] = {}  # canvas_id -> events
-        
-        # 캐시 메타데이터
-        self._cache_timestamps: Dict[str, datetime] = {}
-        self._access_counts: Dict[str, int] = {}
-        self._cache_sizes: Dict[str, int] = {}
-        
         # 캐시 설정
         self._l1_ttl = 300  # L1 캐시 5분
         self._l2_ttl = 3600  # L2 캐시 1시간  
         self._max_l1_size = 1000  # L1 캐시 최대 항목 수
         self._max_canvas_size = 10 * 1024 * 1024  # Canvas 최대 크기 10MB
+        self._max_events = 1000  # Canvas당 캐시할 최대 이벤트 수
+        
+        # L1 캐시 (메모리) - canvas/sync/events 항목이 하나의 바이트 예산을 공유
+        self._l1 = ByteBudgetCache(
+            max_bytes=max_l1_bytes,
+            max_items=self._max_l1_size,
+            policy=eviction_policy
+        )
+        
+        # L2 캐시 (공유 백엔드) - 미지정 시 전역 CacheManager의 백엔드 사용
+        self._l2 = l2_backend if l2_backend is not None else cache_manager.l2_backend
+        
+        # 캐시 메타데이터
+        self._access_counts: Dict[str, int] = {}
+        self._last_evictions = 0
         
         # 통계
         self._hit_counts = {'l1': 0, 'l2': 0, 'miss': 0}
         self._operation_counts = {'get': 0, 'set': 0, 'invalidate': 0}
-        
-        # 비동기 락
-        self._cache_locks: Dict[str, asyncio.Lock] = {}
     
-    async def get_canvas(self, canvas_id: UUID) -> Optional[CanvasData]:
+    async def get_canvas(
+        self,
+        canvas_id: UUID,
+        loader: Optional[Callable[[], Awaitable[Optional[CanvasData]]]] = None
+    ) -> Optional[CanvasData]:
         """
         Canvas 데이터 조회 (2-Tier 캐싱)
         
         순서:
         1. L1 캐시 확인
         2. L2 캐시 확인  
-        3. 원본 소스 로드 (현재는 생략)
+        3. 원본 소스 로드 (loader가 주어진 경우)
+        
+        2~3단계는 같은 Canvas에 대해 동시에 하나만 실행되고 나머지 요청은 결과를 공유합니다.
+        Canvas는 쓰기 시 명시적으로 무효화되므로 stale 값은 반환하지 않습니다.
         """
-        canvas_key = str(canvas_id)
+        canvas_key = f"{self.CANVAS_PREFIX}{canvas_id}"
         self._operation_counts['get'] += 1
         
         try:
             # L1 캐시 확인
-            l1_data = await self._get_from_l1_canvas(canvas_key)
-            if l1_data:
+            payload = self._l1.get(canvas_key)
+            if payload is not None:
                 self._hit_counts['l1'] += 1
                 self._access_counts[canvas_key] = self._access_counts.get(canvas_key, 0) + 1
                 logger.debug(f"Canvas L1 캐시 히트: {canvas_id}")
-                return CanvasData(**l1_data)
+                return CanvasData.model_validate_json(payload)
             
-            # L2 캐시 확인
-            l2_data = await self._get_from_l2_canvas(canvas_key)
-            if l2_data:
-                self._hit_counts['l2'] += 1
+            # L2 캐시 확인 → 원본 로드 (단일 실행)
+            payload, source = await _canvas_single_flight.do(
+                canvas_key,
+                lambda: self._load_canvas_payload(canvas_key, loader)
+            )
+            if payload is not None:
+                self._hit_counts['l2' if source == 'l2' else 'miss'] += 1
                 # L1 캐시에 저장
-                await self._set_to_l1_canvas(canvas_key, l2_data)
-                logger.debug(f"Canvas L2 캐시 히트: {canvas_id}")
-                return CanvasData(**l2_data)
+                self._set_to_l1(canvas_key, payload)
+                logger.debug(f"Canvas {'L2 캐시 히트' if source == 'l2' else '원본 로드'}: {canvas_id}")
+                return CanvasData.model_validate_json(payload)
             
             # 캐시 미스
             self._hit_counts['miss'] += 1
@@ -99,6 +261,29 @@ class CanvasCacheManager:
             logger.error(f"Canvas 캐시 조회 실패 {canvas_id}: {str(e)}")
             return None
     
+    async def _load_canvas_payload(
+        self,
+        canvas_key: str,
+        loader: Optional[Callable[[], Awaitable[Optional[CanvasData]]]]
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """L2 조회, 없으면 원본 로드 후 L2에 저장 - (payload, 'l2' | 'source' | None)"""
+        payload = await self._get_from_l2(canvas_key)
+        if payload is not None:
+            return payload, 'l2'
+        
+        if loader is None:
+            return None, None
+        
+        canvas_data = await loader()
+        if canvas_data is None:
+            return None, None
+        
+        payload = canvas_data.model_dump_json()
+        # 로드 중 무효화되었으면 이전 상태를 L2에 다시 쓰지 않음
+        if _canvas_single_flight.owns(canvas_key) and len(payload.encode()) <= self._max_canvas_size:
+            await self._set_to_l2(canvas_key, payload, self._l2_ttl)
+        return payload, 'source'
+    
     async def set_canvas(
         self, 
         canvas_id: UUID, 
@@ -108,27 +293,22 @@ class CanvasCacheManager:
         """
         Canvas 데이터 저장 (2-Tier 캐싱)
         """
-        canvas_key = str(canvas_id)
+        canvas_key = f"{self.CANVAS_PREFIX}{canvas_id}"
         self._operation_counts['set'] += 1
         
         try:
-            # 데이터 직렬화
-            data_dict = canvas_data.model_dump()
-            
-            # 크기 확인
-            data_size = len(json.dumps(data_dict).encode())
+            # 데이터 직렬화 (L1/L2에 저장되는 바로 그 문자열로 크기 측정)
+            payload = canvas_data.model_dump_json()
+            data_size = len(payload.encode())
             if data_size > self._max_canvas_size:
                 logger.warning(f"Canvas 데이터 크기 초과: {canvas_id} - {data_size} bytes")
                 return False
             
             # L1 캐시에 저장
-            await self._set_to_l1_canvas(canvas_key, data_dict)
+            self._set_to_l1(canvas_key, payload, data_size)
             
             # L2 캐시에 저장
-            await self._set_to_l2_canvas(canvas_key, data_dict, ttl_override or self._l2_ttl)
-            
-            # 메타데이터 업데이트
-            self._cache_sizes[canvas_key] = data_size
+            await self._set_to_l2(canvas_key, payload, ttl_override or self._l2_ttl)
             
             logger.debug(f"Canvas 캐시 저장: {canvas_id} ({data_size} bytes)")
             return True
@@ -143,19 +323,19 @@ class CanvasCacheManager:
         client_id: str
     ) -> Optional[CanvasSyncState]:
         """동기화 상태 조회"""
-        sync_key = f"{canvas_id}:{client_id}"
+        sync_key = f"{self.SYNC_PREFIX}{canvas_id}:{client_id}"
         
         try:
             # L1 캐시 확인
-            l1_data = await self._get_from_l1_sync(sync_key)
-            if l1_data:
-                return CanvasSyncState(**l1_data)
+            payload = self._l1.get(sync_key)
+            if payload is not None:
+                return CanvasSyncState.model_validate_json(payload)
             
             # L2 캐시 확인
-            l2_data = await self._get_from_l2_sync(sync_key)
-            if l2_data:
-                await self._set_to_l1_sync(sync_key, l2_data)
-                return CanvasSyncState(**l2_data)
+            payload = await self._get_from_l2(sync_key)
+            if payload is not None:
+                self._set_to_l1(sync_key, payload)
+                return CanvasSyncState.model_validate_json(payload)
             
             return None
             
@@ -170,16 +350,16 @@ class CanvasCacheManager:
         sync_state: CanvasSyncState
     ) -> bool:
         """동기화 상태 저장"""
-        sync_key = f"{canvas_id}:{client_id}"
+        sync_key = f"{self.SYNC_PREFIX}{canvas_id}:{client_id}"
         
         try:
-            data_dict = sync_state.model_dump()
+            payload = sync_state.model_dump_json()
             
             # L1 캐시에 저장
-            await self._set_to_l1_sync(sync_key, data_dict)
+            self._set_to_l1(sync_key, payload)
             
             # L2 캐시에 저장
-            await self._set_to_l2_sync(sync_key, data_dict)
+            await self._set_to_l2(sync_key, payload, self._l2_ttl)
             
             logger.debug(f"동기화 상태 저장: {sync_key}")
             return True
@@ -193,49 +373,40 @@ class CanvasCacheManager:
         canvas_id: UUID, 
         limit: int = 100
     ) -> List[CanvasEventData]:
-        """이벤트 캐시 조회"""
-        event_key = f"events:{canvas_id}"
+        """이벤트 캐시 조회 (최신 이벤트 우선)"""
+        event_key = f"{self.EVENTS_PREFIX}{canvas_id}"
         
         try:
-            # L1 캐시 확인
-            l1_events = await self._get_from_l1_events(event_key)
-            if l1_events:
-                # 제한 적용
-                events = l1_events[:limit]
-                return [CanvasEventData(**event_dict) for event_dict in events]
-            
-            # L2 캐시 확인
-            l2_events = await self._get_from_l2_events(event_key, limit)
-            if l2_events:
-                await self._set_to_l1_events(event_key, l2_events)
-                return [CanvasEventData(**event_dict) for event_dict in l2_events]
-            
-            return []
+            events = await self._load_event_payloads(event_key)
+            return [
+                CanvasEventData.model_validate_json(payload)
+                for payload in events[:limit]
+            ]
             
         except Exception as e:
             logger.error(f"이벤트 캐시 조회 실패 {canvas_id}: {str(e)}")
             return []
     
     async def add_event(self, event: CanvasEventData) -> bool:
-        """이벤트 캐시에 추가"""
-        event_key = f"events:{event.canvas_id}"
+        """
+        이벤트 캐시에 추가
+        
+        L2 이벤트 목록은 읽기-수정-쓰기로 갱신되므로 여러 워커가 동시에 같은 Canvas에
+        이벤트를 추가하면 일부가 캐시에서 누락될 수 있습니다 (원본은 DB 이벤트 로그).
+        """
+        event_key = f"{self.EVENTS_PREFIX}{event.canvas_id}"
         
         try:
-            event_dict = event.model_dump()
+            payload = event.model_dump_json()
+            events = [payload] + await self._load_event_payloads(event_key)
+            # 캐시 크기 제한
+            events = events[:self._max_events]
             
             # L1 캐시 업데이트
-            if event_key in self._event_cache:
-                self._event_cache[event_key].insert(0, event_dict)
-                # 캐시 크기 제한
-                if len(self._event_cache[event_key]) > 1000:
-                    self._event_cache[event_key] = self._event_cache[event_key][:1000]
-            else:
-                self._event_cache[event_key] = [event_dict]
-            
-            self._cache_timestamps[event_key] = datetime.utcnow()
+            self._set_to_l1(event_key, events, sum(len(item.encode()) for item in events))
             
             # L2 캐시 업데이트
-            await self._add_to_l2_events(event_key, event_dict)
+            await self._set_to_l2(event_key, events, self._l2_ttl)
             
             logger.debug(f"이벤트 캐시 추가: {event.event_id}")
             return True
@@ -246,34 +417,26 @@ class CanvasCacheManager:
     
     async def invalidate_canvas(self, canvas_id: UUID) -> bool:
         """Canvas 캐시 무효화"""
-        canvas_key = str(canvas_id)
+        canvas_key = f"{self.CANVAS_PREFIX}{canvas_id}"
+        event_key = f"{self.EVENTS_PREFIX}{canvas_id}"
         self._operation_counts['invalidate'] += 1
         
         try:
-            # L1 캐시에서 제거
-            if canvas_key in self._canvas_cache:
-                del self._canvas_cache[canvas_key]
-            
-            if canvas_key in self._cache_timestamps:
-                del self._cache_timestamps[canvas_key]
-            
-            if canvas_key in self._access_counts:
-                del self._access_counts[canvas_key]
+            # 진행 중인 원본 로드 결과가 캐시에 저장되지 않도록 함
+            _canvas_single_flight.forget(canvas_key)
             
-            if canvas_key in self._cache_sizes:
-                del self._cache_sizes[canvas_key]
+            # L1 캐시에서 제거
+            self._l1.delete(canvas_key)
+            self._l1.delete(event_key)
+            self._access_counts.pop(canvas_key, None)
             
             # L2 캐시에서 제거
-            await self._invalidate_l2_canvas(canvas_key)
+            await self._invalidate_l2(canvas_key)
+            await self._invalidate_l2(event_key)
             
             # 관련 동기화 상태도 무효화
             await self._invalidate_related_sync_states(canvas_id)
             
-            # 이벤트 캐시 무효화
-            event_key = f"events:{canvas_id}"
-            if event_key in self._event_cache:
-                del self._event_cache[event_key]
-            
             logger.info(f"Canvas 캐시 무효화: {canvas_id}")
             return True
             
@@ -282,27 +445,19 @@ class CanvasCacheManager:
             return False
     
     async def warm_up_cache(self, canvas_ids: List[UUID]) -> Dict[str, int]:
-        """캐시 워밍업 (사전 로딩)"""
+        """캐시 워밍업 (사전 로딩) - L2에 있는 Canvas를 한 번의 배치 조회로 L1에 적재"""
         try:
-            warmed_count = 0
-            failed_count = 0
-            
-            for canvas_id in canvas_ids:
-                try:
-                    # 캐시가 없는 경우에만 로드 시도
-                    existing_data = await self.get_canvas(canvas_id)
-                    if not existing_data:
-                        # 실제로는 DB에서 로드해야 하지만
-                        # 현재는 스킵
-                        failed_count += 1
-                    else:
-                        warmed_count += 1
-                        
-                except Exception as e:
-                    logger.warning(f"캐시 워밍업 실패 {canvas_id}: {str(e)}")
-                    failed_count += 1
-            
-            result = {'warmed': warmed_count, 'failed': failed_count}
+            keys = [f"{self.CANVAS_PREFIX}{canvas_id}" for canvas_id in canvas_ids]
+            missing = [key for key in keys if key not in self._l1]
+            
+            loaded: Dict[str, Any] = {}
+            if missing and self._l2:
+                loaded = await self._l2.get_many(missing)
+                for key, payload in loaded.items():
+                    self._set_to_l1(key, payload)
+            
+            warmed_count = len(keys) - len(missing) + len(loaded)
+            result = {'warmed': warmed_count, 'failed': len(keys) - warmed_count}
             logger.info(f"캐시 워밍업 완료: {result}")
             return result
             
@@ -313,54 +468,25 @@ class CanvasCacheManager:
     async def cleanup_expired_cache(self) -> Dict[str, int]:
         """만료된 캐시 항목 정리"""
         try:
-            current_time = datetime.utcnow()
-            
             # L1 캐시 정리
-            l1_cleaned = 0
-            expired_canvas_keys = []
-            expired_sync_keys = []
-            expired_event_keys = []
-            
-            # Canvas 캐시 만료 확인
-            for key, timestamp in self._cache_timestamps.items():
-                if (current_time - timestamp).seconds > self._l1_ttl:
-                    if key.startswith('events:'):
-                        expired_event_keys.append(key)
-                    elif ':' in key:  # sync state key
-                        expired_sync_keys.append(key)
-                    else:  # canvas key
-                        expired_canvas_keys.append(key)
-            
-            # 만료된 항목들 제거
-            for key in expired_canvas_keys:
-                if key in self._canvas_cache:
-                    del self._canvas_cache[key]
-                    l1_cleaned += 1
-                self._cleanup_cache_metadata(key)
-            
-            for key in expired_sync_keys:
-                if key in self._sync_state_cache:
-                    del self._sync_state_cache[key]
-                    l1_cleaned += 1
-                self._cleanup_cache_metadata(key)
-            
-            for key in expired_event_keys:
-                if key in self._event_cache:
-                    del self._event_cache[key]
-                    l1_cleaned += 1
-                self._cleanup_cache_metadata(key)
+            l1_cleaned = self._l1.clear_expired()
+            
+            # 캐시에서 빠진 항목의 접근 통계 정리
+            for key in [key for key in self._access_counts if key not in self._l1]:
+                del self._access_counts[key]
             
             # L2 캐시 정리
             l2_cleaned = await self._cleanup_l2_cache()
             
-            # LRU 기반 캐시 크기 제한
-            lru_cleaned = await self._enforce_cache_size_limits()
+            # 예산 초과로 축출된 항목 수 (저장 시점에 O(1)로 축출됨)
+            lru_cleaned = self._l1.evictions - self._last_evictions
+            self._last_evictions = self._l1.evictions
             
             result = {
                 'l1_cleaned': l1_cleaned,
                 'l2_cleaned': l2_cleaned,
                 'lru_cleaned': lru_cleaned,
-                'total_l1_size': len(self._canvas_cache) + len(self._sync_state_cache) + len(self._event_cache)
+                'total_l1_size': len(self._l1)
             }
             
             if l1_cleaned > 0 or l2_cleaned > 0:
@@ -378,24 +504,24 @@ class CanvasCacheManager:
             total_hits = sum(self._hit_counts.values())
             hit_ratio = self._hit_counts['l1'] / total_hits if total_hits > 0 else 0
             
-            l1_memory_usage = sum(
-                len(json.dumps(data).encode()) 
-                for data in self._canvas_cache.values()
-            )
+            keys = self._l1.keys()
+            l1_stats = self._l1.stats()
             
             return {
                 'hit_counts': self._hit_counts.copy(),
                 'operation_counts': self._operation_counts.copy(),
                 'hit_ratio': hit_ratio,
                 'l1_cache_sizes': {
-                    'canvas': len(self._canvas_cache),
-                    'sync_state': len(self._sync_state_cache),
-                    'events': len(self._event_cache)
+                    'canvas': sum(1 for key in keys if key.startswith(self.CANVAS_PREFIX)),
+                    'sync_state': sum(1 for key in keys if key.startswith(self.SYNC_PREFIX)),
+                    'events': sum(1 for key in keys if key.startswith(self.EVENTS_PREFIX))
                 },
-                'l1_memory_usage': l1_memory_usage,
+                'l1_memory_usage': l1_stats['bytes'],
+                'l1': l1_stats,
+                'l2': self._l2.stats() if self._l2 else "disabled",
                 'most_accessed': self._get_most_accessed_items(),
                 'cache_efficiency': self._calculate_cache_efficiency(),
-                'average_item_size': sum(self._cache_sizes.values()) / len(self._cache_sizes) if self._cache_sizes else 0
+                'average_item_size': l1_stats['bytes'] / l1_stats['items'] if l1_stats['items'] else 0
             }
             
         except Exception as e:
@@ -404,150 +530,62 @@ class CanvasCacheManager:
     
     # ===== L1 캐시 (메모리) 메서드 =====
     
-    async def _get_from_l1_canvas(self, key: str) -> Optional[Dict[str, Any]]:
-        """L1 Canvas 캐시에서 조회"""
-        if key not in self._canvas_cache:
-            return None
-        
-        # TTL 확인
-        timestamp = self._cache_timestamps.get(key)
-        if timestamp and (datetime.utcnow() - timestamp).seconds > self._l1_ttl:
-            # 만료된 항목 제거
-            del self._canvas_cache[key]
-            self._cleanup_cache_metadata(key)
-            return None
-        
-        return self._canvas_cache[key]
-    
-    async def _set_to_l1_canvas(self, key: str, data: Dict[str, Any]) -> None:
-        """L1 Canvas 캐시에 저장"""
-        self._canvas_cache[key] = data
-        self._cache_timestamps[key] = datetime.utcnow()
-    
-    async def _get_from_l1_sync(self, key: str) -> Optional[Dict[str, Any]]:
-        """L1 동기화 상태 캐시에서 조회"""
-        if key not in self._sync_state_cache:
-            return None
-        
-        timestamp = self._cache_timestamps.get(key)
-        if timestamp and (datetime.utcnow() - timestamp).seconds > self._l1_ttl:
-            del self._sync_state_cache[key]
-            self._cleanup_cache_metadata(key)
-            return None
+    def _set_to_l1(self, key: str, value: Any, size_bytes: Optional[int] = None) -> None:
+        """L1 캐시에 저장 (value는 직렬화된 JSON 문자열 또는 그 목록)"""
+        if size_bytes is None:
+            if isinstance(value, str):
+                size_bytes = len(value.encode())
+            else:
+                size_bytes = sum(len(item.encode()) for item in value)
         
-        return self._sync_state_cache[key]
-    
-    async def _set_to_l1_sync(self, key: str, data: Dict[str, Any]) -> None:
-        """L1 동기화 상태 캐시에 저장"""
-        self._sync_state_cache[key] = data
-        self._cache_timestamps[key] = datetime.utcnow()
-    
-    async def _get_from_l1_events(self, key: str) -> Optional[List[Dict[str, Any]]]:
-        """L1 이벤트 캐시에서 조회"""
-        if key not in self._event_cache:
-            return None
+        if not self._l1.set(key, value, size_bytes, self._l1_ttl):
+            logger.debug(f"L1 캐시 예산 초과로 저장 생략: {key} ({size_bytes} bytes)")
+    
+    async def _load_event_payloads(self, event_key: str) -> List[str]:
+        """L1 → L2 순서로 직렬화된 이벤트 목록 조회"""
+        events = self._l1.get(event_key)
+        if events is not None:
+            return events
         
-        timestamp = self._cache_timestamps.get(key)
-        if timestamp and (datetime.utcnow() - timestamp).seconds > self._l1_ttl:
-            del self._event_cache[key]
-            self._cleanup_cache_metadata(key)
-            return None
+        events = await self._get_from_l2(event_key)
+        if events:
+            self._set_to_l1(event_key, events)
+            return events
         
-        return self._event_cache[key]
-    
-    async def _set_to_l1_events(self, key: str, events: List[Dict[str, Any]]) -> None:
-        """L1 이벤트 캐시에 저장"""
-        self._event_cache[key] = events
-        self._cache_timestamps[key] = datetime.utcnow()
-    
-    # ===== L2 캐시 (PostgreSQL) 메서드 =====
-    
-    async def _get_from_l2_canvas(self, key: str) -> Optional[Dict[str, Any]]:
-        """L2 Canvas 캐시에서 조회"""
-        try:
-            # 실제 구현 시 canvas_cache 테이블에서 조회
-            logger.debug(f"L2 Canvas 캐시 조회: {key}")
-            return None  # 현재는 None 반환
-            
-        except Exception as e:
-            logger.error(f"L2 Canvas 캐시 조회 실패 {key}: {str(e)}")
-            return None
+        return []
     
-    async def _set_to_l2_canvas(
-        self, 
-        key: str, 
-        data: Dict[str, Any], 
-        ttl: int
-    ) -> bool:
-        """L2 Canvas 캐시에 저장"""
-        try:
-            # 실제 구현 시 canvas_cache 테이블에 UPSERT
-            logger.debug(f"L2 Canvas 캐시 저장: {key}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"L2 Canvas 캐시 저장 실패 {key}: {str(e)}")
-            return False
+    # ===== L2 캐시 (공유 백엔드) 메서드 =====
     
-    async def _get_from_l2_sync(self, key: str) -> Optional[Dict[str, Any]]:
-        """L2 동기화 상태 캐시에서 조회"""
-        try:
-            logger.debug(f"L2 동기화 캐시 조회: {key}")
-            return None
-            
-        except Exception as e:
-            logger.error(f"L2 동기화 캐시 조회 실패 {key}: {str(e)}")
+    async def _get_from_l2(self, key: str) -> Optional[Any]:
+        """L2 캐시에서 조회 (백엔드 오류는 미스로 처리됨)"""
+        if not self._l2:
             return None
+        return await self._l2.get(key)
     
-    async def _set_to_l2_sync(self, key: str, data: Dict[str, Any]) -> bool:
-        """L2 동기화 상태 캐시에 저장"""
-        try:
-            logger.debug(f"L2 동기화 캐시 저장: {key}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"L2 동기화 캐시 저장 실패 {key}: {str(e)}")
+    async def _set_to_l2(self, key: str, value: Any, ttl: int) -> bool:
+        """L2 캐시에 저장"""
+        if not self._l2:
             return False
+        await self._l2.set(key, value, ttl)
+        return True
     
-    async def _get_from_l2_events(
-        self, 
-        key: str, 
-        limit: int
-    ) -> Optional[List[Dict[str, Any]]]:
-        """L2 이벤트 캐시에서 조회"""
-        try:
-            logger.debug(f"L2 이벤트 캐시 조회: {key}")
-            return None
-            
-        except Exception as e:
-            logger.error(f"L2 이벤트 캐시 조회 실패 {key}: {str(e)}")
-            return None
-    
-    async def _add_to_l2_events(self, key: str, event_dict: Dict[str, Any]) -> bool:
-        """L2 이벤트 캐시에 추가"""
-        try:
-            logger.debug(f"L2 이벤트 캐시 추가: {key}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"L2 이벤트 캐시 추가 실패 {key}: {str(e)}")
+    async def _invalidate_l2(self, key: str) -> bool:
+        """L2 캐시 무효화"""
+        if not self._l2:
             return False
-    
-    async def _invalidate_l2_canvas(self, key: str) -> bool:
-        """L2 Canvas 캐시 무효화"""
         try:
-            logger.debug(f"L2 Canvas 캐시 무효화: {key}")
-            return True
+            return await self._l2.delete(key)
             
         except Exception as e:
-            logger.error(f"L2 Canvas 캐시 무효화 실패 {key}: {str(e)}")
+            logger.error(f"L2 캐시 무효화 실패 {key}: {str(e)}")
             return False
     
     async def _cleanup_l2_cache(self) -> int:
         """L2 캐시 정리"""
+        if not self._l2:
+            return 0
         try:
-            logger.debug("L2 캐시 정리")
-            return 0  # 정리된 항목 수
+            return await self._l2.clear_expired()
             
         except Exception as e:
             logger.error(f"L2 캐시 정리 실패: {str(e)}")
@@ -555,47 +593,16 @@ class CanvasCacheManager:
     
     # ===== 유틸리티 메서드 =====
     
-    def _cleanup_cache_metadata(self, key: str) -> None:
-        """캐시 메타데이터 정리"""
-        if key in self._cache_timestamps:
-            del self._cache_timestamps[key]
-        if key in self._access_counts:
-            del self._access_counts[key]
-        if key in self._cache_sizes:
-            del self._cache_sizes[key]
-    
     async def _invalidate_related_sync_states(self, canvas_id: UUID) -> None:
         """관련된 동기화 상태 무효화"""
-        canvas_prefix = f"{canvas_id}:"
-        expired_keys = [
-            key for key in self._sync_state_cache.keys() 
-            if key.startswith(canvas_prefix)
-        ]
-        
-        for key in expired_keys:
-            del self._sync_state_cache[key]
-            self._cleanup_cache_metadata(key)
-    
-    async def _enforce_cache_size_limits(self) -> int:
-        """캐시 크기 제한 강제 적용 (LRU)"""
-        cleaned_count = 0
-        
-        # Canvas 캐시 크기 제한
-        if len(self._canvas_cache) > self._max_l1_size:
-            # 접근 빈도 기반 정렬
-            sorted_items = sorted(
-                self._access_counts.items(),
-                key=lambda x: x[1]
-            )
-            
-            remove_count = len(self._canvas_cache) - self._max_l1_size
-            for key, _ in sorted_items[:remove_count]:
-                if key in self._canvas_cache:
-                    del self._canvas_cache[key]
-                    cleaned_count += 1
-                self._cleanup_cache_metadata(key)
+        sync_prefix = f"{self.SYNC_PREFIX}{canvas_id}:"
+        self._l1.delete_prefix(sync_prefix)
         
-        return cleaned_count
+        if self._l2:
+            try:
+                await self._l2.delete_pattern(sync_prefix)
+            except Exception as e:
+                logger.error(f"L2 동기화 상태 무효화 실패 {canvas_id}: {str(e)}")
     
     def _get_most_accessed_items(self, limit: int = 10) -> List[Dict[str, Any]]:
         """가장 많이 접근된 항목들"""
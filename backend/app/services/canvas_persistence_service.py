@@ -15,6 +15,7 @@ import logging
 from app.db.models.conversation import Conversation, Message, MessageRole
 from app.repositories.conversation import ConversationRepository, MessageRepository
 from app.services.conversation_cache_manager import conversation_cache_manager
+from app.services.conversation_context_cache import conversation_context_store
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +80,9 @@ class CanvasPersistenceService:
                 
                 await session.commit()
                 
+                # 캐시된 대화 컨텍스트의 메시지 메타데이터가 바뀌었으므로 다음 조회 때 DB에서 다시 구성
+                conversation_context_store.invalidate(conversation_id)
+                
                 result = {
                     "canvas_id": canvas_id,
                     "action": "updated",
@@ -102,6 +106,15 @@ class CanvasPersistenceService:
                     attachments=[]
                 )
                 
+                # 대화 컨텍스트는 무효화하지 않고 새 메시지만 추가
+                conversation_context_store.append(conversation_id, {
+                    "id": str(canvas_message.id),
+                    "role": canvas_message.role.value,
+                    "content": canvas_message.content,
+                    "metadata_": canvas_message.metadata_,
+                    "created_at": canvas_message.created_at.isoformat()
+                })
+                
                 result = {
                     "canvas_id": canvas_id,
                     "action": "created",
@@ -231,6 +244,7 @@ class CanvasPersistenceService:
                 
                 # 캐시 무효화
                 self.cache_manager.invalidate_conversation_cache(conversation_id)
+                conversation_context_store.invalidate(conversation_id)
                 
                 result = {
                     "canvas_id": canvas_id,
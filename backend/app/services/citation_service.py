@@ -14,6 +14,93 @@ from app.models.citation import (
 from app.services.logging_service import LoggingService
 
 
+# 매치 종류 (같은 위치에서 겹치면 이 순서로 우선)
+_TITLE, _DOMAIN, _URL = 0, 1, 2
+
+
+class CitationPatternMatcher:
+    """
+    모든 출처의 제목 키워드/도메인/URL을 하나의 정규식으로 묶어 응답 텍스트를 한 번만 훑는 매처
+
+    전방 탐색 `(?=(...))` 으로 모든 시작 위치에서 가장 긴 패턴을 찾고, 같은 위치에서 시작하는
+    더 짧은 패턴(가장 긴 패턴의 접두사)은 미리 계산한 목록으로 확인합니다.
+    패턴별로는 re.finditer와 같이 겹치지 않는 매치만, URL은 첫 번째 매치만 사용합니다.
+    """
+
+    def __init__(self):
+        # key: (대소문자 무시 여부, 정규화된 패턴) -> 원문 패턴
+        self._patterns: Dict[Tuple[bool, str], str] = {}
+        # key -> [(출처 순번, 매치 종류, 키워드 순번, 인용 텍스트, 신뢰도)]
+        self._targets: Dict[Tuple[bool, str], List[Tuple[int, int, int, str, float]]] = {}
+        self._prefixes: Dict[Tuple[bool, str], List[Tuple[bool, str]]] = {}
+        self._regex: Optional[re.Pattern] = None
+
+    def add(
+        self,
+        pattern: str,
+        source_index: int,
+        kind: int,
+        order: int,
+        confidence: float,
+        ignore_case: bool = True
+    ) -> None:
+        key = (ignore_case, pattern.lower() if ignore_case else pattern)
+        self._patterns.setdefault(key, pattern)
+        self._targets.setdefault(key, []).append((source_index, kind, order, pattern, confidence))
+
+    def compile(self) -> None:
+        if not self._patterns:
+            return
+        # 긴 패턴을 먼저 두어야 같은 위치에서 가장 긴 패턴이 선택됨
+        keys = sorted(self._patterns, key=lambda k: len(k[1]), reverse=True)
+        alternatives = [
+            f"(?i:{re.escape(self._patterns[key])})" if key[0] else re.escape(self._patterns[key])
+            for key in keys
+        ]
+        self._regex = re.compile("(?=(" + "|".join(alternatives) + "))")
+
+        # 각 패턴에 대해 같은 위치에서 함께 매치될 수 있는 다른 패턴 (접두사 또는 대소문자만 다른 패턴)
+        for key in keys:
+            lowered = key[1].lower()
+            self._prefixes[key] = [
+                other for other in keys
+                if other != key and len(other[1]) <= len(key[1]) and lowered.startswith(other[1].lower())
+            ]
+
+    def _matches_at(self, text: str, position: int, key: Tuple[bool, str]) -> bool:
+        segment = text[position:position + len(key[1])]
+        return segment.lower() == key[1] if key[0] else segment == key[1]
+
+    def find(self, text: str) -> List[Tuple[int, int, int, int, int, str, float]]:
+        """(시작, 끝, 출처 순번, 매치 종류, 키워드 순번, 인용 텍스트, 신뢰도) 목록 - 시작 위치 순"""
+        if self._regex is None:
+            return []
+
+        found = []
+        last_end: Dict[Tuple[bool, str], int] = {}
+        for match in self._regex.finditer(text):
+            start = match.start()
+            matched = match.group(1)
+            longest = (True, matched.lower()) if (True, matched.lower()) in self._targets else (False, matched)
+            if longest not in self._targets:
+                continue
+
+            for index, key in enumerate([longest, *self._prefixes[longest]]):
+                if index and not self._matches_at(text, start, key):
+                    continue
+                # 패턴별로 겹치지 않게, URL은 첫 번째 위치만
+                if start < last_end.get(key, 0) or (not key[0] and key in last_end):
+                    continue
+                end = start + len(key[1])
+                last_end[key] = end
+                for source_index, kind, order, pattern, confidence in self._targets[key]:
+                    found.append((start, end, source_index, kind, order, pattern, confidence))
+
+        # 기준 구현과 같은 순서: 시작 위치, 출처 순서, 제목 → 도메인 → URL, 키워드 순서
+        found.sort(key=lambda item: (item[0], item[2], item[3], item[4]))
+        return found
+
+
 class CitationService:
     """인용 및 출처 처리 서비스"""
     
@@ -131,127 +218,49 @@ class CitationService:
         sources: List[Source],
         min_confidence: float
     ) -> List[Citation]:
-        """응답 텍스트에서 인용 정보 추출"""
-        citations = []
-        
-        for source in sources:
-            # 제목 기반 인용 찾기
-            title_citations = await self._find_title_citations(
-                response_text, source, min_confidence
-            )
-            citations.extend(title_citations)
+        """응답 텍스트에서 인용 정보 추출 (모든 출처 패턴을 한 번에 매칭)"""
+        matcher = CitationPatternMatcher()
+        
+        for source_index, source in enumerate(sources):
+            # 제목 기반 (3글자 이상 상위 5개 키워드) - 신뢰도가 기준 미만인 패턴은 처음부터 제외
+            title_keywords = [word for word in source.title.split() if len(word) >= 3]
+            for order, keyword in enumerate(title_keywords[:5]):
+                confidence = await self._calculate_citation_confidence(keyword, source, "title_match")
+                if confidence >= min_confidence:
+                    matcher.add(keyword, source_index, _TITLE, order, confidence)
             
-            # 도메인 기반 인용 찾기
-            domain_citations = await self._find_domain_citations(
-                response_text, source, min_confidence
-            )
-            citations.extend(domain_citations)
+            # 도메인 기반
+            if source.domain:
+                domain_parts = source.domain.replace('www.', '').split('.')
+                main_domain = domain_parts[0] if domain_parts else ''
+                if len(main_domain) >= 3:
+                    confidence = await self._calculate_citation_confidence(main_domain, source, "domain_match")
+                    if confidence >= min_confidence:
+                        matcher.add(main_domain, source_index, _DOMAIN, 0, confidence)
             
-            # URL 기반 인용 찾기 (직접 링크가 포함된 경우)
-            url_citations = await self._find_url_citations(
-                response_text, source, min_confidence
-            )
-            citations.extend(url_citations)
+            # URL 기반 (직접 링크가 포함된 경우, 100% 신뢰도)
+            if source.url:
+                matcher.add(str(source.url), source_index, _URL, 0, 1.0, ignore_case=False)
         
-        # 중복 제거 및 정렬
-        unique_citations = await self._deduplicate_citations(citations)
-        return sorted(unique_citations, key=lambda x: x.start_position)
-    
-    async def _find_title_citations(
-        self,
-        text: str,
-        source: Source,
-        min_confidence: float
-    ) -> List[Citation]:
-        """제목 기반 인용 찾기"""
-        citations = []
+        matcher.compile()
         
-        # 제목의 주요 키워드 추출 (3글자 이상)
-        title_keywords = [word for word in source.title.split() if len(word) >= 3]
-        
-        for keyword in title_keywords[:5]:  # 상위 5개 키워드만 사용
-            pattern = re.escape(keyword)
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                confidence = await self._calculate_citation_confidence(
-                    keyword, source, "title_match"
-                )
-                
-                if confidence >= min_confidence:
-                    citation = Citation(
-                        id=f"cite_{uuid.uuid4().hex[:8]}",
-                        text=keyword,
-                        source_id=source.id,
-                        start_position=match.start(),
-                        end_position=match.end(),
-                        confidence=confidence,
-                        context=self._extract_context(text, match.start(), match.end())
-                    )
-                    citations.append(citation)
-        
-        return citations
-    
-    async def _find_domain_citations(
-        self,
-        text: str,
-        source: Source,
-        min_confidence: float
-    ) -> List[Citation]:
-        """도메인 기반 인용 찾기"""
         citations = []
-        
-        if not source.domain:
-            return citations
-        
-        # 도메인에서 회사/기관명 추출
-        domain_parts = source.domain.replace('www.', '').split('.')
-        main_domain = domain_parts[0] if domain_parts else ''
-        
-        if len(main_domain) >= 3:
-            pattern = re.escape(main_domain)
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                confidence = await self._calculate_citation_confidence(
-                    main_domain, source, "domain_match"
-                )
-                
-                if confidence >= min_confidence:
-                    citation = Citation(
-                        id=f"cite_{uuid.uuid4().hex[:8]}",
-                        text=main_domain,
-                        source_id=source.id,
-                        start_position=match.start(),
-                        end_position=match.end(),
-                        confidence=confidence,
-                        context=self._extract_context(text, match.start(), match.end())
-                    )
-                    citations.append(citation)
-        
-        return citations
-    
-    async def _find_url_citations(
-        self,
-        text: str,
-        source: Source,
-        min_confidence: float
-    ) -> List[Citation]:
-        """URL 기반 인용 찾기"""
-        citations = []
-        
-        if not source.url:
-            return citations
-        
-        url_str = str(source.url)
-        if url_str in text:
-            start_pos = text.find(url_str)
-            citation = Citation(
+        seen = set()
+        for start, end, source_index, _, _, text, confidence in matcher.find(response_text):
+            source_id = sources[source_index].id
+            # 같은 위치의 같은 소스는 중복으로 간주
+            if (source_id, start, end) in seen:
+                continue
+            seen.add((source_id, start, end))
+            citations.append(Citation(
                 id=f"cite_{uuid.uuid4().hex[:8]}",
-                text=url_str,
-                source_id=source.id,
-                start_position=start_pos,
-                end_position=start_pos + len(url_str),
-                confidence=1.0,  # URL 매치는 100% 신뢰도
-                context=self._extract_context(text, start_pos, start_pos + len(url_str))
-            )
-            citations.append(citation)
+                text=text,
+                source_id=source_id,
+                start_position=start,
+                end_position=end,
+                confidence=confidence,
+                context=self._extract_context(response_text, start, end)
+            ))
         
         return citations
     
@@ -344,20 +353,6 @@ class CitationService:
         
         return context
     
-    async def _deduplicate_citations(self, citations: List[Citation]) -> List[Citation]:
-        """중복 인용 제거"""
-        seen = set()
-        unique_citations = []
-        
-        for citation in citations:
-            # 같은 위치의 같은 소스는 중복으로 간주
-            key = (citation.source_id, citation.start_position, citation.end_position)
-            if key not in seen:
-                seen.add(key)
-                unique_citations.append(citation)
-        
-        return unique_citations
-    
     def _parse_date(self, date_str: Optional[str]) -> Optional[datetime]:
         """날짜 문자열 파싱"""
         if not date_str:
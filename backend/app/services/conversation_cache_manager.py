@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text
 from app.services.cache_manager import cache_manager
 from app.db.models.conversation import Conversation, Message, MessageRole, ConversationStatus
+from app.db.session import AsyncSessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -150,15 +151,35 @@ class ConversationCacheManager:
                 self.message_cache[conversation_id][cache_key] = messages
                 return messages
         
-        # L2: PostgreSQL 캐시 테이블 확인
-        cached_data = await self.base_cache.get(cache_key, session)
-        if cached_data:
+        # L2 → L3: 공유 캐시 확인, 미스 시 메인 테이블 조회 (같은 키의 동시 미스는 한 번만 조회)
+        # 합류한 다른 요청도 결과를 기다리므로 로더는 첫 호출자의 요청 세션 대신 자체 세션을 사용
+        loaded = False
+        
+        async def load_messages() -> List[Dict[str, Any]]:
+            nonlocal loaded
+            loaded = True
+            async with AsyncSessionLocal() as own_session:
+                return await self._load_conversation_messages(conversation_id, own_session, limit, skip)
+        
+        messages = await self.base_cache.get_or_compute(
+            cache_key,
+            load_messages,
+            ttl_seconds=600  # 10분
+        )
+        if not loaded:
             self.stats['message_hits'] += 1
-            # L1에도 저장
-            self._update_message_cache(conversation_id, cache_key, cached_data)
-            return cached_data
+        self._update_message_cache(conversation_id, cache_key, messages)
         
-        # L3: 메인 테이블에서 조회
+        return messages
+    
+    async def _load_conversation_messages(
+        self,
+        conversation_id: str,
+        session: AsyncSession,
+        limit: int,
+        skip: int
+    ) -> List[Dict[str, Any]]:
+        """L3: 메인 테이블에서 메시지 조회"""
         self.stats['message_misses'] += 1
         
         query = text("""
@@ -229,10 +250,6 @@ class ConversationCacheManager:
         else:
             logger.debug(f"📤 메시지 반환 - Canvas 데이터 없음 ({len(messages)}개 메시지)")
         
-        # 캐시에 저장 (L1 + L2)
-        await self.base_cache.set(cache_key, messages, session, ttl_seconds=600)  # 10분
-        self._update_message_cache(conversation_id, cache_key, messages)
-        
         return messages
     
     async def search_conversations(
@@ -347,10 +364,9 @@ class ConversationCacheManager:
         if conversation_id in self.message_cache:
             self.message_cache.pop(conversation_id)
         
-        # L2 캐시 무효화
-        if session:
-            await self.base_cache.invalidate_pattern(f"user_conversations:{user_id}", session)
-            await self.base_cache.invalidate_pattern(f"conversation_messages:{conversation_id}", session)
+        # L2 캐시 무효화 (진행 중인 조회 결과도 저장되지 않음)
+        await self.base_cache.invalidate_pattern(f"user_conversations:{user_id}", session)
+        await self.base_cache.invalidate_pattern(f"conversation_messages:{conversation_id}", session)
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
@@ -0,0 +1,252 @@
+"""
+대화 컨텍스트 증분 캐시
+- 대화별로 최근 메시지, Q&A 쌍, 줄별 글자 수(토큰 추정용)와 장기메모리 요약을 메모리에 유지
+- 메시지가 추가되면 마지막 Q&A 쌍만 갱신하므로 컨텍스트 구성 비용이 전체 이력이 아닌 새 메시지 수에 비례
+- ConversationMemoryService(장기/단기 메모리)와 UniversalContextAnalyzer(최근 메시지 분석)가 같은 상태를 공유
+"""
+
+import asyncio
+import json
+import logging
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.repositories.conversation import ConversationRepository
+
+logger = logging.getLogger(__name__)
+
+# (비ASCII 글자 수, ASCII 글자 수)
+CharCounts = Tuple[int, int]
+
+
+def count_chars(text: str) -> CharCounts:
+    non_ascii = sum(1 for c in text if ord(c) > 127)
+    return non_ascii, len(text) - non_ascii
+
+
+def estimate_tokens(counts: CharCounts) -> int:
+    """글자 수 기반 토큰 추정 (한국어 1글자 1.5토큰, 영어 4글자 1토큰)"""
+    non_ascii, ascii_chars = counts
+    return int(non_ascii * 1.5 + ascii_chars * 0.25)
+
+
+def add_counts(*counts: CharCounts) -> CharCounts:
+    return sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+
+def time_key(value: Optional[str]) -> datetime:
+    """메시지 시각 비교용 키 (DB에서 읽은 값은 시간대 없음, 방금 저장한 값은 KST라 시간대 정보를 버림)"""
+    if not value:
+        return datetime.min
+    try:
+        return datetime.fromisoformat(value).replace(tzinfo=None)
+    except ValueError:
+        return datetime.min
+
+
+@dataclass
+class ConversationContextState:
+    """대화 하나의 증분 컨텍스트 (메시지는 시간순, 역할은 DB 저장 형식인 대문자)"""
+    conversation_id: str
+    user_id: str
+    max_messages: int
+    messages: Deque[Dict[str, Any]] = field(init=False)
+    # 완성된 Q&A 쌍과 각 쌍의 ("사용자: ...", "AI: ...") 줄 글자 수
+    qa_pairs: Deque[Dict[str, Any]] = field(init=False)
+    pair_counts: Deque[Tuple[CharCounts, CharCounts]] = field(init=False)
+    current_pair: Optional[Dict[str, Any]] = None
+    current_counts: Tuple[CharCounts, CharCounts] = ((0, 0), (0, 0))
+    # 마지막으로 완성된 장기메모리 요약 (summary_loaded가 False면 아직 DB에서 확인하지 않음)
+    summary: Optional[str] = None
+    summary_version: int = 0
+    summary_covered_until: Optional[str] = None
+    summary_loaded: bool = False
+
+    def __post_init__(self):
+        self.messages = deque(maxlen=self.max_messages)
+        self.qa_pairs = deque(maxlen=max(1, self.max_messages // 2))
+        self.pair_counts = deque(maxlen=max(1, self.max_messages // 2))
+
+    def append(self, message: Dict[str, Any]) -> None:
+        """메시지 추가 - ConversationMemoryService._group_messages_to_qa_pairs와 같은 규칙으로 쌍 갱신"""
+        role = str(message.get("role", "")).upper()
+        content = message.get("content", "") or ""
+        timestamp = message.get("created_at", "")
+        self.messages.append({
+            "id": message.get("id"),
+            "role": role,
+            "content": content,
+            "created_at": timestamp,
+            "metadata": message.get("metadata") or message.get("metadata_") or {},
+        })
+
+        if role == "USER":
+            # 답변이 있는 쌍만 완성된 쌍으로 남기고 새 질문 시작 (답변 없는 질문은 버림)
+            if self.current_pair and self.current_pair.get("answer"):
+                self.qa_pairs.append(self.current_pair)
+                self.pair_counts.append(self.current_counts)
+            self.current_pair = {
+                "question": content,
+                "question_time": timestamp,
+                "answer": "",
+                "answer_time": ""
+            }
+            self.current_counts = (count_chars(f"사용자: {content}"), (0, 0))
+        elif role == "ASSISTANT" and self.current_pair and self.current_pair.get("question"):
+            self.current_pair["answer"] = content
+            self.current_pair["answer_time"] = timestamp
+            self.current_counts = (self.current_counts[0], count_chars(f"AI: {content}") if content else (0, 0))
+
+    def pairs(self) -> Tuple[List[Dict[str, Any]], List[Tuple[CharCounts, CharCounts]]]:
+        """(Q&A 쌍 목록, 쌍별 줄 글자 수) - 진행 중인 마지막 쌍 포함"""
+        pairs = list(self.qa_pairs)
+        counts = list(self.pair_counts)
+        if self.current_pair and self.current_pair.get("question"):
+            pairs.append(self.current_pair)
+            counts.append(self.current_counts)
+        return pairs, counts
+
+    def set_summary(self, summary: Optional[str], version: int, covered_until: Optional[str]) -> None:
+        """더 새로운 버전일 때만 요약 교체"""
+        self.summary_loaded = True
+        if summary is not None and version >= self.summary_version:
+            self.summary, self.summary_version, self.summary_covered_until = summary, version, covered_until
+
+    def unsummarized_pairs(self, short_term_limit: int) -> List[Dict[str, Any]]:
+        """장기메모리 구간 중 아직 요약에 반영되지 않은 Q&A 쌍"""
+        pairs, _ = self.pairs()
+        long_term = pairs[:-short_term_limit] if len(pairs) > short_term_limit else []
+        if self.summary_covered_until is None:
+            return long_term
+        covered_until = time_key(self.summary_covered_until)
+        return [pair for pair in long_term if time_key(pair.get("question_time")) > covered_until]
+
+    def recent_messages(self, limit: int) -> List[Dict[str, Any]]:
+        if limit <= 0:
+            return []
+        return list(self.messages)[-limit:]
+
+
+class ConversationContextStore:
+    """대화별 증분 컨텍스트 LRU 캐시"""
+
+    def __init__(self, max_conversations: Optional[int] = None, max_messages: Optional[int] = None):
+        self.max_conversations = max_conversations or settings.CONVERSATION_CONTEXT_CACHE_SIZE
+        self.max_messages = max_messages or settings.CONVERSATION_CONTEXT_MAX_MESSAGES
+        self._states: "OrderedDict[str, ConversationContextState]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # 로드 중인 대화의 추가/무효화 횟수 (로드하는 동안 바뀌었는지 확인)
+        self._loading_changes: Dict[str, int] = {}
+        self.stats = {"hits": 0, "loads": 0, "appends": 0, "invalidations": 0}
+
+    async def get(self, conversation_id: str, session: AsyncSession) -> Optional[ConversationContextState]:
+        """캐시된 컨텍스트 반환, 없으면 최근 메시지를 한 번 읽어 구성 (대화가 없으면 None)"""
+        state = self._touch(conversation_id)
+        if state is not None:
+            self.stats["hits"] += 1
+            return state
+
+        lock = self._locks.setdefault(conversation_id, asyncio.Lock())
+        async with lock:
+            state = self._touch(conversation_id)
+            if state is not None:
+                self.stats["hits"] += 1
+                return state
+
+            self._loading_changes[conversation_id] = 0
+            try:
+                state = await self._load(conversation_id, session)
+            finally:
+                changes = self._loading_changes.pop(conversation_id, 0)
+            if state is not None and not changes:
+                # 로드하는 동안 메시지가 추가되었으면 누락될 수 있으므로 캐시하지 않음
+                self._put(conversation_id, state)
+        self._locks.pop(conversation_id, None)
+        return state
+
+    def append(self, conversation_id: str, message: Dict[str, Any]) -> None:
+        """저장된 메시지를 캐시된 컨텍스트에 추가 (캐시에 없으면 다음 조회 때 DB에서 구성)"""
+        self._mark_changed(conversation_id)
+        state = self._states.get(conversation_id)
+        if state is not None:
+            state.append(message)
+            self.stats["appends"] += 1
+
+    def peek(self, conversation_id: str) -> Optional[ConversationContextState]:
+        """캐시에 있을 때만 반환 (DB 조회 없음)"""
+        return self._states.get(conversation_id)
+
+    def invalidate(self, conversation_id: str) -> None:
+        self._mark_changed(conversation_id)
+        if self._states.pop(conversation_id, None) is not None:
+            self.stats["invalidations"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "conversations": len(self._states), "max_conversations": self.max_conversations}
+
+    def _mark_changed(self, conversation_id: str) -> None:
+        if conversation_id in self._loading_changes:
+            self._loading_changes[conversation_id] += 1
+
+    def _touch(self, conversation_id: str) -> Optional[ConversationContextState]:
+        state = self._states.get(conversation_id)
+        if state is not None:
+            self._states.move_to_end(conversation_id)
+        return state
+
+    def _put(self, conversation_id: str, state: ConversationContextState) -> None:
+        self._states[conversation_id] = state
+        self._states.move_to_end(conversation_id)
+        while len(self._states) > self.max_conversations:
+            self._states.popitem(last=False)
+
+    async def _load(self, conversation_id: str, session: AsyncSession) -> Optional[ConversationContextState]:
+        self.stats["loads"] += 1
+        conversation = await ConversationRepository(session).get(conversation_id)
+        if not conversation:
+            return None
+
+        result = await session.execute(
+            text("""
+                SELECT id, role, content, created_at, metadata_
+                FROM messages
+                WHERE conversation_id = :conversation_id
+                ORDER BY created_at DESC
+                LIMIT :limit
+            """),
+            {"conversation_id": conversation_id, "limit": self.max_messages}
+        )
+        rows = list(result)
+        rows.reverse()
+
+        state = ConversationContextState(
+            conversation_id=conversation_id,
+            user_id=str(conversation.user_id),
+            max_messages=self.max_messages
+        )
+        for row in rows:
+            metadata = row.metadata_ or {}
+            if isinstance(metadata, str):
+                try:
+                    metadata = json.loads(metadata)
+                except (json.JSONDecodeError, TypeError):
+                    metadata = {}
+            state.append({
+                "id": str(row.id),
+                "role": row.role.name if hasattr(row.role, "name") else str(row.role),
+                "content": row.content,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "metadata": metadata,
+            })
+        logger.debug(f"대화 컨텍스트 로드: {conversation_id} ({len(rows)}개 메시지)")
+        return state
+
+
+# 전역 대화 컨텍스트 캐시 인스턴스
+conversation_context_store = ConversationContextStore()
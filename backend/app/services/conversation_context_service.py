@@ -12,6 +12,7 @@ from sqlalchemy import text, desc
 
 from app.agents.base import ConversationContext
 from app.agents.llm_router import llm_router
+from app.services.conversation_context_cache import conversation_context_store
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +100,14 @@ class UniversalContextAnalyzer:
         session_id: str, 
         db_session: AsyncSession
     ) -> List[Dict[str, Any]]:
-        """최근 메시지들을 조회합니다."""
+        """최근 메시지들을 조회합니다 (대화 컨텍스트 캐시 우선, 캐시를 쓸 수 없으면 DB 조회)."""
+        try:
+            state = await conversation_context_store.get(session_id, db_session)
+            if state is not None:
+                return state.recent_messages(self.max_recent_messages)
+        except Exception as e:
+            logger.warning(f"대화 컨텍스트 캐시 조회 실패, DB 조회로 대체: {e}")
+        
         try:
             logger.info(f"🔍 DB 메시지 조회 시작 - session_id: {session_id}, limit: {self.max_recent_messages}")
             
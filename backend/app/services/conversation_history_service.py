@@ -12,6 +12,7 @@ from sqlalchemy.orm import selectinload
 from app.db.models.conversation import Conversation, Message, ConversationStatus, MessageRole
 from app.repositories.conversation import ConversationRepository, MessageRepository
 from app.services.conversation_cache_manager import conversation_cache_manager
+from app.services.conversation_context_cache import conversation_context_store
 from app.services.intelligent_cache_manager import intelligent_cache_manager
 import logging
 
@@ -298,7 +299,7 @@ class ConversationHistoryService:
                 session=session
             )
             
-            return {
+            message_data = {
                 'id': str(message.id),
                 'conversation_id': str(message.conversation_id),
                 'role': message.role.value,
@@ -313,6 +314,15 @@ class ConversationHistoryService:
                 'updated_at': message.updated_at.isoformat()
             }
             
+            # 대화 컨텍스트는 무효화하지 않고 새 메시지만 추가
+            conversation_context_store.append(conversation_id, message_data)
+            
+            # 요약되지 않은 Q&A 쌍이 쌓였으면 백그라운드 요약 예약 (응답을 기다리게 하지 않음)
+            from app.services.conversation_memory_service import conversation_summary_worker
+            conversation_summary_worker.notify(conversation_id)
+            
+            return message_data
+            
         except Exception as e:
             await session.rollback()
             logger.error(f"메시지 추가 실패: {str(e)}")
@@ -403,6 +413,7 @@ class ConversationHistoryService:
                 conversation_id=conversation_id,
                 session=session
             )
+            conversation_context_store.invalidate(conversation_id)
             
             return True
             
@@ -1,21 +1,28 @@
 """
 대화 메모리 서비스 - 하이브리드 메모리 시스템
 
-장기메모리: 5개 초과 시 LLM 요약 생성
+장기메모리: 5개 초과 시 LLM 요약 (백그라운드 작업자가 증분 생성, 요청 경로는 마지막 완성본 사용)
 단기메모리: 최근 5개 Q&A 쌍 (원문 보존)
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import time
+from typing import List, Dict, Any, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 import json
 
 from app.db.session import AsyncSessionLocal
-from app.db.models import ConversationSummary
-from app.services.conversation_history_service import conversation_history_service
-from app.agents.llm_router import llm_router
+from app.core.config import settings
+from app.db.models import ConversationSummary, ConversationSummaryVersion
+from app.services.conversation_context_cache import (
+    CharCounts, add_counts, conversation_context_store, count_chars, estimate_tokens
+)
+from app.agents.llm_router import is_degraded_model, llm_router
+from sqlalchemy import delete, exists
 from sqlalchemy.future import select
+from sqlalchemy.orm import aliased
 
 logger = logging.getLogger(__name__)
 
@@ -74,14 +81,10 @@ class ConversationMemoryService:
     ) -> Dict[str, Any]:
         """내부: 컨텍스트 구성"""
         
-        # 1. 대화 상세 정보 조회
-        conversation_detail = await conversation_history_service.get_conversation_detail(
-            conversation_id=conversation_id,
-            user_id=user_id,
-            session=session
-        )
+        # 1. 대화별 증분 컨텍스트 조회 (메시지 추가 시 갱신된 Q&A 쌍과 줄별 글자 수)
+        state = await conversation_context_store.get(conversation_id, session)
         
-        if not conversation_detail or not conversation_detail.get('messages'):
+        if state is None or state.user_id != str(user_id):
             return {
                 'long_term_memory': '',
                 'short_term_memory': [],
@@ -89,31 +92,34 @@ class ConversationMemoryService:
                 'total_tokens': 0
             }
         
-        messages = conversation_detail['messages']
-        
-        # 2. 메시지를 Q&A 쌍으로 그룹화
-        qa_pairs = self._group_messages_to_qa_pairs(messages)
+        # 2. Q&A 쌍 (메시지를 다시 그룹화하지 않음)
+        qa_pairs, pair_counts = state.pairs()
         
         # 3. 장기/단기 메모리 분리
         if len(qa_pairs) <= self.short_term_limit:
             # 단기메모리만 사용
             long_term_memory = ''
             short_term_memory = qa_pairs
+            short_term_counts = pair_counts
         else:
             # 장기 + 단기 메모리 사용
             long_term_qa_pairs = qa_pairs[:-self.short_term_limit]
             short_term_memory = qa_pairs[-self.short_term_limit:]
+            short_term_counts = pair_counts[-self.short_term_limit:]
             
-            # 장기메모리 요약 조회 또는 생성
-            long_term_memory = await self._get_or_create_summary(
-                conversation_id, long_term_qa_pairs, session
-            )
+            # 요청 경로에서는 요약 생성을 기다리지 않고 마지막으로 완성된 요약 사용
+            long_term_memory = await self._get_latest_summary(state, session)
+            if not long_term_memory:
+                long_term_memory = self._create_simple_summary(long_term_qa_pairs)
+            
+            # 요약되지 않은 Q&A 쌍이 쌓였으면 백그라운드 요약 예약
+            conversation_summary_worker.notify(conversation_id)
         
         # 4. LLM용 컨텍스트 프롬프트 구성
         context_prompt = self._build_context_prompt(long_term_memory, short_term_memory)
         
-        # 5. 토큰 수 추정
-        total_tokens = self._estimate_tokens(context_prompt)
+        # 5. 토큰 수 추정 (미리 계산된 줄별 글자 수 합산)
+        total_tokens = self._estimate_context_tokens(long_term_memory, short_term_memory, short_term_counts)
         
         return {
             'long_term_memory': long_term_memory,
@@ -153,66 +159,41 @@ class ConversationMemoryService:
             
         return qa_pairs
     
-    async def _get_or_create_summary(
+    async def _get_latest_summary(self, state, session: AsyncSession) -> str:
+        """마지막으로 완성된 요약 (컨텍스트에 없으면 요약 버전 테이블에서 한 번 조회)"""
+        if not state.summary_loaded:
+            record = await self._latest_summary_record(state.conversation_id, session)
+            if record:
+                state.set_summary(record.summary_text, record.version, record.covered_until)
+            else:
+                state.set_summary(None, 0, None)
+        return state.summary or ''
+    
+    async def _latest_summary_record(
         self,
         conversation_id: str,
-        qa_pairs: List[Dict],
         session: AsyncSession
-    ) -> str:
-        """장기메모리 요약 조회 또는 생성"""
-        
-        try:
-            # conversation_summaries 테이블에서 기존 요약 조회
-            async with AsyncSessionLocal() as session:
-                existing_summary = await session.execute(
-                    select(ConversationSummary)
-                    .where(ConversationSummary.conversation_id == conversation_id)
-                    .order_by(ConversationSummary.updated_at.desc())
-                )
-                existing_record = existing_summary.scalar_one_or_none()
-                
-                # 기존 요약이 있고, 메시지 개수가 크게 변하지 않았으면 재사용
-                current_message_count = len(qa_pairs)
-                if existing_record and abs(existing_record.messages_count - current_message_count) <= 2:
-                    logger.info(f"기존 요약 재사용: {conversation_id}")
-                    return existing_record.summary_text
-            
-            # 새로운 요약 생성
-            summary = await self._generate_summary(qa_pairs)
-            
-            # 생성된 요약을 데이터베이스에 저장
-            async with AsyncSessionLocal() as session:
-                # 기존 요약이 있다면 업데이트, 없다면 생성
-                if existing_record:
-                    existing_record.summary_text = summary
-                    existing_record.messages_count = len(qa_pairs)
-                    existing_record.updated_at = datetime.utcnow()
-                    await session.merge(existing_record)
-                else:
-                    new_summary = ConversationSummary(
-                        conversation_id=conversation_id,
-                        summary_text=summary,
-                        summary_type="auto",
-                        messages_count=len(qa_pairs)
-                    )
-                    session.add(new_summary)
-                
-                await session.commit()
-            
-            logger.info(f"대화 {conversation_id} 요약 생성 완료 (길이: {len(summary)})")
-            
-            return summary
-            
-        except Exception as e:
-            logger.error(f"요약 생성 실패: {e}")
-            # 폴백: 간단한 요약
-            return self._create_simple_summary(qa_pairs)
+    ) -> Optional[ConversationSummaryVersion]:
+        result = await session.execute(
+            select(ConversationSummaryVersion)
+            .where(ConversationSummaryVersion.conversation_id == conversation_id)
+            .order_by(ConversationSummaryVersion.version.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
     
-    async def _generate_summary(self, qa_pairs: List[Dict]) -> str:
-        """LLM을 사용하여 대화 요약 생성"""
+    async def _summarize_with_llm(
+        self,
+        qa_pairs: List[Dict],
+        previous_summary: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """
+        LLM 요약 생성, (요약, 실제 사용 모델) 반환
         
+        previous_summary가 있으면 이전 요약에 새 Q&A 쌍만 반영한 갱신 요약을 생성
+        """
         if not qa_pairs:
-            return ""
+            return previous_summary or "", settings.CONVERSATION_SUMMARY_MODEL
         
         # 요약할 대화 내용 구성
         conversation_text = ""
@@ -220,10 +201,21 @@ class ConversationMemoryService:
             conversation_text += f"Q{i}: {pair['question']}\n"
             conversation_text += f"A{i}: {pair['answer']}\n\n"
         
-        # 요약 생성 프롬프트
-        summary_prompt = f"""다음 대화 내용을 간결하게 요약해주세요.
+        if previous_summary:
+            intro = f"""다음은 지금까지의 대화 요약과 그 이후에 새로 나눈 대화입니다. 기존 요약에 새 대화 내용을 반영하여 갱신된 요약을 작성해주세요.
+
+[기존 요약]
+{previous_summary}
+
+[새 대화]
+{conversation_text}"""
+        else:
+            intro = f"""다음 대화 내용을 간결하게 요약해주세요.
 
-{conversation_text}
+{conversation_text}"""
+        
+        # 요약 생성 프롬프트
+        summary_prompt = f"""{intro}
 
 요약 규칙:
 1. 주요 주제와 핵심 내용만 포함
@@ -234,28 +226,22 @@ class ConversationMemoryService:
 
 요약:"""
 
-        try:
-            # 기본 모델로 요약 생성 (gemini 사용)
-            response = await llm_router.generate_response(
-                message=summary_prompt,
-                model="gemini",
-                agent_type="none",
-                user_id="system",
-                session_id=None,
-                stream=False
-            )
-            
-            summary = response.response.strip()
-            
-            # 길이 제한
-            if len(summary) > 300:
-                summary = summary[:297] + "..."
-                
-            return summary
+        # 기본 모델로 요약 생성 (gemini 사용)
+        response, model_used = await llm_router.generate_response(
+            model_name=settings.CONVERSATION_SUMMARY_MODEL,
+            prompt=summary_prompt,
+            user_id="system",
+            include_datetime=False,
+            cache="conversation_summary"
+        )
+        
+        summary = response.strip()
+        
+        # 길이 제한
+        if len(summary) > 300:
+            summary = summary[:297] + "..."
             
-        except Exception as e:
-            logger.error(f"LLM 요약 생성 실패: {e}")
-            return self._create_simple_summary(qa_pairs)
+        return summary, model_used
     
     def _create_simple_summary(self, qa_pairs: List[Dict]) -> str:
         """간단한 규칙 기반 요약 생성 (폴백)"""
@@ -290,6 +276,27 @@ class ConversationMemoryService:
         
         return "\n".join(context_parts)
     
+    def _estimate_context_tokens(
+        self,
+        long_term_memory: str,
+        short_term_memory: List[Dict],
+        short_term_counts: List[Tuple[CharCounts, CharCounts]]
+    ) -> int:
+        """_build_context_prompt 결과의 토큰 수 추정 (_estimate_tokens와 같은 값, 프롬프트를 다시 세지 않음)"""
+        parts: List[CharCounts] = []
+        if long_term_memory:
+            parts.append(count_chars(f"[이전 대화 요약]\n{long_term_memory}\n"))
+        if short_term_memory:
+            parts.append(count_chars("[최근 대화]"))
+            for pair, (question_counts, answer_counts) in zip(short_term_memory, short_term_counts):
+                parts.append(question_counts)
+                if pair['answer']:
+                    parts.append(answer_counts)
+        if not parts:
+            return 0
+        # 줄 사이 개행 문자 포함
+        return estimate_tokens(add_counts(*parts, (0, len(parts) - 1)))
+    
     def _estimate_tokens(self, text: str) -> int:
         """텍스트 토큰 수 추정 (한국어 기준)"""
         # 간단한 추정: 한국어는 보통 1글자당 1.5토큰 정도
@@ -327,17 +334,12 @@ class ConversationMemoryService:
     ) -> bool:
         """내부: 요약 필요 여부 확인"""
         
-        conversation_detail = await conversation_history_service.get_conversation_detail(
-            conversation_id=conversation_id,
-            user_id=user_id,
-            session=session
-        )
+        state = await conversation_context_store.get(conversation_id, session)
         
-        if not conversation_detail:
+        if state is None or state.user_id != str(user_id):
             return False
         
-        messages = conversation_detail.get('messages', [])
-        qa_pairs = self._group_messages_to_qa_pairs(messages)
+        qa_pairs, _ = state.pairs()
         
         # 5개 Q&A 쌍을 초과하면 요약 필요
         return len(qa_pairs) > self.short_term_limit
@@ -360,12 +362,174 @@ class ConversationMemoryService:
                     await session.delete(summary)
                     deleted_count += 1
                 
+                # 더 새로운 버전이 있는 오래된 요약 버전 삭제 (대화별 최신 버전은 유지)
+                newer = aliased(ConversationSummaryVersion)
+                result = await session.execute(
+                    delete(ConversationSummaryVersion)
+                    .where(ConversationSummaryVersion.created_at < cutoff_date)
+                    .where(exists().where(
+                        newer.conversation_id == ConversationSummaryVersion.conversation_id,
+                        newer.version > ConversationSummaryVersion.version
+                    ))
+                )
+                
                 await session.commit()
-                logger.info(f"오래된 요약 {deleted_count}개 정리 완료")
+                logger.info(f"오래된 요약 {deleted_count}개, 이전 요약 버전 {result.rowcount}개 정리 완료")
                 
         except Exception as e:
             logger.error(f"요약 정리 실패: {e}")
 
 
+class ConversationSummaryWorker:
+    """
+    장기메모리 요약 백그라운드 작업자
+    
+    메시지 추가/컨텍스트 조회 때 아직 요약되지 않은 장기 구간 Q&A 쌍이 기준 이상 쌓인 대화를
+    대기열에 넣고, 마지막 요약 버전 + 새 Q&A 쌍만으로 다음 버전을 생성해 저장합니다.
+    요약에 실패한 대화(LLM 오류, Mock/fallback 응답)는 연속 실패 횟수에 따라 지수적으로 늘어나는
+    시간 동안 다시 대기열에 넣지 않습니다.
+    """
+    
+    def __init__(
+        self,
+        memory_service: ConversationMemoryService,
+        min_new_pairs: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.memory_service = memory_service
+        self.min_new_pairs = min_new_pairs or settings.CONVERSATION_SUMMARY_MIN_NEW_PAIRS
+        self.concurrency = concurrency or settings.CONVERSATION_SUMMARY_WORKERS
+        
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._scheduled: Set[str] = set()
+        # conversation_id -> (다시 시도할 시각, 연속 실패 횟수)
+        self._backoff: Dict[str, Tuple[float, int]] = {}
+        
+        self.stats = {"queued": 0, "summarized": 0, "skipped": 0, "failed": 0, "backed_off": 0}
+    
+    def notify(self, conversation_id: str) -> bool:
+        """요약이 필요하면 대기열에 추가 (캐시된 컨텍스트만 확인하므로 DB/LLM 호출 없음)"""
+        if conversation_id in self._scheduled:
+            return False
+        backoff = self._backoff.get(conversation_id)
+        if backoff is not None and time.time() < backoff[0]:
+            self.stats["backed_off"] += 1
+            return False
+        state = conversation_context_store.peek(conversation_id)
+        if state is None:
+            return False
+        
+        new_pairs = state.unsummarized_pairs(self.memory_service.short_term_limit)
+        # 요약이 아직 없으면 장기 구간이 생기자마자 생성
+        threshold = 1 if state.summary_loaded and state.summary is None else self.min_new_pairs
+        if len(new_pairs) < threshold:
+            return False
+        
+        self._ensure_workers()
+        self._scheduled.add(conversation_id)
+        self._queue.put_nowait(conversation_id)
+        self.stats["queued"] += 1
+        return True
+    
+    async def close(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._scheduled.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": self._queue.qsize() if self._queue else 0,
+            "workers": len(self._workers),
+            "backing_off": len(self._backoff)
+        }
+    
+    def _ensure_workers(self) -> None:
+        if self._workers and not all(task.done() for task in self._workers):
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+    
+    async def _run(self) -> None:
+        while True:
+            conversation_id = await self._queue.get()
+            summarized = False
+            try:
+                summarized = await self._summarize(conversation_id)
+            except Exception as e:
+                self._record_failure(conversation_id)
+                logger.warning(f"백그라운드 대화 요약 실패 [{conversation_id}]: {e}")
+            finally:
+                self._scheduled.discard(conversation_id)
+            if summarized:
+                # 요약하는 동안 새로 쌓인 Q&A 쌍 확인
+                self.notify(conversation_id)
+    
+    def _record_failure(self, conversation_id: str) -> None:
+        """요약 실패 기록 - 연속 실패할수록 다음 시도까지 대기 시간을 두 배로 (상한 있음)"""
+        self.stats["failed"] += 1
+        failures = self._backoff.get(conversation_id, (0.0, 0))[1] + 1
+        delay = min(
+            settings.CONVERSATION_SUMMARY_RETRY_BACKOFF_SECONDS * 2 ** (failures - 1),
+            settings.CONVERSATION_SUMMARY_RETRY_BACKOFF_MAX_SECONDS
+        )
+        self._backoff[conversation_id] = (time.time() + delay, failures)
+    
+    async def _summarize(self, conversation_id: str) -> bool:
+        """마지막 요약 버전에 새 Q&A 쌍을 반영한 다음 버전 저장"""
+        async with AsyncSessionLocal() as session:
+            state = await conversation_context_store.get(conversation_id, session)
+            if state is None:
+                return False
+            
+            # 다른 프로세스가 저장한 버전이 있을 수 있으므로 최신 버전을 기준으로 사용
+            latest = await self.memory_service._latest_summary_record(conversation_id, session)
+            if latest:
+                state.set_summary(latest.summary_text, latest.version, latest.covered_until)
+            else:
+                state.set_summary(None, 0, None)
+            
+            new_pairs = state.unsummarized_pairs(self.memory_service.short_term_limit)
+            threshold = 1 if latest is None else self.min_new_pairs
+            if len(new_pairs) < threshold:
+                self.stats["skipped"] += 1
+                return False
+            
+            started = time.perf_counter()
+            summary, model_used = await self.memory_service._summarize_with_llm(
+                new_pairs, latest.summary_text if latest else None
+            )
+            if is_degraded_model(model_used):
+                # Mock/fallback 응답은 버전으로 저장하지 않고 기존 요약 유지 (턴마다 다시 호출하지 않도록 대기)
+                self._record_failure(conversation_id)
+                logger.warning(f"대화 {conversation_id} 요약 건너뜀: Mock/fallback 응답 ({model_used})")
+                return False
+            version = (latest.version if latest else 0) + 1
+            covered_until = new_pairs[-1].get("question_time")
+            
+            session.add(ConversationSummaryVersion(
+                conversation_id=conversation_id,
+                version=version,
+                base_version=latest.version if latest else None,
+                summary_text=summary,
+                pairs_covered=(latest.pairs_covered if latest else 0) + len(new_pairs),
+                covered_until=covered_until,
+                model=model_used,
+                latency_ms=int((time.perf_counter() - started) * 1000)
+            ))
+            await session.commit()
+        
+        state.set_summary(summary, version, covered_until)
+        self._backoff.pop(conversation_id, None)
+        self.stats["summarized"] += 1
+        logger.info(f"대화 {conversation_id} 요약 v{version} 생성 완료 (새 Q&A {len(new_pairs)}개 반영)")
+        return True
+
+
 # 서비스 인스턴스
-conversation_memory_service = ConversationMemoryService()
\ No newline at end of file
+conversation_memory_service = ConversationMemoryService()
+conversation_summary_worker = ConversationSummaryWorker(conversation_memory_service)
\ No newline at end of file
@@ -0,0 +1,340 @@
+"""
+문서 추출 서비스 (PDF / DOCX / 이미지 OCR)
+- pypdf, python-docx, pytesseract 파싱은 워커 프로세스 풀에서 실행 (이벤트 루프 차단 없음)
+- 페이지/섹션 단위로 추출되는 대로 스트리밍 (다음 구간을 미리 추출하며 소비자와 병행)
+- 문서당 메모리 상한: 한 번에 최대 두 구간만 메모리에 유지, 최대 추출 글자 수 제한
+- 추출 결과는 파일 체크섬(File.checksum) 기준으로 디스크에 캐시 - 같은 파일은 다시 파싱하지 않음
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Document processing imports
+try:
+    import pypdf
+    import docx
+    from PIL import Image
+    import pytesseract
+    DOCUMENT_PROCESSING_AVAILABLE = True
+except ImportError:
+    DOCUMENT_PROCESSING_AVAILABLE = False
+    logger.warning("Document processing libraries not available. Installing: pip install pypdf python-docx Pillow pytesseract")
+
+# 추출 로직이 바뀌면 올려서 기존 캐시를 무효화
+EXTRACTOR_VERSION = 1
+
+
+@dataclass
+class ExtractedSection:
+    """추출된 페이지/섹션"""
+    index: int
+    text: str
+    page_number: Optional[int] = None
+    kind: str = "page"  # page | section | ocr
+
+
+# ===== 워커 프로세스 함수 (pickle 가능한 모듈 수준 함수) =====
+
+def _pdf_page_count(path: str) -> int:
+    return len(pypdf.PdfReader(path).pages)
+
+
+def _extract_pdf_pages(path: str, start: int, count: int) -> List[Tuple[int, str]]:
+    """PDF의 [start, start+count) 페이지 텍스트 추출"""
+    reader = pypdf.PdfReader(path)
+    end = min(start + count, len(reader.pages))
+    return [(page_no, reader.pages[page_no].extract_text() or "") for page_no in range(start, end)]
+
+
+def _extract_docx_sections(path: str, max_section_chars: int, max_total_chars: int) -> List[str]:
+    """DOCX 문단을 제목 또는 길이 기준 섹션으로 묶어 추출 (최대 글자 수까지)"""
+    document = docx.Document(path)
+    sections: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    total = 0
+
+    def flush():
+        nonlocal current, current_len
+        if current:
+            sections.append("\n".join(current))
+        current, current_len = [], 0
+
+    for paragraph in document.paragraphs:
+        text = paragraph.text.strip()
+        if not text:
+            continue
+        is_heading = (paragraph.style is not None and paragraph.style.name or "").startswith("Heading")
+        if is_heading or current_len + len(text) > max_section_chars:
+            flush()
+        current.append(text)
+        current_len += len(text)
+        total += len(text)
+        if total >= max_total_chars:
+            break
+    flush()
+
+    # 표 내용도 섹션으로 추가
+    for table in document.tables:
+        if total >= max_total_chars:
+            break
+        rows = [" | ".join(cell.text.strip() for cell in row.cells) for row in table.rows]
+        table_text = "\n".join(row for row in rows if row.strip(" |"))
+        if table_text:
+            sections.append(table_text)
+            total += len(table_text)
+
+    return sections
+
+
+def _ocr_image(path: str, languages: str) -> str:
+    """이미지 OCR"""
+    with Image.open(path) as image:
+        return pytesseract.image_to_string(image, lang=languages)
+
+
+class DocumentExtractionService:
+    """문서 추출 서비스"""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        pdf_pages_per_batch: Optional[int] = None,
+        max_chars_per_document: Optional[int] = None
+    ):
+        self.cache_dir = Path(settings.DOCUMENT_EXTRACTION_CACHE_DIR if cache_dir is None else cache_dir)
+        self.max_workers = max_workers or settings.DOCUMENT_EXTRACTION_WORKERS
+        self.pdf_pages_per_batch = pdf_pages_per_batch or settings.DOCUMENT_EXTRACTION_PAGES_PER_BATCH
+        self.max_chars_per_document = max_chars_per_document or settings.DOCUMENT_MAX_EXTRACTED_CHARS
+        self.max_section_chars = 4000
+        self.ocr_languages = settings.DOCUMENT_OCR_LANGUAGES
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # 같은 체크섬을 동시에 추출하지 않도록 진행 중인 추출 표시
+        self._in_progress: Dict[str, asyncio.Event] = {}
+
+        self.stats = {"cache_hits": 0, "extractions": 0, "sections_extracted": 0, "truncated": 0, "failures": 0}
+
+    # ===== 공개 API =====
+
+    async def iter_sections(
+        self,
+        kind: str,
+        content: Union[bytes, str, None] = None,
+        file_path: Optional[str] = None,
+        checksum: Optional[str] = None
+    ) -> AsyncIterator[ExtractedSection]:
+        """
+        문서를 페이지/섹션 단위로 스트리밍 추출
+
+        kind: "pdf" | "docx" | "image"
+        content(바이트 또는 base64 문자열)나 file_path 중 하나를 지정합니다.
+        checksum을 주면 (File.checksum) 해시 계산 없이 캐시 키로 사용합니다.
+        """
+        if not DOCUMENT_PROCESSING_AVAILABLE:
+            raise RuntimeError(f"{kind} 추출 라이브러리가 설치되지 않았습니다")
+
+        async with self._materialize(content, file_path) as path:
+            loop = asyncio.get_running_loop()
+            checksum = checksum or await loop.run_in_executor(None, self._file_checksum, path)
+            cache_path = self._cache_path(kind, checksum)
+
+            # 다른 요청이 같은 파일을 추출 중이면 끝날 때까지 기다렸다가 캐시 사용
+            in_progress = self._in_progress.get(cache_path.name)
+            if in_progress is not None:
+                await in_progress.wait()
+
+            if cache_path.exists():
+                self.stats["cache_hits"] += 1
+                async for section in self._read_cache(cache_path):
+                    yield section
+                return
+
+            done = asyncio.Event()
+            self._in_progress[cache_path.name] = done
+            try:
+                async for section in self._extract_and_cache(kind, path, cache_path):
+                    yield section
+            finally:
+                done.set()
+                self._in_progress.pop(cache_path.name, None)
+
+    async def extract_text(self, kind: str, **kwargs) -> str:
+        """전체 텍스트 추출 (스트리밍이 필요 없는 경우, 예: 이미지 OCR)"""
+        return "\n\n".join([section.text async for section in self.iter_sections(kind, **kwargs)])
+
+    async def close(self) -> None:
+        """워커 풀 종료"""
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "workers": self.max_workers}
+
+    # ===== 추출 =====
+
+    async def _extract_and_cache(
+        self, kind: str, path: str, cache_path: Path
+    ) -> AsyncIterator[ExtractedSection]:
+        """추출하면서 임시 캐시 파일에 기록, 끝까지 추출된 경우에만 캐시로 확정"""
+        self.stats["extractions"] += 1
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        completed = False
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as cache_file:
+                async for section in self._extract(kind, path):
+                    cache_file.write(json.dumps(asdict(section), ensure_ascii=False) + "\n")
+                    self.stats["sections_extracted"] += 1
+                    yield section
+            completed = True
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            self.stats["failures"] += 1
+            raise
+        finally:
+            if not completed and os.path.exists(tmp_path):
+                # 소비자가 중간에 멈췄거나 실패한 경우 불완전한 결과는 캐시하지 않음
+                os.unlink(tmp_path)
+
+    async def _extract(self, kind: str, path: str) -> AsyncIterator[ExtractedSection]:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        budget = self.max_chars_per_document
+
+        if kind == "pdf":
+            page_count = await loop.run_in_executor(executor, _pdf_page_count, path)
+            starts = list(range(0, page_count, self.pdf_pages_per_batch))
+            index = 0
+
+            # 현재 구간을 소비하는 동안 다음 구간을 미리 추출 (메모리에는 최대 두 구간)
+            next_batch = loop.run_in_executor(executor, _extract_pdf_pages, path, starts[0], self.pdf_pages_per_batch) if starts else None
+            for position in range(len(starts)):
+                pages = await next_batch
+                next_batch = None
+                if position + 1 < len(starts) and budget > 0:
+                    next_batch = loop.run_in_executor(
+                        executor, _extract_pdf_pages, path, starts[position + 1], self.pdf_pages_per_batch
+                    )
+
+                for page_no, text in pages:
+                    if budget <= 0:
+                        break
+                    text = text[:budget]
+                    budget -= len(text)
+                    if text.strip():
+                        yield ExtractedSection(index=index, text=text, page_number=page_no + 1, kind="page")
+                        index += 1
+
+                if budget <= 0:
+                    self.stats["truncated"] += 1
+                    logger.warning(f"문서 추출 글자 수 상한 도달 - {self.max_chars_per_document}자에서 중단")
+                    if next_batch is not None:
+                        next_batch.cancel()
+                    break
+
+        elif kind == "docx":
+            sections = await loop.run_in_executor(
+                executor, _extract_docx_sections, path, self.max_section_chars, budget
+            )
+            for index, text in enumerate(sections):
+                yield ExtractedSection(index=index, text=text, kind="section")
+
+        elif kind == "image":
+            text = await loop.run_in_executor(executor, _ocr_image, path, self.ocr_languages)
+            yield ExtractedSection(index=0, text=text[:budget], kind="ocr")
+
+        else:
+            raise ValueError(f"지원하지 않는 추출 유형: {kind}")
+
+    # ===== 캐시 =====
+
+    def _cache_path(self, kind: str, checksum: str) -> Path:
+        return self.cache_dir / checksum[:2] / f"{checksum}.{kind}.v{EXTRACTOR_VERSION}.jsonl"
+
+    async def _read_cache(self, cache_path: Path) -> AsyncIterator[ExtractedSection]:
+        loop = asyncio.get_running_loop()
+        with open(cache_path, "r", encoding="utf-8") as cache_file:
+            while True:
+                line = await loop.run_in_executor(None, cache_file.readline)
+                if not line:
+                    break
+                yield ExtractedSection(**json.loads(line))
+
+    @staticmethod
+    def _file_checksum(path: str) -> str:
+        """File.checksum과 같은 MD5 체크섬"""
+        hash_md5 = hashlib.md5()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hash_md5.update(chunk)
+        return hash_md5.hexdigest()
+
+    # ===== 유틸리티 =====
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            logger.info(f"📄 문서 추출 워커 풀 시작 (process x {self.max_workers})")
+        return self._executor
+
+    def _materialize(self, content: Union[bytes, str, None], file_path: Optional[str]):
+        """워커 프로세스에 넘길 파일 경로 확보 (메모리 내용은 임시 파일로 저장)"""
+        return _MaterializedFile(content, file_path)
+
+
+class _MaterializedFile:
+    """file_path가 있으면 그대로, 없으면 content를 임시 파일로 쓰고 종료 시 삭제"""
+
+    def __init__(self, content: Union[bytes, str, None], file_path: Optional[str]):
+        self.content = content
+        self.file_path = file_path
+        self._tmp_path: Optional[str] = None
+
+    async def __aenter__(self) -> str:
+        if self.file_path:
+            return self.file_path
+        if self.content is None:
+            raise ValueError("content 또는 file_path가 필요합니다")
+
+        data = self.content
+        if isinstance(data, str):
+            try:
+                data = base64.b64decode(data, validate=True)
+            except (binascii.Error, ValueError):
+                raise ValueError("문자열 content는 base64로 인코딩된 파일이어야 합니다")
+
+        loop = asyncio.get_running_loop()
+        self._tmp_path = await loop.run_in_executor(None, self._write_temp, data)
+        return self._tmp_path
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._tmp_path and os.path.exists(self._tmp_path):
+            os.unlink(self._tmp_path)
+
+    @staticmethod
+    def _write_temp(data: bytes) -> str:
+        fd, path = tempfile.mkstemp(suffix=".upload")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return path
+
+
+# 전역 문서 추출 서비스
+document_extraction_service = DocumentExtractionService()
@@ -0,0 +1,403 @@
+"""
+임베딩 서비스
+- 워커 프로세스/스레드 풀에서 배치 추론 (이벤트 루프를 막지 않음)
+- 동시 요청의 텍스트를 모아 하나의 배치로 처리 (dynamic batching)
+- 텍스트 해시 기반 벡터 캐시: 메모리 LRU + 디스크(SQLite), 크기 제한 및 축출
+- 처리량 지표 (texts/sec, 배치 채움 비율)
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Encoder = Callable[[List[str]], List[List[float]]]
+
+# 워커(프로세스 또는 스레드)별로 로드된 모델
+_worker_models: Dict[str, object] = {}
+_worker_models_lock = threading.Lock()
+
+
+def _load_worker_model(model_name: str):
+    """워커에서 임베딩 모델 로드 (워커당 한 번)"""
+    with _worker_models_lock:
+        model = _worker_models.get(model_name)
+        if model is None:
+            from langchain_community.embeddings import HuggingFaceEmbeddings
+            model = HuggingFaceEmbeddings(model_name=model_name)
+            _worker_models[model_name] = model
+        return model
+
+
+def _encode_in_worker(model_name: str, texts: List[str]) -> List[List[float]]:
+    """워커에서 실행되는 배치 인코딩"""
+    return _load_worker_model(model_name).embed_documents(texts)
+
+
+class EmbeddingDiskCache:
+    """SQLite 기반 디스크 벡터 캐시 (접근 시각 기준 축출)"""
+
+    def __init__(self, path: Path, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # 저장된 항목 수 (연결을 열 때 한 번 세고 이후 삽입/축출로 갱신)
+        self._count = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key TEXT PRIMARY KEY, vector BLOB NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_accessed ON embeddings(accessed_at)"
+            )
+            self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        return self._conn
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        if not keys:
+            return {}
+        with self._lock:
+            conn = self._connection()
+            found: Dict[str, np.ndarray] = {}
+            # SQLite 바인드 변수 제한을 고려해 나눠서 조회
+            for start in range(0, len(keys), 500):
+                part = keys[start:start + 500]
+                placeholders = ",".join("?" * len(part))
+                rows = conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", part
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE embeddings SET accessed_at = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                conn.commit()
+            return found
+
+    def set_many(self, items: Dict[str, np.ndarray]) -> None:
+        if not items:
+            return
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            rows = [(vector.astype(np.float32).tobytes(), now, key) for key, vector in items.items()]
+            # 새 항목만 삽입되므로 rowcount로 항목 수를 추적 (이미 있던 키는 갱신)
+            inserted = conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (vector, accessed_at, key) VALUES (?, ?, ?)", rows
+            ).rowcount
+            self._count += inserted
+            if inserted < len(rows):
+                conn.executemany("UPDATE embeddings SET vector = ?, accessed_at = ? WHERE key = ?", rows)
+            if self._count > self.max_entries:
+                # 가장 오래 사용되지 않은 항목부터 10% 여유를 두고 정리
+                excess = self._count - int(self.max_entries * 0.9)
+                self._count -= conn.execute(
+                    "DELETE FROM embeddings WHERE key IN ("
+                    "SELECT key FROM embeddings ORDER BY accessed_at ASC LIMIT ?)",
+                    (excess,)
+                ).rowcount
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class EmbeddingService:
+    """배치 임베딩 서비스"""
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        encoder: Optional[Encoder] = None,
+        max_batch_size: Optional[int] = None,
+        max_batch_wait_ms: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        use_process_pool: Optional[bool] = None,
+        memory_cache_size: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        disk_cache_max_entries: Optional[int] = None
+    ):
+        """
+        encoder를 지정하면 모델 대신 해당 함수를 스레드 풀에서 실행합니다 (테스트/외부 모델용).
+        cache_dir를 빈 문자열로 지정하면 디스크 캐시를 사용하지 않습니다.
+        """
+        self.model_name = model_name or settings.EMBEDDING_MODEL_NAME
+        self._encoder = encoder
+        self.max_batch_size = max_batch_size or settings.EMBEDDING_MAX_BATCH_SIZE
+        self.max_batch_wait = (
+            settings.EMBEDDING_BATCH_WAIT_MS if max_batch_wait_ms is None else max_batch_wait_ms
+        ) / 1000
+        self.max_workers = max_workers or settings.EMBEDDING_WORKERS
+        self.use_process_pool = (
+            settings.EMBEDDING_USE_PROCESS_POOL if use_process_pool is None else use_process_pool
+        ) and encoder is None
+
+        # 메모리 캐시 (LRU)
+        self.memory_cache_size = memory_cache_size or settings.EMBEDDING_MEMORY_CACHE_SIZE
+        self._memory_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        # 디스크 캐시
+        cache_dir = settings.EMBEDDING_CACHE_DIR if cache_dir is None else cache_dir
+        self._disk_cache: Optional[EmbeddingDiskCache] = None
+        if cache_dir:
+            slug = self.model_name.replace("/", "__")
+            self._disk_cache = EmbeddingDiskCache(
+                Path(cache_dir) / f"{slug}.sqlite3",
+                disk_cache_max_entries or settings.EMBEDDING_DISK_CACHE_MAX_ENTRIES
+            )
+
+        # 배치 처리 상태 (이벤트 루프별로 생성)
+        self._executor: Optional[Executor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher_task: Optional[asyncio.Task] = None
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._batch_tasks: set = set()
+
+        # 지표
+        self.metrics = {
+            "texts_requested": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "coalesced": 0,
+            "texts_embedded": 0,
+            "batches": 0,
+            "encode_seconds": 0.0,
+            "failed_batches": 0,
+        }
+
+    # ===== 공개 API =====
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """텍스트 목록 임베딩 (캐시 → 진행 중 요청 합류 → 배치 큐)"""
+        if not texts:
+            return []
+
+        self.metrics["texts_requested"] += len(texts)
+        keys = [self._key(text) for text in texts]
+        vectors: Dict[str, np.ndarray] = {}
+
+        # 1. 메모리 캐시
+        for key in keys:
+            vector = self._memory_cache.get(key)
+            if vector is not None:
+                self._memory_cache.move_to_end(key)
+                vectors[key] = vector
+        self.metrics["memory_hits"] += len(vectors)
+
+        # 2. 디스크 캐시
+        missing = [key for key in dict.fromkeys(keys) if key not in vectors]
+        if missing and self._disk_cache:
+            loop = asyncio.get_running_loop()
+            try:
+                disk_vectors = await loop.run_in_executor(None, self._disk_cache.get_many, missing)
+            except Exception as e:
+                logger.warning(f"임베딩 디스크 캐시 조회 실패: {e}")
+                disk_vectors = {}
+            self.metrics["disk_hits"] += len(disk_vectors)
+            for key, vector in disk_vectors.items():
+                self._remember(key, vector)
+            vectors.update(disk_vectors)
+
+        # 3. 배치 큐 (같은 텍스트가 이미 대기 중이면 합류)
+        self._ensure_batcher()
+        text_by_key = dict(zip(keys, texts))
+        futures = {}
+        for key in dict.fromkeys(keys):
+            if key in vectors:
+                continue
+            future = self._pending.get(key)
+            if future is None:
+                future = await self._enqueue(key, text_by_key[key])
+            else:
+                self.metrics["coalesced"] += 1
+            futures[key] = future
+
+        if futures:
+            # 공유 future는 다른 요청도 기다리므로 이 호출이 취소되어도 함께 취소되지 않게 보호
+            results = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+            vectors.update(zip(futures.keys(), results))
+
+        return [vectors[key].tolist() for key in keys]
+
+    async def embed_query(self, text: str) -> List[float]:
+        """단일 쿼리 임베딩"""
+        return (await self.embed([text]))[0]
+
+    def get_metrics(self) -> Dict[str, object]:
+        """처리량 지표"""
+        batches = self.metrics["batches"]
+        embedded = self.metrics["texts_embedded"]
+        requested = self.metrics["texts_requested"]
+        encode_seconds = self.metrics["encode_seconds"]
+        return {
+            **self.metrics,
+            "texts_per_second": embedded / encode_seconds if encode_seconds else 0.0,
+            "avg_batch_size": embedded / batches if batches else 0.0,
+            "batch_fill_ratio": embedded / (batches * self.max_batch_size) if batches else 0.0,
+            "cache_hit_ratio": (
+                (self.metrics["memory_hits"] + self.metrics["disk_hits"]) / requested if requested else 0.0
+            ),
+            "memory_cache_entries": len(self._memory_cache),
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "worker_type": "process" if self.use_process_pool else "thread",
+            "max_workers": self.max_workers,
+        }
+
+    async def close(self) -> None:
+        """배치 작업 중지 및 워커 풀 종료 (실행 중인 배치는 디스크 캐시 저장까지 완료)"""
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+        if self._batcher_task:
+            self._batcher_task.cancel()
+            try:
+                await self._batcher_task
+            except asyncio.CancelledError:
+                pass
+            self._batcher_task = None
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._disk_cache:
+            self._disk_cache.close()
+        self._loop = None
+
+    # ===== 배치 처리 =====
+
+    async def _enqueue(self, key: str, text: str) -> asyncio.Future:
+        future = self._loop.create_future()
+        self._pending[key] = future
+        await self._queue.put((key, text, future))
+        return future
+
+    def _ensure_batcher(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._batcher_task is None or self._batcher_task.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._batch_slots = asyncio.Semaphore(self.max_workers)
+            self._pending = {}
+            self._batch_tasks = set()
+            self._batcher_task = loop.create_task(self._batch_loop())
+
+    async def _batch_loop(self) -> None:
+        """큐에서 첫 항목을 기다린 뒤 max_batch_wait 동안 max_batch_size까지 모아 실행"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_batch_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # 워커 수만큼만 동시에 실행 (나머지는 큐에서 더 큰 배치로 모임)
+            await self._batch_slots.acquire()
+            task = self._loop.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, str, asyncio.Future]]) -> None:
+        keys = [key for key, _, _ in batch]
+        texts = [text for _, text, _ in batch]
+        try:
+            started = time.perf_counter()
+            embeddings = await self._loop.run_in_executor(self._get_executor(), *self._encode_call(texts))
+            self.metrics["encode_seconds"] += time.perf_counter() - started
+            self.metrics["batches"] += 1
+            self.metrics["texts_embedded"] += len(texts)
+
+            vectors = {
+                key: np.asarray(embedding, dtype=np.float32)
+                for key, embedding in zip(keys, embeddings)
+            }
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+            for key, _, future in batch:
+                if not future.done():
+                    future.set_result(vectors[key])
+
+            if self._disk_cache:
+                try:
+                    await self._loop.run_in_executor(None, self._disk_cache.set_many, vectors)
+                except Exception as e:
+                    logger.warning(f"임베딩 디스크 캐시 저장 실패: {e}")
+
+        except Exception as e:
+            self.metrics["failed_batches"] += 1
+            logger.error(f"❌ 임베딩 배치 실패 ({len(batch)}개): {e}")
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for key in keys:
+                self._pending.pop(key, None)
+            self._batch_slots.release()
+
+    def _encode_call(self, texts: List[str]) -> tuple:
+        if self._encoder is not None:
+            return self._encoder, texts
+        return _encode_in_worker, self.model_name, texts
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_process_pool:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="embedding"
+                )
+            logger.info(
+                f"🧮 임베딩 워커 풀 시작: {self.model_name} "
+                f"({'process' if self.use_process_pool else 'thread'} x {self.max_workers})"
+            )
+        return self._executor
+
+    # ===== 캐시 =====
+
+    def _key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode()).hexdigest()
+
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        self._memory_cache[key] = vector
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
+
+# 전역 임베딩 서비스 (기본 모델)
+embedding_service = EmbeddingService()
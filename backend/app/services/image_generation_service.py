@@ -17,6 +17,7 @@ import aiofiles
 
 from app.core.config import settings
 from app.services.cache_manager import cache_manager
+from app.services.blob_store import blob_store
 from app.db.session import AsyncSessionLocal
 from app.db.models.image_generation import GeneratedImage
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -483,8 +484,8 @@ class ImageGenerationService:
             filename = f"{job_id}_{index}.png"
             file_path = image_dir / filename
             
-            # 이미지 저장 (Google GenAI Image 객체에서 직접 저장)
-            image_obj.save(str(file_path))
+            # 이미지 저장 (같은 내용이면 기존 블롭을 링크)
+            await blob_store.store_image_bytes(image_obj.image_bytes, file_path)
             
             # URL 반환 (실제 서버 URL로 변경 필요)
             base_url = getattr(settings, 'BASE_URL', 'http://localhost:8000')
@@ -1245,8 +1246,8 @@ class ImageGenerationService:
             filename = f"{job_id}_edited_{index}.jpg"
             file_path = image_dir / filename
             
-            # 이미지 저장
-            image_obj.save(str(file_path))
+            # 이미지 저장 (같은 내용이면 기존 블롭을 링크)
+            await blob_store.store_image_bytes(image_obj.image_bytes, file_path)
             
             # 파일이 실제로 저장되고 접근 가능한지 확인
             await self._ensure_file_accessible(str(file_path))
@@ -1561,10 +1562,15 @@ class ImageGenerationService:
             except Exception as info_error:
                 logger.debug(f"⚠️ 이미지 정보 조회 실패: {info_error}")
             
-            # 이미지 저장 (PIL Image 객체)
+            # 이미지 저장 (PIL Image 객체 → PNG, 같은 내용이면 기존 블롭을 링크)
             save_start = time.time()
-            image.save(str(file_path), "PNG")
+            from io import BytesIO
+            png_buffer = BytesIO()
+            image.save(png_buffer, "PNG")
+            blob_ref = await blob_store.store_image_bytes(png_buffer.getvalue(), file_path)
             save_duration = time.time() - save_start
+            if blob_ref.deduplicated:
+                logger.info(f"♻️ 동일한 이미지 블롭 재사용: {blob_ref.sha256[:12]}")
             
             # 파일 저장 확인 및 크기 로깅
             if file_path.exists():
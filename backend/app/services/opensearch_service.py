@@ -1,107 +1,130 @@
 """
 AWS OpenSearch 서비스
+- 비동기 클라이언트 (연결 풀 공유, 이벤트 루프 차단 없음)
+- 대기열 기반 bulk 인덱싱 (대기열이 차면 생산자가 기다림 - back-pressure)
+- embedding_vector 필드 kNN 검색 및 BM25 + 벡터 하이브리드 검색
+- OPENSEARCH_BACKEND=local이면 프로세스 내 대체 구현 사용 (클러스터 없이 테스트/개발)
 """
 
-from typing import Dict, List, Any, Optional
-from opensearchpy import OpenSearch, RequestsHttpConnection
-from requests_aws4auth import AWS4Auth
+from typing import Dict, List, Any, Optional, Tuple
+import asyncio
 import logging
-import json
+import math
+import re
+from collections import Counter
 from datetime import datetime
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+try:
+    from opensearchpy import AsyncOpenSearch, AIOHttpConnection, AWSV4SignerAsyncAuth
+    OPENSEARCH_AVAILABLE = True
+except ImportError:
+    OPENSEARCH_AVAILABLE = False
+    logger.warning("opensearch-py not available. Installing: pip install 'opensearch-py[async]'")
+
 
 class OpenSearchService:
     """AWS OpenSearch 서비스 클래스"""
-    
-    def __init__(self):
-        self.client = None
-        self._initialize_client()
-    
+
+    def __init__(self, client: Any = None):
+        self.client = client
+        self._bulk_indexer: Optional["BulkIndexer"] = None
+        if self.client is None:
+            self._initialize_client()
+
     def _initialize_client(self):
-        """OpenSearch 클라이언트 초기화"""
+        """OpenSearch 클라이언트 초기화 (연결은 첫 요청 시 맺어짐)"""
         try:
-            if settings.OPENSEARCH_URL:
-                # 기본 인증(username/password)이 있는 경우 - 우선 순위
-                if settings.OPENSEARCH_USERNAME and settings.OPENSEARCH_PASSWORD:
-                    self.client = OpenSearch(
-                        hosts=[settings.OPENSEARCH_URL],
-                        http_auth=(settings.OPENSEARCH_USERNAME, settings.OPENSEARCH_PASSWORD),
-                        use_ssl=True,
-                        verify_certs=True,
-                        timeout=30,
-                        max_retries=10,
-                        retry_on_timeout=True
-                    )
-                
-                # AWS 인증이 있는 경우 (fallback)
-                elif settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
-                    auth = AWS4Auth(
-                        settings.AWS_ACCESS_KEY_ID,
-                        settings.AWS_SECRET_ACCESS_KEY,
-                        settings.AWS_REGION,
-                        'es'
-                    )
-                    
-                    self.client = OpenSearch(
-                        hosts=[{
-                            'host': settings.OPENSEARCH_URL.replace('https://', '').replace('http://', ''),
-                            'port': 443
-                        }],
-                        http_auth=auth,
-                        use_ssl=True,
-                        verify_certs=True,
-                        connection_class=RequestsHttpConnection,
-                        timeout=30,
-                        max_retries=10,
-                        retry_on_timeout=True
-                    )
-                
-                else:
-                    # 인증 없는 로컬 연결
-                    self.client = OpenSearch(
-                        hosts=[settings.OPENSEARCH_URL],
-                        use_ssl=False,
-                        timeout=30
-                    )
-                
-                logger.info("OpenSearch 클라이언트 초기화 완료")
-                
-                # 연결 테스트
-                if self.client.ping():
-                    logger.info("OpenSearch 연결 성공")
-                else:
-                    logger.warning("OpenSearch 연결 실패")
-                    
-            else:
+            if settings.OPENSEARCH_BACKEND == "local":
+                self.client = LocalOpenSearchClient()
+                logger.info("OpenSearch 로컬 대체 백엔드 사용")
+                return
+
+            if not settings.OPENSEARCH_URL:
                 logger.warning("OPENSEARCH_URL이 설정되지 않음")
-                
+                return
+
+            if not OPENSEARCH_AVAILABLE:
+                return
+
+            pool_options = {
+                "connection_class": AIOHttpConnection,
+                "maxsize": settings.OPENSEARCH_POOL_MAXSIZE,
+                "timeout": 30,
+                "max_retries": 3,
+                "retry_on_timeout": True,
+            }
+
+            # 기본 인증(username/password)이 있는 경우 - 우선 순위
+            if settings.OPENSEARCH_USERNAME and settings.OPENSEARCH_PASSWORD:
+                self.client = AsyncOpenSearch(
+                    hosts=[settings.OPENSEARCH_URL],
+                    http_auth=(settings.OPENSEARCH_USERNAME, settings.OPENSEARCH_PASSWORD),
+                    use_ssl=True,
+                    verify_certs=True,
+                    **pool_options
+                )
+
+            # AWS 인증이 있는 경우 (fallback)
+            elif settings.AWS_ACCESS_KEY_ID and settings.AWS_SECRET_ACCESS_KEY:
+                import boto3
+                credentials = boto3.Session(
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.AWS_REGION
+                ).get_credentials()
+
+                self.client = AsyncOpenSearch(
+                    hosts=[{
+                        'host': settings.OPENSEARCH_URL.replace('https://', '').replace('http://', ''),
+                        'port': 443
+                    }],
+                    http_auth=AWSV4SignerAsyncAuth(credentials, settings.AWS_REGION, 'es'),
+                    use_ssl=True,
+                    verify_certs=True,
+                    **pool_options
+                )
+
+            else:
+                # 인증 없는 로컬 연결
+                self.client = AsyncOpenSearch(
+                    hosts=[settings.OPENSEARCH_URL],
+                    use_ssl=False,
+                    **pool_options
+                )
+
+            logger.info("OpenSearch 비동기 클라이언트 초기화 완료")
+
         except Exception as e:
             logger.error(f"OpenSearch 초기화 실패: {e}")
             self.client = None
-    
-    def is_connected(self) -> bool:
+
+    @staticmethod
+    def _full_index_name(index_name: str) -> str:
+        return f"{settings.OPENSEARCH_INDEX_PREFIX}{index_name}"
+
+    async def is_connected(self) -> bool:
         """OpenSearch 연결 상태 확인"""
         try:
-            return self.client is not None and self.client.ping()
+            return self.client is not None and await self.client.ping()
         except Exception:
             return False
-    
-    def get_cluster_info(self) -> Optional[Dict]:
+
+    async def get_cluster_info(self) -> Optional[Dict]:
         """클러스터 정보 조회"""
         try:
             if self.client:
-                return self.client.info()
+                return await self.client.info()
         except Exception as e:
             logger.error(f"클러스터 정보 조회 실패: {e}")
         return None
-    
-    def create_index(
-        self, 
-        index_name: str, 
+
+    async def create_index(
+        self,
+        index_name: str,
         mapping: Dict = None,
         settings_dict: Dict = None
     ) -> bool:
@@ -109,64 +132,147 @@ class OpenSearchService:
         try:
             if not self.client:
                 return False
-                
-            full_index_name = f"{settings.OPENSEARCH_INDEX_PREFIX}{index_name}"
-            
+
+            full_index_name = self._full_index_name(index_name)
+
             # 인덱스가 이미 존재하는지 확인
-            if self.client.indices.exists(index=full_index_name):
+            if await self.client.indices.exists(index=full_index_name):
                 logger.info(f"인덱스 '{full_index_name}'이 이미 존재합니다")
                 return True
-            
+
             body = {}
             if settings_dict:
                 body['settings'] = settings_dict
             if mapping:
                 body['mappings'] = mapping
-            
-            response = self.client.indices.create(
+
+            response = await self.client.indices.create(
                 index=full_index_name,
                 body=body if body else None
             )
-            
+
             logger.info(f"인덱스 '{full_index_name}' 생성 성공")
             return response.get('acknowledged', False)
-            
+
         except Exception as e:
             logger.error(f"인덱스 생성 실패: {e}")
             return False
-    
-    def index_document(
-        self, 
-        index_name: str, 
-        doc_id: str, 
+
+    async def create_vector_index(
+        self,
+        index_name: str,
+        dimension: int,
+        vector_field: str = 'embedding_vector'
+    ) -> bool:
+        """kNN 검색용 인덱스 생성 (HNSW, 코사인 유사도)"""
+        mapping = {
+            "properties": {
+                vector_field: {
+                    "type": "knn_vector",
+                    "dimension": dimension,
+                    "method": {"name": "hnsw", "space_type": "cosinesimil", "engine": "lucene"}
+                },
+                "content": {"type": "text"},
+                "title": {"type": "text"},
+                "description": {"type": "text"},
+                "indexed_at": {"type": "date"}
+            }
+        }
+        return await self.create_index(index_name, mapping=mapping, settings_dict={"index": {"knn": True}})
+
+    async def index_document(
+        self,
+        index_name: str,
+        doc_id: str,
         document: Dict,
         refresh: str = 'wait_for'
     ) -> bool:
-        """문서 인덱싱"""
+        """문서 인덱싱 (단건 - 대량 인덱싱은 bulk_index_documents 사용)"""
         try:
             if not self.client:
                 return False
-                
-            full_index_name = f"{settings.OPENSEARCH_INDEX_PREFIX}{index_name}"
-            
+
             # 타임스탬프 추가
             document['indexed_at'] = datetime.utcnow().isoformat()
-            
-            response = self.client.index(
-                index=full_index_name,
+
+            response = await self.client.index(
+                index=self._full_index_name(index_name),
                 id=doc_id,
                 body=document,
                 refresh=refresh
             )
-            
+
             logger.debug(f"문서 인덱싱 성공: {doc_id}")
             return response.get('result') in ['created', 'updated']
-            
+
         except Exception as e:
             logger.error(f"문서 인덱싱 실패 ({doc_id}): {e}")
             return False
-    
-    def search_documents(
+
+    # ===== Bulk 인덱싱 =====
+
+    def get_bulk_indexer(self) -> "BulkIndexer":
+        """공유 bulk 인덱서 (첫 사용 시 시작)"""
+        if self._bulk_indexer is None:
+            self._bulk_indexer = BulkIndexer(self.client)
+        return self._bulk_indexer
+
+    async def bulk_index_documents(
+        self,
+        index_name: str,
+        documents: List[Tuple[str, Dict]]
+    ) -> Dict[str, int]:
+        """
+        문서 목록을 bulk 요청으로 인덱싱하고 완료까지 대기
+
+        documents: (doc_id, 문서) 목록
+        Returns: {"indexed": 성공 수, "failed": 실패 수}
+        """
+        if not self.client or not documents:
+            return {"indexed": 0, "failed": 0}
+
+        indexer = self.get_bulk_indexer()
+        futures = [
+            await indexer.add(self._full_index_name(index_name), doc_id, document)
+            for doc_id, document in documents
+        ]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        indexed = sum(1 for result in results if result is True)
+        return {"indexed": indexed, "failed": len(results) - indexed}
+
+    async def index_document_chunks(
+        self,
+        index_name: str,
+        doc_id: str,
+        chunks: List[Dict[str, Any]],
+        vector_field: str = 'embedding_vector'
+    ) -> Dict[str, int]:
+        """
+        문서 청크를 임베딩과 함께 bulk 인덱싱
+
+        chunks: {"content": str, "metadata": dict} - 청크 ID는 {doc_id}_{순번}
+        """
+        from app.services.embedding_service import embedding_service
+
+        vectors = await embedding_service.embed([chunk["content"] for chunk in chunks])
+        documents = [
+            (
+                f"{doc_id}_{i}",
+                {
+                    "doc_id": doc_id,
+                    "chunk_index": i,
+                    "content": chunk["content"],
+                    "metadata": chunk.get("metadata", {}),
+                    vector_field: vector
+                }
+            )
+            for i, (chunk, vector) in enumerate(zip(chunks, vectors))
+        ]
+        return await self.bulk_index_documents(index_name, documents)
+
+    # ===== 검색 =====
+
+    async def search_documents(
         self,
         index_name: str,
         query: Dict,
@@ -178,30 +284,46 @@ class OpenSearchService:
         try:
             if not self.client:
                 return None
-                
-            full_index_name = f"{settings.OPENSEARCH_INDEX_PREFIX}{index_name}"
-            
+
             search_body = {
                 'query': query,
                 'size': size,
                 'from': from_
             }
-            
+
             if sort:
                 search_body['sort'] = sort
-            
-            response = self.client.search(
-                index=full_index_name,
+
+            return await self.client.search(
+                index=self._full_index_name(index_name),
                 body=search_body
             )
-            
-            return response
-            
+
         except Exception as e:
             logger.error(f"문서 검색 실패: {e}")
             return None
-    
-    def semantic_search(
+
+    async def knn_search(
+        self,
+        index_name: str,
+        query_vector: List[float],
+        vector_field: str = 'embedding_vector',
+        size: int = 10,
+        filter_query: Optional[Dict] = None
+    ) -> Optional[List[Dict]]:
+        """벡터 kNN 검색"""
+        knn_clause: Dict[str, Any] = {"vector": list(query_vector), "k": size}
+        if filter_query:
+            knn_clause["filter"] = filter_query
+
+        response = await self.search_documents(
+            index_name=index_name,
+            query={"knn": {vector_field: knn_clause}},
+            size=size
+        )
+        return self._hits(response)
+
+    async def semantic_search(
         self,
         index_name: str,
         query_text: str,
@@ -209,128 +331,501 @@ class OpenSearchService:
         size: int = 10,
         min_score: float = 0.5
     ) -> Optional[List[Dict]]:
-        """시맨틱 검색 (벡터 유사도 기반)"""
+        """시맨틱 검색 (질의 임베딩 → embedding_vector kNN)"""
         try:
             if not self.client:
                 return None
-            
-            # 여기에 임베딩 생성 로직이 필요함 (별도 서비스에서 처리)
-            # 현재는 기본 텍스트 검색으로 대체
-            query = {
-                "multi_match": {
-                    "query": query_text,
-                    "fields": ["content", "title", "description"],
-                    "type": "best_fields",
-                    "minimum_should_match": "75%"
-                }
-            }
-            
-            response = self.search_documents(
-                index_name=index_name,
-                query=query,
-                size=size
-            )
-            
-            if response and 'hits' in response:
-                results = []
-                for hit in response['hits']['hits']:
-                    if hit['_score'] >= min_score:
-                        result = {
-                            'id': hit['_id'],
-                            'score': hit['_score'],
-                            'source': hit['_source']
-                        }
-                        results.append(result)
-                
-                return results
-            
-            return []
-            
+
+            from app.services.embedding_service import embedding_service
+            query_vector = await embedding_service.embed_query(query_text)
+
+            results = await self.knn_search(index_name, query_vector, vector_field=vector_field, size=size)
+            if results is None:
+                return None
+            return [result for result in results if result['score'] >= min_score]
+
         except Exception as e:
             logger.error(f"시맨틱 검색 실패: {e}")
             return None
-    
-    def delete_document(self, index_name: str, doc_id: str) -> bool:
+
+    async def hybrid_search(
+        self,
+        index_name: str,
+        query_text: str,
+        vector_field: str = 'embedding_vector',
+        size: int = 10,
+        vector_weight: float = 0.5,
+        text_fields: Optional[List[str]] = None
+    ) -> Optional[List[Dict]]:
+        """
+        BM25 + 벡터 하이브리드 검색
+
+        두 검색을 동시에 실행하고 각 점수를 min-max 정규화한 뒤
+        vector_weight 비율로 합산합니다 (검색 파이프라인 설정 없이 모든 클러스터에서 동작).
+        """
+        try:
+            if not self.client:
+                return None
+
+            from app.services.embedding_service import embedding_service
+            query_vector = await embedding_service.embed_query(query_text)
+
+            # 융합 후 순위가 바뀔 수 있으므로 후보는 넉넉히 조회
+            candidates = size * 2
+            text_response, vector_results = await asyncio.gather(
+                self.search_documents(
+                    index_name=index_name,
+                    query={
+                        "multi_match": {
+                            "query": query_text,
+                            "fields": text_fields or ["content", "title", "description"],
+                            "type": "best_fields"
+                        }
+                    },
+                    size=candidates
+                ),
+                self.knn_search(index_name, query_vector, vector_field=vector_field, size=candidates)
+            )
+
+            return fuse_scores(self._hits(text_response) or [], vector_results or [], vector_weight)[:size]
+
+        except Exception as e:
+            logger.error(f"하이브리드 검색 실패: {e}")
+            return None
+
+    @staticmethod
+    def _hits(response: Optional[Dict]) -> Optional[List[Dict]]:
+        if response is None:
+            return None
+        return [
+            {'id': hit['_id'], 'score': hit['_score'], 'source': hit['_source']}
+            for hit in response.get('hits', {}).get('hits', [])
+        ]
+
+    # ===== 관리 =====
+
+    async def delete_document(self, index_name: str, doc_id: str) -> bool:
         """문서 삭제"""
         try:
             if not self.client:
                 return False
-                
-            full_index_name = f"{settings.OPENSEARCH_INDEX_PREFIX}{index_name}"
-            
-            response = self.client.delete(
-                index=full_index_name,
+
+            response = await self.client.delete(
+                index=self._full_index_name(index_name),
                 id=doc_id,
                 refresh='wait_for'
             )
-            
+
             logger.debug(f"문서 삭제 성공: {doc_id}")
             return response.get('result') == 'deleted'
-            
+
         except Exception as e:
             logger.error(f"문서 삭제 실패 ({doc_id}): {e}")
             return False
-    
-    def delete_index(self, index_name: str) -> bool:
+
+    async def delete_index(self, index_name: str) -> bool:
         """인덱스 삭제"""
         try:
             if not self.client:
                 return False
-                
-            full_index_name = f"{settings.OPENSEARCH_INDEX_PREFIX}{index_name}"
-            
-            if not self.client.indices.exists(index=full_index_name):
+
+            full_index_name = self._full_index_name(index_name)
+
+            if not await self.client.indices.exists(index=full_index_name):
                 logger.warning(f"인덱스 '{full_index_name}'이 존재하지 않습니다")
                 return True
-            
-            response = self.client.indices.delete(index=full_index_name)
-            
+
+            response = await self.client.indices.delete(index=full_index_name)
+
             logger.info(f"인덱스 '{full_index_name}' 삭제 성공")
             return response.get('acknowledged', False)
-            
+
         except Exception as e:
             logger.error(f"인덱스 삭제 실패: {e}")
             return False
-    
-    def get_document_count(self, index_name: str) -> int:
+
+    async def get_document_count(self, index_name: str) -> int:
         """인덱스의 문서 수 조회"""
         try:
             if not self.client:
                 return 0
-                
-            full_index_name = f"{settings.OPENSEARCH_INDEX_PREFIX}{index_name}"
-            
-            response = self.client.count(index=full_index_name)
+
+            response = await self.client.count(index=self._full_index_name(index_name))
             return response.get('count', 0)
-            
+
         except Exception as e:
             logger.error(f"문서 수 조회 실패: {e}")
             return 0
-    
-    def list_indices(self) -> List[str]:
+
+    async def list_indices(self) -> List[str]:
         """인덱스 목록 조회"""
         try:
             if not self.client:
                 return []
-                
-            response = self.client.cat.indices(format='json')
-            
+
+            response = await self.client.cat.indices(format='json')
+
             indices = []
             prefix = settings.OPENSEARCH_INDEX_PREFIX
-            
+
             for index_info in response:
                 index_name = index_info.get('index', '')
                 if index_name.startswith(prefix):
                     # 프리픽스 제거하여 원본 인덱스명 반환
                     clean_name = index_name[len(prefix):]
                     indices.append(clean_name)
-            
+
             return indices
-            
+
         except Exception as e:
             logger.error(f"인덱스 목록 조회 실패: {e}")
             return []
 
+    async def close(self) -> None:
+        """남은 bulk 요청 처리 후 연결 풀 종료"""
+        if self._bulk_indexer:
+            await self._bulk_indexer.close()
+            self._bulk_indexer = None
+        if self.client:
+            await self.client.close()
+
+
+class BulkIndexer:
+    """
+    대기열 기반 bulk 인덱서
+
+    add()는 대기열이 가득 차면 기다리므로 생산자가 클러스터 처리 속도를 넘지 못하고,
+    요청은 문서 수/바이트/대기 시간 기준으로 묶여 최대 concurrency개까지 동시에 전송됩니다.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_docs: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ):
+        self.client = client
+        self.max_docs = max_docs or settings.OPENSEARCH_BULK_MAX_DOCS
+        self.max_bytes = max_bytes or settings.OPENSEARCH_BULK_MAX_BYTES
+        self.flush_interval = (flush_interval_ms or settings.OPENSEARCH_BULK_FLUSH_MS) / 1000
+        self.queue_size = queue_size or settings.OPENSEARCH_BULK_QUEUE_SIZE
+        self.concurrency = concurrency or settings.OPENSEARCH_BULK_CONCURRENCY
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._requests: set = set()
+        self._pending: set = set()
+
+        self.stats = {"requests": 0, "indexed": 0, "failed": 0, "producer_waits": 0}
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._worker = asyncio.create_task(self._run())
+
+    async def add(self, full_index_name: str, doc_id: str, document: Dict) -> asyncio.Future:
+        """문서를 대기열에 추가하고 결과 Future 반환 (대기열이 가득 차면 여기서 대기)"""
+        self._ensure_worker()
+        document = {**document, 'indexed_at': datetime.utcnow().isoformat()}
+        future = asyncio.get_running_loop().create_future()
+
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+        if self._queue.full():
+            self.stats["producer_waits"] += 1
+        await self._queue.put((full_index_name, doc_id, document, future))
+        return future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            batch_bytes = _estimate_size(batch[0][2])
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.max_docs and batch_bytes < self.max_bytes:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                batch_bytes += _estimate_size(item[2])
+
+            # 동시 요청 수 제한 - 세마포어를 얻을 때까지 대기열 소비도 멈춤
+            await self._semaphore.acquire()
+            request = asyncio.create_task(self._send(batch))
+            self._requests.add(request)
+            request.add_done_callback(self._requests.discard)
+
+    async def _send(self, batch: List[Tuple[str, str, Dict, asyncio.Future]]) -> None:
+        try:
+            body: List[Dict] = []
+            for full_index_name, doc_id, document, _ in batch:
+                body.append({"index": {"_index": full_index_name, "_id": doc_id}})
+                body.append(document)
+
+            response = await self.client.bulk(body=body)
+            self.stats["requests"] += 1
+
+            for (_, doc_id, _, future), item in zip(batch, response.get("items", [])):
+                result = item.get("index", {})
+                ok = result.get("status", 500) < 300
+                self.stats["indexed" if ok else "failed"] += 1
+                if not ok:
+                    logger.warning(f"bulk 인덱싱 실패 ({doc_id}): {result.get('error')}")
+                if not future.done():
+                    future.set_result(ok)
+        except Exception as e:
+            logger.error(f"bulk 요청 실패 ({len(batch)}건): {e}")
+            self.stats["failed"] += len(batch)
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_result(False)
+            self._semaphore.release()
+
+    async def close(self) -> None:
+        """대기열과 진행 중인 요청을 모두 처리한 뒤 종료"""
+        if self._worker is None:
+            return
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+
+def _estimate_size(document: Dict) -> int:
+    """bulk 요청 크기 추정 (임베딩 벡터는 값당 약 10바이트)"""
+    size = 0
+    for value in document.values():
+        if isinstance(value, (list, tuple)):
+            size += len(value) * 10
+        else:
+            size += len(str(value))
+    return size
+
+
+def fuse_scores(
+    text_hits: List[Dict],
+    vector_hits: List[Dict],
+    vector_weight: float = 0.5
+) -> List[Dict]:
+    """BM25/벡터 점수를 각각 min-max 정규화 후 가중 합산"""
+    def normalize(hits: List[Dict]) -> Dict[str, float]:
+        if not hits:
+            return {}
+        scores = [hit['score'] for hit in hits]
+        low, high = min(scores), max(scores)
+        span = high - low
+        return {hit['id']: (hit['score'] - low) / span if span else 1.0 for hit in hits}
+
+    text_scores = normalize(text_hits)
+    vector_scores = normalize(vector_hits)
+    sources = {hit['id']: hit['source'] for hit in text_hits + vector_hits}
+
+    fused = [
+        {
+            'id': doc_id,
+            'score': (1 - vector_weight) * text_scores.get(doc_id, 0.0) + vector_weight * vector_scores.get(doc_id, 0.0),
+            'text_score': text_scores.get(doc_id, 0.0),
+            'vector_score': vector_scores.get(doc_id, 0.0),
+            'source': source
+        }
+        for doc_id, source in sources.items()
+    ]
+    fused.sort(key=lambda hit: hit['score'], reverse=True)
+    return fused
+
+
+class LocalOpenSearchClient:
+    """OpenSearchService가 사용하는 API의 프로세스 내 대체 구현
+
+    테스트와 클러스터가 없는 개발 환경용입니다. 지원 질의: match_all, match, term,
+    multi_match (BM25), knn (코사인, nmslib cosinesimil과 같은 1/(2-cos) 점수), bool(must/should/filter).
+    """
+
+    _TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self):
+        self._indices: Dict[str, Dict[str, Dict]] = {}
+        self.indices = _LocalIndicesClient(self)
+        self.cat = _LocalCatClient(self)
+
+    async def ping(self) -> bool:
+        return True
+
+    async def info(self) -> Dict:
+        return {"cluster_name": "local", "version": {"distribution": "local"}}
+
+    async def index(self, index: str, id: str, body: Dict, refresh: Any = None) -> Dict:
+        docs = self._indices.setdefault(index, {})
+        result = "updated" if id in docs else "created"
+        docs[id] = dict(body)
+        return {"_id": id, "result": result}
+
+    async def bulk(self, body: List[Dict]) -> Dict:
+        items = []
+        for action, document in zip(body[::2], body[1::2]):
+            meta = action["index"]
+            response = await self.index(meta["_index"], meta["_id"], document)
+            items.append({"index": {"_id": meta["_id"], "status": 201 if response["result"] == "created" else 200}})
+        return {"errors": False, "items": items}
+
+    async def delete(self, index: str, id: str, refresh: Any = None) -> Dict:
+        removed = self._indices.get(index, {}).pop(id, None)
+        return {"_id": id, "result": "deleted" if removed is not None else "not_found"}
+
+    async def count(self, index: str) -> Dict:
+        return {"count": len(self._indices.get(index, {}))}
+
+    async def search(self, index: str, body: Dict) -> Dict:
+        docs = self._indices.get(index, {})
+        scored = []
+        for doc_id, source in docs.items():
+            score = self._score(body.get("query", {"match_all": {}}), source, docs)
+            if score is not None:
+                scored.append((score, doc_id, source))
+        scored.sort(key=lambda item: item[0], reverse=True)
+
+        start = body.get("from", 0)
+        hits = [
+            {"_id": doc_id, "_score": score, "_source": source}
+            for score, doc_id, source in scored[start:start + body.get("size", 10)]
+        ]
+        return {"hits": {"total": {"value": len(scored)}, "hits": hits}}
+
+    async def close(self) -> None:
+        pass
+
+    # ===== 질의 평가 =====
+
+    def _tokens(self, text: Any) -> List[str]:
+        return self._TOKEN_PATTERN.findall(str(text or "").lower())
+
+    def _score(self, query: Dict, source: Dict, docs: Dict[str, Dict]) -> Optional[float]:
+        """문서 점수 (매치되지 않으면 None)"""
+        (kind, clause), = query.items()
+
+        if kind == "match_all":
+            return 1.0
+
+        if kind == "term":
+            (field, value), = clause.items()
+            value = value.get("value") if isinstance(value, dict) else value
+            return 1.0 if source.get(field) == value else None
+
+        if kind == "match":
+            (field, value), = clause.items()
+            value = value.get("query") if isinstance(value, dict) else value
+            return self._bm25(self._tokens(value), [field], source, docs)
+
+        if kind == "multi_match":
+            fields = [field.split("^")[0] for field in clause.get("fields", ["content"])]
+            return self._bm25(self._tokens(clause["query"]), fields, source, docs)
+
+        if kind == "knn":
+            (field, params), = clause.items()
+            vector = source.get(field)
+            if not vector:
+                return None
+            if params.get("filter") and self._score(params["filter"], source, docs) is None:
+                return None
+            return 1.0 / (2.0 - _cosine(params["vector"], vector))
+
+        if kind == "bool":
+            total = 0.0
+            for sub in _as_list(clause.get("must")):
+                score = self._score(sub, source, docs)
+                if score is None:
+                    return None
+                total += score
+            for sub in _as_list(clause.get("filter")):
+                if self._score(sub, source, docs) is None:
+                    return None
+            should = [self._score(sub, source, docs) for sub in _as_list(clause.get("should"))]
+            matched = [score for score in should if score is not None]
+            if should and not matched and not clause.get("must") and not clause.get("filter"):
+                return None
+            return total + sum(matched) if (matched or clause.get("must")) else 1.0
+
+        raise ValueError(f"로컬 OpenSearch에서 지원하지 않는 질의: {kind}")
+
+    def _bm25(self, terms: List[str], fields: List[str], source: Dict, docs: Dict[str, Dict]) -> Optional[float]:
+        """필드별 BM25 중 최댓값 (best_fields)"""
+        k1, b = 1.2, 0.75
+        best = None
+        for field in fields:
+            doc_tokens = self._tokens(source.get(field))
+            if not doc_tokens:
+                continue
+            field_lengths = [len(self._tokens(doc.get(field))) for doc in docs.values()]
+            avg_length = sum(field_lengths) / len(field_lengths) or 1
+            tf = Counter(doc_tokens)
+
+            score = 0.0
+            for term in set(terms):
+                if term not in tf:
+                    continue
+                df = sum(1 for doc in docs.values() if term in self._tokens(doc.get(field)))
+                idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+                score += idf * tf[term] * (k1 + 1) / (tf[term] + k1 * (1 - b + b * len(doc_tokens) / avg_length))
+
+            if score > 0 and (best is None or score > best):
+                best = score
+        return best
+
+
+class _LocalIndicesClient:
+    def __init__(self, owner: LocalOpenSearchClient):
+        self._owner = owner
+
+    async def exists(self, index: str) -> bool:
+        return index in self._owner._indices
+
+    async def create(self, index: str, body: Optional[Dict] = None) -> Dict:
+        self._owner._indices.setdefault(index, {})
+        return {"acknowledged": True, "index": index}
+
+    async def delete(self, index: str) -> Dict:
+        self._owner._indices.pop(index, None)
+        return {"acknowledged": True}
+
+
+class _LocalCatClient:
+    def __init__(self, owner: LocalOpenSearchClient):
+        self._owner = owner
+
+    async def indices(self, format: str = "json") -> List[Dict]:
+        return [{"index": name, "docs.count": str(len(docs))} for name, docs in self._owner._indices.items()]
+
+
+def _as_list(value: Any) -> List:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
 
 # 서비스 인스턴스
-opensearch_service = OpenSearchService()
\ No newline at end of file
+opensearch_service = OpenSearchService()
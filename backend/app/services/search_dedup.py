@@ -0,0 +1,262 @@
+"""
+검색 결과 중복 제거
+- URL 정규화: 추적 파라미터 제거, 스킴/호스트 통일, 모바일/AMP 변형을 원본 URL로 변환
+- 근사 중복: 제목+스니펫 문자 3-gram MinHash (LSH 밴드 색인)로 전재/복사 기사 묶기
+- 각 묶음(클러스터)에서는 가장 좋은 결과 하나만 유지
+"""
+
+import re
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+
+from app.core.config import settings
+
+# 추적/세션 파라미터 (정확히 일치하거나 접두사로 시작하면 제거)
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref", "ref_src", "ref_url", "referrer", "spm",
+    "_hsenc", "_hsmi", "_ga", "_gl", "vero_id", "oly_anon_id", "oly_enc_id", "rb_clickid", "s_cid",
+    "amp", "outputtype", "usqp",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "itm_", "ga_")
+
+# 같은 사이트의 모바일/AMP 호스트 접두사
+_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Google AMP 뷰어 / AMP 캐시 URL (원본 호스트와 경로가 URL 안에 들어 있음)
+_GOOGLE_AMP = re.compile(r"^/amp/(?:s/)?(?P<target>.+)$")
+_AMP_CACHE_HOST = ".cdn.ampproject.org"
+_AMP_CACHE_PATH = re.compile(r"^/(?:[a-z]/)*?(?:s/)?(?P<target>[^/]+\..+)$")
+_AMP_PATH_SUFFIX = re.compile(r"/amp/?$|\.amp(?=\.html?$)|\.amp$", re.IGNORECASE)
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def canonicalize_url(url: str) -> str:
+    """중복 비교용 정규 URL (원본 URL을 대체하지 않음)"""
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        return url
+    host = (parts.hostname or "").lower()
+    path = parts.path or "/"
+    query = parts.query
+
+    # AMP 캐시/뷰어 URL은 안에 들어 있는 원본 URL로 변환
+    if host.endswith(_AMP_CACHE_HOST) or (host in ("google.com", "www.google.com") and path.startswith("/amp/")):
+        pattern = _GOOGLE_AMP if "google.com" in host else _AMP_CACHE_PATH
+        match = pattern.match(unquote(path))
+        if match:
+            target = match.group("target")
+            if not target.startswith(("http://", "https://")):
+                target = "https://" + target
+            return canonicalize_url(target + (f"?{query}" if query else ""))
+
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") >= 2:
+            host = host[len(prefix):]
+            break
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = _AMP_PATH_SUFFIX.sub("", path) or "/"
+    path = re.sub(r"/{2,}", "/", path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    params = [
+        (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    ]
+    params.sort()
+
+    # http/https는 같은 문서로 간주
+    return urlunsplit(("https", host, path, urlencode(params), ""))
+
+
+def _is_variant(url: str) -> bool:
+    """추적 파라미터가 붙었거나 AMP/모바일 변형인 URL인지"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return False
+    host = (parts.hostname or "").lower()
+    if host.endswith(_AMP_CACHE_HOST) or host.startswith(("m.", "mobile.", "amp.")) or _AMP_PATH_SUFFIX.search(parts.path):
+        return True
+    return any(
+        key.lower() in TRACKING_PARAMS or key.lower().startswith(TRACKING_PREFIXES)
+        for key, _ in parse_qsl(parts.query, keep_blank_values=True)
+    )
+
+
+def _shingles(text: str) -> Tuple[set, int]:
+    """문자 3-gram 집합과 단어 수 (한국어 조사/띄어쓰기 차이에도 겹치도록 문자 단위 사용)"""
+    words = _WORD.findall(text.lower())
+    compact = " ".join(words)
+    return {compact[i:i + 3] for i in range(len(compact) - 2)}, len(words)
+
+
+# MinHash 순열 (a * x + b) mod p - 32비트 해시라 uint64 곱셈이 넘치지 않음, 고정 시드로 서명 재현
+_PRIME = np.uint64(4294967311)
+_NUM_PERM = 64
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, 2 ** 32, size=(_NUM_PERM, 1), dtype=np.uint64)
+_PERM_B = _rng.randint(0, 2 ** 32, size=(_NUM_PERM, 1), dtype=np.uint64)
+
+
+def minhash(text: str) -> Tuple[Tuple[int, ...], int]:
+    """(MinHash 서명, 단어 수)"""
+    shingles, word_count = _shingles(text)
+    if not shingles:
+        return (), word_count
+    hashed = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+    signature = ((_PERM_A * hashed % _PRIME + _PERM_B) % _PRIME).min(axis=1)
+    return tuple(int(value) for value in signature), word_count
+
+
+def estimate_jaccard(a: Tuple[int, ...], b: Tuple[int, ...]) -> float:
+    if not a or not b:
+        return 0.0
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+@dataclass
+class ResultCluster:
+    """중복 결과 묶음 (best가 대표 결과)"""
+    best: Dict[str, Any]
+    quality: Tuple[float, ...]
+    canonical_urls: List[str]
+    signatures: List[Tuple[int, ...]] = field(default_factory=list)
+    duplicate_urls: List[str] = field(default_factory=list)
+
+
+class ResultDeduplicator:
+    """
+    결과를 하나씩 추가하며 중복을 묶는 증분 중복 제거기
+
+    정규화 URL이 같으면 바로 같은 클러스터로 묶고, 다르면 MinHash 서명을 4개씩 16개 밴드로
+    나눈 LSH 색인에서 후보 클러스터를 찾아 추정 Jaccard 유사도로 확인합니다.
+    """
+
+    _BANDS = 16
+    _ROWS = _NUM_PERM // _BANDS
+
+    def __init__(self, similarity_threshold: Optional[float] = None, min_words: Optional[int] = None):
+        self.similarity_threshold = (
+            settings.SEARCH_DEDUP_SIMILARITY_THRESHOLD if similarity_threshold is None else similarity_threshold
+        )
+        self.min_words = settings.SEARCH_DEDUP_MIN_WORDS if min_words is None else min_words
+        self.clusters: List[ResultCluster] = []
+        self._by_url: Dict[str, int] = {}
+        self._bands: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+        self.stats = {"added": 0, "url_duplicates": 0, "near_duplicates": 0}
+
+    def add(self, result: Dict[str, Any]) -> Tuple[int, bool]:
+        """
+        결과 추가
+
+        Returns:
+            (클러스터 번호, 새 클러스터 여부)
+        """
+        self.stats["added"] += 1
+        url = result.get("url", "")
+        canonical = canonicalize_url(url)
+        result["canonical_url"] = canonical
+        quality = self._quality(result, url)
+
+        index = self._by_url.get(canonical)
+        if index is not None:
+            self.stats["url_duplicates"] += 1
+            self._merge(index, result, quality, canonical)
+            return index, False
+
+        signature, word_count = minhash(f"{result.get('title', '')} {result.get('snippet', '')}")
+        # 너무 짧은 텍스트는 우연히 겹치기 쉬워 URL 기준으로만 비교
+        if word_count < self.min_words:
+            signature = ()
+
+        index = self._find_near_duplicate(signature)
+        created = index is None
+        if not created:
+            self.stats["near_duplicates"] += 1
+            self._merge(index, result, quality, canonical)
+            self._by_url[canonical] = index
+        else:
+            index = len(self.clusters)
+            self.clusters.append(ResultCluster(best=result, quality=quality, canonical_urls=[canonical]))
+            self._by_url[canonical] = index
+
+        if signature:
+            self.clusters[index].signatures.append(signature)
+            for band in self._band_keys(signature):
+                self._bands.setdefault(band, []).append(index)
+        return index, created
+
+    def results(self) -> List[Dict[str, Any]]:
+        """클러스터별 대표 결과 (처음 발견된 순서)"""
+        return [cluster.best for cluster in self.clusters]
+
+    def _merge(self, index: int, result: Dict[str, Any], quality: Tuple[float, ...], canonical: str) -> None:
+        """더 좋은 결과를 대표로 두고 점수는 최댓값 유지 (여러 검색어에서 발견된 결과 가산)"""
+        cluster = self.clusters[index]
+        previous = cluster.best
+        if quality > cluster.quality:
+            cluster.best, cluster.quality = result, quality
+            cluster.duplicate_urls.append(previous.get("url", ""))
+        else:
+            cluster.duplicate_urls.append(result.get("url", ""))
+        if canonical not in cluster.canonical_urls:
+            cluster.canonical_urls.append(canonical)
+
+        best = cluster.best
+        for key in ("score", "relevance_score"):
+            values = [v for v in (previous.get(key), result.get(key)) if v is not None]
+            if values:
+                best[key] = max(values)
+        best["duplicate_urls"] = list(cluster.duplicate_urls)
+
+    def _find_near_duplicate(self, signature: Tuple[int, ...]) -> Optional[int]:
+        if not signature:
+            return None
+        candidates = set()
+        for band in self._band_keys(signature):
+            candidates.update(self._bands.get(band, ()))
+
+        best_index, best_similarity = None, self.similarity_threshold
+        for index in sorted(candidates):
+            similarity = max(estimate_jaccard(signature, other) for other in self.clusters[index].signatures)
+            if similarity >= best_similarity:
+                best_index, best_similarity = index, similarity
+        return best_index
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, Tuple[int, ...]]]:
+        return [
+            (band, signature[band * self._ROWS:(band + 1) * self._ROWS])
+            for band in range(self._BANDS)
+        ]
+
+    @staticmethod
+    def _quality(result: Dict[str, Any], url: str) -> Tuple[float, ...]:
+        """대표 선택 기준: 점수 → 관련성 → 정규형 URL(추적 파라미터/AMP 없음) → 스니펫 길이"""
+        clean = 0.0 if _is_variant(url) else 1.0
+        return (
+            float(result.get("score") or 0.0),
+            float(result.get("relevance_score") or 0.0),
+            clean,
+            float(len(result.get("snippet") or "")),
+        )
@@ -0,0 +1,255 @@
+"""
+검색 팬아웃 실행기
+- 전체 마감 시간(deadline) 안에서 여러 검색 제공자/사이트 질의를 동시에 실행
+- 제공자별 지연 시간 히스토그램의 p95가 지나도 끝나지 않은 요청은 한 번 중복 요청(hedge)
+- 점수가 충분히 높은 결과가 모이면 조기 반환하고 남은 요청은 취소
+"""
+
+import asyncio
+import contextvars
+import logging
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 중첩된 팬아웃(균형 검색 안의 일반 검색 등)이 바깥 마감 시간을 넘지 않도록 공유
+_current_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "search_fanout_deadline", default=None
+)
+_NESTED_DEADLINE_MARGIN = 0.05
+
+
+class LatencyHistogram:
+    """최근 N개 응답 시간 기반 지연 시간 분포 (초 단위)"""
+
+    def __init__(self, window: int = 500):
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "samples": self.count,
+            "p50_ms": self._ms(self.percentile(0.50)),
+            "p95_ms": self._ms(self.percentile(0.95)),
+            "p99_ms": self._ms(self.percentile(0.99)),
+        }
+
+    @staticmethod
+    def _ms(seconds: Optional[float]) -> Optional[float]:
+        return round(seconds * 1000, 1) if seconds is not None else None
+
+
+@dataclass
+class FanOutCall:
+    """팬아웃 대상 호출 하나 (factory는 호출할 때마다 새 코루틴 생성)"""
+    name: str
+    provider: str
+    factory: Callable[[], Awaitable[List[Any]]]
+    hedge: bool = True
+
+
+@dataclass
+class FanOutOutcome:
+    """팬아웃 결과 (results는 호출 순서대로, 끝나지 않은 호출은 빈 리스트)"""
+    results: Dict[str, List[Any]]
+    completed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    cancelled: List[str] = field(default_factory=list)
+    early_return: bool = False
+    timed_out: bool = False
+
+    def ordered(self) -> List[Any]:
+        merged: List[Any] = []
+        for items in self.results.values():
+            merged.extend(items)
+        return merged
+
+    def count_at_least(self, min_score: float) -> int:
+        return sum(
+            1 for items in self.results.values() for item in items
+            if getattr(item, "score", 0.0) >= min_score
+        )
+
+
+class SearchFanOut:
+    """마감 시간, hedge 요청, 조기 반환을 지원하는 검색 팬아웃 실행기"""
+
+    def __init__(
+        self,
+        deadline_seconds: Optional[float] = None,
+        hedge_enabled: Optional[bool] = None,
+        hedge_default_delay_ms: Optional[int] = None,
+        hedge_min_delay_ms: Optional[int] = None,
+        hedge_min_samples: Optional[int] = None
+    ):
+        self.deadline_seconds = deadline_seconds or settings.SEARCH_FANOUT_DEADLINE_SECONDS
+        self.hedge_enabled = settings.SEARCH_HEDGE_ENABLED if hedge_enabled is None else hedge_enabled
+        self.hedge_default_delay = (hedge_default_delay_ms or settings.SEARCH_HEDGE_DEFAULT_DELAY_MS) / 1000
+        self.hedge_min_delay = (
+            settings.SEARCH_HEDGE_MIN_DELAY_MS if hedge_min_delay_ms is None else hedge_min_delay_ms
+        ) / 1000
+        self.hedge_min_samples = (
+            settings.SEARCH_HEDGE_MIN_SAMPLES if hedge_min_samples is None else hedge_min_samples
+        )
+
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    # ===== 공개 API =====
+
+    async def run(
+        self,
+        calls: List[FanOutCall],
+        timeout: Optional[float] = None,
+        min_results: Optional[int] = None,
+        min_score: float = 0.0
+    ) -> FanOutOutcome:
+        """
+        호출들을 동시에 실행하고 마감 시간 또는 조기 반환 조건까지 기다림
+
+        Args:
+            calls: 실행할 호출 목록 (결과 병합 순서)
+            timeout: 이번 팬아웃 마감 시간 (바깥 팬아웃의 남은 시간을 넘지 않음)
+            min_results: min_score 이상 결과가 이만큼 모이면 나머지를 취소하고 반환
+            min_score: 조기 반환 판정 점수
+        """
+        outcome = FanOutOutcome(results={call.name: [] for call in calls})
+        if not calls:
+            return outcome
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (timeout or self.deadline_seconds)
+        outer_deadline = _current_deadline.get()
+        if outer_deadline is not None:
+            # 바깥 팬아웃이 취소하기 전에 부분 결과를 돌려줄 수 있도록 약간 먼저 마감
+            deadline = min(deadline, outer_deadline - _NESTED_DEADLINE_MARGIN)
+
+        token = _current_deadline.set(deadline)
+        try:
+            tasks = {asyncio.create_task(self._run_call(call, deadline)): call for call in calls}
+        finally:
+            _current_deadline.reset(token)
+
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    outcome.timed_out = True
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    call = tasks[task]
+                    if task.exception() is not None:
+                        outcome.failed.append(call.name)
+                        logger.warning(f"검색 팬아웃 호출 실패 [{call.name}]: {task.exception()}")
+                        continue
+                    outcome.results[call.name] = task.result() or []
+                    outcome.completed.append(call.name)
+
+                if pending and min_results and outcome.count_at_least(min_score) >= min_results:
+                    outcome.early_return = True
+                    break
+        finally:
+            # 늦은 결과는 버리고 요청을 정리 (취소가 끝날 때까지 기다려 연결을 깨끗이 반환)
+            for task in pending:
+                task.cancel()
+                outcome.cancelled.append(tasks[task].name)
+                self._stat(tasks[task].provider, "early_cancelled" if outcome.early_return else "deadline_cancelled")
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if outcome.cancelled:
+            reason = "조기 반환" if outcome.early_return else "마감 시간 초과"
+            logger.info(f"⏱️ 검색 팬아웃 {reason} - 취소: {', '.join(outcome.cancelled)}")
+        return outcome
+
+    def hedge_delay(self, provider: str) -> float:
+        """hedge 요청 지연 시간 (표본이 충분하면 제공자 p95, 아니면 기본값)"""
+        histogram = self.histograms.get(provider)
+        if histogram is None or histogram.count < self.hedge_min_samples:
+            return self.hedge_default_delay
+        return max(self.hedge_min_delay, histogram.percentile(0.95))
+
+    def get_stats(self) -> Dict[str, Any]:
+        providers = {}
+        for provider in sorted(set(self.histograms) | set(self.stats)):
+            histogram = self.histograms.get(provider)
+            providers[provider] = {
+                **self.stats.get(provider, {}),
+                "latency": histogram.snapshot() if histogram else None,
+                "hedge_delay_ms": round(self.hedge_delay(provider) * 1000, 1),
+            }
+        return {
+            "deadline_seconds": self.deadline_seconds,
+            "hedge_enabled": self.hedge_enabled,
+            "providers": providers,
+        }
+
+    # ===== 내부 =====
+
+    async def _run_call(self, call: FanOutCall, deadline: float) -> List[Any]:
+        """호출 하나 실행 - p95가 지나도 끝나지 않으면 한 번 중복 요청하고 먼저 끝난 쪽 사용"""
+        loop = asyncio.get_running_loop()
+        self._stat(call.provider, "calls")
+        primary = asyncio.create_task(self._timed(call))
+        attempts = {primary}
+
+        try:
+            delay = self.hedge_delay(call.provider)
+            if not (self.hedge_enabled and call.hedge) or loop.time() + delay >= deadline:
+                return await primary
+
+            done, _ = await asyncio.wait(attempts, timeout=delay)
+            if not done:
+                self._stat(call.provider, "hedges")
+                hedge = asyncio.create_task(self._timed(call))
+                attempts.add(hedge)
+
+            error: Optional[BaseException] = None
+            while attempts:
+                done, attempts = await asyncio.wait(attempts, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self._stat(call.provider, "hedge_wins")
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in attempts:
+                task.cancel()
+            if attempts:
+                await asyncio.gather(*attempts, return_exceptions=True)
+
+    async def _timed(self, call: FanOutCall) -> List[Any]:
+        """완료된 요청의 지연 시간만 기록 (취소된 요청은 기록하지 않음)"""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        result = await call.factory()
+        histogram = self.histograms.get(call.provider)
+        if histogram is None:
+            histogram = self.histograms[call.provider] = LatencyHistogram()
+        histogram.record(loop.time() - started)
+        return result
+
+    def _stat(self, provider: str, key: str) -> None:
+        counters = self.stats.setdefault(provider, {})
+        counters[key] = counters.get(key, 0) + 1
@@ -7,7 +7,7 @@ import hashlib
 import json
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, Optional, Any, Set, Tuple, Union
 from urllib.parse import quote_plus
 from dataclasses import dataclass, field
 from enum import Enum
@@ -18,6 +18,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.repositories.cache import CacheRepository
 from app.services.cache_manager import cache_manager
+from app.services.search_fanout import FanOutCall, SearchFanOut
+from app.services.site_recommendation_store import site_recommendation_store
 from app.agents.llm_router import llm_router
 
 
@@ -268,6 +270,52 @@ class QueryAnalyzer:
             params.lr = None  # 언어 제한 해제
 
 
+class KeywordCategoryMatcher:
+    """
+    카테고리 키워드를 하나의 정규식으로 미리 컴파일한 매처 (대소문자 무시)
+
+    전방 탐색으로 모든 위치에서 가장 긴 키워드를 찾고 같은 위치의 더 짧은 키워드도 함께 인정하므로,
+    키워드별로 `kw in query`를 반복한 것과 같은 키워드 집합을 한 번의 탐색으로 얻습니다.
+    """
+
+    def __init__(self, category_keywords: Dict[str, List[str]]):
+        self.categories = list(category_keywords)
+        self._keyword_categories: Dict[str, List[str]] = {}
+        for category, keywords in category_keywords.items():
+            for keyword in keywords:
+                self._keyword_categories.setdefault(keyword.lower(), []).append(category)
+
+        keywords = sorted(self._keyword_categories, key=len, reverse=True)
+        self._pattern = re.compile(
+            "(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))", re.IGNORECASE
+        ) if keywords else None
+        self._prefixes = {
+            keyword: [other for other in keywords if other != keyword and keyword.startswith(other)]
+            for keyword in keywords
+        }
+
+    def match(self, query: str) -> Dict[str, Set[str]]:
+        """카테고리별 매칭된 키워드 집합 (카테고리 정의 순서 유지)"""
+        if self._pattern is None:
+            return {}
+        query_lower = query.lower()
+        found: Set[str] = set()
+        for match in self._pattern.finditer(query_lower):
+            longest = match.group(1).lower()
+            found.add(longest)
+            start = match.start()
+            found.update(
+                keyword for keyword in self._prefixes.get(longest, ())
+                if query_lower.startswith(keyword, start)
+            )
+
+        matched: Dict[str, Set[str]] = {}
+        for keyword in found:
+            for category in self._keyword_categories.get(keyword, ()):
+                matched.setdefault(category, set()).add(keyword)
+        return {category: matched[category] for category in self.categories if category in matched}
+
+
 @dataclass
 class CandidateSite:
     """메타 검색 후보 사이트"""
@@ -365,18 +413,15 @@ class BalancedSearchStrategy:
             "trade": ["수출", "수입", "무역", "관세", "FTA", "원산지", "해외진출", "국제", "통관", "수출입"],
             "business": ["회사", "기업", "채용", "취업", "비즈니스", "스타트업", "면접", "연봉", "이력서", "구인"]
         }
+        self.category_matcher = KeywordCategoryMatcher(self.category_keywords)
     
     def detect_category_with_confidence(self, query: str) -> Tuple[Optional[str], float]:
         """카테고리 감지 (보수적 접근)"""
-        category_scores = {}
-        query_lower = query.lower()
-        
-        for category, keywords in self.category_keywords.items():
-            # 키워드 매칭 점수 계산
-            matches = sum(1 for kw in keywords if kw in query_lower)
-            if matches > 0:
-                # 매칭된 키워드 수 / 전체 키워드 수의 비율로 점수 계산
-                category_scores[category] = min(matches / 3, 1.0)  # 최대 1.0으로 제한
+        # 매칭된 키워드 수 기반 점수 (최대 1.0으로 제한)
+        category_scores = {
+            category: min(len(keywords) / 3, 1.0)
+            for category, keywords in self.category_matcher.match(query).items()
+        }
         
         # 최고 점수 카테고리 반환 (임계값 이상일 때만)
         if category_scores and max(category_scores.values()) >= self.confidence_threshold:
@@ -442,39 +487,23 @@ class BalancedSearchStrategy:
     ) -> List[SearchResult]:
         """균형잡힌 검색 실행"""
         
-        # 1. 병렬 검색 실행
-        general_task = asyncio.create_task(
-            self.search_service._execute_general_search(
-                query, self.max_general_results, session
-            )
-        )
-        
-        category_task = asyncio.create_task(
-            self._execute_category_search(
-                query, category, self.max_category_results, session
-            )
-        )
-        
-        try:
-            general_results, category_results = await asyncio.gather(
-                general_task, category_task, return_exceptions=True
-            )
-            
-            # 예외 처리
-            if isinstance(general_results, Exception):
-                print(f"일반 검색 실패: {general_results}")
-                general_results = []
-            if isinstance(category_results, Exception):
-                print(f"카테고리 검색 실패: {category_results}")
-                category_results = []
-                
-        except Exception as e:
-            print(f"병렬 검색 실행 중 오류: {e}")
-            # Fallback: 일반 검색만 실행
-            general_results = await self.search_service._execute_general_search(
-                query, max_results, session
-            )
-            category_results = []
+        # 1. 병렬 검색 실행 (일반 검색은 내부에서 제공자별 hedge를 하므로 카테고리 검색만 hedge)
+        outcome = await self.search_service.fanout.run([
+            FanOutCall(
+                "general", "general_search",
+                lambda: self.search_service._execute_general_search(query, self.max_general_results, session),
+                hedge=False
+            ),
+            FanOutCall(
+                "category", "google_category",
+                lambda: self._execute_category_search(query, category, self.max_category_results, session)
+            ),
+        ])
+        general_results = outcome.results["general"]
+        category_results = outcome.results["category"]
+        
+        if outcome.failed or outcome.cancelled:
+            print(f"⚠️ 균형 검색 일부 누락 - 실패: {outcome.failed}, 시간 초과: {outcome.cancelled}")
         
         # 2. 결과 통합 및 균형 조정
         balanced_results = self._merge_and_balance(
@@ -595,6 +624,15 @@ class MetaSearchStrategy:
                 CandidateSite("news.naver.com", "한국 뉴스", 0.8, "site_operator")
             ]
         }
+        
+        # 카테고리별 기본 사이트 선택 키워드
+        self.default_site_matcher = KeywordCategoryMatcher({
+            "programming": ["python", "javascript", "react", "코딩", "프로그래밍", "개발", "api"],
+            "business": ["비즈니스", "경영", "마케팅", "전략", "business", "startup", "회사"],
+            "research": ["논문", "연구", "학술", "research", "study", "academic"],
+            "news": ["뉴스", "소식", "현재", "최근", "news", "latest"]
+        })
+        self.site_store = site_recommendation_store  # 주제별 LLM 사이트 추천 저장소
     
     async def execute_meta_search(
         self, 
@@ -610,14 +648,14 @@ class MetaSearchStrategy:
         candidate_sites = await self._discover_relevant_sites(query)
         print(f"🔍 후보 사이트 발견: {len(candidate_sites)}개")
         
-        # 2단계: 각 사이트에서 검색 실행
-        meta_results = await self._search_within_sites(query, candidate_sites, session)
-        print(f"🎯 메타 검색 결과: {len(meta_results)}개")
-        
-        # 3단계: 일반 검색 결과도 가져오기
-        general_results = await self.search_service._execute_general_search(
-            query, self.max_general_results, session
+        # 2~3단계: 사이트별 검색과 일반 검색을 동시에 실행 (각각 팬아웃 마감 시간 적용)
+        meta_results, general_results = await asyncio.gather(
+            self._search_within_sites(query, candidate_sites, session),
+            self.search_service._execute_general_search(
+                query, self.max_general_results, session
+            )
         )
+        print(f"🎯 메타 검색 결과: {len(meta_results)}개")
         print(f"📊 일반 검색 결과: {len(general_results)}개")
         
         # 4단계: 결과 통합 및 순위화
@@ -630,9 +668,12 @@ class MetaSearchStrategy:
         """검색어에 적합한 사이트 발견"""
         all_candidates = []
         
-        # 방법 1: LLM 기반 사이트 추천
+        # 방법 1: LLM 기반 사이트 추천 (주제별 저장소에 있으면 LLM 호출 없이 재사용)
         try:
-            llm_recommendations = await self._get_llm_site_recommendations(query)
+            stored_sites = await self.site_store.get_or_discover(
+                query, lambda: self._get_llm_site_recommendations(query)
+            )
+            llm_recommendations = [CandidateSite(**site) for site in stored_sites]
             all_candidates.extend(llm_recommendations)
             print(f"💡 LLM 추천 사이트: {len(llm_recommendations)}개")
         except Exception as e:
@@ -677,7 +718,12 @@ JSON 형태로만 응답해주세요:
 """
         
         try:
-            response, _ = await llm_router.generate_response("gemini", prompt)
+            response, _ = await llm_router.generate_response(
+                model_name="gemini",
+                prompt=prompt,
+                cache="meta_search_site_recommendations",
+                cache_ttl_seconds=86400
+            )
             return self._parse_llm_recommendations(response)
         except Exception as e:
             print(f"LLM 사이트 추천 오류: {e}")
@@ -718,29 +764,9 @@ JSON 형태로만 응답해주세요:
     
     def _get_category_default_sites(self, query: str) -> List[CandidateSite]:
         """카테고리 기반 기본 사이트 선택"""
-        query_lower = query.lower()
         selected_sites = []
-        
-        # 프로그래밍 관련
-        programming_keywords = ["python", "javascript", "react", "코딩", "프로그래밍", "개발", "api"]
-        if any(keyword in query_lower for keyword in programming_keywords):
-            selected_sites.extend(self.category_default_sites.get("programming", []))
-        
-        # 비즈니스 관련
-        business_keywords = ["비즈니스", "경영", "마케팅", "전략", "business", "startup", "회사"]
-        if any(keyword in query_lower for keyword in business_keywords):
-            selected_sites.extend(self.category_default_sites.get("business", []))
-        
-        # 연구 관련
-        research_keywords = ["논문", "연구", "학술", "research", "study", "academic"]
-        if any(keyword in query_lower for keyword in research_keywords):
-            selected_sites.extend(self.category_default_sites.get("research", []))
-        
-        # 뉴스 관련
-        news_keywords = ["뉴스", "소식", "현재", "최근", "news", "latest"]
-        if any(keyword in query_lower for keyword in news_keywords):
-            selected_sites.extend(self.category_default_sites.get("news", []))
-        
+        for category in self.default_site_matcher.match(query):
+            selected_sites.extend(self.category_default_sites.get(category, []))
         return selected_sites
     
     def _deduplicate_sites(self, sites: List[CandidateSite]) -> List[CandidateSite]:
@@ -763,28 +789,36 @@ JSON 형태로만 응답해주세요:
     ) -> List[SearchResult]:
         """각 사이트에서 검색 실행"""
         
-        search_tasks = []
+        calls = []
         for site in sites[:5]:  # 최대 5개 사이트
-            if site.search_method == "site_operator":
-                task = self._search_via_site_operator(query, site, session)
-            elif site.search_method == "crawling":
-                task = self._search_via_crawling(query, site, session)
+            if site.search_method == "crawling":
+                search = self._search_via_crawling
             else:
-                task = self._search_via_site_operator(query, site, session)  # 기본값
+                search = self._search_via_site_operator  # site_operator 및 기본값
             
-            search_tasks.append(task)
-        
-        # 병렬 실행
-        results = await asyncio.gather(*search_tasks, return_exceptions=True)
+            calls.append(FanOutCall(
+                site.domain, "google_site",
+                lambda search=search, site=site: search(query, site, session)
+            ))
+        
+        # 병렬 실행 - 신뢰도 높은 결과가 충분히 모이면 나머지 사이트는 취소
+        outcome = await self.search_service.fanout.run(
+            calls,
+            min_results=self.max_meta_results,
+            min_score=settings.SEARCH_EARLY_RETURN_MIN_SCORE
+        )
         
-        # 성공한 결과만 수집
+        # 성공한 결과만 사이트 순서대로 수집
         all_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                print(f"❌ 사이트 검색 실패 [{sites[i].domain}]: {result}")
-            elif isinstance(result, list):
+        for call in calls:
+            if call.name in outcome.failed:
+                print(f"❌ 사이트 검색 실패 [{call.name}]")
+            elif call.name in outcome.cancelled:
+                print(f"⏱️ 사이트 검색 취소 [{call.name}]")
+            else:
+                result = outcome.results[call.name]
                 all_results.extend(result)
-                print(f"✅ 사이트 검색 성공 [{sites[i].domain}]: {len(result)}개 결과")
+                print(f"✅ 사이트 검색 성공 [{call.name}]: {len(result)}개 결과")
         
         return all_results
     
@@ -895,9 +929,11 @@ class SearchService:
             }
         )
         self.cache_ttl = 3600  # 1시간 캐시
+        self.stale_cache_ttl = 300  # 만료 후 5분간은 이전 결과를 반환하며 백그라운드 갱신
         self.query_analyzer = QueryAnalyzer()  # 쿼리 분석기 추가
         self.balanced_strategy = BalancedSearchStrategy(self)  # 균형 검색 전략 추가
         self.meta_strategy = MetaSearchStrategy(self)  # 메타 검색 전략 추가
+        self.fanout = SearchFanOut()  # 마감 시간/hedge 기반 제공자 팬아웃
     
     def _generate_cache_key(self, query: str, **kwargs) -> str:
         """캐시 키 생성"""
@@ -1193,32 +1229,28 @@ class SearchService:
         **kwargs
     ) -> List[SearchResult]:
         """일반 검색 실행 (균형 검색용)"""
-        results = []
-        
-        try:
-            # 1. Google Custom Search를 메인 검색 엔진으로 사용
-            if settings.GOOGLE_API_KEY and settings.GOOGLE_CSE_ID:
-                try:
-                    google_results = await self.search_google(
-                        query, max_results, SearchType.WEB, session=session, **kwargs
-                    )
-                    results.extend(google_results)
-                except Exception as google_error:
-                    print(f"❌ 일반 Google 검색 실패: {google_error}")
-            
-            # 2. DuckDuckGo로 추가 결과 보완
-            if len(results) < max_results:
-                remaining = max_results - len(results)
-                try:
-                    duckduckgo_results = await self.search_duckduckgo(query, remaining, **kwargs)
-                    results.extend(duckduckgo_results)
-                except Exception as duckduckgo_error:
-                    print(f"❌ DuckDuckGo 보완 검색 실패: {duckduckgo_error}")
-        
-        except Exception as e:
-            print(f"💥 일반 검색 전체 오류: {e}")
+        # Google(메인)과 DuckDuckGo(보완)를 동시에 요청하고 Google 결과를 앞에 배치
+        calls = []
+        if settings.GOOGLE_API_KEY and settings.GOOGLE_CSE_ID:
+            calls.append(FanOutCall(
+                "google", "google",
+                lambda: self.search_google(query, max_results, SearchType.WEB, session=session, **kwargs)
+            ))
+        calls.append(FanOutCall(
+            "duckduckgo", "duckduckgo",
+            lambda: self.search_duckduckgo(query, max_results, **kwargs)
+        ))
+        
+        # 높은 점수 결과가 max_results개 모이면 느린 제공자는 기다리지 않음
+        outcome = await self.fanout.run(
+            calls,
+            min_results=max_results,
+            min_score=settings.SEARCH_EARLY_RETURN_MIN_SCORE
+        )
+        for name in outcome.failed:
+            print(f"❌ 일반 검색 제공자 실패: {name}")
         
-        return results[:max_results]
+        return outcome.ordered()[:max_results]
 
     async def search_web(
         self,
@@ -1267,15 +1299,42 @@ class SearchService:
             **kwargs
         )
         
-        # 캐시 확인
-        if use_cache:
-            cached_results = await cache_manager.get(cache_key, session)
-            if cached_results:
-                search_method = "메타 검색" if should_use_meta_search else "균형 검색" if category else "일반 검색"
-                print(f"📦 캐시에서 검색 결과 조회: {query} ({search_method})")
-                return [SearchResult.from_dict(result) for result in cached_results]
+        if not use_cache:
+            results = await self._execute_search_strategy(
+                query, max_results, session, category, confidence, should_use_meta_search, **kwargs
+            )
+            return results[:max_results]
         
-        # 3. 검색 실행
+        async def load_results() -> List[Dict[str, Any]]:
+            # 백그라운드 갱신은 요청이 끝난 뒤에도 실행될 수 있으므로 요청 세션을 넘기지 않음
+            results = await self._execute_search_strategy(
+                query, max_results, None, category, confidence, should_use_meta_search, **kwargs
+            )
+            if results:
+                print(f"💾 검색 결과 캐시에 저장: {query} ({len(results)}개 결과, TTL: {dynamic_ttl}초)")
+            return [result.to_dict() for result in results]
+        
+        # 캐시 조회 - 동시 미스는 한 번만 검색하고, 만료 직후에는 이전 결과를 반환하며 갱신
+        cached_results = await cache_manager.get_or_compute(
+            cache_key,
+            load_results,
+            ttl_seconds=dynamic_ttl,
+            stale_ttl_seconds=self.stale_cache_ttl,
+            cache_if=bool
+        )
+        return [SearchResult.from_dict(result) for result in cached_results][:max_results]
+    
+    async def _execute_search_strategy(
+        self,
+        query: str,
+        max_results: int,
+        session: Optional[AsyncSession],
+        category: Optional[str],
+        confidence: float,
+        should_use_meta_search: bool,
+        **kwargs
+    ) -> List[SearchResult]:
+        """감지된 카테고리에 따라 메타/균형/일반 검색 중 하나를 실행"""
         if should_use_meta_search:
             # 메타 검색 실행 (LLM 기반 사이트 발견 + 사이트별 검색)
             print(f"🎯 메타 검색 실행: '{query}' (전문 사이트 발견 후 검색)")
@@ -1317,13 +1376,7 @@ class SearchService:
                 result.category_detected = None
                 result.category_confidence = 0.0
         
-        # 4. 결과가 있으면 지능형 TTL로 캐시에 저장
-        if results and use_cache and session:
-            cache_data = [result.to_dict() for result in results]
-            await cache_manager.set(cache_key, cache_data, session, ttl_seconds=dynamic_ttl)
-            print(f"💾 검색 결과 캐시에 저장: {query} ({len(results)}개 결과, TTL: {dynamic_ttl}초)")
-        
-        return results[:max_results]
+        return results
     
     def _should_use_meta_search(self, query: str, category: Optional[str], confidence: float) -> bool:
         """메타 검색 사용 여부 판단"""
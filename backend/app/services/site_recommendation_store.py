@@ -0,0 +1,268 @@
+"""
+메타 검색 사이트 추천 저장소
+- 검색어를 주제 토큰 집합으로 바꿔 LLM이 추천한 사이트를 주제별로 SQLite에 보관
+- 비슷한 주제(토큰 Jaccard 유사도)면 저장된 추천을 재사용하고 LLM은 새 주제에서만 호출
+- 저장된 신뢰도는 시간이 지날수록 감쇠하고, 갱신 시점이 지난 주제는 저장값을 반환하면서 백그라운드에서 갱신
+"""
+
+import asyncio
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# 주제와 무관한 요청 표현
+_STOPWORDS = {
+    "알려줘", "알려주세요", "추천", "추천해줘", "방법", "어떻게", "무엇", "뭐야", "뭔가요", "대해", "대한",
+    "관련", "정리", "설명", "해줘", "해주세요", "찾아줘", "있는", "하는", "그리고", "좀",
+    "the", "a", "an", "of", "for", "to", "in", "on", "and", "or", "how", "what", "is", "are", "about", "best",
+}
+# 자주 붙는 한국어 조사 (토큰 끝에서 한 번만 제거)
+_PARTICLES = ("에서", "으로", "에게", "까지", "부터", "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "도")
+
+
+def topic_tokens(query: str, max_tokens: int = 8) -> FrozenSet[str]:
+    """검색어의 주제 토큰 집합 (요청 표현/조사 제거)"""
+    tokens: Set[str] = set()
+    for token in _TOKEN.findall(query.lower()):
+        for particle in _PARTICLES:
+            if token.endswith(particle) and len(token) - len(particle) >= 2:
+                token = token[:-len(particle)]
+                break
+        if len(token) >= 2 and token not in _STOPWORDS:
+            tokens.add(token)
+    return frozenset(sorted(tokens)[:max_tokens])
+
+
+def topic_key(tokens: FrozenSet[str]) -> str:
+    return " ".join(sorted(tokens))
+
+
+class SiteRecommendationStore:
+    """주제별 사이트 추천 저장소 (SQLite + 메모리 토큰 색인)"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        similarity_threshold: Optional[float] = None,
+        half_life_days: Optional[float] = None,
+        refresh_after_seconds: Optional[int] = None,
+        max_age_seconds: Optional[int] = None
+    ):
+        path = settings.SITE_RECOMMENDATION_CACHE_PATH if path is None else path
+        self.path = Path(path) if path else None
+        self.similarity_threshold = similarity_threshold or settings.SITE_RECOMMENDATION_TOPIC_SIMILARITY
+        self.half_life_seconds = (half_life_days or settings.SITE_RECOMMENDATION_HALF_LIFE_DAYS) * 86400
+        self.refresh_after_seconds = refresh_after_seconds or settings.SITE_RECOMMENDATION_REFRESH_AFTER_SECONDS
+        self.max_age_seconds = max_age_seconds or settings.SITE_RECOMMENDATION_MAX_AGE_SECONDS
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # topic_key -> (토큰 집합, 사이트 목록, 갱신 시각)
+        self._topics: Dict[str, Tuple[FrozenSet[str], List[Dict[str, Any]], float]] = {}
+        self._token_index: Dict[str, Set[str]] = {}
+        self._loaded = False
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        self.stats = {"hits": 0, "similar_hits": 0, "misses": 0, "refreshes": 0, "llm_calls": 0}
+
+    # ===== 공개 API =====
+
+    async def get_or_discover(
+        self,
+        query: str,
+        discover: Callable[[], Awaitable[List[Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        저장된 추천 반환, 새 주제면 discover(LLM 호출) 실행 후 저장
+
+        Args:
+            query: 검색어
+            discover: 사이트 목록(CandidateSite)을 돌려주는 코루틴 함수
+
+        Returns:
+            감쇠된 신뢰도가 반영된 사이트 dict 목록
+        """
+        tokens = topic_tokens(query)
+        if not tokens:
+            return self._to_dicts(await self._discover(discover))
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._ensure_loaded)
+        key = topic_key(tokens)
+
+        # 같은 새 주제가 동시에 들어오면 LLM은 한 번만 호출
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        match = self._lookup(tokens)
+        if match is not None:
+            matched_key, sites, refreshed_at, exact = match
+            age = time.time() - refreshed_at
+            if age < self.max_age_seconds:
+                self.stats["hits" if exact else "similar_hits"] += 1
+                if age >= self.refresh_after_seconds:
+                    # 갱신 시점이 지났으면 저장값을 바로 쓰고 백그라운드에서 다시 추천받음
+                    self._schedule_refresh(matched_key, self._topics[matched_key][0], discover)
+                return self._decayed(sites, age)
+
+        self.stats["misses"] += 1
+        task = asyncio.create_task(self._discover_and_save(key, tokens, discover))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def close(self) -> None:
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "topics": len(self._topics), "refreshing": len(self._refreshing)}
+
+    # ===== 조회 =====
+
+    def _lookup(self, tokens: FrozenSet[str]) -> Optional[Tuple[str, List[Dict[str, Any]], float, bool]]:
+        """(주제 키, 사이트, 갱신 시각, 정확히 같은 주제 여부) - 같은 주제가 없으면 토큰 Jaccard 유사도가 가장 높은 주제"""
+        key = topic_key(tokens)
+        if key in self._topics:
+            _, sites, refreshed_at = self._topics[key]
+            return key, sites, refreshed_at, True
+
+        candidates: Set[str] = set()
+        for token in tokens:
+            candidates.update(self._token_index.get(token, ()))
+
+        best_key, best_similarity = None, self.similarity_threshold
+        for candidate in sorted(candidates):
+            other = self._topics[candidate][0]
+            similarity = len(tokens & other) / len(tokens | other)
+            if similarity >= best_similarity:
+                best_key, best_similarity = candidate, similarity
+        if best_key is None:
+            return None
+
+        _, sites, refreshed_at = self._topics[best_key]
+        return best_key, sites, refreshed_at, False
+
+    def _decayed(self, sites: List[Dict[str, Any]], age: float) -> List[Dict[str, Any]]:
+        """저장 후 경과 시간에 따라 신뢰도를 반감기 기준으로 감쇠"""
+        factor = 0.5 ** (age / self.half_life_seconds)
+        return [{**site, "confidence": round(site.get("confidence", 0.5) * factor, 4)} for site in sites]
+
+    # ===== 추천 / 갱신 =====
+
+    async def _discover(self, discover: Callable[[], Awaitable[List[Any]]]) -> List[Any]:
+        self.stats["llm_calls"] += 1
+        return await discover()
+
+    async def _discover_and_save(
+        self,
+        key: str,
+        tokens: FrozenSet[str],
+        discover: Callable[[], Awaitable[List[Any]]]
+    ) -> List[Dict[str, Any]]:
+        sites = self._to_dicts(await self._discover(discover))
+        if sites:
+            refreshed_at = await asyncio.get_running_loop().run_in_executor(None, self._save, key, tokens, sites)
+            # 메모리 색인은 _lookup과 같은 이벤트 루프 스레드에서만 갱신
+            self._index(key, tokens, sites, refreshed_at)
+        return sites
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        tokens: FrozenSet[str],
+        discover: Callable[[], Awaitable[List[Any]]]
+    ) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                if await self._discover_and_save(key, tokens, discover):
+                    self.stats["refreshes"] += 1
+            except Exception as e:
+                logger.warning(f"사이트 추천 백그라운드 갱신 실패 [{key}]: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    @staticmethod
+    def _to_dicts(sites: List[Any]) -> List[Dict[str, Any]]:
+        return [asdict(site) if not isinstance(site, dict) else dict(site) for site in sites if site]
+
+    # ===== 저장소 =====
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path is None:
+                self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS site_recommendations ("
+                "topic TEXT PRIMARY KEY, tokens TEXT NOT NULL, sites TEXT NOT NULL, refreshed_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def _ensure_loaded(self) -> None:
+        """처음 사용할 때 저장된 주제를 읽어 메모리 색인 구성 (오래된 주제는 정리)"""
+        with self._lock:
+            if self._loaded:
+                return
+            conn = self._connection()
+            conn.execute(
+                "DELETE FROM site_recommendations WHERE refreshed_at < ?",
+                (time.time() - self.max_age_seconds,)
+            )
+            conn.commit()
+            for key, tokens, sites, refreshed_at in conn.execute(
+                "SELECT topic, tokens, sites, refreshed_at FROM site_recommendations"
+            ):
+                self._index(key, frozenset(json.loads(tokens)), json.loads(sites), refreshed_at)
+            self._loaded = True
+            if self._topics:
+                logger.info(f"💾 사이트 추천 저장소 로드: {len(self._topics)}개 주제")
+
+    def _save(self, key: str, tokens: FrozenSet[str], sites: List[Dict[str, Any]]) -> float:
+        """주제 추천을 파일에 기록하고 갱신 시각 반환 (executor 스레드에서 실행)"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO site_recommendations (topic, tokens, sites, refreshed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(sorted(tokens), ensure_ascii=False), json.dumps(sites, ensure_ascii=False), now)
+            )
+            conn.commit()
+        return now
+
+    def _index(self, key: str, tokens: FrozenSet[str], sites: List[Dict[str, Any]], refreshed_at: float) -> None:
+        self._topics[key] = (tokens, sites, refreshed_at)
+        for token in tokens:
+            self._token_index.setdefault(token, set()).add(key)
+
+
+# 전역 사이트 추천 저장소 인스턴스
+site_recommendation_store = SiteRecommendationStore()
@@ -0,0 +1,265 @@
+"""
+영속 벡터 인덱스 서비스 (멀티모달 RAG용)
+- 문서 인덱스는 청크 텍스트 해시로 식별 (청크 단위 재사용은 embedding_service 캐시가 담당)
+- 문서 단위 인덱스를 디스크에 저장하고 메모리 매핑으로 로드
+- 검색은 요청마다 넘겨받은 문서 인덱스 목록에 대해서만 수행 (공유 가변 상태 없음)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.cache_manager import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+EmbedFunction = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+@dataclass
+class DocumentIndex:
+    """디스크에 저장된 문서 인덱스 (메모리 매핑된 임베딩 행렬 + 청크 정보)"""
+    doc_hash: str
+    vectors: np.ndarray  # (청크 수, 차원), L2 정규화된 float32
+    chunks: List[Dict[str, Any]]  # {"text_hash", "content", "metadata"}
+
+    @property
+    def size(self) -> int:
+        return len(self.chunks)
+
+
+class VectorIndexService:
+    """콘텐츠 주소 기반 영속 벡터 인덱스"""
+
+    def __init__(
+        self,
+        index_dir: Optional[str] = None,
+        max_open_indexes: int = 256
+    ):
+        self.index_dir = Path(index_dir or settings.VECTOR_INDEX_DIR)
+        self.max_open_indexes = max_open_indexes
+
+        # 열린 문서 인덱스 (LRU)
+        self._open_indexes: "OrderedDict[str, DocumentIndex]" = OrderedDict()
+        # 검색/로드는 executor 스레드에서 실행되므로 변경은 락으로 보호
+        self._lock = threading.Lock()
+
+        # 같은 문서의 동시 인덱싱은 한 번만 수행
+        self._single_flight = SingleFlight()
+
+        self.stats = {
+            "indexes_built": 0,
+            "indexes_reused": 0,
+            "chunks_indexed": 0,
+            "searches": 0,
+        }
+
+    # ===== 키 생성 =====
+
+    @staticmethod
+    def _model_slug(model_name: str) -> str:
+        return model_name.replace("/", "__")
+
+    @staticmethod
+    def text_hash(model_name: str, text: str) -> str:
+        """모델과 텍스트로 결정되는 청크 키"""
+        return hashlib.sha256(f"{model_name}\0{text}".encode()).hexdigest()
+
+    def document_hash(self, model_name: str, texts: Sequence[str]) -> str:
+        """청크 구성으로 결정되는 문서 인덱스 키 (같은 내용이면 사용자/요청과 무관하게 동일)"""
+        digest = hashlib.sha256(model_name.encode())
+        for text in texts:
+            digest.update(self.text_hash(model_name, text).encode())
+        return digest.hexdigest()
+
+    def _index_paths(self, model_name: str, doc_hash: str) -> Tuple[Path, Path]:
+        base = self.index_dir / self._model_slug(model_name) / doc_hash[:2]
+        return base / f"{doc_hash}.npy", base / f"{doc_hash}.json"
+
+    # ===== 인덱싱 =====
+
+    async def ensure_index(
+        self,
+        model_name: str,
+        chunks: List[Dict[str, Any]],
+        embed_fn: EmbedFunction
+    ) -> str:
+        """
+        문서 청크 목록의 인덱스를 보장하고 문서 해시 반환
+
+        chunks: {"content": str, "metadata": dict}
+        이미 디스크에 있으면 임베딩 없이 재사용합니다.
+        """
+        texts = [chunk["content"] for chunk in chunks]
+        doc_hash = self.document_hash(model_name, texts)
+        key = f"{self._model_slug(model_name)}:{doc_hash}"
+
+        await self._single_flight.do(
+            key,
+            lambda: self._build_index(model_name, doc_hash, chunks, embed_fn)
+        )
+        return doc_hash
+
+    async def _build_index(
+        self,
+        model_name: str,
+        doc_hash: str,
+        chunks: List[Dict[str, Any]],
+        embed_fn: EmbedFunction
+    ) -> None:
+        loop = asyncio.get_running_loop()
+
+        if doc_hash in self._open_indexes or await loop.run_in_executor(
+            None, self._index_exists, model_name, doc_hash
+        ):
+            self.stats["indexes_reused"] += 1
+            return
+
+        text_hashes = [self.text_hash(model_name, chunk["content"]) for chunk in chunks]
+
+        # 청크 단위 캐시/배치 처리는 embed_fn(embedding_service)이 담당
+        embeddings = await embed_fn([chunk["content"] for chunk in chunks])
+        vectors = self._normalize(embeddings)
+        self.stats["chunks_indexed"] += len(chunks)
+
+        manifest = [
+            {"text_hash": text_hash, "content": chunk["content"], "metadata": chunk.get("metadata", {})}
+            for text_hash, chunk in zip(text_hashes, chunks)
+        ]
+
+        await loop.run_in_executor(None, self._write_index, model_name, doc_hash, vectors, manifest)
+        self.stats["indexes_built"] += 1
+        logger.info(f"🗂️ 벡터 인덱스 생성: {doc_hash[:12]} ({len(chunks)}개 청크)")
+
+    def _index_exists(self, model_name: str, doc_hash: str) -> bool:
+        vectors_path, manifest_path = self._index_paths(model_name, doc_hash)
+        return vectors_path.exists() and manifest_path.exists()
+
+    def _write_index(
+        self,
+        model_name: str,
+        doc_hash: str,
+        vectors: np.ndarray,
+        manifest: List[Dict[str, Any]]
+    ) -> None:
+        """임시 파일에 쓴 뒤 교체 - 동시에 읽는 워커는 완성된 파일만 봄"""
+        vectors_path, manifest_path = self._index_paths(model_name, doc_hash)
+        vectors_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 매니페스트를 먼저 쓰고 벡터 파일을 마지막에 교체 (벡터 파일 존재 = 완성된 인덱스)
+        for path, write in (
+            (manifest_path, lambda f: f.write(json.dumps(manifest, ensure_ascii=False, default=str).encode())),
+            (vectors_path, lambda f: np.save(f, vectors.astype(np.float32))),
+        ):
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    write(f)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+    # ===== 로드 =====
+
+    def _load_index(self, model_name: str, doc_hash: str) -> Optional[DocumentIndex]:
+        with self._lock:
+            index = self._open_indexes.get(doc_hash)
+            if index is not None:
+                self._open_indexes.move_to_end(doc_hash)
+                return index
+
+        vectors_path, manifest_path = self._index_paths(model_name, doc_hash)
+        if not vectors_path.exists() or not manifest_path.exists():
+            return None
+
+        index = DocumentIndex(
+            doc_hash=doc_hash,
+            vectors=np.load(vectors_path, mmap_mode="r"),
+            chunks=json.loads(manifest_path.read_text(encoding="utf-8"))
+        )
+
+        with self._lock:
+            self._open_indexes[doc_hash] = index
+            while len(self._open_indexes) > self.max_open_indexes:
+                self._open_indexes.popitem(last=False)
+        return index
+
+    # ===== 검색 =====
+
+    async def search(
+        self,
+        model_name: str,
+        query_vector: List[float],
+        doc_hashes: List[str],
+        k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """주어진 문서 인덱스들에서 코사인 유사도 상위 k개 청크 검색"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self._search_sync, model_name, query_vector, doc_hashes, k
+        )
+
+    def _search_sync(
+        self,
+        model_name: str,
+        query_vector: List[float],
+        doc_hashes: List[str],
+        k: int
+    ) -> List[Dict[str, Any]]:
+        self.stats["searches"] += 1
+        query = self._normalize([query_vector])[0]
+
+        candidates: List[Tuple[float, Dict[str, Any]]] = []
+        for doc_hash in dict.fromkeys(doc_hashes):
+            index = self._load_index(model_name, doc_hash)
+            if index is None or index.size == 0:
+                logger.warning(f"벡터 인덱스를 찾을 수 없음: {doc_hash[:12]}")
+                continue
+
+            scores = np.asarray(index.vectors @ query)
+            top = np.argsort(-scores)[:k]
+            candidates.extend((float(scores[row]), index.chunks[row]) for row in top)
+
+        candidates.sort(key=lambda item: item[0], reverse=True)
+        return [
+            {
+                "content": chunk["content"],
+                "metadata": chunk["metadata"],
+                "similarity_score": score,
+                "relevance_score": max(0.0, score)
+            }
+            for score, chunk in candidates[:k]
+        ]
+
+    # ===== 유틸리티 =====
+
+    @staticmethod
+    def _normalize(vectors: Sequence[Sequence[float]]) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "open_indexes": len(self._open_indexes),
+            "index_dir": str(self.index_dir)
+        }
+
+
+# 전역 벡터 인덱스 서비스
+vector_index_service = VectorIndexService()
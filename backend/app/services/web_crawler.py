@@ -1,18 +1,43 @@
 """
 웹 크롤링 서비스 - 특정 URL 직접 접근 및 콘텐츠 추출
+- crawl_many: 호스트별 동시 요청 제한 + 공유 연결 풀 (HTTP/2 가능 시 사용)
+- 응답은 스트리밍으로 읽으며 최대 크기에서 중단
+- 파싱 결과는 디스크 캐시에 저장하고 ETag/Last-Modified로 재검증 (304면 재파싱 없음)
+- HTML 파싱은 워커 프로세스에서 실행 (lxml 사용 가능 시 lxml 파서)
 """
 
 import asyncio
+import json
 import re
-from typing import Dict, List, Optional, Any
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urljoin, urlparse
 import httpx
 from bs4 import BeautifulSoup
 import logging
 from datetime import datetime
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+    logger.warning("lxml not available, falling back to html.parser. Installing: pip install lxml")
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class WebCrawlResult:
     """웹 크롤링 결과 데이터 클래스"""
@@ -28,7 +53,9 @@ class WebCrawlResult:
         error: str = None,
         status_code: int = 200,
         content_type: str = "",
-        last_modified: str = None
+        last_modified: str = None,
+        from_cache: bool = False,
+        truncated: bool = False
     ):
         self.url = url
         self.title = title
@@ -40,6 +67,8 @@ class WebCrawlResult:
         self.status_code = status_code
         self.content_type = content_type
         self.last_modified = last_modified
+        self.from_cache = from_cache
+        self.truncated = truncated
         self.timestamp = datetime.utcnow().isoformat()
     
     def to_dict(self) -> Dict[str, Any]:
@@ -54,22 +83,250 @@ class WebCrawlResult:
             "status_code": self.status_code,
             "content_type": self.content_type,
             "last_modified": self.last_modified,
+            "from_cache": self.from_cache,
+            "truncated": self.truncated,
             "timestamp": self.timestamp
         }
 
 
+def _extract_text_content(soup: BeautifulSoup) -> str:
+    """HTML에서 텍스트 내용 추출"""
+    # 불필요한 태그 제거
+    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+        element.decompose()
+    
+    # 메인 콘텐츠 영역 찾기
+    content_selectors = [
+        'main', 'article', '.content', '.post', '.entry',
+        '#content', '#main', '.main-content', '.article-content'
+    ]
+    
+    main_content = None
+    for selector in content_selectors:
+        main_content = soup.select_one(selector)
+        if main_content:
+            break
+    
+    # 메인 콘텐츠가 없으면 body 전체 사용
+    if not main_content:
+        main_content = soup.find('body') or soup
+    
+    # 텍스트 추출
+    text = main_content.get_text(separator=' ', strip=True)
+    
+    # 여러 공백을 하나로 정리
+    text = re.sub(r'\s+', ' ', text)
+    
+    return text.strip()
+
+
+def _extract_headings(soup: BeautifulSoup) -> List[str]:
+    """제목 태그 (h1-h6) 추출"""
+    headings = []
+    for i in range(1, 7):
+        for heading in soup.find_all(f'h{i}'):
+            text = heading.get_text(strip=True)
+            if text and len(text) <= 200:  # 너무 긴 제목 제외
+                headings.append(text)
+    return headings
+
+
+def _extract_links(soup: BeautifulSoup, base_url: str) -> List[str]:
+    """링크 추출 (최대 20개)"""
+    links = []
+    for link in soup.find_all('a', href=True)[:20]:
+        href = link['href']
+        if href.startswith(('http://', 'https://')):
+            links.append(href)
+        elif href.startswith('/'):
+            links.append(urljoin(base_url, href))
+    return links
+
+
+def _generate_summary(content: str, max_length: int = 500) -> str:
+    """콘텐츠 요약 생성 (간단한 문장 기반)"""
+    if not content:
+        return ""
+    
+    # 문장 단위로 분할
+    sentences = re.split(r'[.!?]\s+', content)
+    
+    summary = ""
+    for sentence in sentences:
+        if len(summary) + len(sentence) <= max_length:
+            summary += sentence + ". "
+        else:
+            break
+    
+    return summary.strip()
+
+
+def _parse_html_page(markup: Any, url: str, parser: str) -> Dict[str, Any]:
+    """HTML 파싱 (워커 프로세스에서 실행, 링크는 항상 추출해 캐시에 함께 저장)"""
+    soup = BeautifulSoup(markup, parser)
+    
+    # 제목 추출
+    title_element = soup.find('title')
+    title = title_element.get_text(strip=True) if title_element else ""
+    if not title:
+        h1 = soup.find('h1')
+        title = h1.get_text(strip=True) if h1 else "제목 없음"
+    
+    content = _extract_text_content(soup)
+    headings = _extract_headings(soup)
+    links = _extract_links(soup, url)
+    
+    return {
+        "title": title,
+        "content": content,
+        "summary": _generate_summary(content),
+        "headings": headings,
+        "links": links,
+    }
+
+
+class PageCache:
+    """SQLite 기반 크롤링 결과 캐시 (ETag/Last-Modified 재검증용 검증자 함께 저장)"""
+
+    def __init__(self, path: Path, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # 저장된 항목 수 (연결을 열 때 한 번 세고 이후 삽입/축출로 갱신)
+        self._count = 0
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, result TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages(accessed_at)"
+            )
+            self._count = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+        return self._conn
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT etag, last_modified, result, fetched_at FROM pages WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            conn.commit()
+            etag, last_modified, result, fetched_at = row
+            return {
+                "etag": etag,
+                "last_modified": last_modified,
+                "result": json.loads(result),
+                "fetched_at": fetched_at,
+            }
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str], result: Dict[str, Any]) -> None:
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            row = (etag, last_modified, json.dumps(result, ensure_ascii=False), now, now, url)
+            # 새 항목만 삽입되므로 rowcount로 항목 수를 추적 (이미 있으면 갱신)
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO pages (etag, last_modified, result, fetched_at, accessed_at, url) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                row
+            ).rowcount
+            if inserted:
+                self._count += inserted
+            else:
+                conn.execute(
+                    "UPDATE pages SET etag = ?, last_modified = ?, result = ?, fetched_at = ?, accessed_at = ? "
+                    "WHERE url = ?",
+                    row
+                )
+            if self._count > self.max_entries:
+                # 가장 오래 사용되지 않은 항목부터 10% 여유를 두고 정리
+                excess = self._count - int(self.max_entries * 0.9)
+                self._count -= conn.execute(
+                    "DELETE FROM pages WHERE url IN ("
+                    "SELECT url FROM pages ORDER BY accessed_at ASC LIMIT ?)",
+                    (excess,)
+                ).rowcount
+            conn.commit()
+
+    def touch(self, url: str) -> None:
+        """304 응답으로 재검증된 항목의 신선도 갱신"""
+        with self._lock:
+            conn = self._connection()
+            now = time.time()
+            conn.execute("UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 class WebCrawlerService:
     """웹 크롤링 서비스 클래스"""
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        max_response_bytes: Optional[int] = None,
+        parse_workers: Optional[int] = None,
+        cache_dir: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.max_concurrency = max_concurrency or settings.CRAWLER_MAX_CONCURRENCY
+        self.per_host_concurrency = per_host_concurrency or settings.CRAWLER_PER_HOST_CONCURRENCY
+        self.max_response_bytes = max_response_bytes or settings.CRAWLER_MAX_RESPONSE_BYTES
+        self.parse_workers = settings.CRAWLER_PARSE_WORKERS if parse_workers is None else parse_workers
+        self.cache_fresh_seconds = settings.CRAWLER_CACHE_FRESH_SECONDS
+        
+        # 모든 크롤링이 하나의 연결 풀을 공유 (h2 설치 시 호스트당 연결 하나로 다중화)
         self.client = httpx.AsyncClient(
             timeout=httpx.Timeout(30.0),
             headers={
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
             },
-            follow_redirects=True
+            follow_redirects=True,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency
+            ),
+            transport=transport
         )
         
+        cache_dir = settings.CRAWLER_CACHE_DIR if cache_dir is None else cache_dir
+        self.cache: Optional[PageCache] = (
+            PageCache(Path(cache_dir) / "pages.sqlite3", settings.CRAWLER_CACHE_MAX_ENTRIES)
+            if cache_dir else None
+        )
+        
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._global_semaphore: Optional[asyncio.Semaphore] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        
+        self.stats = {
+            "requests": 0,
+            "cache_hits": 0,
+            "revalidated": 0,
+            "fetched": 0,
+            "truncated": 0,
+            "errors": 0,
+            "bytes_downloaded": 0,
+        }
+        
         # 크롤링 제외 도메인 (로봇 차단, 저작권 등)
         self.excluded_domains = {
             "facebook.com", "instagram.com", "twitter.com", "x.com",
@@ -95,73 +352,12 @@ class WebCrawlerService:
         except:
             return False
     
-    def _extract_text_content(self, soup: BeautifulSoup) -> str:
-        """HTML에서 텍스트 내용 추출"""
-        # 불필요한 태그 제거
-        for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-            element.decompose()
-        
-        # 메인 콘텐츠 영역 찾기
-        content_selectors = [
-            'main', 'article', '.content', '.post', '.entry',
-            '#content', '#main', '.main-content', '.article-content'
-        ]
-        
-        main_content = None
-        for selector in content_selectors:
-            main_content = soup.select_one(selector)
-            if main_content:
-                break
-        
-        # 메인 콘텐츠가 없으면 body 전체 사용
-        if not main_content:
-            main_content = soup.find('body') or soup
-        
-        # 텍스트 추출
-        text = main_content.get_text(separator=' ', strip=True)
-        
-        # 여러 공백을 하나로 정리
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
-    
-    def _extract_headings(self, soup: BeautifulSoup) -> List[str]:
-        """제목 태그 (h1-h6) 추출"""
-        headings = []
-        for i in range(1, 7):
-            for heading in soup.find_all(f'h{i}'):
-                text = heading.get_text(strip=True)
-                if text and len(text) <= 200:  # 너무 긴 제목 제외
-                    headings.append(text)
-        return headings
-    
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """링크 추출 (최대 20개)"""
-        links = []
-        for link in soup.find_all('a', href=True)[:20]:
-            href = link['href']
-            if href.startswith(('http://', 'https://')):
-                links.append(href)
-            elif href.startswith('/'):
-                links.append(urljoin(base_url, href))
-        return links
-    
-    def _generate_summary(self, content: str, max_length: int = 500) -> str:
-        """콘텐츠 요약 생성 (간단한 문장 기반)"""
-        if not content:
-            return ""
-        
-        # 문장 단위로 분할
-        sentences = re.split(r'[.!?]\s+', content)
-        
-        summary = ""
-        for sentence in sentences:
-            if len(summary) + len(sentence) <= max_length:
-                summary += sentence + ". "
-            else:
-                break
-        
-        return summary.strip()
+    async def crawl_many(self, urls: List[str], extract_links: bool = False) -> List[WebCrawlResult]:
+        """여러 URL 동시 크롤링 (입력 순서 유지, 같은 URL은 한 번만 요청)"""
+        unique_urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.crawl_url(url, extract_links) for url in unique_urls))
+        by_url = dict(zip(unique_urls, results))
+        return [by_url[url] for url in urls]
     
     async def crawl_url(self, url: str, extract_links: bool = False) -> WebCrawlResult:
         """특정 URL 크롤링"""
@@ -171,68 +367,80 @@ class WebCrawlerService:
                 error="크롤링이 허용되지 않는 URL입니다"
             )
         
+        self.stats["requests"] += 1
+        loop = asyncio.get_running_loop()
+        
         try:
-            logger.info(f"웹 크롤링 시작: {url}")
-            
-            response = await self.client.get(url)
-            response.raise_for_status()
-            
-            # 콘텐츠 타입 확인
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/html' not in content_type:
-                return WebCrawlResult(
-                    url=url,
-                    error=f"지원하지 않는 콘텐츠 타입: {content_type}",
-                    content_type=content_type,
-                    status_code=response.status_code
-                )
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 제목 추출
-            title_element = soup.find('title')
-            title = title_element.get_text(strip=True) if title_element else ""
-            
-            # 메타 태그에서 추가 정보 추출
-            if not title:
-                h1 = soup.find('h1')
-                title = h1.get_text(strip=True) if h1 else "제목 없음"
-            
-            # 텍스트 콘텐츠 추출
-            content = self._extract_text_content(soup)
+            cached = await loop.run_in_executor(None, self.cache.get, url) if self.cache else None
+            if cached and time.time() - cached["fetched_at"] < self.cache_fresh_seconds:
+                self.stats["cache_hits"] += 1
+                return self._result_from_cache(url, cached, extract_links)
             
-            # 제목들 추출
-            headings = self._extract_headings(soup)
+            # 호스트별 동시 요청 제한 (전체 제한 안에서)
+            async with self._acquire_slot(url):
+                logger.info(f"웹 크롤링 시작: {url}")
+                
+                headers = {}
+                if cached:
+                    if cached["etag"]:
+                        headers["If-None-Match"] = cached["etag"]
+                    if cached["last_modified"]:
+                        headers["If-Modified-Since"] = cached["last_modified"]
+                
+                async with self.client.stream("GET", url, headers=headers) as response:
+                    if response.status_code == 304 and cached:
+                        self.stats["revalidated"] += 1
+                        if self.cache:
+                            await loop.run_in_executor(None, self.cache.touch, url)
+                        logger.info(f"웹 크롤링 캐시 재검증: {url} (304)")
+                        return self._result_from_cache(url, cached, extract_links)
+                    
+                    response.raise_for_status()
+                    
+                    # 콘텐츠 타입 확인
+                    content_type = response.headers.get('content-type', '').lower()
+                    if 'text/html' not in content_type:
+                        return WebCrawlResult(
+                            url=url,
+                            error=f"지원하지 않는 콘텐츠 타입: {content_type}",
+                            content_type=content_type,
+                            status_code=response.status_code
+                        )
+                    
+                    body, truncated = await self._read_capped(response)
+                    status_code = response.status_code
+                    charset = response.charset_encoding
+                    etag = response.headers.get('etag')
+                    last_modified = response.headers.get('last-modified')
             
-            # 링크 추출 (선택적)
-            links = self._extract_links(soup, url) if extract_links else []
+            # 인코딩이 명시되지 않았으면 바이트 그대로 넘겨 meta charset 감지에 맡김
+            markup = body.decode(charset, errors="replace") if charset else body
             
-            # 요약 생성
-            summary = self._generate_summary(content)
+            # HTML 파싱 (이벤트 루프 밖에서)
+            parsed = await loop.run_in_executor(self._get_executor(), _parse_html_page, markup, url, HTML_PARSER)
             
-            # Last-Modified 헤더 확인
-            last_modified = response.headers.get('last-modified')
+            result = {
+                **parsed,
+                "status_code": status_code,
+                "content_type": content_type,
+                "last_modified": last_modified,
+                "truncated": truncated,
+            }
+            if self.cache:
+                await loop.run_in_executor(None, self.cache.set, url, etag, last_modified, result)
             
-            logger.info(f"웹 크롤링 완료: {url} (제목: {title[:50]}, 콘텐츠: {len(content)}자)")
+            self.stats["fetched"] += 1
+            logger.info(f"웹 크롤링 완료: {url} (제목: {parsed['title'][:50]}, 콘텐츠: {len(parsed['content'])}자)")
             
-            return WebCrawlResult(
-                url=url,
-                title=title,
-                content=content,
-                summary=summary,
-                headings=headings,
-                links=links,
-                status_code=response.status_code,
-                content_type=content_type,
-                last_modified=last_modified
-            )
+            return WebCrawlResult(url=url, **{**result, "links": result["links"] if extract_links else []})
             
         except httpx.TimeoutException:
+            self.stats["errors"] += 1
             logger.warning(f"웹 크롤링 타임아웃: {url}")
             return WebCrawlResult(url=url, error="페이지 로딩 시간 초과")
             
         except httpx.HTTPStatusError as e:
+            self.stats["errors"] += 1
             logger.warning(f"웹 크롤링 HTTP 오류: {url} - {e.response.status_code}")
             return WebCrawlResult(
                 url=url, 
@@ -241,9 +449,70 @@ class WebCrawlerService:
             )
             
         except Exception as e:
+            self.stats["errors"] += 1
             logger.error(f"웹 크롤링 오류: {url} - {e}")
             return WebCrawlResult(url=url, error=f"크롤링 실패: {str(e)}")
     
+    async def _read_capped(self, response: httpx.Response) -> Tuple[bytes, bool]:
+        """최대 크기까지만 스트리밍으로 읽기 (초과 시 나머지는 받지 않고 연결 종료)"""
+        declared = response.headers.get('content-length')
+        if declared and declared.isdigit() and int(declared) > self.max_response_bytes:
+            logger.info(f"응답 크기 초과 예정 ({declared} bytes) - {self.max_response_bytes} bytes까지만 읽음: {response.url}")
+        
+        chunks: List[bytes] = []
+        received = 0
+        truncated = False
+        async for chunk in response.aiter_bytes():
+            remaining = self.max_response_bytes - received
+            if len(chunk) >= remaining:
+                chunks.append(chunk[:remaining])
+                received += remaining
+                truncated = len(chunk) > remaining
+                if truncated:
+                    break
+                continue
+            chunks.append(chunk)
+            received += len(chunk)
+        
+        self.stats["bytes_downloaded"] += received
+        if truncated:
+            self.stats["truncated"] += 1
+        return b"".join(chunks), truncated
+    
+    def _result_from_cache(self, url: str, cached: Dict[str, Any], extract_links: bool) -> WebCrawlResult:
+        result = cached["result"]
+        return WebCrawlResult(
+            url=url,
+            **{**result, "links": result.get("links", []) if extract_links else []},
+            from_cache=True
+        )
+    
+    def _acquire_slot(self, url: str) -> "_CrawlSlot":
+        if self._global_semaphore is None:
+            self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        return _CrawlSlot(self._global_semaphore, semaphore)
+    
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """파싱 워커 풀 (0이면 기본 스레드 풀 사용)"""
+        if self.parse_workers <= 0:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.parse_workers)
+            logger.info(f"🕸️ 크롤링 파싱 워커 풀 시작 (process x {self.parse_workers}, parser={HTML_PARSER})")
+        return self._executor
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "http2": HTTP2_AVAILABLE,
+            "parser": HTML_PARSER,
+            "hosts": len(self._host_semaphores),
+        }
+    
     async def search_in_content(self, crawl_result: WebCrawlResult, query: str) -> Dict[str, Any]:
         """크롤링된 콘텐츠에서 검색"""
         if crawl_result.error:
@@ -289,8 +558,35 @@ class WebCrawlerService:
         }
     
     async def close(self):
-        """클라이언트 정리"""
+        """클라이언트, 파싱 워커 풀, 캐시 정리"""
         await self.client.aclose()
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self.cache:
+            self.cache.close()
+
+
+class _CrawlSlot:
+    """전체 동시성 슬롯을 잡기 전에 호스트 슬롯부터 확보 (한 호스트가 전체 슬롯을 점유하지 않도록)"""
+
+    def __init__(self, global_semaphore: asyncio.Semaphore, host_semaphore: asyncio.Semaphore):
+        self._global = global_semaphore
+        self._host = host_semaphore
+
+    async def __aenter__(self):
+        await self._host.acquire()
+        try:
+            await self._global.acquire()
+        except BaseException:
+            self._host.release()
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._global.release()
+        self._host.release()
+        return False
 
 
 # 전역 웹 크롤러 인스턴스
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+인용 매처 벤치마크
+출처별 반복 탐색(기존 구현)과 단일 패스 매처의 처리 시간을 비교하고 결과가 같은지 확인
+
+사용법: python scripts/benchmark_citation_matcher.py [--sources 30] [--chars 20000] [--repeat 20]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.citation_service import CitationService
+from tests.unit.citation_reference import extract_citations_by_source
+
+VOCABULARY = [
+    "인공지능", "machine", "learning", "Python", "JavaScript", "database", "research", "analysis",
+    "클라우드", "security", "framework", "performance", "openai", "github", "stackoverflow",
+    "wikipedia", "tutorial", "guide", "benchmark", "optimization", "network", "뉴스", "분석", "보고서"
+]
+DOMAINS = ["github.com", "stackoverflow.com", "en.wikipedia.org", "news.naver.com", "arxiv.org", "docs.python.org"]
+
+
+def build_inputs(source_count: int, chars: int, seed: int = 7):
+    rnd = random.Random(seed)
+    results = []
+    for i in range(source_count):
+        domain = rnd.choice(DOMAINS)
+        results.append({
+            "title": " ".join(rnd.choice(VOCABULARY) for _ in range(rnd.randint(4, 9))),
+            "url": f"https://{domain}/page/{i}",
+            "snippet": "",
+            "page_rank": rnd.randint(0, 10),
+        })
+
+    words = []
+    length = 0
+    while length < chars:
+        word = rnd.choice(VOCABULARY) if rnd.random() < 0.9 else rnd.choice(results)["url"]
+        words.append(word)
+        length += len(word) + 1
+    return results, " ".join(words)
+
+
+async def measure(func, text, sources, min_confidence, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        citations = await func(text, sources, min_confidence)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return citations, timings[len(timings) // 2]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="인용 매처 벤치마크")
+    parser.add_argument("--sources", type=int, default=30)
+    parser.add_argument("--chars", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    service = CitationService(logging_service=None)
+    results, text = build_inputs(args.sources, args.chars)
+    sources = await service._process_search_results(results)
+
+    print(f"출처 {len(sources)}개, 응답 {len(text):,}자, {args.repeat}회 반복 (중앙값)")
+    # 0.7은 기본값(제목/도메인 매치는 신뢰도 기준 미만), 0.0은 모든 패턴이 유효한 최악의 경우
+    for min_confidence in (0.7, 0.0):
+        reference, reference_time = await measure(
+            partial(extract_citations_by_source, service), text, sources, min_confidence, args.repeat
+        )
+        single_pass, single_pass_time = await measure(
+            service._extract_citations, text, sources, min_confidence, args.repeat
+        )
+        same = [
+            (c.text, c.source_id, c.start_position, c.end_position, c.confidence) for c in reference
+        ] == [
+            (c.text, c.source_id, c.start_position, c.end_position, c.confidence) for c in single_pass
+        ]
+        print(
+            f"min_confidence={min_confidence}: 인용 {len(single_pass)}개 | "
+            f"출처별 탐색 {reference_time * 1000:.2f}ms | 단일 패스 {single_pass_time * 1000:.2f}ms | "
+            f"{reference_time / single_pass_time:.1f}배 | 결과 일치: {'예' if same else '아니오'}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+LangGraph Supervisor 병렬/추측 실행 벤치마크
+Mock LLM(app.agents.mock_llm 응답 + 고정 지연)으로 웹 검색 턴의 전체 실행 시간을 비교
+- sequential: 8단계를 순서대로 실행하던 기존 그래프
+- speculative: 의도 분석 ∥ 컨텍스트 평가, 라우팅 확정 전 웹 검색 에이전트 추측 실행
+
+사용법: python scripts/benchmark_supervisor_speculation.py [--repeat 20] [--latency 0.05] [--worker-calls 3]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.messages import AIMessage
+
+from app.agents.base import AgentInput
+from app.agents.llm_client_registry import ANTHROPIC, llm_client_registry
+from app.agents.mock_llm import mock_llm
+from app.agents.speculative_executor import speculative_executor
+from app.agents.workflow_cache import NO_CHECKPOINTER, workflow_cache
+
+# 체크포인터 DB 없이 그래프 실행 시간만 측정
+workflow_cache.default_backend = lambda: NO_CHECKPOINTER
+
+from app.agents.langgraph.supervisor_langgraph import AgentType, langgraph_supervisor_agent  # noqa: E402
+
+QUERIES = [
+    "최신 전기차 배터리 기술 동향 검색해줘",
+    "서울 이번 주 날씨 정보 알려줘",
+    "파이썬 3.13 새 기능 검색",
+    "반도체 수출 통계 정보 찾아줘",
+]
+
+
+class MockChatModel:
+    """고정 지연 후 Mock LLM 응답 (의도 분석 프롬프트에는 분류 결과를 JSON으로 응답)"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def ainvoke(self, messages, **kwargs):
+        await asyncio.sleep(self.latency)
+        system = messages[0].content if isinstance(messages, list) else ""
+        query = messages[-1].content if isinstance(messages, list) else str(messages)
+        if "의도 분석 전문가" in system:
+            category = mock_llm.classify_query(query)
+            intent = {"search": "web_search", "creative": "canvas"}.get(category, "general_chat")
+            return AIMessage(content=json.dumps({"primary_intent": intent, "confidence": 0.9}))
+        return AIMessage(content=mock_llm.generate_response(query))
+
+
+class MockWebSearchWorker:
+    """검색어 생성/검색 결과 분석/답변 생성에 해당하는 LLM 호출을 흉내내는 Worker"""
+
+    def __init__(self, model: MockChatModel, calls: int):
+        self.model = model
+        self.calls = calls
+
+    async def execute(self, input_data: AgentInput, model: str):
+        response = None
+        for _ in range(self.calls):
+            response = await self.model.ainvoke([AIMessage(content=input_data.query)])
+        return SimpleNamespace(result=response.content, metadata={"confidence": 0.8})
+
+
+async def run_turns(speculative: bool, repeat: int):
+    app = langgraph_supervisor_agent._get_compiled_workflow(speculative)
+    timings, outputs = [], []
+    for i in range(repeat):
+        input_data = AgentInput(query=QUERIES[i % len(QUERIES)], user_id="bench", session_id=f"s{i}")
+        started = time.perf_counter()
+        state = langgraph_supervisor_agent._build_initial_state(input_data, "claude-sonnet", time.time(), speculative)
+        try:
+            final_state = await app.ainvoke(state)
+        finally:
+            speculative_executor.cancel(state["speculation_id"])
+        timings.append(time.perf_counter() - started)
+        outputs.append(final_state)
+    return timings, outputs
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="LangGraph Supervisor 병렬/추측 실행 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock LLM 호출당 지연(초)")
+    parser.add_argument("--worker-calls", type=int, default=3, help="웹 검색 Worker의 LLM 호출 수")
+    args = parser.parse_args()
+
+    model = MockChatModel(args.latency)
+    llm_client_registry.clear()
+    llm_client_registry.register_factory(ANTHROPIC, lambda name, params: model)
+    langgraph_supervisor_agent.worker_agents[AgentType.WEB_SEARCH] = MockWebSearchWorker(model, args.worker_calls)
+
+    results = {}
+    for speculative in (False, True):
+        timings, outputs = await run_turns(speculative, args.repeat)
+        failed = sum(1 for state in outputs if state.get("errors") or not state.get("final_output"))
+        results[speculative] = statistics.median(timings) * 1000
+        name = "speculative" if speculative else "sequential"
+        print(f"{name}: 중앙값 {results[speculative]:.1f}ms (실패 {failed}/{args.repeat})")
+
+    print(f"중앙값 지연 감소: {(1 - results[True] / results[False]) * 100:.1f}%")
+    print(f"추측 실행 통계: {speculative_executor.get_stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+LangGraph 워크플로우 캐시 벤치마크
+요청마다 compile()하던 기존 방식과 컴파일 캐시의 호출당 오버헤드를 비교
+(에이전트 워크플로우 + 노드가 아무 일도 하지 않는 8단계 그래프의 전체 실행 시간)
+
+사용법: python scripts/benchmark_workflow_cache.py [--repeat 200]
+"""
+
+import argparse
+import asyncio
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import TypedDict
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langgraph.graph import END, StateGraph
+
+from app.agents.workflow_cache import NO_CHECKPOINTER, CompiledWorkflowCache, workflow_cache
+
+# 에이전트 모듈을 불러올 때 DB 체크포인터를 만들지 않도록 체크포인터 없이 측정
+workflow_cache.default_backend = lambda: NO_CHECKPOINTER
+
+AGENTS = [
+    ("app.agents.langgraph.web_search_langgraph", "langgraph_web_search_agent"),
+    ("app.agents.langgraph.canvas_langgraph", "langgraph_canvas_agent"),
+    ("app.agents.langgraph.information_gap_langgraph", "langgraph_information_gap_analyzer"),
+    ("app.agents.langgraph.supervisor_langgraph", "langgraph_supervisor_agent"),
+    ("app.agents.langgraph.parallel_processor", "langgraph_parallel_processor"),
+    ("app.agents.langgraph.multimodal_rag_langgraph", "langgraph_multimodal_rag_agent"),
+]
+
+
+class PipelineState(TypedDict):
+    query: str
+    steps: int
+
+
+def build_pipeline(nodes: int = 8) -> StateGraph:
+    workflow = StateGraph(PipelineState)
+
+    async def step(state: PipelineState):
+        return {"steps": state["steps"] + 1}
+
+    names = [f"step_{i}" for i in range(nodes)]
+    for name in names:
+        workflow.add_node(name, step)
+    workflow.set_entry_point(names[0])
+    for current, following in zip(names, names[1:]):
+        workflow.add_edge(current, following)
+    workflow.add_edge(names[-1], END)
+    return workflow
+
+
+def median_ms(timings):
+    timings.sort()
+    return timings[len(timings) // 2] * 1000
+
+
+def measure_compile(agent_id, build, repeat):
+    cache = CompiledWorkflowCache()
+    workflow = build()
+    per_request, cached = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        workflow.compile()
+        per_request.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        cache.get(agent_id, build, backend=NO_CHECKPOINTER)
+        cached.append(time.perf_counter() - started)
+    return median_ms(per_request), median_ms(cached)
+
+
+async def measure_invoke(repeat):
+    cache = CompiledWorkflowCache()
+    workflow = build_pipeline()
+    per_request, cached = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await workflow.compile().ainvoke({"query": "q", "steps": 0})
+        per_request.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await cache.get("pipeline", build_pipeline, backend=NO_CHECKPOINTER).ainvoke({"query": "q", "steps": 0})
+        cached.append(time.perf_counter() - started)
+    return median_ms(per_request), median_ms(cached)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="LangGraph 워크플로우 캐시 벤치마크")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.repeat}회 반복 (중앙값)")
+    for module_name, attribute in AGENTS:
+        try:
+            agent = getattr(importlib.import_module(module_name), attribute)
+        except Exception as e:
+            print(f"{attribute}: 건너뜀 ({type(e).__name__}: {e})")
+            continue
+        compile_ms, cached_ms = measure_compile(agent.agent_id, agent._build_workflow, args.repeat)
+        print(f"{agent.agent_id}: 요청별 compile {compile_ms:.3f}ms | 캐시 조회 {cached_ms:.4f}ms")
+
+    compile_ms, cached_ms = await measure_invoke(args.repeat)
+    print(
+        f"8단계 그래프 전체 실행: 요청별 compile {compile_ms:.3f}ms | 캐시 {cached_ms:.3f}ms | "
+        f"호출당 {compile_ms - cached_ms:.3f}ms 절감"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
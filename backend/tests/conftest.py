@@ -0,0 +1,128 @@
+"""
+공통 테스트 설정 및 픽스처
+"""
+
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services.cache_backends import RedisCacheBackend, LocalRedisClient
+from app.agents.routing import intent_classifier as classifier_module
+from app.agents.routing.intent_classifier import DynamicIntentClassifier
+from app.agents.routing.local_intent_model import HashedNgramIntentModel
+from app.services import document_extraction_service as extraction_module
+from app.services.cache_manager import CacheManager
+from app.services.document_extraction_service import DocumentExtractionService, ExtractedSection
+from app.services.embedding_service import EmbeddingService
+from app.services.web_crawler import WebCrawlerService
+
+
+@pytest.fixture
+def local_redis_client():
+    """인메모리 Redis 호환 클라이언트"""
+    return LocalRedisClient()
+
+
+@pytest.fixture
+def redis_cache_backend(local_redis_client):
+    """인메모리 클라이언트를 쓰는 L2 캐시 백엔드"""
+    return RedisCacheBackend(local_redis_client)
+
+
+@pytest.fixture
+def cache_manager(redis_cache_backend):
+    """L2 백엔드를 연결한 캐시 매니저"""
+    return CacheManager(l2_backend=redis_cache_backend)
+
+
+class RecordingEncoder:
+    """배치 크기를 기록하는 테스트용 인코더 (워커 스레드에서 실행)"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, texts):
+        self.batches.append(len(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+@pytest.fixture
+def recording_encoder():
+    """텍스트 길이를 벡터로 돌려주는 인코더"""
+    return RecordingEncoder()
+
+
+@pytest.fixture
+def make_embedding_service(recording_encoder):
+    """같은 인코더를 공유하는 임베딩 서비스 생성 함수 (cache_dir를 주면 디스크 캐시 사용)"""
+    def make(cache_dir=""):
+        return EmbeddingService(
+            model_name="test/length",
+            encoder=recording_encoder,
+            max_batch_size=8,
+            max_batch_wait_ms=20,
+            max_workers=1,
+            cache_dir=cache_dir
+        )
+    return make
+
+
+@pytest.fixture
+def embedding_service(make_embedding_service):
+    """디스크 캐시 없는 임베딩 서비스 (종료는 테스트에서 await close())"""
+    return make_embedding_service()
+
+
+@pytest.fixture
+def document_extraction_service(tmp_path, monkeypatch):
+    """파서 대신 service.pages를 돌려주는 추출 서비스 (service.calls에 추출 호출 수 기록)"""
+    monkeypatch.setattr(extraction_module, "DOCUMENT_PROCESSING_AVAILABLE", True)
+    service = DocumentExtractionService(cache_dir=str(tmp_path / "cache"))
+    service.pages = []
+    service.calls = 0
+
+    async def fake_extract(kind, path):
+        service.calls += 1
+        for i, text in enumerate(service.pages):
+            yield ExtractedSection(index=i, text=text, page_number=i + 1)
+
+    service._extract = fake_extract
+    return service
+
+
+@pytest.fixture
+def intent_classifier(tmp_path):
+    """빈 로컬 모델을 임시 경로에 저장하는 의도 분류기 (샘플 20개부터 로컬 모델 사용)"""
+    classifier = DynamicIntentClassifier()
+    classifier.local_model = HashedNgramIntentModel(classifier._intent_labels)
+    classifier.local_model_path = str(tmp_path / "intent_model.npz")
+    classifier.local_min_samples = 20
+    return classifier
+
+
+@pytest.fixture
+def intent_llm(monkeypatch):
+    """의도 분류 LLM 호출 대체 (intent_llm.intent로 응답 지정, intent_llm.calls에 프롬프트 기록)"""
+    fake = SimpleNamespace(intent="web_search", calls=[])
+
+    async def generate_response(model_name, prompt, **kwargs):
+        fake.calls.append(prompt)
+        return json.dumps({"primary_intent": fake.intent, "confidence": 0.9}), model_name
+
+    monkeypatch.setattr(classifier_module.llm_router, "generate_response", generate_response)
+    return fake
+
+
+@pytest.fixture
+def make_web_crawler(tmp_path):
+    """요청을 handler로 처리하는 크롤러 생성 함수 (파싱은 이벤트 루프에서, 캐시는 임시 경로)"""
+    def make(handler, **kwargs):
+        return WebCrawlerService(
+            parse_workers=0,
+            cache_dir=str(tmp_path / "crawler"),
+            transport=httpx.MockTransport(handler),
+            **kwargs
+        )
+    return make
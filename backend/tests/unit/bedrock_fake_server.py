@@ -0,0 +1,136 @@
+"""
+로컬 가짜 Bedrock 엔드포인트
+- bedrock-runtime의 InvokeModel / InvokeModelWithResponseStream(AWS event stream 인코딩)을 흉내내는 FastAPI 앱
+- 마지막 사용자 메시지를 단어 단위로 되돌려주며, 응답 지연을 설정해 동시 처리량을 오프라인에서 측정 가능
+- 모델 ID가 "throttled"로 시작하면 429(ThrottlingException)로 응답
+
+사용법: python -m tests.unit.bedrock_fake_server [--port 8787] [--latency 0.5] [--chunk-delay 0.02]
+        BEDROCK_ENDPOINT_URL=http://127.0.0.1:8787 으로 백엔드 실행
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import struct
+import zlib
+from typing import Any, Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+def encode_event(headers: Dict[str, str], payload: bytes) -> bytes:
+    """AWS event stream 메시지 인코딩 (문자열 헤더만 사용)"""
+    encoded_headers = b""
+    for name, value in headers.items():
+        name_bytes, value_bytes = name.encode("utf-8"), value.encode("utf-8")
+        encoded_headers += (
+            struct.pack(">B", len(name_bytes)) + name_bytes
+            + struct.pack(">BH", 7, len(value_bytes)) + value_bytes
+        )
+    total_length = 12 + len(encoded_headers) + len(payload) + 4
+    prelude = struct.pack(">II", total_length, len(encoded_headers))
+    message = prelude + struct.pack(">I", zlib.crc32(prelude)) + encoded_headers + payload
+    return message + struct.pack(">I", zlib.crc32(message))
+
+
+def chunk_event(data: Dict[str, Any]) -> bytes:
+    payload = json.dumps({"bytes": base64.b64encode(json.dumps(data).encode("utf-8")).decode("ascii")})
+    return encode_event(
+        {":event-type": "chunk", ":content-type": "application/json", ":message-type": "event"},
+        payload.encode("utf-8")
+    )
+
+
+def _reply_words(body: Dict[str, Any]) -> List[str]:
+    user_turns = [m.get("content", "") for m in body.get("messages", []) if m.get("role") == "user"]
+    text = user_turns[-1] if user_turns else ""
+    if not isinstance(text, str):
+        text = json.dumps(text, ensure_ascii=False)
+    words = f"echo: {text}".split(" ")
+    return [word if i == len(words) - 1 else word + " " for i, word in enumerate(words)]
+
+
+def create_app(latency_seconds: float = 0.0, chunk_delay_seconds: float = 0.0) -> FastAPI:
+    """
+    가짜 Bedrock 앱 생성
+
+    Args:
+        latency_seconds: 첫 응답까지의 지연 (모델 처리 시간 흉내)
+        chunk_delay_seconds: 스트리밍 청크 사이 지연
+    """
+    app = FastAPI(title="Fake Bedrock Runtime")
+    app.state.requests = []
+
+    def _check_signature(request: Request):
+        authorization = request.headers.get("authorization", "")
+        if not authorization.startswith("AWS4-HMAC-SHA256 ") or "x-amz-date" not in request.headers:
+            return JSONResponse(status_code=403, content={"message": "Missing SigV4 signature"})
+        if request.path_params["model_id"].startswith("throttled"):
+            return JSONResponse(
+                status_code=429,
+                content={"message": "Too many requests"},
+                headers={"x-amzn-ErrorType": "ThrottlingException"}
+            )
+        return None
+
+    @app.post("/model/{model_id}/invoke")
+    async def invoke(model_id: str, request: Request):
+        denied = _check_signature(request)
+        if denied:
+            return denied
+        body = await request.json()
+        app.state.requests.append({"model_id": model_id, "action": "invoke", "body": body})
+        await asyncio.sleep(latency_seconds)
+        words = _reply_words(body)
+        return {
+            "id": f"msg_fake_{len(app.state.requests)}",
+            "type": "message",
+            "role": "assistant",
+            "model": model_id,
+            "content": [{"type": "text", "text": "".join(words)}],
+            "stop_reason": "end_turn",
+            "usage": {"input_tokens": len(json.dumps(body)) // 4, "output_tokens": len(words)},
+        }
+
+    @app.post("/model/{model_id}/invoke-with-response-stream")
+    async def invoke_stream(model_id: str, request: Request):
+        denied = _check_signature(request)
+        if denied:
+            return denied
+        body = await request.json()
+        app.state.requests.append({"model_id": model_id, "action": "stream", "body": body})
+        words = _reply_words(body)
+
+        async def events():
+            await asyncio.sleep(latency_seconds)
+            yield chunk_event({"type": "message_start", "message": {"model": model_id, "usage": {"input_tokens": 1}}})
+            yield chunk_event({"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}})
+            for word in words:
+                yield chunk_event({"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": word}})
+                if chunk_delay_seconds:
+                    await asyncio.sleep(chunk_delay_seconds)
+            yield chunk_event({"type": "content_block_stop", "index": 0})
+            yield chunk_event({
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn"},
+                "usage": {"output_tokens": len(words)}
+            })
+            yield chunk_event({"type": "message_stop"})
+
+        return StreamingResponse(events(), media_type="application/vnd.amazon.eventstream")
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="로컬 가짜 Bedrock 엔드포인트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--chunk-delay", type=float, default=0.02)
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.latency, args.chunk_delay), host=args.host, port=args.port)
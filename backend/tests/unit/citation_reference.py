@@ -0,0 +1,103 @@
+"""
+출처별 반복 탐색 인용 추출 (CitationService 단일 패스 매처 이전 구현)
+- 단일 패스 매처 결과 검증(test_citation_service)과 처리 시간 비교(scripts/benchmark_citation_matcher)용 기준 구현
+- 신뢰도 계산과 문맥 추출은 서비스 메서드를 그대로 사용
+"""
+
+import re
+import uuid
+from typing import List
+
+from app.models.citation import Citation, Source
+from app.services.citation_service import CitationService
+
+
+async def extract_citations_by_source(
+    service: CitationService,
+    response_text: str,
+    sources: List[Source],
+    min_confidence: float
+) -> List[Citation]:
+    """출처마다 제목 키워드/도메인/URL로 텍스트를 반복 탐색"""
+    citations = []
+
+    for source in sources:
+        citations.extend(await _find_title_citations(service, response_text, source, min_confidence))
+        citations.extend(await _find_domain_citations(service, response_text, source, min_confidence))
+        citations.extend(_find_url_citations(service, response_text, source))
+
+    # 같은 위치의 같은 소스는 중복으로 간주
+    seen = set()
+    unique_citations = []
+    for citation in citations:
+        key = (citation.source_id, citation.start_position, citation.end_position)
+        if key not in seen:
+            seen.add(key)
+            unique_citations.append(citation)
+    return sorted(unique_citations, key=lambda x: x.start_position)
+
+
+def _citation(service: CitationService, text: str, matched: str, source: Source, start: int, confidence: float) -> Citation:
+    return Citation(
+        id=f"cite_{uuid.uuid4().hex[:8]}",
+        text=matched,
+        source_id=source.id,
+        start_position=start,
+        end_position=start + len(matched),
+        confidence=confidence,
+        context=service._extract_context(text, start, start + len(matched))
+    )
+
+
+async def _find_title_citations(
+    service: CitationService,
+    text: str,
+    source: Source,
+    min_confidence: float
+) -> List[Citation]:
+    """제목의 주요 키워드(3글자 이상, 상위 5개) 기반 인용"""
+    citations = []
+    title_keywords = [word for word in source.title.split() if len(word) >= 3]
+
+    for keyword in title_keywords[:5]:
+        for match in re.finditer(re.escape(keyword), text, re.IGNORECASE):
+            confidence = await service._calculate_citation_confidence(keyword, source, "title_match")
+            if confidence >= min_confidence:
+                citations.append(_citation(service, text, keyword, source, match.start(), confidence))
+
+    return citations
+
+
+async def _find_domain_citations(
+    service: CitationService,
+    text: str,
+    source: Source,
+    min_confidence: float
+) -> List[Citation]:
+    """도메인의 회사/기관명 기반 인용"""
+    citations = []
+    if not source.domain:
+        return citations
+
+    domain_parts = source.domain.replace('www.', '').split('.')
+    main_domain = domain_parts[0] if domain_parts else ''
+
+    if len(main_domain) >= 3:
+        for match in re.finditer(re.escape(main_domain), text, re.IGNORECASE):
+            confidence = await service._calculate_citation_confidence(main_domain, source, "domain_match")
+            if confidence >= min_confidence:
+                citations.append(_citation(service, text, main_domain, source, match.start(), confidence))
+
+    return citations
+
+
+def _find_url_citations(service: CitationService, text: str, source: Source) -> List[Citation]:
+    """URL 기반 인용 (첫 번째 위치만, 100% 신뢰도)"""
+    if not source.url:
+        return []
+
+    url_str = str(source.url)
+    start_pos = text.find(url_str)
+    if start_pos < 0:
+        return []
+    return [_citation(service, text, url_str, source, start_pos, 1.0)]
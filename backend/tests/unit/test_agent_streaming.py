@@ -0,0 +1,180 @@
+"""
+에이전트 스트리밍 프로토콜(execute_stream) 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from app.agents.base import BaseAgent, AgentInput, AgentOutput, AgentStreamEvent
+from app.agents.workers.web_search import WebSearchAgent, SearchQuery, EnhancedSearchResult
+from app.services.web_crawler import WebCrawlResult
+
+
+class _EchoAgent(BaseAgent):
+    """execute만 구현한 테스트용 에이전트"""
+
+    def __init__(self):
+        super().__init__(agent_id="echo", name="Echo", description="테스트용")
+
+    async def execute(self, input_data, model="gemini", progress_callback=None):
+        output = self.create_output(
+            result=f"echo: {input_data.query}",
+            metadata={},
+            execution_time_ms=0,
+            model_used=model
+        )
+        output.citations = [{"id": "c1", "url": "https://example.com"}]
+        return output
+
+    def get_capabilities(self):
+        return []
+
+    def get_supported_models(self):
+        return ["gemini"]
+
+
+async def _collect(stream):
+    return [event async for event in stream]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAgentStreaming:
+    """execute_stream 이벤트 순서 및 내용 테스트"""
+
+    async def test_default_execute_stream_wraps_execute(self):
+        """기본 구현은 citations → token → result 순서로 execute 결과를 전달"""
+        agent = _EchoAgent()
+        events = await _collect(agent.execute_stream(AgentInput(query="안녕", user_id="u1")))
+
+        assert [e.type for e in events] == ["citations", "token", "result"]
+        assert events[1].text == "echo: 안녕"
+        assert isinstance(events[-1].output, AgentOutput)
+        assert events[-1].output.result == "echo: 안녕"
+
+    async def test_web_search_streams_llm_tokens_after_citations(self):
+        """웹 검색은 인용 정보를 먼저 보내고 LLM 토큰을 생성 순서대로 전달"""
+        agent = WebSearchAgent()
+        pipeline = {
+            "url_info": {"search_type": "general"},
+            "search_queries": [SearchQuery(query="파이썬", priority=1, intent_type="정보형", language="ko")],
+            "all_search_results": [],
+            "ranked_results": [
+                {"title": "Python", "url": "https://python.org", "snippet": "언어", "source": "google"}
+            ],
+        }
+
+        async def fake_stream(model_name, prompt, **kwargs):
+            for chunk in ["파이썬은 ", "프로그래밍 ", "언어입니다."]:
+                yield chunk
+
+        with patch.object(agent, "_run_search_pipeline", return_value=pipeline), \
+                patch("app.agents.workers.web_search.llm_router.stream_response", side_effect=fake_stream):
+            events = await _collect(agent.execute_stream(AgentInput(query="파이썬이 뭐야?", user_id="u1")))
+
+        assert events[0].type == "citations"
+        assert events[0].citations[0]["url"] == "https://python.org"
+        tokens = [e.text for e in events if e.type == "token"]
+        assert tokens == ["파이썬은 ", "프로그래밍 ", "언어입니다."]
+        assert events[-1].type == "result"
+        assert events[-1].output.result == "".join(tokens)
+        assert isinstance(events[-1], AgentStreamEvent)
+
+    async def test_web_search_emits_partial_citations_before_final(self):
+        """검색 결과가 도착하는 동안 중간 인용(partial)을 보내고 최종 인용으로 대체"""
+        agent = WebSearchAgent()
+        ranked = [{"title": "Python", "url": "https://python.org", "snippet": "언어", "source": "google"}]
+
+        async def fake_pipeline(input_data, model, progress_callback=None, partial_callback=None):
+            await partial_callback(ranked)
+            await partial_callback(ranked)  # 상위 결과가 같으면 다시 보내지 않음
+            return {
+                "url_info": {"search_type": "general"},
+                "search_queries": [SearchQuery(query="파이썬", priority=1, intent_type="정보형", language="ko")],
+                "all_search_results": [],
+                "ranked_results": ranked,
+            }
+
+        async def fake_stream(model_name, prompt, **kwargs):
+            yield "답변"
+
+        with patch.object(agent, "_run_search_pipeline", side_effect=fake_pipeline), \
+                patch("app.agents.workers.web_search.llm_router.stream_response", side_effect=fake_stream):
+            events = await _collect(agent.execute_stream(AgentInput(query="파이썬이 뭐야?", user_id="u1")))
+
+        citation_events = [e for e in events if e.type == "citations"]
+        assert [e.partial for e in citation_events] == [True, False]
+        assert events[-1].type == "result"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWebSearchParallelExecution:
+    """다중 검색어 동시 실행 수 제한 및 품질 기준 조기 종료 테스트"""
+
+    async def test_bounded_concurrency_and_early_stop(self):
+        agent = WebSearchAgent()
+        queries = [
+            SearchQuery(query=f"q{i}", priority=1 if i == 0 else 3, intent_type="정보형", language="ko")
+            for i in range(6)
+        ]
+        running = 0
+        peak = 0
+        started = []
+
+        async def fake_single(query, *args):
+            nonlocal running, peak
+            started.append(query.query)
+            running += 1
+            peak = max(peak, running)
+            try:
+                await asyncio.sleep(0.01 if query.priority == 1 else 0.05)
+                return EnhancedSearchResult(search_query=query, results=[], relevance_score=0.5, success=True)
+            finally:
+                running -= 1
+
+        arrived = []
+
+        async def on_result(result):
+            arrived.append(result.search_query.query)
+            return len(arrived) >= 2
+
+        with patch.object(agent, "_execute_single_search", side_effect=fake_single), \
+                patch("app.agents.workers.web_search.settings.WEB_SEARCH_MAX_CONCURRENT_QUERIES", 2):
+            results = await agent._execute_parallel_searches(queries, session=None, on_result=on_result)
+
+        assert peak <= 2
+        assert started[0] == "q0"  # 핵심 검색어부터 실행
+        assert arrived[0] == "q0"
+        assert len(results) == 2
+        assert len(started) < len(queries)  # 남은 검색은 시작 전에 취소
+
+    async def test_url_crawl_targets_fetched_in_one_batch(self):
+        """URL 크롤링 대상은 crawl_many 한 번으로 가져와 각 검색어에 나눠줌"""
+        agent = WebSearchAgent()
+        urls = ["https://a.example.com/1", "https://a.example.com/2"]
+        queries = [
+            SearchQuery(query=f"q{i}", priority=1, intent_type="정보형", language="ko", search_type="url_crawl", target_url=url)
+            for i, url in enumerate(urls + urls[:1])
+        ]
+        crawled_urls = []
+
+        async def fake_crawl_many(batch):
+            crawled_urls.append(list(batch))
+            return [WebCrawlResult(url=url, title=url) for url in batch]
+
+        async def fake_single(query, *args):
+            crawled = args[-1]
+            crawl_result = (await asyncio.shield(crawled))[query.target_url]
+            return EnhancedSearchResult(
+                search_query=query, results=[{"url": crawl_result.url}], relevance_score=0.5, success=True
+            )
+
+        with patch.object(agent, "_execute_single_search", side_effect=fake_single), \
+                patch("app.agents.workers.web_search.web_crawler.crawl_many", side_effect=fake_crawl_many):
+            results = await agent._execute_parallel_searches(queries, session=None)
+
+        assert crawled_urls == [urls]
+        assert sorted(r.results[0]["url"] for r in results) == sorted(urls + urls[:1])
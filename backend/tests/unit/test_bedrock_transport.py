@@ -0,0 +1,78 @@
+"""
+Bedrock 비동기 전송 계층 단위 테스트 (로컬 가짜 엔드포인트 사용)
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from botocore.credentials import Credentials
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from app.agents.bedrock_transport import BedrockAsyncTransport, BedrockError, ChatBedrockAsync
+from tests.unit.bedrock_fake_server import create_app
+
+MODEL_ID = "us.anthropic.claude-sonnet-4-20250514-v1:0"
+
+
+def _transport(app, credentials=None):
+    return BedrockAsyncTransport(
+        endpoint_url="http://fake-bedrock",
+        region="us-west-2",
+        credentials=credentials or Credentials("AKIDEXAMPLE", "secret"),
+        max_connections=32,
+        transport=httpx.ASGITransport(app=app)
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBedrockAsyncTransport:
+    """서명 요청, 이벤트 스트림 해석, 동시 호출 테스트"""
+
+    async def test_invoke_and_native_stream(self):
+        app = create_app()
+        transport = _transport(app)
+        model = ChatBedrockAsync(model_id=MODEL_ID, model_kwargs={"temperature": 0.7}, transport=transport)
+        messages = [SystemMessage(content="간결하게 답변"), HumanMessage(content="안녕 bedrock 스트림")]
+
+        response = await model.ainvoke(messages)
+        chunks = [chunk.content async for chunk in model.astream(messages)]
+        await transport.close()
+
+        assert response.content == "echo: 안녕 bedrock 스트림"
+        assert response.usage_metadata["output_tokens"] == 4
+        assert [chunk for chunk in chunks if chunk] == ["echo: ", "안녕 ", "bedrock ", "스트림"]
+
+        invoke_request, stream_request = app.state.requests
+        assert invoke_request["model_id"] == MODEL_ID and stream_request["action"] == "stream"
+        assert invoke_request["body"]["system"] == "간결하게 답변"
+        assert invoke_request["body"]["temperature"] == 0.7
+        assert invoke_request["body"]["anthropic_version"] == "bedrock-2023-05-31"
+
+    async def test_concurrent_calls_overlap_on_io(self):
+        """응답 지연이 있어도 동시 호출은 스레드 없이 겹쳐서 처리"""
+        transport = _transport(create_app(latency_seconds=0.1))
+        model = ChatBedrockAsync(model_id=MODEL_ID, transport=transport)
+
+        started = time.perf_counter()
+        responses = await asyncio.gather(*(model.ainvoke(f"질문 {i}") for i in range(20)))
+        elapsed = time.perf_counter() - started
+        await transport.close()
+
+        assert [r.content for r in responses] == [f"echo: 질문 {i}" for i in range(20)]
+        assert elapsed < 1.0  # 순차 처리라면 2초 이상
+
+    async def test_error_responses(self):
+        app = create_app()
+        transport = _transport(app)
+        with pytest.raises(BedrockError) as error:
+            await transport.invoke("throttled-model", {"messages": []})
+        assert error.value.status_code == 429 and "Too many requests" in str(error.value)
+
+        # 서명 없는 요청은 가짜 엔드포인트도 거부
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app)) as client:
+            response = await client.post(f"http://fake-bedrock/model/{MODEL_ID}/invoke", json={"messages": []})
+        await transport.close()
+        assert response.status_code == 403
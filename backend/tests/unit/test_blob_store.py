@@ -0,0 +1,58 @@
+"""
+콘텐츠 주소 기반 블롭 저장소 단위 테스트
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.services.blob_store import BlobStore, plan_sweep
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBlobStore:
+    """중복 제거 저장 및 GC 계획 테스트"""
+
+    async def test_same_content_is_stored_once(self, tmp_path):
+        """같은 내용은 블롭 하나를 공유하고 기존 경로로 모두 읽을 수 있음"""
+        store = BlobStore(root=str(tmp_path / "blobs"), upload_dir=str(tmp_path))
+        first = await store.store_bytes(b"same image", tmp_path / "generated_images" / "a.png")
+        second = await store.store_bytes(b"same image", tmp_path / "edited_images" / "b.jpg")
+
+        assert first.sha256 == second.sha256
+        assert not first.deduplicated and second.deduplicated
+        assert first.path.read_bytes() == second.path.read_bytes() == b"same image"
+        assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 1
+        assert store.stats["bytes_saved"] == len(b"same image")
+
+    async def test_discard_removes_new_blob_without_other_links(self, tmp_path):
+        """기록 전에 되돌린 새 블롭은 다른 링크가 없으면 삭제"""
+        store = BlobStore(root=str(tmp_path / "blobs"), upload_dir=str(tmp_path))
+        tmp_file = store.temp_path()
+        tmp_file.write_bytes(b"upload")
+        ref = await store.adopt_file(tmp_file, "ab" * 32, tmp_path / "user" / "f.txt")
+
+        await store.discard(ref)
+
+        assert not ref.path.exists()
+        assert not store.blob_path(ref.sha256).exists()
+
+    async def test_plan_sweep_keeps_referenced_and_recent_links(self):
+        """참조 행이 있거나 유예 기간 내인 링크는 유지, 링크가 모두 사라진 오래된 블롭만 삭제"""
+        now = datetime.utcnow()
+        old = now - timedelta(days=2)
+        cutoff = now - timedelta(days=1)
+        links = [
+            ("/u/file1", "shared", old),
+            ("/u/file2", "shared", old),
+            ("/u/orphan", "lonely", old),
+            ("/u/new", "fresh", now),
+        ]
+        blobs = [("shared", old), ("lonely", old), ("fresh", now)]
+
+        orphan_links, ref_counts, dead_blobs = plan_sweep(links, blobs, {"/u/file1": 2}, cutoff)
+
+        assert sorted(orphan_links) == [("/u/file2", "shared"), ("/u/orphan", "lonely")]
+        assert ref_counts == {"shared": 2, "lonely": 0, "fresh": 0}
+        assert dead_blobs == {"lonely"}
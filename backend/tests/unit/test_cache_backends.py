@@ -0,0 +1,144 @@
+"""
+교체 가능한 L2 캐시 백엔드 단위 테스트
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.repositories.cache import CacheRepository
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCacheBackends:
+    """L2 배치 조회/저장 및 히트 카운트 버퍼링 테스트"""
+
+    async def test_set_many_and_get_many_roundtrip(self, cache_manager, redis_cache_backend):
+        """배치로 저장한 값을 L1이 비어 있어도 L2에서 한 번에 조회"""
+        await cache_manager.set_many({"a": {"v": 1}, "b": [1, 2], "c": "text"})
+
+        cache_manager.l1_cache.clear()
+        values = await cache_manager.get_many(["a", "b", "c", "missing"])
+
+        assert values == {"a": {"v": 1}, "b": [1, 2], "c": "text"}
+        assert redis_cache_backend.stats()["hits"] == 3
+        assert redis_cache_backend.stats()["misses"] == 1
+        # L2 히트는 L1으로 승격
+        assert cache_manager.l1_cache.get("a") is not None
+
+    async def test_hit_counts_are_buffered_until_flush(self, cache_manager, redis_cache_backend, local_redis_client):
+        """히트 카운트는 읽기 경로에서 쓰지 않고 flush 시 한 번에 반영"""
+        await cache_manager.set("k", 42)
+
+        for _ in range(3):
+            cache_manager.l1_cache.clear()
+            assert await cache_manager.get("k") == 42
+
+        assert await local_redis_client.hget(redis_cache_backend.hits_key, "k") is None
+        assert await cache_manager.flush_hit_counters() == 3
+        assert int(await local_redis_client.hget(redis_cache_backend.hits_key, "k")) == 3
+
+    async def test_invalidate_pattern_removes_l2_entries(self, cache_manager):
+        """패턴 무효화는 L1과 L2 모두에서 제거"""
+        await cache_manager.set_many({"search:1": 1, "search:2": 2, "image:1": 3})
+
+        await cache_manager.invalidate_pattern("search:")
+        cache_manager.l1_cache.clear()
+
+        assert await cache_manager.get_many(["search:1", "search:2", "image:1"]) == {"image:1": 3}
+
+    async def test_invalidate_pattern_matches_glob_characters_literally(self, cache_manager):
+        """패턴의 글롭 문자(*?[])는 문자 그대로 매칭해 관련 없는 키를 지우지 않음"""
+        await cache_manager.set_many({"q:a*b": 1, "q:axxb": 2, "q:[ab]": 3, "q:a": 4, "q:a?": 5, "q:ab": 6})
+
+        await cache_manager.invalidate_pattern("a*b")
+        await cache_manager.invalidate_pattern("[ab]")
+        await cache_manager.invalidate_pattern("a?")
+        cache_manager.l1_cache.clear()
+
+        remaining = await cache_manager.get_many(["q:a*b", "q:axxb", "q:[ab]", "q:a", "q:a?", "q:ab"])
+        assert remaining == {"q:axxb": 2, "q:a": 4, "q:ab": 6}
+
+
+@pytest.mark.unit
+class TestPostgresCacheSerialization:
+    """cache_entries 값 직렬화 테스트"""
+
+    def test_serialization_accepts_datetime_and_uuid(self):
+        """PostgreSQL 백엔드도 다른 직렬화 경로처럼 JSON이 아닌 값을 문자열로 저장"""
+        value = {"at": datetime(2025, 1, 2, 3, 4, 5), "id": uuid.UUID(int=1)}
+        assert json.loads(CacheRepository._serialize(value)) == {
+            "at": "2025-01-02 03:04:05", "id": "00000000-0000-0000-0000-000000000001"
+        }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetOrCompute:
+    """get_or_compute 단일 실행 및 stale-while-revalidate 테스트"""
+
+    async def test_concurrent_misses_run_loader_once(self, cache_manager):
+        """같은 키의 동시 미스는 loader를 한 번만 실행하고 결과를 공유"""
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"answer": 42}
+
+        results = await asyncio.gather(*[
+            cache_manager.get_or_compute("hot", loader, ttl_seconds=60) for _ in range(10)
+        ])
+
+        assert calls == 1
+        assert all(result == {"answer": 42} for result in results)
+        assert cache_manager.get_stats()["single_flight"]["coalesced"] == 9
+
+        cache_manager.l1_cache.clear()
+        assert await cache_manager.get_or_compute("hot", loader, ttl_seconds=60) == {"answer": 42}
+        assert calls == 1
+
+    async def test_stale_value_is_served_while_refreshing(self, cache_manager):
+        """만료된 값은 stale 기간 동안 즉시 반환되고 백그라운드에서 갱신"""
+        version = 0
+
+        async def loader():
+            nonlocal version
+            version += 1
+            return version
+
+        assert await cache_manager.get_or_compute("k", loader, ttl_seconds=60, stale_ttl_seconds=60) == 1
+
+        # 저장된 항목을 만료 상태로 변경
+        entry = await cache_manager.get("k")
+        entry["expires_at"] = time.time() - 1
+        await cache_manager.set("k", entry, ttl_seconds=60)
+
+        assert await cache_manager.get_or_compute("k", loader, ttl_seconds=60, stale_ttl_seconds=60) == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await cache_manager.get_or_compute("k", loader, ttl_seconds=60, stale_ttl_seconds=60) == 2
+
+    async def test_invalidation_during_load_skips_store(self, cache_manager):
+        """로드 중 무효화되면 오래된 결과를 캐시에 저장하지 않음"""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader():
+            started.set()
+            await release.wait()
+            return "old"
+
+        task = asyncio.create_task(cache_manager.get_or_compute("doc:1", slow_loader, ttl_seconds=60))
+        await started.wait()
+        await cache_manager.invalidate_pattern("doc:")
+        release.set()
+
+        assert await task == "old"
+        assert await cache_manager.get("doc:1") is None
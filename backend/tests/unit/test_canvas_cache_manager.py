@@ -0,0 +1,97 @@
+"""
+Canvas 2-Tier 캐시 (바이트 예산 L1 + 공유 L2) 단위 테스트
+"""
+
+import pytest
+from uuid import uuid4
+
+from app.models.canvas_models import CanvasData, CanvasSyncState
+from app.services.cache_backends import RedisCacheBackend, LocalRedisClient
+from app.services.canvas_cache_manager import ByteBudgetCache, CanvasCacheManager
+
+
+def _make_canvas(name: str = "테스트 캔버스") -> CanvasData:
+    canvas_id = uuid4()
+    return CanvasData(
+        id=canvas_id,
+        workspace_id=uuid4(),
+        name=name,
+        sync_state=CanvasSyncState(canvas_id=canvas_id)
+    )
+
+
+@pytest.mark.unit
+class TestByteBudgetCache:
+    """바이트 예산 기반 LRU/LFU 축출 테스트"""
+
+    def test_lru_evicts_least_recently_used_by_bytes(self):
+        """바이트 예산을 넘으면 가장 오래 사용하지 않은 항목부터 축출"""
+        cache = ByteBudgetCache(max_bytes=30, max_items=100, policy="lru")
+        cache.set("a", "a" * 10, 10, 60)
+        cache.set("b", "b" * 10, 10, 60)
+        cache.set("c", "c" * 10, 10, 60)
+        cache.get("a")
+
+        cache.set("d", "d" * 10, 10, 60)
+
+        assert "b" not in cache
+        assert cache.keys() == ["a", "c", "d"]
+        assert cache.total_bytes == 30
+        assert cache.evictions == 1
+
+    def test_lfu_keeps_frequently_used_items(self):
+        """LFU는 접근 빈도가 가장 낮은 항목을 축출"""
+        cache = ByteBudgetCache(max_bytes=20, max_items=100, policy="lfu")
+        cache.set("hot", "h" * 10, 10, 60)
+        cache.set("cold", "c" * 10, 10, 60)
+        for _ in range(3):
+            cache.get("hot")
+        cache.get("cold")
+
+        cache.set("new", "n" * 10, 10, 60)
+
+        assert "hot" in cache
+        assert "cold" not in cache
+
+    def test_oversized_item_is_rejected(self):
+        """예산보다 큰 단일 항목은 저장하지 않음"""
+        cache = ByteBudgetCache(max_bytes=10, max_items=100)
+        assert cache.set("big", "x" * 11, 11, 60) is False
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCanvasCacheManager:
+    """공유 L2를 통한 Canvas 재사용 테스트"""
+
+    async def test_canvas_is_shared_across_instances_through_l2(self):
+        """다른 인스턴스(워커)에서 저장한 Canvas를 L2에서 조회하고 L1으로 승격"""
+        backend = RedisCacheBackend(LocalRedisClient())
+        writer = CanvasCacheManager(db_session=None, l2_backend=backend)
+        reader = CanvasCacheManager(db_session=None, l2_backend=backend)
+        canvas = _make_canvas()
+
+        assert await writer.set_canvas(canvas.id, canvas)
+        loaded = await reader.get_canvas(canvas.id)
+
+        assert loaded == canvas
+        assert reader._hit_counts['l2'] == 1
+        stats = await reader.get_cache_statistics()
+        assert stats['l1_memory_usage'] == len(canvas.model_dump_json().encode())
+
+        assert await reader.get_canvas(canvas.id) == canvas
+        assert reader._hit_counts['l1'] == 1
+
+    async def test_invalidate_removes_canvas_from_both_tiers(self):
+        """무효화 후에는 다른 인스턴스에서도 미스"""
+        backend = RedisCacheBackend(LocalRedisClient())
+        manager = CanvasCacheManager(db_session=None, l2_backend=backend)
+        canvas = _make_canvas()
+        await manager.set_canvas(canvas.id, canvas)
+
+        await manager.invalidate_canvas(canvas.id)
+
+        other = CanvasCacheManager(db_session=None, l2_backend=backend)
+        assert await manager.get_canvas(canvas.id) is None
+        assert await other.get_canvas(canvas.id) is None
@@ -0,0 +1,48 @@
+"""
+인용 추출 서비스 단위 테스트
+"""
+
+import pytest
+
+from app.services.citation_service import CitationService
+from tests.unit.citation_reference import extract_citations_by_source
+
+
+SEARCH_RESULTS = [
+    {"title": "JavaScript Script Guide", "url": "https://github.com/js/guide", "score": 0.9},
+    {"title": "script tutorial for JAVASCRIPT", "url": "https://developer.mozilla.org/docs"},
+    {"title": "GitHub Docs aaa", "url": "https://docs.github.com/"},
+    {"title": "뉴스 기사 모음", "url": "https://news.naver.com/article/1"},
+]
+
+RESPONSE = (
+    "JavaScript 가이드(https://github.com/js/guide)에 따르면 script 태그는... "
+    "GitHub 문서와 github 예제, aaaaaaa 패턴, mozilla 문서 참고. "
+    "다시 https://github.com/js/guide 와 뉴스 기사 모음을 보세요. javascript SCRIPT"
+)
+
+
+def _signature(citations):
+    return [(c.text, c.source_id, c.start_position, c.end_position, c.confidence, c.context) for c in citations]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCitationMatcher:
+    """단일 패스 매처와 출처별 반복 탐색 결과 비교"""
+
+    @pytest.mark.parametrize("min_confidence", [0.0, 0.3, 0.7])
+    async def test_single_pass_matches_reference(self, min_confidence):
+        """겹치는 키워드, 대소문자 차이, 반복 URL이 있어도 기준 구현과 같은 인용을 같은 순서로 반환"""
+        service = CitationService(logging_service=None)
+        sources = await service._process_search_results(SEARCH_RESULTS)
+
+        expected = await extract_citations_by_source(service, RESPONSE, sources, min_confidence)
+        actual = await service._extract_citations(RESPONSE, sources, min_confidence)
+
+        assert _signature(actual) == _signature(expected)
+        assert expected  # URL 매치는 항상 존재
+
+    async def test_no_sources(self):
+        service = CitationService(logging_service=None)
+        assert await service._extract_citations(RESPONSE, [], 0.0) == []
@@ -0,0 +1,190 @@
+"""
+대화 컨텍스트 증분 캐시 단위 테스트
+"""
+
+import random
+import time
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.conversation_context_cache import ConversationContextState, ConversationContextStore
+from app.services.conversation_memory_service import ConversationMemoryService
+
+
+def _random_messages(rnd: random.Random, count: int):
+    words = ["파이썬", "설치", "방법", "python", "install", "에러", "error", "버전", "3.11", ""]
+    return [
+        {
+            "id": str(i),
+            "role": rnd.choice(["user", "assistant", "assistant", "system"]),
+            "content": " ".join(rnd.choice(words) for _ in range(rnd.randint(0, 6))),
+            "created_at": f"2025-01-01T00:00:{i:02d}",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestConversationContextState:
+    """증분 Q&A 쌍/토큰 추정이 전체 재계산과 같은지 확인"""
+
+    def test_incremental_matches_full_rebuild(self):
+        service = ConversationMemoryService()
+        rnd = random.Random(3)
+        for _ in range(200):
+            messages = _random_messages(rnd, rnd.randint(0, 30))
+            state = ConversationContextState(conversation_id="c1", user_id="u1", max_messages=100)
+            for message in messages:
+                state.append(message)
+
+            pairs, counts = state.pairs()
+            assert pairs == service._group_messages_to_qa_pairs(messages)
+
+            summary = rnd.choice(["", "이전 대화 요약 summary"])
+            short_term, short_counts = pairs[-5:], counts[-5:]
+            prompt = service._build_context_prompt(summary, short_term)
+            assert service._estimate_context_tokens(summary, short_term, short_counts) == service._estimate_tokens(prompt)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestConversationContextStore:
+    """로드/추가/무효화 테스트"""
+
+    async def test_loads_once_and_appends_new_messages(self):
+        store = ConversationContextStore(max_conversations=2, max_messages=10)
+        loaded = ConversationContextState(conversation_id="c1", user_id="u1", max_messages=10)
+        loaded.append({"role": "USER", "content": "안녕"})
+
+        with patch.object(store, "_load", AsyncMock(return_value=loaded)) as load:
+            state = await store.get("c1", session=None)
+            store.append("c1", {"role": "assistant", "content": "반갑습니다"})
+            again = await store.get("c1", session=None)
+
+        assert load.await_count == 1
+        assert again is state
+        assert state.pairs()[0] == [{
+            "question": "안녕", "question_time": "", "answer": "반갑습니다", "answer_time": ""
+        }]
+        assert [m["role"] for m in state.recent_messages(10)] == ["USER", "ASSISTANT"]
+
+        store.invalidate("c1")
+        assert store.get_stats()["conversations"] == 0
+
+    async def test_not_cached_when_message_added_during_load(self):
+        store = ConversationContextStore(max_conversations=2, max_messages=10)
+
+        async def slow_load(conversation_id, session):
+            store.append(conversation_id, {"role": "user", "content": "로드 중 추가"})
+            return ConversationContextState(conversation_id=conversation_id, user_id="u1", max_messages=10)
+
+        with patch.object(store, "_load", side_effect=slow_load):
+            await store.get("c1", session=None)
+
+        assert store.get_stats()["conversations"] == 0
+
+
+def _long_conversation(state: ConversationContextState, pairs: int):
+    for i in range(pairs):
+        state.append({"role": "user", "content": f"질문 {i}", "created_at": f"2025-01-01T00:{i:02d}:00"})
+        state.append({"role": "assistant", "content": f"답변 {i}", "created_at": f"2025-01-01T00:{i:02d}:30"})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBackgroundSummarization:
+    """요청 경로는 요약을 기다리지 않고, 요약은 작업자가 증분 생성"""
+
+    async def test_request_path_never_waits_for_llm(self):
+        from app.services import conversation_memory_service as memory_module
+
+        service = ConversationMemoryService()
+        state = ConversationContextState(conversation_id="c1", user_id="u1", max_messages=100)
+        _long_conversation(state, 8)
+
+        with patch.object(memory_module.conversation_context_store, "get", AsyncMock(return_value=state)), \
+                patch.object(service, "_latest_summary_record", AsyncMock(return_value=None)), \
+                patch.object(service, "_summarize_with_llm", AsyncMock()) as llm, \
+                patch.object(memory_module.conversation_summary_worker, "notify") as notify:
+            context = await service._build_context("c1", "u1", session=None)
+
+        llm.assert_not_awaited()
+        notify.assert_called_once_with("c1")
+        assert len(context["short_term_memory"]) == 5
+        assert "질문 0" in context["long_term_memory"]  # 요약이 없으면 규칙 기반 요약 사용
+
+    async def test_worker_summarizes_only_new_pairs(self):
+        from app.services import conversation_memory_service as memory_module
+
+        service = ConversationMemoryService()
+        worker = memory_module.ConversationSummaryWorker(service, min_new_pairs=2, concurrency=1)
+        state = ConversationContextState(conversation_id="c1", user_id="u1", max_messages=100)
+        _long_conversation(state, 10)  # 장기 구간 5쌍
+
+        previous = SimpleNamespace(
+            conversation_id="c1", version=1, summary_text="이전 요약", pairs_covered=3,
+            covered_until="2025-01-01T00:02:00"
+        )
+        session = AsyncMock()
+        session.add = lambda record: added.append(record)
+        added = []
+
+        class _Session:
+            async def __aenter__(self):
+                return session
+
+            async def __aexit__(self, *args):
+                return False
+
+        with patch.object(memory_module, "AsyncSessionLocal", _Session), \
+                patch.object(memory_module, "ConversationSummaryVersion", lambda **kwargs: SimpleNamespace(**kwargs)), \
+                patch.object(memory_module.conversation_context_store, "get", AsyncMock(return_value=state)), \
+                patch.object(service, "_latest_summary_record", AsyncMock(return_value=previous)), \
+                patch.object(service, "_summarize_with_llm", AsyncMock(return_value=("갱신된 요약", "gemini-2.0-flash"))) as llm:
+            assert await worker._summarize("c1") is True
+
+        new_pairs, previous_summary = llm.await_args.args
+        assert [p["question"] for p in new_pairs] == ["질문 3", "질문 4"]
+        assert previous_summary == "이전 요약"
+        assert added[0].version == 2 and added[0].base_version == 1 and added[0].pairs_covered == 5
+        assert state.summary == "갱신된 요약" and state.summary_version == 2
+        assert state.unsummarized_pairs(service.short_term_limit) == []
+
+    async def test_worker_does_not_save_mock_or_fallback_summary(self):
+        from app.services import conversation_memory_service as memory_module
+
+        service = ConversationMemoryService()
+        worker = memory_module.ConversationSummaryWorker(service, min_new_pairs=1, concurrency=1)
+        state = ConversationContextState(conversation_id="c1", user_id="u1", max_messages=100)
+        _long_conversation(state, 8)
+
+        session = AsyncMock()
+        session.add = lambda record: added.append(record)
+        added = []
+
+        class _Session:
+            async def __aenter__(self):
+                return session
+
+            async def __aexit__(self, *args):
+                return False
+
+        for model_used in ("mock-gemini", "mock-gemini-fallback"):
+            with patch.object(memory_module, "AsyncSessionLocal", _Session), \
+                    patch.object(memory_module.conversation_context_store, "get", AsyncMock(return_value=state)), \
+                    patch.object(service, "_latest_summary_record", AsyncMock(return_value=None)), \
+                    patch.object(service, "_summarize_with_llm", AsyncMock(return_value=("Mock 응답", model_used))):
+                assert await worker._summarize("c1") is False
+
+        assert added == []
+        assert state.summary is None
+        assert worker.stats["failed"] == 2 and worker.stats["summarized"] == 0
+
+        # 실패한 대화는 다음 턴에 다시 대기열에 넣지 않음 (연속 실패마다 대기 시간 두 배)
+        retry_at, failures = worker._backoff["c1"]
+        assert failures == 2 and retry_at > time.time()
+        with patch.object(memory_module.conversation_context_store, "peek", return_value=state):
+            assert worker.notify("c1") is False
+        assert worker.stats["queued"] == 0 and worker.stats["backed_off"] == 1
@@ -0,0 +1,36 @@
+"""
+문서 추출 서비스 단위 테스트
+"""
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestDocumentExtractionService:
+    """체크섬 기준 추출 캐시 테스트"""
+
+    async def test_same_file_is_extracted_once(self, document_extraction_service):
+        """같은 파일 내용은 다시 파싱하지 않고 캐시된 페이지를 순서대로 스트리밍"""
+        document_extraction_service.pages = ["첫 페이지", "둘째 페이지"]
+
+        first = [s.text async for s in document_extraction_service.iter_sections("pdf", content=b"%PDF-1.4 same")]
+        second = [s async for s in document_extraction_service.iter_sections("pdf", content=b"%PDF-1.4 same")]
+
+        assert first == ["첫 페이지", "둘째 페이지"]
+        assert [s.text for s in second] == first
+        assert [s.page_number for s in second] == [1, 2]
+        assert document_extraction_service.calls == 1
+        assert document_extraction_service.stats["cache_hits"] == 1
+
+    async def test_partially_consumed_extraction_is_not_cached(self, document_extraction_service, tmp_path):
+        """소비자가 중간에 멈춘 추출 결과는 캐시하지 않음"""
+        document_extraction_service.pages = ["a", "b", "c"]
+
+        sections = document_extraction_service.iter_sections("pdf", content=b"doc", checksum="abc123")
+        assert (await sections.__anext__()).text == "a"
+        await sections.aclose()
+
+        assert [s.text async for s in document_extraction_service.iter_sections("pdf", content=b"doc", checksum="abc123")] == ["a", "b", "c"]
+        assert document_extraction_service.calls == 2
+        assert not list((tmp_path / "cache").rglob("*.tmp"))
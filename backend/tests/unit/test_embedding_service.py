@@ -0,0 +1,56 @@
+"""
+배치 임베딩 서비스 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestEmbeddingService:
+    """동적 배치, 캐시, 지표 테스트"""
+
+    async def test_concurrent_requests_share_batches(self, embedding_service, recording_encoder):
+        """동시 요청의 텍스트는 하나의 배치로 묶이고 중복 텍스트는 한 번만 인코딩"""
+        results = await asyncio.gather(
+            embedding_service.embed(["a", "bb"]),
+            embedding_service.embed(["ccc", "a"]),
+            embedding_service.embed_query("dddd"),
+        )
+        await embedding_service.close()
+
+        assert results == [[[1.0, 1.0], [2.0, 1.0]], [[3.0, 1.0], [1.0, 1.0]], [4.0, 1.0]]
+        assert recording_encoder.batches == [4]
+        metrics = embedding_service.get_metrics()
+        assert metrics["texts_embedded"] == 4
+        assert metrics["batch_fill_ratio"] == 0.5
+
+    async def test_vectors_are_served_from_memory_and_disk_cache(self, make_embedding_service, recording_encoder, tmp_path):
+        """같은 텍스트는 다시 인코딩하지 않으며, 새 인스턴스는 디스크 캐시를 사용"""
+        service = make_embedding_service(cache_dir=str(tmp_path))
+        await service.embed(["hello", "world"])
+        assert await service.embed(["hello"]) == [[5.0, 1.0]]
+        await service.close()
+        assert recording_encoder.batches == [2]
+
+        restarted = make_embedding_service(cache_dir=str(tmp_path))
+        assert await restarted.embed(["world", "new"]) == [[5.0, 1.0], [3.0, 1.0]]
+        await restarted.close()
+
+        assert recording_encoder.batches == [2, 1]
+        assert restarted.get_metrics()["disk_hits"] == 1
+
+    async def test_cancelled_caller_does_not_cancel_coalesced_waiters(self, embedding_service):
+        """합류한 요청 하나가 취소되어도 같은 텍스트를 기다리는 다른 요청은 결과를 받음"""
+        first = asyncio.create_task(embedding_service.embed(["shared"]))
+        second = asyncio.create_task(embedding_service.embed(["shared"]))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == [[6.0, 1.0]]
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        await embedding_service.close()
+        assert embedding_service.get_metrics()["coalesced"] == 1
@@ -0,0 +1,44 @@
+"""
+스트리밍 파일 업로드 단위 테스트
+"""
+
+import hashlib
+import io
+
+import pytest
+from fastapi import UploadFile
+
+from app.api.v1 import files as files_api
+from app.api.v1.files import FileTooLargeError, stream_upload_to_disk
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStreamUploadToDisk:
+    """저장과 체크섬 계산을 한 번에 수행하는 업로드 테스트"""
+
+    async def test_checksum_is_computed_while_writing(self, tmp_path, monkeypatch):
+        """여러 청크로 저장해도 크기와 MD5가 원본과 일치"""
+        monkeypatch.setattr(files_api, "UPLOAD_CHUNK_SIZE", 7)
+        data = b"streamed upload payload " * 10
+        target = tmp_path / "out.txt"
+
+        file_size, checksum, sha256 = await stream_upload_to_disk(
+            UploadFile(file=io.BytesIO(data), filename="a.txt"), target
+        )
+
+        assert file_size == len(data)
+        assert checksum == hashlib.md5(data).hexdigest()
+        assert sha256 == hashlib.sha256(data).hexdigest()
+        assert target.read_bytes() == data
+
+    async def test_oversized_upload_is_aborted_and_removed(self, tmp_path, monkeypatch):
+        """최대 크기를 넘으면 스트리밍 중 중단하고 부분 파일을 삭제"""
+        monkeypatch.setattr(files_api, "UPLOAD_CHUNK_SIZE", 4)
+        monkeypatch.setattr(files_api, "MAX_FILE_SIZE", 10)
+        target = tmp_path / "big.bin"
+
+        with pytest.raises(FileTooLargeError):
+            await stream_upload_to_disk(UploadFile(file=io.BytesIO(b"x" * 32), filename="big.bin"), target)
+
+        assert not target.exists()
@@ -0,0 +1,72 @@
+"""
+의도 분류기 로컬 단계 단위 테스트
+"""
+
+import pytest
+
+from app.agents.routing.intent_classifier import IntentType
+from app.agents.routing.local_intent_model import HashedNgramIntentModel
+
+TRAINING = [
+    ("오늘 서울 날씨 알려줘", "web_search"),
+    ("최신 주가 검색해줘", "web_search"),
+    ("근처 맛집 찾아줘", "web_search"),
+    ("고양이 그림 그려줘", "canvas"),
+    ("로고 이미지 만들어줘", "canvas"),
+    ("매출 차트 그려줘", "canvas"),
+    ("양자역학이 뭐야", "general_chat"),
+    ("재귀 함수 원리 설명해줘", "general_chat"),
+    ("시 한 편 써줘", "general_chat"),
+]
+
+
+@pytest.mark.unit
+class TestHashedNgramIntentModel:
+    """해시 n-gram 모델 학습/저장 테스트"""
+
+    def test_learns_intents_and_survives_reload(self, tmp_path):
+        model = HashedNgramIntentModel([intent.value for intent in IntentType])
+        for _ in range(20):
+            for text, label in TRAINING:
+                model.partial_fit(text, label)
+
+        assert model.predict("내일 부산 날씨 알려줘")[0] == "web_search"
+        assert model.predict("강아지 그림 그려줘")[0] == "canvas"
+
+        path = str(tmp_path / "model.npz")
+        model.save(path)
+        reloaded = HashedNgramIntentModel.load(path, model.labels)
+        assert reloaded.predict_proba("강아지 그림 그려줘") == pytest.approx(model.predict_proba("강아지 그림 그려줘"))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLocalClassificationTiers:
+    """질의 캐시 → 로컬 모델 → LLM 단계 테스트"""
+
+    async def test_repeat_and_learned_queries_skip_llm(self, intent_classifier, intent_llm):
+        first = await intent_classifier._classify_intent("오늘 서울 날씨 알려줘", None, None, "mock")
+        again = await intent_classifier._classify_intent("오늘  서울 날씨 알려줘!", None, None, "mock")
+        assert first.primary_intent == again.primary_intent == IntentType.WEB_SEARCH
+        assert len(intent_llm.calls) == 1
+        assert again.context_factors == ["query_cache"]
+
+        # 충분히 학습되면 처음 보는 질의도 로컬 모델이 처리
+        for _ in range(25):
+            assert intent_classifier.train_from_history([
+                {"query": text, "primary_intent": label, "confidence": 0.9} for text, label in TRAINING
+            ]) == len(TRAINING)
+        result = await intent_classifier._classify_intent("고양이 이미지 그려줘", None, None, "mock")
+        assert result.primary_intent == IntentType.CANVAS
+        assert result.context_factors == ["local_model"]
+        assert len(intent_llm.calls) == 1
+
+    async def test_correction_updates_cached_intent(self, intent_classifier, intent_llm):
+        intent_classifier.local_min_samples = 10_000
+        intent_llm.intent = "general_chat"
+
+        await intent_classifier._classify_intent("파이썬 최신 버전", None, None, "mock")
+        await intent_classifier.record_correction("user-1", "general_chat", "web_search", "파이썬 최신 버전")
+
+        result = await intent_classifier._classify_intent("파이썬 최신 버전", None, None, "mock")
+        assert result.primary_intent == IntentType.WEB_SEARCH
@@ -0,0 +1,220 @@
+"""
+LangGraph 비동기 일괄 기록 체크포인터 단위 테스트 (메모리 저장소로 DB 왕복 횟수 측정)
+"""
+
+import operator
+from datetime import datetime, timedelta
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from app.agents.langgraph_checkpointer import AsyncPooledCheckpointer
+from app.agents.workflow_cache import ASYNC_POSTGRES_CHECKPOINTER, CompiledWorkflowCache
+
+
+class _MemoryStore:
+    """SQLCheckpointStore와 같은 인터페이스의 메모리 저장소 (write_batch 호출 = 트랜잭션 1회)"""
+
+    def __init__(self):
+        self.checkpoints = {}
+        self.writes = {}
+        self.batches = []
+        self.fetches = 0
+        self.fail_next = False
+
+    async def write_batch(self, checkpoints, writes):
+        if self.fail_next:
+            self.fail_next = False
+            raise ConnectionError("db down")
+        self.batches.append((len(checkpoints), len(writes)))
+        for row in checkpoints:
+            self.checkpoints[(row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"])] = row
+        for row in writes:
+            key = (row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"], row["task_id"], row["idx"])
+            if row["idx"] < 0 or key not in self.writes:
+                self.writes[key] = row
+
+    async def fetch_checkpoints(self, thread_id, checkpoint_ns=None, checkpoint_id=None, before_id=None, limit=None):
+        self.fetches += 1
+        rows = [
+            row for (thread, ns, cid), row in self.checkpoints.items()
+            if thread == thread_id
+            and (checkpoint_ns is None or ns == checkpoint_ns)
+            and (not checkpoint_id or cid == checkpoint_id)
+            and (not before_id or cid < before_id)
+        ]
+        rows.sort(key=lambda row: row["checkpoint_id"], reverse=True)
+        return rows[:limit] if limit else rows
+
+    async def fetch_writes(self, thread_id, checkpoint_ns, checkpoint_id):
+        return [row for key, row in sorted(self.writes.items()) if key[:3] == (thread_id, checkpoint_ns, checkpoint_id)]
+
+    async def delete_thread(self, thread_id):
+        self.checkpoints = {k: v for k, v in self.checkpoints.items() if k[0] != thread_id}
+        self.writes = {k: v for k, v in self.writes.items() if k[0] != thread_id}
+
+    async def prune(self, cutoff):
+        latest = {}
+        for (thread, _, _), row in self.checkpoints.items():
+            latest[thread] = max(latest.get(thread, row["created_at"]), row["created_at"])
+        stale = [thread for thread, created_at in latest.items() if created_at < cutoff]
+        for thread in stale:
+            await self.delete_thread(thread)
+        return len(stale)
+
+
+class _State(TypedDict):
+    query: str
+    steps: int
+
+
+class _TurnState(TypedDict):
+    query: str
+    errors: Annotated[List[str], operator.add]
+
+
+def _workflow(nodes: int = 8):
+    workflow = StateGraph(_State)
+
+    async def step(state: _State):
+        return {"steps": state["steps"] + 1}
+
+    names = [f"step_{i}" for i in range(nodes)]
+    for name in names:
+        workflow.add_node(name, step)
+    workflow.set_entry_point(names[0])
+    for current, following in zip(names, names[1:]):
+        workflow.add_edge(current, following)
+    workflow.add_edge(names[-1], END)
+    return workflow
+
+
+def _pipeline(checkpointer, nodes: int = 8):
+    return _workflow(nodes).compile(checkpointer=checkpointer)
+
+
+def _checkpointer(store, ttl_hours=0):
+    return AsyncPooledCheckpointer(store, batch_size=1000, flush_interval_ms=10_000, ttl_hours=ttl_hours)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAsyncPooledCheckpointer:
+    """단계별 쓰기 일괄 기록, 최종 상태만 저장, TTL 정리 테스트"""
+
+    async def test_step_writes_are_batched_into_one_transaction(self):
+        store = _MemoryStore()
+        checkpointer = _checkpointer(store)
+        app = _pipeline(checkpointer)
+        config = {"configurable": {"thread_id": "user_session"}}
+
+        result = await app.ainvoke({"query": "q", "steps": 0}, config=config, durability="async")
+        # 실행 시작 시 한 번 읽고 나머지 단계 쓰기는 모두 버퍼에 쌓임
+        assert store.batches == []
+        await checkpointer.aflush()
+
+        assert result["steps"] == 8
+        assert len(store.batches) == 1
+        checkpoints, writes = store.batches[0]
+        assert checkpoints >= 9 and writes >= 8
+
+        # 같은 스레드의 다음 실행은 저장된 최신 상태를 읽음
+        state = await app.aget_state(config)
+        assert state.values["steps"] == 8
+        await checkpointer.aclose()
+
+    async def test_exit_durability_stores_final_state_only(self):
+        store = _MemoryStore()
+        checkpointer = _checkpointer(store)
+        app = _pipeline(checkpointer)
+        config = {"configurable": {"thread_id": "supervisor_user_session"}}
+
+        await app.ainvoke({"query": "q", "steps": 0}, config=config, durability="exit")
+        await checkpointer.aclose()
+
+        assert len(store.checkpoints) == 1
+        assert checkpointer.stats["checkpoints"] == 1
+        state = await app.aget_state(config)
+        assert state.values["steps"] == 8
+
+    async def test_failed_flush_is_retried_and_stale_threads_pruned(self):
+        store = _MemoryStore()
+        checkpointer = _checkpointer(store, ttl_hours=1)
+        app = _pipeline(checkpointer, nodes=2)
+
+        await app.ainvoke({"query": "q", "steps": 0}, config={"configurable": {"thread_id": "old"}})
+        store.fail_next = True
+        with pytest.raises(ConnectionError):
+            await checkpointer.aflush()
+        assert checkpointer.get_stats()["pending_checkpoints"] > 0
+
+        await checkpointer.aflush()
+        await app.ainvoke({"query": "q", "steps": 0}, config={"configurable": {"thread_id": "new"}})
+        await checkpointer.aflush()
+        for key, row in store.checkpoints.items():
+            if key[0] == "old":
+                row["created_at"] = datetime.utcnow() - timedelta(hours=2)
+
+        assert await checkpointer.aprune() == 1
+        assert {key[0] for key in store.checkpoints} == {"new"}
+        await checkpointer.aclose()
+
+    async def test_each_turn_starts_with_empty_reducer_fields(self):
+        """같은 대화의 다음 턴이 이전 턴의 errors 등 누적 필드를 이어받지 않음"""
+        store = _MemoryStore()
+        checkpointer = _checkpointer(store)
+        cache = CompiledWorkflowCache()
+        cache._checkpointers[ASYNC_POSTGRES_CHECKPOINTER] = checkpointer
+
+        def build():
+            workflow = StateGraph(_TurnState)
+
+            async def work(state: _TurnState):
+                return {"errors": ["boom"] if state["query"] == "fail" else []}
+
+            workflow.add_node("work", work)
+            workflow.set_entry_point("work")
+            workflow.add_edge("work", END)
+            return workflow
+
+        app = cache.get("agent", build, backend=ASYNC_POSTGRES_CHECKPOINTER)
+        first = await app.ainvoke(
+            {"query": "fail", "errors": []},
+            **cache.run_options("supervisor_user_session", backend=ASYNC_POSTGRES_CHECKPOINTER)
+        )
+        second = await app.ainvoke(
+            {"query": "ok", "errors": []},
+            **cache.run_options("supervisor_user_session", backend=ASYNC_POSTGRES_CHECKPOINTER)
+        )
+        await checkpointer.aclose()
+
+        assert first["errors"] == ["boom"]
+        assert second["errors"] == []
+        assert len({key[0] for key in store.checkpoints}) == 2
+
+    async def test_fresh_runs_do_no_reads_or_forced_flushes(self):
+        """실행마다 새 스레드면 그래프 시작 시 DB 조회/강제 기록 없음, 쓰기는 한 번에 기록"""
+        store = _MemoryStore()
+        checkpointer = _checkpointer(store)
+        cache = CompiledWorkflowCache()
+        cache._checkpointers[ASYNC_POSTGRES_CHECKPOINTER] = checkpointer
+        app = cache.get("agent", _workflow, backend=ASYNC_POSTGRES_CHECKPOINTER)
+
+        for _ in range(30):
+            await app.ainvoke(
+                {"query": "q", "steps": 0},
+                **cache.run_options("supervisor_user_session", backend=ASYNC_POSTGRES_CHECKPOINTER)
+            )
+
+        assert store.fetches == 0 and store.batches == []
+        assert checkpointer.stats["skipped_reads"] == 30 and checkpointer.stats["read_flushes"] == 0
+
+        # 다른 스레드 행만 쌓여 있으면 조회 전에 기록하지 않고, 같은 스레드 행이 있을 때만 기록
+        config = {"configurable": {"thread_id": "resumable"}}
+        await app.ainvoke({"query": "q", "steps": 0}, config=config, durability="exit")
+        await app.aget_state(config)
+        assert checkpointer.stats["read_flushes"] == 1 and len(store.batches) == 1
+        await app.aget_state(config)
+        assert checkpointer.stats["read_flushes"] == 1 and store.fetches == 2
+        await checkpointer.aclose()
@@ -0,0 +1,81 @@
+"""
+LLM 클라이언트 레지스트리 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.agents import llm_client_registry as registry_module
+from app.agents.llm_client_registry import ANTHROPIC, GOOGLE, LLMClientRegistry
+
+
+class _FakeModel:
+    def __init__(self, model, params, fail=False):
+        self.model = model
+        self.params = params
+        self.fail = fail
+        self.active = 0
+        self.max_active = 0
+
+    async def ainvoke(self, prompt):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail:
+                raise RuntimeError("provider error")
+            return f"{self.model}: {prompt}"
+        finally:
+            self.active -= 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLLMClientRegistry:
+    """클라이언트 재사용, 제공자별 동시 호출 제한, 상태 추적 테스트"""
+
+    async def test_fan_out_reuses_one_client_per_key(self):
+        registry = LLMClientRegistry(max_concurrency=3)
+        created = []
+
+        def factory(model, params):
+            created.append((model, params))
+            return _FakeModel(model, params)
+
+        registry.register_factory(ANTHROPIC, factory)
+        registry.register_factory(GOOGLE, factory)
+
+        clients = [registry.for_model_name("claude-sonnet", temperature=0.3) for _ in range(10)]
+        results = await asyncio.gather(*(client.ainvoke(f"작업 {i}") for i, client in enumerate(clients)))
+
+        assert all(client is clients[0] for client in clients)
+        assert results[9] == "claude-sonnet: 작업 9"
+        assert clients[0].client.max_active == 3
+        assert clients[0].health.calls == 10
+
+        # 파라미터나 제공자가 다르면 별도 클라이언트
+        assert registry.for_model_name("claude-sonnet", temperature=0.1) is not clients[0]
+        assert registry.for_model_name("gemini-pro", temperature=0.3).provider == GOOGLE
+        assert registry.for_model_name("unknown").model == registry_module.DEFAULT_ANTHROPIC_MODEL
+        assert len(created) == 4
+        assert registry.get_stats()["reused"] == 9
+
+    async def test_consecutive_failures_mark_client_unhealthy(self, monkeypatch):
+        monkeypatch.setattr(registry_module.settings, "LLM_CLIENT_UNHEALTHY_AFTER_FAILURES", 2)
+        monkeypatch.setattr(registry_module.settings, "LLM_CLIENT_UNHEALTHY_COOLDOWN_SECONDS", 30)
+        now = [1000.0]
+        monkeypatch.setattr(registry_module.time, "time", lambda: now[0])
+
+        registry = LLMClientRegistry(max_concurrency=2)
+        registry.register_factory(GOOGLE, lambda model, params: _FakeModel(model, params, fail=True))
+        client = registry.get(GOOGLE, "gemini-1.5-pro")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await client.ainvoke("질문")
+        assert not client.healthy
+        assert registry.get_stats()["clients"][0]["last_error"] == "provider error"
+
+        now[0] += 31
+        assert client.healthy
@@ -0,0 +1,70 @@
+"""
+LLM 응답 캐시 단위 테스트
+"""
+
+import pytest
+
+from app.agents import llm_router as llm_router_module
+from app.agents.llm_router import LLMRouter, LLMResponseCache
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLLMResponseCache:
+    """호출 지점 opt-in 캐시 테스트"""
+
+    async def test_opt_in_call_site_reuses_response(self, monkeypatch):
+        """cache를 지정한 호출만 재사용되고, 날짜 컨텍스트가 있어도 같은 날이면 히트"""
+        router = LLMRouter()
+        router.response_cache = LLMResponseCache(max_entries=10)
+        calls = []
+
+        async def fake_generate(model_name, prompt, include_datetime):
+            calls.append(prompt)
+            return f"answer {len(calls)}", model_name
+
+        monkeypatch.setattr(router, "_generate_uncached", fake_generate)
+
+        first = await router.generate_response(model_name="m", prompt="제목 생성:  안녕", cache="title")
+        second = await router.generate_response(model_name="m", prompt="제목 생성: 안녕", cache="title")
+        uncached = await router.generate_response(model_name="m", prompt="제목 생성: 안녕")
+        other_params = await router.generate_response(model_name="m", prompt="제목 생성: 안녕", cache="title", temperature=0.9)
+
+        assert first == second == ("answer 1", "m")
+        assert uncached == ("answer 2", "m")
+        assert other_params == ("answer 3", "m")
+
+        stats = router.response_cache.get_stats()["call_sites"]["title"]
+        assert stats["hits"] == 1 and stats["misses"] == 2
+        assert stats["tokens_saved"] > 0
+
+    async def test_ttl_and_size_bound(self, monkeypatch):
+        """만료된 항목은 미스, 최대 항목 수를 넘으면 오래된 항목부터 제거"""
+        cache = LLMResponseCache(max_entries=2, default_ttl_seconds=60)
+        now = [1000.0]
+        monkeypatch.setattr(llm_router_module.time, "time", lambda: now[0])
+
+        for i in range(3):
+            cache.set(f"k{i}", f"v{i}", "m")
+        assert cache.get("k0", "site") is None
+        assert cache.get("k2", "site") == ("v2", "m")
+
+        now[0] += 61
+        assert cache.get("k2", "site") is None
+
+    async def test_mock_and_fallback_responses_are_not_cached(self, monkeypatch):
+        """Mock 모드/fallback 응답은 저장하지 않아 실제 모델 설정 후 바로 실제 응답 사용"""
+        router = LLMRouter()
+        router.response_cache = LLMResponseCache(max_entries=10)
+        models = iter(["mock-m", "mock-m-fallback", "m", "m"])
+
+        async def fake_generate(model_name, prompt, include_datetime):
+            model_used = next(models)
+            return f"answer from {model_used}", model_used
+
+        monkeypatch.setattr(router, "_generate_uncached", fake_generate)
+
+        responses = [await router.generate_response(model_name="m", prompt="제목 생성: 안녕", cache="title") for _ in range(4)]
+
+        assert [model for _, model in responses] == ["mock-m", "mock-m-fallback", "m", "m"]
+        assert router.response_cache.get_stats()["entries"] == 1
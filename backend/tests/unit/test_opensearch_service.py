@@ -0,0 +1,67 @@
+"""
+OpenSearch 서비스 단위 테스트 (프로세스 내 대체 백엔드 사용)
+"""
+
+import pytest
+
+from app.services.opensearch_service import (
+    BulkIndexer,
+    LocalOpenSearchClient,
+    OpenSearchService,
+    fuse_scores,
+)
+
+
+def _documents():
+    return [
+        ("a", {"content": "python asyncio event loop", "embedding_vector": [1.0, 0.0, 0.0]}),
+        ("b", {"content": "java virtual machine", "embedding_vector": [0.0, 1.0, 0.0]}),
+        ("c", {"content": "python packaging", "embedding_vector": [0.7, 0.7, 0.0]}),
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestOpenSearchService:
+    """bulk 인덱싱, kNN 및 하이브리드 점수 테스트"""
+
+    async def test_bulk_index_then_knn_search(self):
+        """bulk로 인덱싱한 문서를 embedding_vector kNN으로 검색"""
+        service = OpenSearchService(client=LocalOpenSearchClient())
+
+        result = await service.bulk_index_documents("docs", _documents())
+        assert result == {"indexed": 3, "failed": 0}
+        assert await service.get_document_count("docs") == 3
+
+        hits = await service.knn_search("docs", [1.0, 0.1, 0.0], size=2)
+        assert [hit["id"] for hit in hits] == ["a", "c"]
+        await service.close()
+
+    async def test_bulk_indexer_applies_back_pressure(self):
+        """대기열이 가득 차면 생산자가 대기하고, 요청은 최대 문서 수 단위로 묶임"""
+        client = LocalOpenSearchClient()
+        indexer = BulkIndexer(client, max_docs=2, flush_interval_ms=5, queue_size=1, concurrency=1)
+
+        futures = [await indexer.add("idx", str(i), {"content": f"doc {i}"}) for i in range(5)]
+        await indexer.close()
+
+        assert all(future.result() for future in futures)
+        assert indexer.stats["indexed"] == 5
+        assert indexer.stats["producer_waits"] > 0
+        assert (await client.count("idx"))["count"] == 5
+
+    async def test_hybrid_fusion_combines_text_and_vector_scores(self):
+        """BM25와 벡터 양쪽에서 높은 문서가 한쪽에서만 높은 문서보다 앞섬"""
+        client = LocalOpenSearchClient()
+        for doc_id, document in _documents():
+            await client.index("idx", doc_id, document)
+
+        text = await client.search("idx", {"query": {"multi_match": {"query": "python", "fields": ["content"]}}})
+        vector = await client.search("idx", {"query": {"knn": {"embedding_vector": {"vector": [0.7, 0.7, 0.0], "k": 3}}}})
+        to_hits = lambda response: [
+            {"id": hit["_id"], "score": hit["_score"], "source": hit["_source"]} for hit in response["hits"]["hits"]
+        ]
+
+        fused = fuse_scores(to_hits(text), to_hits(vector), vector_weight=0.5)
+        assert "b" not in [hit["id"] for hit in to_hits(text)]
+        assert fused[0]["id"] == "c"
@@ -0,0 +1,72 @@
+"""
+검색 결과 중복 제거 단위 테스트
+"""
+
+import pytest
+
+from app.services.search_dedup import ResultDeduplicator, canonicalize_url
+
+
+@pytest.mark.unit
+class TestCanonicalizeUrl:
+    """URL 정규화 테스트"""
+
+    @pytest.mark.parametrize("url", [
+        "https://www.example.com/news/1?utm_source=feed&id=3&fbclid=abc#top",
+        "http://m.example.com/news/1/?id=3",
+        "https://example.com/news/1/amp?id=3",
+        "https://www.google.com/amp/s/example.com/news/1%3Fid%3D3",
+        "https://example-com.cdn.ampproject.org/c/s/example.com/news/1?id=3",
+    ])
+    def test_variants_share_canonical_url(self, url):
+        """추적 파라미터, 스킴/호스트, 모바일/AMP 변형은 같은 정규 URL"""
+        assert canonicalize_url(url) == "https://example.com/news/1?id=3"
+
+    def test_meaningful_query_is_kept(self):
+        assert canonicalize_url("https://example.com/search?q=a") != canonicalize_url("https://example.com/search?q=b")
+
+
+@pytest.mark.unit
+class TestResultDeduplicator:
+    """URL/근사 중복 클러스터링 테스트"""
+
+    def test_syndicated_copy_keeps_best_member(self):
+        """전재 기사는 한 클러스터로 묶고 점수가 높은 결과를 대표로 유지"""
+        dedup = ResultDeduplicator()
+        original = {
+            "url": "https://news.a.com/1?utm_source=x",
+            "title": "삼성전자, 3분기 영업이익 10조원 돌파… 반도체 회복세 뚜렷",
+            "snippet": "삼성전자가 3분기 연결 기준 영업이익이 10조원을 넘어섰다고 밝혔다",
+            "score": 0.8,
+        }
+        copy = {
+            "url": "https://b.com/x",
+            "title": "삼성전자 3분기 영업이익 10조원 돌파...반도체 회복세 뚜렷",
+            "snippet": "삼성전자가 3분기 연결기준 영업이익이 10조원을 넘어섰다고 밝혔다",
+            "score": 0.9,
+        }
+        different = {
+            "url": "https://c.com/y",
+            "title": "삼성전자 3분기 실적 발표, 영업이익 9조원",
+            "snippet": "메모리 반도체 부진으로 삼성전자가 3분기 잠정 실적을 공개했다",
+            "score": 0.7,
+        }
+
+        assert dedup.add(original) == (0, True)
+        assert dedup.add(copy) == (0, False)
+        assert dedup.add(different) == (1, True)
+
+        results = dedup.results()
+        assert [r["url"] for r in results] == ["https://b.com/x", "https://c.com/y"]
+        assert results[0]["duplicate_urls"] == ["https://news.a.com/1?utm_source=x"]
+        assert dedup.stats["near_duplicates"] == 1
+
+    def test_url_variant_merges_and_keeps_max_score(self):
+        """같은 정규 URL이면 텍스트가 짧아도 묶고 점수는 최댓값 유지"""
+        dedup = ResultDeduplicator()
+        dedup.add({"url": "https://example.com/a", "title": "A", "score": 0.9, "relevance_score": 0.4})
+        dedup.add({"url": "http://m.example.com/a?utm_medium=x", "title": "A", "score": 0.5, "relevance_score": 0.8})
+
+        [result] = dedup.results()
+        assert result["url"] == "https://example.com/a"
+        assert (result["score"], result["relevance_score"]) == (0.9, 0.8)
@@ -0,0 +1,78 @@
+"""
+검색 팬아웃 실행기 단위 테스트
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.search_fanout import FanOutCall, SearchFanOut
+
+
+def _result(score):
+    return SimpleNamespace(score=score)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSearchFanOut:
+    """마감 시간, hedge, 조기 반환 테스트"""
+
+    async def test_slow_call_is_hedged_and_hedge_wins(self):
+        """hedge 지연이 지나도 끝나지 않은 요청은 중복 요청하고 먼저 끝난 결과 사용"""
+        delays = iter([1.0, 0.01])
+        started = []
+
+        async def search():
+            delay = next(delays)
+            started.append(delay)
+            await asyncio.sleep(delay)
+            return [_result(0.9)]
+
+        fanout = SearchFanOut(deadline_seconds=2, hedge_default_delay_ms=30)
+        outcome = await fanout.run([FanOutCall("google", "google", search)])
+
+        assert started == [1.0, 0.01]
+        assert len(outcome.results["google"]) == 1
+        assert fanout.stats["google"]["hedge_wins"] == 1
+
+    async def test_deadline_cancels_late_calls(self):
+        """마감 시간이 지나면 끝난 결과만 반환하고 늦은 요청은 취소"""
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return [_result(0.9)]
+
+        async def fast():
+            return [_result(0.5)]
+
+        fanout = SearchFanOut(deadline_seconds=0.1, hedge_enabled=False)
+        outcome = await fanout.run([FanOutCall("slow", "a", slow), FanOutCall("fast", "b", fast)])
+
+        assert outcome.timed_out and outcome.cancelled == ["slow"]
+        assert outcome.results == {"slow": [], "fast": [outcome.results["fast"][0]]}
+        assert cancelled.is_set()
+
+    async def test_early_return_when_enough_high_score_results(self):
+        """높은 점수 결과가 충분하면 나머지 제공자를 기다리지 않음"""
+        async def good():
+            return [_result(0.95), _result(0.9)]
+
+        async def slow():
+            await asyncio.sleep(5)
+            return [_result(1.0)]
+
+        fanout = SearchFanOut(deadline_seconds=5, hedge_enabled=False)
+        outcome = await asyncio.wait_for(
+            fanout.run([FanOutCall("good", "g", good), FanOutCall("slow", "s", slow)], min_results=2, min_score=0.8),
+            timeout=1
+        )
+
+        assert outcome.early_return and outcome.cancelled == ["slow"]
+        assert [r.score for r in outcome.ordered()] == [0.95, 0.9]
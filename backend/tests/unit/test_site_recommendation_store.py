@@ -0,0 +1,101 @@
+"""
+메타 검색 사이트 추천 저장소 / 카테고리 매처 단위 테스트
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services.search_service import KeywordCategoryMatcher
+from app.services.site_recommendation_store import SiteRecommendationStore, topic_tokens
+
+
+def _discoverer(calls, domain="docs.python.org"):
+    async def discover():
+        calls.append(domain)
+        return [{"domain": domain, "reason": "공식 문서", "confidence": 0.8, "search_method": "site_operator"}]
+    return discover
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSiteRecommendationStore:
+    """주제별 추천 재사용, 신뢰도 감쇠, 백그라운드 갱신 테스트"""
+
+    async def test_llm_is_called_only_for_new_topics(self, tmp_path):
+        """같거나 비슷한 주제는 저장된 추천을 재사용하고, 저장소를 다시 열어도 유지"""
+        path = str(tmp_path / "sites.sqlite3")
+        calls = []
+        store = SiteRecommendationStore(path=path)
+
+        await store.get_or_discover("파이썬 비동기 프로그래밍 방법 알려줘", _discoverer(calls))
+        await store.get_or_discover("파이썬 비동기 프로그래밍", _discoverer(calls))
+        await store.get_or_discover("파이썬 비동기 프로그래밍 예제", _discoverer(calls))
+        await store.get_or_discover("반도체 수출 동향", _discoverer(calls, "kita.net"))
+        await store.close()
+
+        reopened = SiteRecommendationStore(path=path)
+        sites = await reopened.get_or_discover("파이썬 비동기 프로그래밍", _discoverer(calls))
+        await reopened.close()
+
+        assert calls == ["docs.python.org", "kita.net"]
+        assert sites[0]["domain"] == "docs.python.org"
+        assert store.stats["similar_hits"] == 1
+
+    async def test_concurrent_new_topic_calls_llm_once(self, tmp_path):
+        calls = []
+        store = SiteRecommendationStore(path="")
+        results = await asyncio.gather(*(store.get_or_discover("쿠버네티스 배포 전략", _discoverer(calls)) for _ in range(3)))
+        await store.close()
+
+        assert calls == ["docs.python.org"]
+        assert all(r == results[0] for r in results)
+
+    async def test_confidence_decays_and_stale_topic_refreshes_in_background(self):
+        """반감기만큼 지나면 신뢰도가 절반, 갱신 시점이 지나면 저장값을 반환하며 백그라운드 갱신"""
+        calls = []
+        store = SiteRecommendationStore(path="", half_life_days=1, refresh_after_seconds=3600, max_age_seconds=10 * 86400)
+        await store.get_or_discover("러스트 소유권", _discoverer(calls))
+
+        key = next(iter(store._topics))
+        tokens, sites, _ = store._topics[key]
+        store._topics[key] = (tokens, sites, time.time() - 86400)
+
+        stale = await store.get_or_discover("러스트 소유권", _discoverer(calls, "doc.rust-lang.org"))
+        assert stale[0]["domain"] == "docs.python.org"
+        assert stale[0]["confidence"] == pytest.approx(0.4, abs=0.01)
+
+        await asyncio.gather(*store._refreshing.values())
+        fresh = await store.get_or_discover("러스트 소유권", _discoverer(calls))
+        await store.close()
+
+        assert fresh[0]["domain"] == "doc.rust-lang.org"
+        assert calls == ["docs.python.org", "doc.rust-lang.org"]
+
+
+@pytest.mark.unit
+class TestTopicTokens:
+    """주제 토큰화 테스트"""
+
+    def test_topic_tokens_ignore_request_phrases(self):
+        assert topic_tokens("파이썬 비동기 프로그래밍 방법 알려줘") == topic_tokens("파이썬 비동기 프로그래밍")
+
+
+@pytest.mark.unit
+class TestKeywordCategoryMatcher:
+    """단일 정규식 키워드 매처 테스트"""
+
+    def test_matches_same_keywords_as_substring_scan(self):
+        """겹치는 키워드(연구개발/연구/개발)도 키워드별 부분 문자열 검사와 같은 집합을 반환"""
+        keywords = {
+            "trade": ["수출", "수입", "수출입", "FTA"],
+            "research": ["연구", "연구개발", "개발", "R&D"],
+        }
+        matcher = KeywordCategoryMatcher(keywords)
+
+        assert matcher.match("반도체 수출입 fta 연구개발 r&d 동향") == {
+            "trade": {"수출", "수출입", "fta"},
+            "research": {"연구", "연구개발", "개발", "r&d"},
+        }
+        assert matcher.match("날씨") == {}
@@ -0,0 +1,60 @@
+"""
+추측 실행 관리자 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.agents.speculative_executor import SpeculativeExecutor
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSpeculativeExecutor:
+    """추측이 맞으면 결과 재사용, 다르면 취소"""
+
+    async def test_matching_claim_reuses_running_task(self):
+        executor = SpeculativeExecutor()
+        calls = []
+
+        async def worker():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"agent_type": "web_search", "success": True}
+
+        assert executor.start("run-1", "web_search", worker)
+        assert not executor.start("run-1", "web_search", worker)  # 같은 실행에서 중복 시작 안 함
+
+        await asyncio.sleep(0.01)  # 선택이 확정되는 동안 작업은 이미 진행 중
+        task = executor.claim("run-1", "web_search")
+
+        assert (await task)["success"] is True
+        assert calls == [1]
+        assert executor.get_stats()["hits"] == 1 and executor.get_stats()["in_flight"] == 0
+
+    async def test_mismatch_and_abandoned_runs_are_cancelled(self):
+        executor = SpeculativeExecutor()
+        started = asyncio.Event()
+
+        async def slow_worker():
+            started.set()
+            await asyncio.sleep(10)
+
+        executor.start("run-1", "web_search", slow_worker)
+        await started.wait()
+        task = executor._tasks["run-1"][1]
+
+        assert executor.claim("run-1", "canvas") is None
+        await asyncio.sleep(0)
+        assert task.cancelled()
+
+        executor.start("run-2", "web_search", slow_worker)
+        abandoned = executor._tasks["run-2"][1]
+        executor.cancel("run-2")
+        await asyncio.sleep(0)
+
+        assert abandoned.cancelled()
+        assert executor.claim(None, "web_search") is None
+        stats = executor.get_stats()
+        assert stats["misses"] == 1 and stats["cancelled"] == 2 and stats["in_flight"] == 0
@@ -0,0 +1,129 @@
+"""
+LangGraph Supervisor 병렬 분석/추측 실행 그래프 단위 테스트 (LLM과 Worker는 Mock)
+"""
+
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.agents.base import AgentInput
+from app.agents.langgraph.supervisor_langgraph import AgentType, LangGraphSupervisorAgent
+from app.agents.speculative_executor import speculative_executor
+
+PROMPT_KINDS = {
+    "고급 의도 분석 전문가": "intent",
+    "대화 맥락 평가 전문가": "context",
+    "작업 복잡도 평가 전문가": "complexity",
+    "라우팅 전략 수립 전문가": "routing",
+    "결과 통합 전문가": "integrate",
+}
+
+
+class _FakeModel:
+    """시스템 프롬프트로 단계를 구분해 고정 지연 후 JSON 응답, 호출 구간 기록"""
+
+    def __init__(self, routing_agent: str = "web_search", fail_intent: bool = False, latency: float = 0.05):
+        self.routing_agent = routing_agent
+        self.fail_intent = fail_intent
+        self.latency = latency
+        self.calls = {}
+
+    async def ainvoke(self, messages, **kwargs):
+        kind = next((k for phrase, k in PROMPT_KINDS.items() if phrase in messages[0].content), "other")
+        started = time.perf_counter()
+        await asyncio.sleep(self.latency)
+        self.calls[kind] = (started, time.perf_counter())
+        if kind == "intent":
+            if self.fail_intent:
+                raise RuntimeError("intent model down")
+            return AIMessage(content=json.dumps({"primary_intent": "web_search", "confidence": 0.9}))
+        if kind == "routing":
+            return AIMessage(content=json.dumps({"execution_mode": "single_agent", "primary_agent": self.routing_agent}))
+        if kind == "integrate":
+            return AIMessage(content="통합 답변")
+        return AIMessage(content="{}")
+
+
+class _FakeWorker:
+    """실행/취소 여부를 기록하는 Worker"""
+
+    def __init__(self, duration: float):
+        self.duration = duration
+        self.runs = 0
+        self.cancelled = False
+
+    async def execute(self, input_data: AgentInput, model: str):
+        self.runs += 1
+        try:
+            await asyncio.sleep(self.duration)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return SimpleNamespace(result=f"{input_data.query} 결과", metadata={"confidence": 0.8})
+
+
+def _agent(model: _FakeModel, workers):
+    agent = LangGraphSupervisorAgent()
+    agent._get_llm_model = lambda model_name: model
+    agent.worker_agents = workers
+    return agent
+
+
+async def _run(agent: LangGraphSupervisorAgent):
+    app = agent._build_workflow().compile()
+    state = agent._build_initial_state(
+        AgentInput(query="최신 배터리 기술 검색해줘", user_id="u", session_id="s"), "claude-sonnet", time.time(), True
+    )
+    try:
+        return await app.ainvoke(state)
+    finally:
+        speculative_executor.cancel(state["speculation_id"])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSupervisorSpeculation:
+    """의도 분석 ∥ 컨텍스트 평가, 추측 실행 재사용/취소, 의도 분석 실패 시 조기 종료"""
+
+    async def test_parallel_analysis_and_speculative_hit(self):
+        model = _FakeModel()
+        web = _FakeWorker(duration=0.05)
+        agent = _agent(model, {AgentType.WEB_SEARCH: web})
+
+        final_state = await _run(agent)
+
+        intent, context = model.calls["intent"], model.calls["context"]
+        assert intent[0] < context[1] and context[0] < intent[1]  # 두 분석 호출 구간이 겹침
+        assert model.calls["complexity"][0] >= max(intent[1], context[1])  # 둘 다 끝난 뒤 합류
+        assert web.runs == 1  # 추측 실행 결과를 그대로 넘겨받아 다시 실행하지 않음
+        assert final_state["execution_metadata"]["speculative_hit"] is True
+        assert final_state["agent_results"][0]["success"] is True
+
+    async def test_speculative_miss_cancels_guess(self):
+        model = _FakeModel(routing_agent="canvas")
+        web = _FakeWorker(duration=10)
+        canvas = _FakeWorker(duration=0)
+        agent = _agent(model, {AgentType.WEB_SEARCH: web, AgentType.CANVAS: canvas})
+
+        final_state = await _run(agent)
+        await asyncio.sleep(0)
+
+        assert web.runs == 1 and web.cancelled
+        assert canvas.runs == 1
+        assert final_state["execution_metadata"]["speculative_hit"] is False
+        assert final_state["agent_results"][0]["agent_type"] == "canvas"
+
+    async def test_intent_failure_ends_before_complexity(self):
+        model = _FakeModel(fail_intent=True)
+        web = _FakeWorker(duration=0)
+        agent = _agent(model, {AgentType.WEB_SEARCH: web})
+
+        final_state = await _run(agent)
+
+        assert final_state["should_fallback"] is True
+        assert "complexity" not in model.calls and "routing" not in model.calls
+        assert web.runs == 0
@@ -0,0 +1,75 @@
+"""
+영속 벡터 인덱스 서비스 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.vector_index_service import VectorIndexService
+
+MODEL = "test/bag-of-words"
+VOCAB = ["python", "java", "cache", "vector", "index", "korea"]
+
+
+class _CountingEmbedder:
+    """단어 등장 여부로 임베딩하는 테스트용 모델 (호출된 텍스트 수 기록)"""
+
+    def __init__(self):
+        self.embedded = 0
+
+    async def __call__(self, texts):
+        self.embedded += len(texts)
+        return [self.embed_query(text) for text in texts]
+
+    @staticmethod
+    def embed_query(text):
+        words = text.lower().split()
+        return [float(word in words) for word in VOCAB]
+
+
+def _chunks(*texts):
+    return [{"content": text, "metadata": {"n": i}} for i, text in enumerate(texts)]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestVectorIndexService:
+    """문서 인덱스 재사용 및 요청별 검색 테스트"""
+
+    async def test_reindexing_same_document_skips_embedding(self, tmp_path):
+        """같은 문서는 새 프로세스(인스턴스)에서도 디스크 인덱스를 재사용"""
+        embedder = _CountingEmbedder()
+        chunks = _chunks("python cache", "java vector index")
+
+        first = VectorIndexService(index_dir=str(tmp_path))
+        doc_hash = await first.ensure_index(MODEL, chunks, embedder)
+        assert embedder.embedded == 2
+
+        second = VectorIndexService(index_dir=str(tmp_path))
+        assert await second.ensure_index(MODEL, chunks, embedder) == doc_hash
+        assert embedder.embedded == 2
+        assert second.stats["indexes_reused"] == 1
+
+        results = await second.search(MODEL, embedder.embed_query("vector index"), [doc_hash], k=1)
+        assert results[0]["content"] == "java vector index"
+        assert results[0]["metadata"] == {"n": 1}
+
+    async def test_concurrent_requests_keep_separate_document_sets(self, tmp_path):
+        """동시 요청은 각자의 문서 인덱스만 검색하고, 같은 문서는 한 번만 인덱싱"""
+        embedder = _CountingEmbedder()
+        service = VectorIndexService(index_dir=str(tmp_path))
+
+        doc_a, doc_b, doc_a_again = await asyncio.gather(
+            service.ensure_index(MODEL, _chunks("python cache", "korea"), embedder),
+            service.ensure_index(MODEL, _chunks("java index"), embedder),
+            service.ensure_index(MODEL, _chunks("python cache", "korea"), embedder),
+        )
+
+        assert doc_a == doc_a_again
+        assert embedder.embedded == 3
+
+        results_a = await service.search(MODEL, embedder.embed_query("java"), [doc_a], k=5)
+        results_b = await service.search(MODEL, embedder.embed_query("java"), [doc_b], k=5)
+        assert "java index" not in [r["content"] for r in results_a]
+        assert results_b[0]["content"] == "java index"
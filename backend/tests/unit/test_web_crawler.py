@@ -0,0 +1,72 @@
+"""
+웹 크롤러 단위 테스트
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+PAGE = b"<html><head><title>Test Page</title></head><body><main><h1>Heading</h1><p>Hello crawler.</p></main></body></html>"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWebCrawlerService:
+    """연결 제한, 응답 크기 제한, 캐시 재검증 테스트"""
+
+    async def test_cached_page_is_revalidated_with_etag(self, make_web_crawler):
+        """신선도가 지난 캐시는 If-None-Match로 재검증하고 304면 재파싱 없이 반환"""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=PAGE, headers={"content-type": "text/html; charset=utf-8", "etag": '"v1"'})
+
+        crawler = make_web_crawler(handler)
+        crawler.cache_fresh_seconds = 0
+
+        first = await crawler.crawl_url("https://example.com/a")
+        second = await crawler.crawl_url("https://example.com/a")
+        await crawler.close()
+
+        assert first.title == "Test Page" and not first.from_cache
+        assert second.from_cache and second.content == first.content
+        assert seen_headers == [None, '"v1"']
+        assert crawler.stats["revalidated"] == 1
+
+    async def test_response_is_truncated_at_size_cap(self, make_web_crawler):
+        """최대 크기를 넘는 응답은 스트리밍 중 잘라서 파싱"""
+        body = b"<html><body><p>" + b"x" * 5000 + b"</p></body></html>"
+
+        def handler(request):
+            return httpx.Response(200, content=body, headers={"content-type": "text/html"})
+
+        crawler = make_web_crawler(handler, max_response_bytes=1000)
+        result = await crawler.crawl_url("https://example.com/big")
+        await crawler.close()
+
+        assert result.error is None and result.truncated
+        assert crawler.stats["bytes_downloaded"] == 1000
+
+    async def test_crawl_many_limits_requests_per_host(self, make_web_crawler):
+        """같은 호스트는 호스트 제한 이상 동시에 요청하지 않고, 결과는 입력 순서 유지"""
+        active = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return httpx.Response(200, content=PAGE, headers={"content-type": "text/html"})
+
+        crawler = make_web_crawler(handler, per_host_concurrency=2)
+        urls = [f"https://example.com/{i}" for i in range(6)] + ["https://example.com/0"]
+        results = await crawler.crawl_many(urls)
+        await crawler.close()
+
+        assert [r.url for r in results] == urls
+        assert active["peak"] == 2
+        assert crawler.stats["requests"] == 6
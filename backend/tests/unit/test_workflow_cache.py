@@ -0,0 +1,57 @@
+"""
+LangGraph 워크플로우 컴파일 캐시 단위 테스트
+"""
+
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from app.agents.workflow_cache import NO_CHECKPOINTER, CompiledWorkflowCache
+
+
+class _State(TypedDict):
+    thread: str
+    visits: int
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCompiledWorkflowCache:
+    """프로세스당 한 번 컴파일, 요청별 값은 입력 상태로만 전달"""
+
+    async def test_compiles_once_per_key(self):
+        cache = CompiledWorkflowCache()
+        builds = []
+
+        def build():
+            builds.append(1)
+            workflow = StateGraph(_State)
+
+            async def visit(state: _State):
+                return {"visits": state["visits"] + 1}
+
+            workflow.add_node("visit", visit)
+            workflow.set_entry_point("visit")
+            workflow.add_edge("visit", END)
+            return workflow
+
+        app = cache.get("agent", build, backend=NO_CHECKPOINTER)
+        results = [
+            await cache.get("agent", build, backend=NO_CHECKPOINTER).ainvoke({"thread": f"t{i}", "visits": i})
+            for i in range(5)
+        ]
+
+        assert cache.get("agent", build, backend=NO_CHECKPOINTER) is app
+        assert len(builds) == 1
+        assert [r["visits"] for r in results] == [1, 2, 3, 4, 5]
+
+        # 변형이 다르면 별도로 컴파일, 무효화하면 다시 컴파일
+        assert cache.get("agent", build, variant="tool_calling", backend=NO_CHECKPOINTER) is not app
+        cache.invalidate("agent")
+        cache.get("agent", build, backend=NO_CHECKPOINTER)
+        assert len(builds) == 3
+
+        stats = cache.get_stats()
+        assert stats["compiles"] == 3 and stats["hits"] == 6
+        assert stats["workflows"] == ["agent[default/none]"]
@@ -152,6 +152,11 @@ class ApiService {
                   }
                   break;
                   
+                case 'citations':
+                  // 답변 토큰보다 먼저 확정된 인용 정보 (최종 정보는 result 이벤트에 포함)
+                  loggers.debug('인용 정보 수신', eventData.data, 'ApiService');
+                  break;
+
                 case 'chunk':
                   // 청크 데이터 수신 - 타이핑 효과로 표시 (빈도 제어된 로깅)
                   const chunkData = eventData.data;